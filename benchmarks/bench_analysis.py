@@ -0,0 +1,22 @@
+# Static/dynamic analysis of the monopoly domain: time of the pass, how its predicates and fluents split, and
+# how much of the initial state is static, i.e. need not be stored per state.
+
+from common import best_of, example
+from tsal.translator.analysis import SymbolAnalysis
+from tsal.translator.tsalparser import TSALParser
+
+
+def main():
+    domain = TSALParser.parse(example('monopoly', 'domain.tsal'))
+    problem = TSALParser.parse(example('monopoly', 'problem.tsal'))
+    seconds = best_of(lambda: SymbolAnalysis(domain), repeat=20)
+    analysis = domain.analysis
+    print('monopoly: analysis {:8.3f} ms'.format(seconds * 1000))
+    for kind in ('static', 'add_only', 'delete_only', 'increasing', 'decreasing', 'dynamic'):
+        print('  {:<12} {:4d} symbols'.format(kind, len(getattr(analysis, kind))))
+    static, other = analysis.partition(problem.init)
+    print('  init: {} atoms, {} static, {} stored per state'.format(len(problem.init), len(static), len(other)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+# Integer encoding of the monopoly initial state (its :init repeated): time to build the Encoding and encode
+# the init, and membership lookups of the encoded atoms against lookups of the parsed atoms.
+
+from common import best_of, example, scaled_problem
+from tsal.translator.encoding import Encoding
+from tsal.translator.tsalparser import TSALParser
+
+FACTOR = 20
+
+
+def lookups(state, atoms):
+    return sum(1 for atom in atoms if atom in state)
+
+
+def main():
+    domain = TSALParser.parse(example('monopoly', 'domain.tsal'))
+    problem = TSALParser.parse_string(scaled_problem(example('monopoly', 'problem.tsal'), FACTOR))
+    seconds = best_of(lambda: Encoding(problem, domain).encode_init(), repeat=5)
+    encoding = problem.encoding(domain)
+    atoms = [atom.args[0] for atom in problem.init]
+    codes = [encoding.encode(atom) for atom in problem.init]
+    print('monopoly/problem.tsal x{}: {} atoms, {} objects, {} symbols'.format(
+        FACTOR, len(atoms), len(encoding.objects), len(encoding.symbols)))
+    print('  encoding + encode_init {:8.2f} ms'.format(seconds * 1000))
+    for label, items in (('parsed atoms', atoms), ('encoded atoms', codes)):
+        state = set(items)
+        seconds = best_of(lambda: lookups(state, items), repeat=10)
+        print('  {:<14} lookups {:8.2f} ms'.format(label, seconds * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+# Numeric preconditions of the monopoly actions and events over all their groundings: a recursive walk of
+# the Expression trees (what each consumer wrote), the compiled expressions called once per grounding, and one
+# batched call per expression over all the groundings; then one expression over many states.
+
+import operator
+
+import numpy as np
+
+from common import best_of, example
+from tsal.simulator.evaluation import CompiledExpression
+from tsal.simulator.fluents import FluentIndex
+from tsal.simulator.grounding import Grounder, parameter_name
+from tsal.translator.expression import Expression
+from tsal.translator.fluent import Fluent
+from tsal.translator.tsalparser import TSALParser
+
+STATES = 10000
+
+OPERATORS = {'+': operator.add, '-': operator.sub, '*': operator.mul, '=': operator.eq, '!=': operator.ne,
+             '<': operator.lt, '>': operator.gt, '<=': operator.le, '>=': operator.ge}
+
+
+def walk(node, values, binding):
+    if isinstance(node, Fluent):
+        args = tuple(binding.get(arg.name, arg.name) if arg.is_variable() else arg.value for arg in node.args)
+        return values.get((node.name,) + args)
+    if node.operator is None:
+        return binding.get(node.value, node.value)
+    left, right = walk(node.left_child, values, binding), walk(node.right_child, values, binding)
+    if left is None or right is None:
+        return None
+    try:
+        return OPERATORS[node.operator](left, right)
+    except TypeError:
+        return None
+
+
+def main():
+    domain = TSALParser.parse(example('monopoly', 'domain.tsal'))
+    problem = TSALParser.parse(example('monopoly', 'problem.tsal'))
+    encoding = problem.encoding(domain)
+    fluents = FluentIndex(encoding, domain.fluents)
+    grounder = Grounder(domain, problem)
+    init = {(atom.args[0].name,) + tuple(arg.value for arg in atom.args[0].args): atom.args[1] for atom in problem.init}
+
+    cases = []  # (expression, compiled, named bindings, id bindings)
+    for operator_ in domain.operators + domain.events:
+        params = [parameter_name(param) for param in operator_.params]
+        rows = list(grounder.groundings(operator_))
+        for condition in operator_.precond:
+            if not isinstance(condition, Expression) or not rows:
+                continue
+            try:
+                compiled = CompiledExpression(condition, fluents, params)
+            except ValueError:  # a variable that is not a parameter, bound while matching the state
+                continue
+            ids = np.array([[encoding.object_id(name) for name in row] for row in rows], dtype=np.int64)
+            cases.append((condition, compiled, [dict(zip(params, row)) for row in rows], ids))
+    values = fluents.initial_values(problem)
+    evaluations = sum(len(named) for _, _, named, _ in cases)
+
+    walked = best_of(lambda: [walk(e, init, binding) for e, _, named, _ in cases for binding in named], repeat=10)
+    called = best_of(lambda: [c(values, tuple(row)) for _, c, _, ids in cases for row in ids.tolist()], repeat=10)
+    batched = best_of(lambda: [c.batch(values, ids) for _, c, _, ids in cases], repeat=10)
+    print('monopoly: {} expressions, {} evaluations'.format(len(cases), evaluations))
+    print('  tree walk {:8.3f} ms  compiled {:8.3f} ms  batched {:8.3f} ms'.format(
+        walked * 1000, called * 1000, batched * 1000))
+
+    expression, compiled, _, ids = max(cases, key=lambda case: ('f0(' in case[1].source, len(case[3])))
+    rows = np.resize(ids, (STATES, ids.shape[1]))
+    states = np.tile(values, (STATES, 1))
+    called = best_of(lambda: [compiled(state, tuple(row)) for state, row in zip(states, rows.tolist())], repeat=3)
+    batched = best_of(lambda: compiled.batch(states, rows), repeat=10)
+    print('{}: {} states  compiled {:8.3f} ms  batched {:8.3f} ms'.format(
+        expression, STATES, called * 1000, batched * 1000))
+
+
+if __name__ == '__main__':
+    main()
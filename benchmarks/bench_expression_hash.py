@@ -0,0 +1,56 @@
+# Hashing of expression trees: every Expression, Process and FrequencyDistribution of the monopoly and
+# viz_doom domains is put into a dict, then looked up 20 times, the way a cache keyed on fluent effects is used.
+# Lookups of the objects as parsed compare equal trees that are distinct objects, lookups of the deduplicated
+# objects (one object per distinct key) only hash.
+
+from common import best_of, example
+from tsal.translator.expression import Expression
+from tsal.translator.tsalparser import TSALParser
+
+ROUNDS = 20
+
+
+def collect(obj, found, seen):
+    # every Expression (with its subtrees), Process and FrequencyDistribution reachable from obj
+    if id(obj) in seen or isinstance(obj, (str, int, float)) or obj is None:
+        return
+    seen.add(id(obj))
+    if type(obj).__name__ in ('Expression', 'Process', 'FrequencyDistribution'):
+        found.append(obj)
+    if isinstance(obj, Expression):
+        children = (obj.left_child, obj.right_child)
+    elif isinstance(obj, (list, tuple)):
+        children = obj
+    elif isinstance(obj, dict):
+        children = obj.values()
+    elif hasattr(obj, '__dict__'):
+        children = vars(obj).values()
+    else:
+        children = ()
+    for child in children:
+        collect(child, found, seen)
+
+
+def lookups(objects):
+    cache = {obj: None for obj in objects}
+    for _ in range(ROUNDS):
+        for obj in objects:
+            cache[obj]
+    return len(cache)
+
+
+def main():
+    for name in (('monopoly', 'domain.tsal'), ('viz_doom', 'domain.tsal')):
+        objects = []
+        collect(TSALParser.parse(example(*name)), objects, set())
+        distinct = lookups(objects)
+        canonical = {}
+        deduplicated = [canonical.setdefault(obj, obj) for obj in objects]
+        seconds = best_of(lambda: lookups(objects), repeat=10)
+        deduplicated_seconds = best_of(lambda: lookups(deduplicated), repeat=10)
+        print('{:<22} {:5d} objects {:5d} distinct keys  parsed {:8.2f} ms  deduplicated {:8.2f} ms'.format(
+            '/'.join(name), len(objects), distinct, seconds * 1000, deduplicated_seconds * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+# Numeric effects on many parallel monopoly states: every player pays 50 (player-cash declared with bounds
+# 0..5000, 2 decimals), once with a Python loop over per-state dicts of fluent values, clamping and rounding
+# each value, once as one batched FluentIndex.decrease over a (states, fluents) array.
+
+import numpy as np
+
+from common import best_of, example
+from tsal.simulator.fluents import FluentIndex
+from tsal.translator.fluent import Fluent
+from tsal.translator.tsalparser import TSALParser
+
+STATES = 1000
+
+
+def main():
+    domain = TSALParser.parse(example('monopoly', 'domain.tsal'))
+    problem = TSALParser.parse(example('monopoly', 'problem.tsal'))
+    declared = [Fluent(fluent.name, fluent.args, [0, 5000, 2], fluent.type) if fluent.name == 'player-cash' else fluent
+                for fluent in domain.fluents]
+    index = FluentIndex(problem.encoding(domain), declared)
+    values = index.initial_values(problem)
+    players = [atom for atom in problem.init if atom.args[0].name == 'player-cash']
+    ids = np.array([index.find(atom) for atom in players])
+
+    states = [{atom.args[0]: atom.args[1] for atom in problem.init} for _ in range(STATES)]
+    fluents = [atom.args[0] for atom in players]
+
+    def loop():
+        for state in states:
+            for fluent in fluents:
+                state[fluent] = round(min(max(state[fluent] - 50, 0), 5000), 2)
+
+    batch = np.tile(values, (STATES, 1))
+    looped = best_of(loop, repeat=5)
+    batched = best_of(lambda: index.decrease(batch, ids, 50.0), repeat=20)
+    print('monopoly: {} ground fluents, {} states, {} fluents changed per state'.format(
+        len(index), STATES, len(ids)))
+    print('  python loop {:8.3f} ms  batched {:8.3f} ms'.format(looped * 1000, batched * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+# Getter calls of a successor generation loop: params, precond, effects and fluent_effects of every action
+# and event of the monopoly domain, and the args of every precondition atom, on the domain as parsed and
+# after Domain.freeze(), where the getters return the stored tuples without copying.
+
+from common import best_of, example
+from tsal.translator.literal import Literal
+from tsal.translator.tsalparser import TSALParser
+
+ROUNDS = 50
+
+
+def getters(operators):
+    count = 0
+    for _ in range(ROUNDS):
+        for operator in operators:
+            count += len(operator.params) + len(operator.effects) + len(operator.fluent_effects)
+            for condition in operator.precond:
+                if isinstance(condition, Literal):
+                    count += len(condition.predicate.args)
+    return count
+
+
+def main():
+    domain = TSALParser.parse(example('monopoly', 'domain.tsal'))
+    operators = domain.operators + domain.events
+    expected = getters(operators)
+    print('monopoly/domain.tsal ({} actions and events, {} rounds)'.format(len(operators), ROUNDS))
+    seconds = best_of(lambda: getters(operators), repeat=40)
+    print('  mutable {:8.2f} ms'.format(seconds * 1000))
+    if hasattr(domain, 'freeze'):
+        domain.freeze()
+        assert getters(operators) == expected
+        seconds = best_of(lambda: getters(operators), repeat=40)
+        print('  frozen  {:8.2f} ms'.format(seconds * 1000))
+
+
+if __name__ == '__main__':
+    main()
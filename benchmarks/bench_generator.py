@@ -0,0 +1,65 @@
+# Applicable groundings per state: testing every ground action (masks and fluent equalities) against the
+# SuccessorGenerator tree, on the states of a random walk in blocksworld with many blocks and in monopoly with
+# the actions and events grounded together.
+
+import numpy as np
+
+from common import best_of, example, problem_with_init, section_bounds
+from tsal.simulator.successor import SuccessorEngine
+from tsal.translator.tsalparser import TSALParser
+
+BLOCKS = 60
+STEPS = 2000
+
+# the example problem leaves the players' status and position undefined, which ends the walk after a roll
+MONOPOLY_INIT = ['(= (doubles-rolled-in-row) 0)'] + [
+    '(= (player-status {0}) free) (= (player-position {0}) 0) (= (player-turns-in-jail {0}) 0)'.format(player)
+    for player in ('player1', 'player2')]
+
+
+def walk(engine, steps, seed=0):
+    rng = np.random.default_rng(seed)
+    state, values = engine.initial()
+    states = []
+    for _ in range(steps):
+        states.append((state.bits, values))
+        applicable = engine.applicable(state, values)
+        if not applicable:
+            break
+        ground, binding = applicable[rng.integers(len(applicable))]
+        state, values = engine.sample(state, values, ground, binding, rng)
+    return states
+
+
+def report(label, engine, states):
+    grounds = engine.grounds
+    candidates = engine.generator.candidates
+    scan = best_of(lambda: [[ground for ground in grounds if ground.holds(bits, values)] for bits, values in states],
+                   repeat=3)
+    tree = best_of(lambda: [candidates(bits, values) for bits, values in states], repeat=3)
+    found = sum(len(candidates(bits, values)) for bits, values in states)
+    print('{}: {} groundings, {} nodes, {:.1f} applicable per state  scan {:8.2f} us  tree {:8.2f} us'.format(
+        label, len(grounds), engine.generator.nodes, found / len(states), scan / len(states) * 1e6,
+        tree / len(states) * 1e6))
+
+
+def main():
+    domain = TSALParser.parse(example('blocksworld', 'domain.tsal'))
+    facts = ['(HANDEMPTY)', '(= (self) p1)'] + ['(ONTABLE b{0}) (CLEAR b{0})'.format(i) for i in range(BLOCKS)]
+    text = problem_with_init(example('blocksworld', 'problem.tsal'), facts)
+    blocks = ' '.join('b{}'.format(i) for i in range(BLOCKS))
+    problem = TSALParser.parse_string(text.replace('D A H G B J E I F C - block', blocks + ' - block'))
+    engine = SuccessorEngine(domain, problem)
+    report('blocksworld {} blocks'.format(BLOCKS), engine, walk(engine, STEPS))
+
+    domain = TSALParser.parse(example('monopoly', 'domain.tsal'))
+    with open(example('monopoly', 'problem.tsal'), 'r', encoding='utf-8') as f:
+        text = f.read()
+    end = section_bounds(text, '(:init')[1] - 1
+    problem = TSALParser.parse_string(text[:end] + ' '.join(MONOPOLY_INIT) + text[end:])
+    engine = SuccessorEngine(domain, problem, domain.operators + domain.events)
+    report('monopoly', engine, walk(engine, STEPS))
+
+
+if __name__ == '__main__':
+    main()
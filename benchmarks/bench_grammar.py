@@ -0,0 +1,46 @@
+# Size of the generated LALR tables and parse time of the monopoly and viz_doom domains.
+
+import glob
+import os
+
+from common import best_of, example
+from tsal.translator import tsalparser
+from tsal.translator.tsalparser import TSALParser
+
+DOMAINS = (('monopoly', 'domain.tsal'), ('viz_doom', 'domain.tsal'))
+
+
+def table_stats(parser):
+    states = len(parser.action)
+    actions = sum(len(row) for row in parser.action.values())
+    gotos = sum(len(row) for row in parser.goto.values())
+    return states, actions, gotos, len(parser.productions)
+
+
+def count_tokens(data):
+    lexer = tsalparser._lexer.clone()
+    lexer.input(data)
+    return sum(1 for _ in lexer)
+
+
+def main():
+    tabdir = os.path.dirname(tsalparser.__file__)
+    parsers = [(name, getattr(tsalparser, name)) for name in ('_parser', '_domain_parser', '_problem_parser')
+               if hasattr(tsalparser, name)]
+    for name, parser in parsers:
+        print('{:<16} {:5d} states {:6d} actions {:5d} gotos {:4d} productions'.format(name, *table_stats(parser)))
+    for path in sorted(glob.glob(os.path.join(tabdir, 'parsetab*.py'))):
+        print('{:<16} {:8.1f} KiB'.format(os.path.basename(path), os.path.getsize(path) / 1024))
+    for name in DOMAINS:
+        path = example(*name)
+        data = TSALParser.read_input(path)
+        tokens = count_tokens(data)
+        parser = TSALParser()
+        print('{} ({} tokens)'.format('/'.join(name), tokens))
+        for start in ('tsal', TSALParser.start_symbol(data)):
+            seconds = best_of(lambda: parser.parse_input(data, start), repeat=60)
+            print('  start {:<8} {:8.2f} ms  {:8.0f} tokens/s'.format(start, seconds * 1000, tokens / seconds))
+
+
+if __name__ == '__main__':
+    main()
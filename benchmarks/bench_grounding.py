@@ -0,0 +1,80 @@
+# Grounding of the actions and events: the monopoly domain, blocksworld with many blocks (no static
+# predicates, every pair of blocks is a grounding) and a generated road map where the static (road ?from ?to)
+# precondition is joined instead of enumerating every pair of locations and checking it.
+
+import itertools
+
+from common import best_of, example, problem_with_init, write_temp
+from tsal.simulator.grounding import Grounder
+from tsal.translator.tsalparser import TSALParser
+
+BLOCKS = 300
+LOCATIONS = 1000
+
+ROADS_DOMAIN = """(define (domain ROADS)
+  (:requirements :typing)
+  (:types location player)
+  (:constants )
+  (:predicates
+      (road ?from - location ?to - location)
+      (at ?l - location)
+  )
+  (:fluents
+      (self) - player
+  )
+  (:actions
+      (:action move
+             :parameters (?from - location ?to - location)
+             :precondition (and (at ?from) (road ?from ?to))
+             :effect (and (not (at ?from)) (at ?to)))
+  )
+)"""
+
+ROADS_PROBLEM = """(define (problem ROADS-{n})
+    (:domain ROADS)
+    (:objects {locations} - location p1 - player)
+    (:init (= (self) p1) (at l0) {roads})
+    (:goal (or (and (= (self) p1) (at l1))))
+)"""
+
+
+def roads_problem(n):
+    roads = ['(road l{} l{})'.format(i, (i + step) % n) for i in range(n) for step in (1, 2, n - 1, n - 2)]
+    return ROADS_PROBLEM.format(n=n, locations=' '.join('l{}'.format(i) for i in range(n)), roads=' '.join(roads))
+
+
+def product_then_check(domain, problem):
+    # the baseline: every pair of locations, kept when the road is in the initial state
+    roads = {tuple(arg.value for arg in atom.args) for atom in problem.init if atom.name == 'road'}
+    locations = problem.objects['location']
+    return [pair for pair in itertools.product(locations, locations) if pair in roads]
+
+
+def report(label, domain, problem, repeat):
+    count = sum(1 for _ in Grounder(domain, problem).ground())
+    streamed = best_of(lambda: sum(1 for _ in Grounder(domain, problem).ground()), repeat=repeat)
+    tabled = best_of(lambda: Grounder(domain, problem).tables(), repeat=repeat)
+    print('{}: {} groundings  ground() {:8.2f} ms  tables() {:8.2f} ms'.format(
+        label, count, streamed * 1000, tabled * 1000))
+
+
+def main():
+    domain = TSALParser.parse(example('monopoly', 'domain.tsal'))
+    problem = TSALParser.parse(example('monopoly', 'problem.tsal'))
+    report('monopoly', domain, problem, repeat=20)
+
+    domain = TSALParser.parse(example('blocksworld', 'domain.tsal'))
+    text = problem_with_init(example('blocksworld', 'problem.tsal'), ['(HANDEMPTY)', '(= (self) p1)'])
+    blocks = ' '.join('b{}'.format(i) for i in range(BLOCKS))
+    problem = TSALParser.parse_string(text.replace('D A H G B J E I F C - block', blocks + ' - block'))
+    report('blocksworld {} blocks'.format(BLOCKS), domain, problem, repeat=3)
+
+    domain = TSALParser.parse(write_temp(ROADS_DOMAIN, 'bench_grounding_domain.tsal'))
+    problem = TSALParser.parse_string(roads_problem(LOCATIONS))
+    report('roads {} locations'.format(LOCATIONS), domain, problem, repeat=5)
+    seconds = best_of(lambda: product_then_check(domain, problem), repeat=3)
+    print('  product then check {:8.2f} ms'.format(seconds * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+# Tracks the cold import time of tsal.interpreter, as reported by python -X importtime, and compares loading the
+# generated lexer/parser tables with rebuilding them from the grammar.
+#
+#     python benchmarks/bench_import.py [runs]
+
+import os
+import statistics
+import subprocess
+import sys
+
+from common import best_of
+
+MODULES = ('tsal.interpreter', 'tsal.translator.tsalparser', 'tsal.translator.parsetab', 'tsal.translator.lextab')
+
+
+def import_times():
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)  # measure with .pyc files, like an installed package
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import tsal.interpreter'],
+                            env=env, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|')
+        name = name.strip()
+        if name in MODULES:
+            times[name] = int(cumulative) / 1000
+    return times
+
+
+def main(runs=10):
+    import_times()  # warm up, writes the .pyc files
+    samples = [import_times() for _ in range(runs)]
+    print('cold import, median of {} runs'.format(runs))
+    for name in MODULES:
+        values = [s[name] for s in samples if name in s]
+        if values:
+            print('  {:<30} {:8.1f} ms'.format(name, statistics.median(values)))
+
+    from tsal.ply import lex, yacc
+    from tsal.translator import tsalparser
+    print('tables')
+    print('  {:<30} {:8.1f} ms'.format('lexer from lextab', 1000 * best_of(lambda: lex.lex(module=tsalparser, lextab='lextab'))))
+    print('  {:<30} {:8.1f} ms'.format('lexer rebuilt', 1000 * best_of(lambda: lex.lex(module=tsalparser))))
+    print('  {:<30} {:8.1f} ms'.format('parser from parsetab', 1000 * best_of(lambda: yacc.yacc(module=tsalparser, tabmodule='parsetab'))))
+    print('  {:<30} {:8.1f} ms'.format('parser rebuilt', 1000 * best_of(lambda: yacc.yacc(module=tsalparser))))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
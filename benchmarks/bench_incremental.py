@@ -0,0 +1,33 @@
+# Re-parses the monopoly domain after editing one action or event, in full and with IncrementalDomain.replace.
+
+from common import best_of, example
+from tsal.translator.incremental import IncrementalDomain, outline
+from tsal.translator.tsalparser import TSALParser
+
+
+def main():
+    with open(example('monopoly', 'domain.tsal'), 'rb') as file:
+        source = file.read()
+    print('outline of {} bytes: {:.2f} ms, {} elements'.format(len(source), best_of(lambda: outline(source)) * 1000,
+                                                                len(outline(source))))
+    incremental = IncrementalDomain(source)
+    for kind in ('action', 'event', 'fluent'):
+        element = [e for e in incremental.elements if e.kind == kind][0]
+        text = incremental.source[element.start:element.end]
+
+        def full():
+            edited = incremental.source[:element.start] + text + incremental.source[element.end:]
+            return TSALParser.parse_string(edited, start='domain')
+
+        def replace():
+            return incremental.replace(incremental.find(kind, element.name), text)
+
+        seconds_full = best_of(full, repeat=10)
+        seconds_replace = best_of(replace, repeat=10)
+        assert str(full()) == str(incremental.domain)
+        print('{:<8} {:<28} full {:8.2f} ms  replace {:6.2f} ms  {:6.1f}x'.format(
+            kind, element.name, seconds_full * 1000, seconds_replace * 1000, seconds_full / seconds_replace))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+# Continuous processes: a ring of fluents each relaxing towards the next one, integrated with Euler steps by a
+# Python loop updating one fluent at a time (a CompiledExpression per process) and by the ProcessIntegrator,
+# which updates them all per step, on one value vector and on a batch of states; then the time to locate the
+# crossing that enables an event.
+
+import numpy as np
+
+from common import best_of
+from tsal.simulator.evaluation import CompiledExpression
+from tsal.simulator.integrator import ProcessIntegrator
+from tsal.simulator.successor import SuccessorEngine
+from tsal.translator.tsalparser import TSALParser
+
+FLUENTS = 200
+STEPS = 200
+STATES = 1000
+
+DOMAIN = '''(define (domain RING)
+  (:requirements :typing)
+  (:types player)
+  (:predicates (alarm))
+  (:fluents (self) - player {fluents})
+  (:processes
+      {processes}
+  )
+  (:actions
+      (:action reset :parameters () :precondition (and (alarm)) :effect (and (not (alarm))))
+  )
+  (:events
+      (:event raise :parameters () :precondition (and (> (x0) 0.0001) (not (alarm))) :effect (and (alarm)))
+  )
+)'''
+
+PROBLEM = '''(define (problem RING-1) (:domain RING)
+  (:objects p1 - player)
+  (:init (= (self) p1) {init})
+  (:goal (or (and (= (self) p1) (alarm)))))'''
+
+
+def per_fluent(compiled, ids, values, dt, steps):
+    values = values.copy()
+    for _ in range(steps):
+        rates = [function(values) for function in compiled]
+        for index, rate in zip(ids, rates):
+            values[index] += dt * rate
+    return values
+
+
+def main():
+    names = ['x{}'.format(i) for i in range(FLUENTS)]
+    processes = ' '.join('(= {} (- (x{}) ?{}))'.format(name, (i + 1) % FLUENTS, name) for i, name in enumerate(names))
+    domain = TSALParser.parse_string(DOMAIN.format(fluents=' '.join('({})'.format(name) for name in names),
+                                                   processes=processes))
+    init = ' '.join('(= ({}) {})'.format(name, 1 if i == FLUENTS // 2 else 0) for i, name in enumerate(names))
+    problem = TSALParser.parse_string(PROBLEM.format(init=init))
+    engine = SuccessorEngine(domain, problem, domain.operators + domain.events)
+    integrator = ProcessIntegrator(domain, engine.fluents)
+    state, values = engine.initial()
+    values = engine.fluents.resize(values)
+    dt = 0.01
+
+    compiled = [CompiledExpression(expression, engine.fluents) for expression in integrator.rates.expressions]
+    ids = integrator.ids
+    loop = best_of(lambda: per_fluent(compiled, ids, values, dt, STEPS), repeat=3)
+    euler = best_of(lambda: integrator.integrate(values, dt * STEPS, dt=dt, method='euler'), repeat=3)
+    rk4 = best_of(lambda: integrator.integrate(values, dt * STEPS, dt=dt, method='rk4'), repeat=3)
+    difference = np.max(np.abs(per_fluent(compiled, ids, values, dt, STEPS)[ids] -
+                               integrator.integrate(values, dt * STEPS, dt=dt, method='euler')[1][ids]))
+    print('{} processes, {} steps: per fluent loop {:8.2f} ms  euler {:8.2f} ms  rk4 {:8.2f} ms  (difference {:.1e})'
+          .format(len(integrator.processes), STEPS, loop * 1000, euler * 1000, rk4 * 1000, difference))
+
+    batch = np.repeat(values[None, :], STATES, axis=0)
+    batch[:, ids[0]] = np.linspace(0, 1, STATES)
+    seconds = best_of(lambda: integrator.integrate(batch, dt * STEPS, dt=dt, method='rk4'), repeat=3)
+    print('  batch of {} states, rk4: {:8.2f} ms, {:8.2f} us per state'.format(
+        STATES, seconds * 1000, seconds / STATES * 1e6))
+
+    watch = lambda vector: len(engine.applicable(state, vector))  # noqa: E731
+    elapsed, found, crossed = integrator.integrate(values, 1000.0, dt=0.1, watch=watch)
+    seconds = best_of(lambda: integrator.integrate(values, 1000.0, dt=0.1, watch=watch), repeat=3)
+    print('  event enabled at t={:.6f} (x0={:.6f}, crossed {}) found in {:8.2f} ms'.format(
+        elapsed, found[engine.fluents.find((engine.encoding.symbol_id('x0'),))], crossed, seconds * 1000))
+
+
+if __name__ == '__main__':
+    main()
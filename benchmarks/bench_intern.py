@@ -0,0 +1,51 @@
+# Set operations over ground atoms, the way a simulator keeps its state: the initial state of the monopoly
+# problem (its :init repeated) is put into a set, then the atoms of a second parse are looked up in it. Runs
+# on the atoms as parsed and on atoms interned in one SymbolTable, where equal atoms are the same object.
+
+import time
+
+from common import best_of, example, scaled_problem
+from tsal.translator.tsalparser import TSALParser
+
+FACTOR = 20
+
+
+def state_ops(state_atoms, query_atoms):
+    state = set(state_atoms)
+    found = 0
+    for atom in query_atoms:
+        if atom in state:
+            found += 1
+    return found
+
+
+def main():
+    data = TSALParser.clean_input(scaled_problem(example('monopoly', 'problem.tsal'), FACTOR))
+    state_atoms = TSALParser().parse_input(data).init
+    query_atoms = TSALParser().parse_input(data).init
+    print('monopoly/problem.tsal x{}: {} ground atoms'.format(FACTOR, len(state_atoms)))
+
+    first = time.perf_counter()
+    found = state_ops(state_atoms, query_atoms)
+    first = time.perf_counter() - first
+    assert found == len(query_atoms)
+    seconds = best_of(lambda: state_ops(state_atoms, query_atoms), repeat=10)
+    print('  parsed     first {:8.2f} ms  then {:8.2f} ms'.format(first * 1000, seconds * 1000))
+
+    try:
+        from tsal.translator.symbols import SymbolTable
+    except ImportError:
+        return
+    symbols = SymbolTable()
+    start = time.perf_counter()
+    state_atoms = symbols.intern(state_atoms)
+    query_atoms = symbols.intern(query_atoms)
+    interning = time.perf_counter() - start
+    assert found == state_ops(state_atoms, query_atoms)
+    seconds = best_of(lambda: state_ops(state_atoms, query_atoms), repeat=10)
+    print('  interned   intern {:7.2f} ms  then {:8.2f} ms  ({} distinct atoms and terms)'.format(
+        interning * 1000, seconds * 1000, len(symbols)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+# Compares the throughput of TSALLexer and the PLY lexer in tokens per second, alone and inside a full parse.
+# The rounds of the two lexers alternate, so a drift of the machine speed affects both. That both produce the same
+# token stream is checked by tests/test_lexer.py.
+
+import time
+
+from common import example, scaled_problem
+from tsal.translator import tsalparser
+from tsal.translator.tsalparser import TSALLexer, TSALParser
+
+
+def token_stream(lexer, data):
+    lexer.lineno = 1
+    lexer.input(data)
+    return [(token.type, token.value, token.lineno, token.lexpos) for token in lexer]
+
+
+def alternating(funcs, repeat):
+    # the fastest time of each function, their runs interleaved
+    best = [None] * len(funcs)
+    for _ in range(repeat):
+        for position, func in enumerate(funcs):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            if best[position] is None or elapsed < best[position]:
+                best[position] = elapsed
+    return best
+
+
+def main():
+    inputs = [('monopoly/domain.tsal', TSALParser.read_input(example('monopoly', 'domain.tsal'))),
+              ('monopoly/problem.tsal x100', TSALParser.clean_input(scaled_problem(example('monopoly', 'problem.tsal'), 100)))]
+    for name, data in inputs:
+        count = len(token_stream(TSALLexer(), data))
+        print('{} ({} tokens)'.format(name, count))
+        lex = alternating([lambda: token_stream(tsalparser._lexer.clone(), data),
+                           lambda: token_stream(TSALLexer(), data)], repeat=10)
+        parsers = [TSALParser(lexer='ply'), TSALParser(lexer='fast')]
+        parse = alternating([lambda parser=parser: parser.parse_input(data) for parser in parsers], repeat=10)
+        for kind, (ply, fast) in (('lex', lex), ('parse', parse)):
+            for label, seconds in (('ply', ply), ('fast', fast)):
+                print('  {:<5} {:<5} {:9.2f} ms {:10.0f} tokens/s'.format(kind, label, seconds * 1000, count / seconds))
+            print('  {:<5} speedup {:.2f}x'.format(kind, ply / fast))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+# Parse time with position tracking off (the default), and of a located parser attaching spans, on the
+# monopoly domain and a scaled monopoly problem. Checks that both give the same result and that every span
+# points at the text of its object.
+
+from common import best_of, example, scaled_problem
+from tsal.translator.tsalparser import TSALParser
+
+
+def check_spans(source, domain):
+    objects = domain.operators + domain.events + domain.predicates
+    for obj in objects:
+        span = obj.span
+        assert span is not None, obj
+        assert source[span.offset:span.end].startswith(b'(') and source[span.end - 1:span.end] == b')', obj
+        assert source.count(b'\n', 0, span.offset) + 1 == span.line, obj
+        assert span.offset - source.rfind(b'\n', 0, span.offset) == span.column, obj
+    return len(objects)
+
+
+def main():
+    with open(example('monopoly', 'domain.tsal'), 'rb') as file:
+        domain_source = file.read()
+    problem_source = scaled_problem(example('monopoly', 'problem.tsal'), 50).encode('utf-8')
+    for name, source in (('monopoly/domain.tsal', domain_source), ('monopoly/problem.tsal x50', problem_source)):
+        data = TSALParser.clean_input(source)
+        located_data = TSALParser.clean_input(source, located=True)
+        fast, located = TSALParser(), TSALParser(located=True)
+        assert str(fast.parse_input(data)) == str(located.parse_input(located_data))
+        print(name)
+        if name.endswith('domain.tsal'):
+            print('  {} spans checked'.format(check_spans(source, located.parse_input(located_data))))
+        for label, parser, text in (('fast', fast, data), ('located', located, located_data)):
+            seconds = best_of(lambda: parser.parse_input(text), repeat=10)
+            print('  {:<8} {:8.2f} ms'.format(label, seconds * 1000))
+
+
+if __name__ == '__main__':
+    main()
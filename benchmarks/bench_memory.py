@@ -0,0 +1,48 @@
+# Memory held by a parsed problem per ground atom of its initial state, measured with tracemalloc on the
+# monopoly problem with its :init section repeated, plus the size of single Term, Predicate, Literal,
+# Fluent and Expression instances.
+
+import gc
+import sys
+import tracemalloc
+
+from common import example, scaled_problem
+from tsal.translator.expression import Expression
+from tsal.translator.fluent import Fluent
+from tsal.translator.literal import Literal
+from tsal.translator.predicate import Predicate
+from tsal.translator.term import Term
+from tsal.translator.tsalparser import TSALParser
+
+FACTOR = 200
+
+
+def instance_size(obj):
+    size = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def main():
+    data = TSALParser.clean_input(scaled_problem(example('monopoly', 'problem.tsal'), FACTOR))
+    parser = TSALParser()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    problem = parser.parse_input(data)
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    atoms = len(problem.init)
+    print('monopoly/problem.tsal x{}: {} ground atoms, {:.1f} MiB, {:.0f} bytes per ground atom'.format(
+        FACTOR, atoms, held / (1 << 20), held / atoms))
+
+    term = Term.constant('p1')
+    predicate = Predicate('owns', [term])
+    for obj in (term, predicate, Literal.positive(predicate), Fluent('money', [term]), Expression(value=1)):
+        print('  {:<11} {:4d} bytes'.format(type(obj).__name__, instance_size(obj)))
+
+
+if __name__ == '__main__':
+    main()
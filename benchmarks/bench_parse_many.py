@@ -0,0 +1,32 @@
+# Parses every example file COPIES times, one after the other and through TSALParser.parse_many with a
+# thread pool and a process pool, and checks that all three return the same results in the same order.
+
+import glob
+import os
+import sys
+
+from common import EXAMPLES, best_of
+from tsal.translator.tsalparser import TSALParser
+
+COPIES = 20
+# the test domain has a known syntax error and would only add noise
+SKIP = ('test',)
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count()
+    files = [f for f in sorted(glob.glob(os.path.join(EXAMPLES, '*', '*.tsal')))
+             if os.path.basename(os.path.dirname(f)) not in SKIP] * COPIES
+    expected = [str(result) for result in map(TSALParser.parse, files)]
+    print('{} files, {} workers'.format(len(files), workers))
+    runs = [('sequential', lambda: [TSALParser.parse(f) for f in files]),
+            ('threads', lambda: TSALParser.parse_many(files, workers=workers)),
+            ('processes', lambda: TSALParser.parse_many(files, workers=workers, processes=True))]
+    for name, run in runs:
+        assert [str(result) for result in run()] == expected, name
+        seconds = best_of(run, repeat=3)
+        print('  {:<10} {:8.3f} s  {:8.1f} files/s'.format(name, seconds, len(files) / seconds))
+
+
+if __name__ == '__main__':
+    main()
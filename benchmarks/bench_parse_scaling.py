@@ -0,0 +1,35 @@
+# Parses blocksworld problems with 1k to 1M :init facts to check that parse time grows linearly.
+#
+#     python benchmarks/bench_parse_scaling.py [max_facts]
+
+import os
+import sys
+
+from common import best_of, example, problem_with_init, write_temp
+from tsal.translator.tsalparser import TSALParser
+
+BLOCKS = 'd a h g b j e i f c'.split()
+
+
+def facts(n):
+    lst = ['(= (self) p1)']
+    for i in range(n - 1):
+        lst.append('(on {} {})'.format(BLOCKS[i % 10], BLOCKS[(i // 10) % 10]))
+    return lst
+
+
+def main(max_facts=10 ** 6):
+    n = 1000
+    print('{:>9} {:>10} {:>12}'.format('facts', 'seconds', 'us / fact'))
+    while n <= max_facts:
+        path = write_temp(problem_with_init(example('blocksworld', 'problem.tsal'), facts(n)), 'blocks_init_{}.tsal'.format(n))
+        try:
+            seconds = best_of(lambda: TSALParser.parse(path), repeat=3 if n < 10 ** 5 else 1)
+        finally:
+            os.remove(path)
+        print('{:>9} {:>10.3f} {:>12.2f}'.format(n, seconds, seconds / n * 1e6))
+        n *= 10
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
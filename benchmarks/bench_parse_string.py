@@ -0,0 +1,41 @@
+# Parses generated sources the way a generator pipeline does: by writing each one to a temporary file and
+# parsing the path, against handing the text straight to TSALParser.parse_string / parse_stream.
+
+import io
+import os
+import tempfile
+
+from common import best_of, example
+from tsal.translator.tsalparser import TSALParser
+
+
+def via_temp_file(text):
+    fd, path = tempfile.mkstemp(suffix='.tsal')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as file:
+            file.write(text)
+        return TSALParser.parse(path)
+    finally:
+        os.remove(path)
+
+
+def main():
+    for name in (('blocksworld', 'domain.tsal'), ('blocksworld', 'problem.tsal'), ('viz_doom', 'domain.tsal'),
+                 ('monopoly', 'domain.tsal')):
+        with open(example(*name), encoding='utf-8') as file:
+            text = file.read()
+        data = text.encode('utf-8')
+        expected = str(via_temp_file(text))
+        runs = [('temp file', lambda: via_temp_file(text)),
+                ('string', lambda: TSALParser.parse_string(text)),
+                ('bytes', lambda: TSALParser.parse_string(memoryview(data))),
+                ('stream', lambda: TSALParser.parse_stream(io.BytesIO(data)))]
+        print('/'.join(name))
+        for label, run in runs:
+            assert str(run()) == expected, label
+            seconds = best_of(run, repeat=20)
+            print('  {:<10} {:8.3f} ms'.format(label, seconds * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,26 @@
+# Compares the input readers of TSALParser on the monopoly problem scaled up 1000x.
+
+import os
+
+from common import best_of, example, scaled_problem, write_temp
+from tsal.translator.tsalparser import TSALParser
+
+FACTOR = 1000
+
+
+def main():
+    path = write_temp(scaled_problem(example('monopoly', 'problem.tsal'), FACTOR), 'monopoly_problem_x{}.tsal'.format(FACTOR))
+    size = os.path.getsize(path) / 2 ** 20
+    try:
+        expected = TSALParser.read_input(path, 'lines')
+        print('monopoly problem x{} ({:.1f} MiB)'.format(FACTOR, size))
+        for reader in ('lines', 'chunked', 'mmap'):
+            assert TSALParser.read_input(path, reader) == expected, reader
+            seconds = best_of(lambda: TSALParser.read_input(path, reader), repeat=3)
+            print('  {:<8} {:8.3f} s  {:8.1f} MiB/s'.format(reader, seconds, size / seconds))
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+# Stochastic events: machines that fail and are repaired at exponentially distributed times, simulated by the
+# EventScheduler (only the ground events an occurrence touches tested again) and by a rescan that finds every
+# enabled event and draws all their times again after each occurrence, in events per second.
+
+import math
+import time
+
+import numpy as np
+
+from tsal.simulator.scheduler import EventScheduler
+from tsal.simulator.successor import SuccessorEngine
+from tsal.translator.tsalparser import TSALParser
+
+MACHINES = 2000
+EVENTS = 20000
+
+DOMAIN = '''(define (domain MACHINES)
+  (:requirements :typing)
+  (:types machine player)
+  (:predicates (working ?m) (broken ?m))
+  (:fluents (self) - player (failures))
+  (:actions
+      (:action repair :parameters (?m - machine) :precondition (and (broken ?m))
+             :effect (and (working ?m) (not (broken ?m))))
+  )
+  (:events
+      (:event fail :parameters (?m - machine) :precondition (and (working ?m))
+             :interarrival (exponential mean 50.0)
+             :effect (and (broken ?m) (not (working ?m)) (+ (failures) 1)))
+      (:event fix :parameters (?m - machine) :precondition (and (broken ?m))
+             :interarrival (exponential mean 5.0)
+             :effect (and (working ?m) (not (broken ?m))))
+  )
+)'''
+
+PROBLEM = '''(define (problem MACHINES-1) (:domain MACHINES)
+  (:objects {} - machine p1 - player)
+  (:init (= (self) p1) (= (failures) 0) {})
+  (:goal (or (and (= (self) p1) (working m0)))))'''
+
+
+def rescan(engine, events, seed=0):
+    # the race of every enabled event, all redrawn after each occurrence
+    rng = np.random.default_rng(seed)
+    scales = {ground.operator.name: float(ground.operator.distribution.value) for ground in engine.grounds}
+    state, values = engine.initial()
+    now = 0.0
+    for _ in range(events):
+        enabled = engine.applicable(state, values)
+        times = rng.standard_exponential(len(enabled)) * np.array([scales[g.operator.name] for g, _ in enabled])
+        first = int(np.argmin(times))
+        now += times[first]
+        ground, binding = enabled[first]
+        state, values = engine.apply(state, values, ground, binding)
+    return now
+
+
+def main():
+    machines = ['m{}'.format(i) for i in range(MACHINES)]
+    domain = TSALParser.parse_string(DOMAIN)
+    problem = TSALParser.parse_string(PROBLEM.format(' '.join(machines),
+                                                     ' '.join('(working {})'.format(m) for m in machines)))
+    engine = SuccessorEngine(domain, problem, domain.events)
+
+    start = time.perf_counter()
+    scheduler = EventScheduler(engine, seed=0)
+    setup = time.perf_counter() - start
+    start = time.perf_counter()
+    trace = scheduler.run(math.inf, EVENTS)
+    seconds = time.perf_counter() - start
+    broken = sum(1 for ground, _ in engine.applicable(scheduler.state, scheduler.values)
+                 if ground.operator.name == 'fix')
+    print('{} ground events, {} enabled: queued in {:8.2f} ms, {} events to t={:.1f} ({} broken)'.format(
+        len(scheduler.events), MACHINES, setup * 1000, len(trace), scheduler.time, broken))
+    print('  scheduler {:10.0f} events/s'.format(len(trace) / seconds))
+
+    events = EVENTS // 20
+    start = time.perf_counter()
+    rescan(engine, events)
+    seconds = time.perf_counter() - start
+    print('  rescan    {:10.0f} events/s'.format(events / seconds))
+
+
+if __name__ == '__main__':
+    main()
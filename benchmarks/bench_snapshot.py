@@ -0,0 +1,35 @@
+# Compares a cold parse against a warm load from the snapshot cache for every tsal file in examples/.
+
+import glob
+import os
+import shutil
+import tempfile
+
+from common import EXAMPLES, best_of
+from tsal.translator.snapshot import SnapshotCache
+from tsal.translator.tsalparser import TSALParser
+
+
+def main():
+    cache_dir = tempfile.mkdtemp(prefix='tsal-snapshots-')
+    try:
+        cache = SnapshotCache(cache_dir)
+        print('{:<40} {:>10} {:>10} {:>8} {:>10}'.format('file', 'parse ms', 'load ms', 'speedup', 'snap KiB'))
+        for path in sorted(glob.glob(os.path.join(EXAMPLES, '*', '*.tsal'))):
+            name = os.path.relpath(path, EXAMPLES)
+            parsed = TSALParser.parse(path)
+            if parsed is None:
+                print('{:<40} syntax error, not cached'.format(name))
+                continue
+            cache.store(path, parsed)
+            assert str(cache.load(path)) == str(parsed), name
+            cold = best_of(lambda: TSALParser.parse(path))
+            warm = best_of(lambda: cache.load(path))
+            size = os.path.getsize(cache.entry_path(path)) / 1024
+            print('{:<40} {:10.2f} {:10.2f} {:7.1f}x {:10.1f}'.format(name, cold * 1000, warm * 1000, cold / warm, size))
+    finally:
+        shutil.rmtree(cache_dir)
+
+
+if __name__ == '__main__':
+    main()
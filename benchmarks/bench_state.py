@@ -0,0 +1,58 @@
+# Ground predicate states on blocksworld with many blocks in one tower: precondition checks as `in` scans of
+# the init list (what consumers did), as lookups in a set of atom codes and as bit tests of a State, and
+# applying the effects of unstack to each representation.
+
+from common import best_of, example, problem_with_init
+from tsal.simulator.state import AtomIndex
+from tsal.translator.predicate import Predicate
+from tsal.translator.term import Term
+from tsal.translator.tsalparser import TSALParser
+
+BLOCKS = 300
+
+
+def atom(name, *args):
+    return Predicate(name, [Term.constant(arg) for arg in args])
+
+
+def main():
+    blocks = ['b{}'.format(i) for i in range(BLOCKS)]
+    facts = ['(ON {} {})'.format(top, below) for top, below in zip(blocks, blocks[1:])]
+    facts += ['(ONTABLE {})'.format(blocks[-1]), '(CLEAR {})'.format(blocks[0]), '(HANDEMPTY)', '(= (self) p1)']
+    text = problem_with_init(example('blocksworld', 'problem.tsal'), facts)
+    domain = TSALParser.parse(example('blocksworld', 'domain.tsal'))
+    problem = TSALParser.parse_string(text.replace('D A H G B J E I F C - block', ' '.join(blocks) + ' - block'))
+    index = AtomIndex(problem.encoding(domain), domain.analysis)
+    state = index.initial_state(problem)
+
+    queries = [atom('on', top, below) for top, below in zip(blocks, blocks[1:])] + [atom('clear', b) for b in blocks]
+    codes = [index.code(query) for query in queries]
+    bits = [index.bit(code) for code in codes]
+    init = list(problem.init)
+    code_set = frozenset(state)
+    scan = best_of(lambda: sum(1 for query in queries if query in init), repeat=3)
+    lookup = best_of(lambda: sum(1 for code in codes if code in code_set), repeat=20)
+    held = state.bits
+    test = best_of(lambda: sum(1 for bit in bits if held >> bit & 1), repeat=20)
+    print('blocksworld {} blocks: {} atoms, {} checks'.format(BLOCKS, len(state), len(queries)))
+    print('  list scan {:9.3f} ms  code set {:7.3f} ms  bit test {:7.3f} ms'.format(
+        scan * 1000, lookup * 1000, test * 1000))
+
+    adds = [atom('holding', blocks[0]), atom('clear', blocks[1])]
+    dels = [atom('clear', blocks[0]), atom('handempty'), atom('on', blocks[0], blocks[1])]
+    add_mask, del_mask = index.mask(adds), index.mask(dels)
+    add_codes, del_codes = frozenset(index.code(a) for a in adds), frozenset(index.code(a) for a in dels)
+
+    def list_successor():
+        successor = [fact for fact in init if fact not in dels]
+        return successor + adds
+
+    listed = best_of(lambda: [list_successor() for _ in range(100)], repeat=3)
+    setted = best_of(lambda: [(code_set - del_codes) | add_codes for _ in range(100)], repeat=10)
+    applied = best_of(lambda: [state.apply(add_mask, del_mask) for _ in range(100)], repeat=10)
+    print('  100 successors: list {:9.3f} ms  code set {:7.3f} ms  State.apply {:7.3f} ms'.format(
+        listed * 1000, setted * 1000, applied * 1000))
+
+
+if __name__ == '__main__':
+    main()
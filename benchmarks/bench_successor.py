@@ -0,0 +1,63 @@
+# Successor states on blocksworld: a depth first expansion of the state space (applicable groundings found by
+# the engine, one transition per outcome) and the rate of apply alone on the (state, grounding) pairs met,
+# in transitions per second; then the applicable actions and events of the initial monopoly state.
+# The target is about a million transitions per second, which is not met: expansion runs at roughly 240k/s and
+# apply alone at roughly 500k/s, about 4x and 2x short. Expansion time splits between the generator walk and
+# building the successor states, both pure Python.
+
+import time
+
+from common import best_of, example
+from tsal.simulator.successor import SuccessorEngine
+from tsal.translator.tsalparser import TSALParser
+
+STATES = 100000
+
+
+def expand(engine, limit):
+    state, values = engine.initial()
+    seen = {state}
+    frontier = [state]
+    transitions = 0
+    while frontier and len(seen) < limit:
+        state = frontier.pop()
+        for _, _, _, successor, _ in engine.successors(state, values):
+            transitions += 1
+            if successor not in seen:
+                seen.add(successor)
+                frontier.append(successor)
+    return seen, transitions
+
+
+def main():
+    domain = TSALParser.parse(example('blocksworld', 'domain.tsal'))
+    problem = TSALParser.parse(example('blocksworld', 'problem.tsal'))
+    engine = SuccessorEngine(domain, problem)
+    _, values = engine.initial()
+
+    start = time.perf_counter()
+    seen, transitions = expand(engine, STATES)
+    seconds = time.perf_counter() - start
+    print('blocksworld: {} groundings, {} states, {} transitions  expansion {:10.0f} transitions/s'.format(
+        len(engine.grounds), len(seen), transitions, transitions / seconds))
+
+    pairs = [(state, ground, binding) for state in list(seen)[:20000]
+             for ground, binding in engine.applicable(state, values)]
+    apply = engine.apply
+    seconds = best_of(lambda: [apply(state, values, ground, binding) for state, ground, binding in pairs], repeat=5)
+    print('  apply {:10.0f} transitions/s'.format(len(pairs) / seconds))
+
+    domain = TSALParser.parse(example('monopoly', 'domain.tsal'))
+    problem = TSALParser.parse(example('monopoly', 'problem.tsal'))
+    for label, operators in (('actions', domain.operators), ('events', domain.events)):
+        seconds = best_of(lambda: SuccessorEngine(domain, problem, operators), repeat=3)
+        engine = SuccessorEngine(domain, problem, operators)
+        state, values = engine.initial()
+        found = engine.applicable(state, values)
+        lookup = best_of(lambda: engine.applicable(state, values), repeat=20)
+        print('monopoly {}: {} groundings built in {:8.2f} ms, {} applicable found in {:8.3f} ms'.format(
+            label, len(engine.grounds), seconds * 1000, len(found), lookup * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+# Type queries of parameter grounding: the objects of every parameter type of the monopoly actions, by
+# walking the types dict against Problem.objects_by_type, and Domain construction on a generated hierarchy
+# of 2000 types (litypes used to be built in O(T^2)).
+
+from common import best_of, example
+from tsal.translator.domain import Domain
+from tsal.translator.tsalparser import TSALParser
+
+
+def walked_objects(types, objects, name):
+    # what callers did without an index: collect the subtypes by walking the types dict
+    names = []
+    stack, seen = [name], {name}
+    while stack:
+        current = stack.pop()
+        names.extend(objects.get(current, ()))
+        for child in types.get(current, ()):
+            if child not in seen:
+                seen.add(child)
+                stack.append(child)
+    return names
+
+
+def main():
+    domain = TSALParser.parse(example('monopoly', 'domain.tsal'))
+    problem = TSALParser.parse(example('monopoly', 'problem.tsal'))
+    queries = [param.type for operator in domain.operators + domain.events for param in operator.params]
+    walked = best_of(lambda: [walked_objects(domain.types, problem.objects, name) for name in queries], repeat=20)
+    problem.objects_by_type(domain)
+    indexed = best_of(lambda: [problem.objects_by_type(domain).get(name, ()) for name in queries], repeat=20)
+    print('monopoly: {} parameter type queries  walk {:8.3f} ms  index {:8.3f} ms'.format(
+        len(queries), walked * 1000, indexed * 1000))
+
+    types = {'t{}'.format(i): ['t{}'.format(j) for j in range(2 * i + 1, min(2 * i + 3, 2000))] for i in range(1000)}
+    seconds = best_of(lambda: Domain('generated', [], dict(types), {}, [], [], [], [], [], [], []), repeat=5)
+    lattice = best_of(lambda: Domain('generated', [], dict(types), {}, [], [], [], [], [], [], []).type_lattice,
+                      repeat=5)
+    print('2000 types: Domain() {:8.2f} ms  with type_lattice {:8.2f} ms'.format(seconds * 1000, lattice * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+# Helpers shared by the benchmark scripts in this directory.
+#
+# The scripts are meant to be run from the repository root against an installed (pip install -e .) tsal, e.g.
+#     python benchmarks/bench_reader.py
+
+import os
+import time
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'examples')
+
+
+def example(*path):
+    return os.path.join(EXAMPLES, *path)
+
+
+def best_of(func, repeat=5):
+    """
+    Run func repeat times and return the fastest wall clock time in seconds
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def section_bounds(text, keyword):
+    """
+    Return the (start, end) offsets of the parenthesized section that starts with keyword, e.g. '(:init'
+    """
+    start = text.index(keyword)
+    depth = 0
+    for i in range(start, len(text)):
+        if text[i] == '(':
+            depth += 1
+        elif text[i] == ')':
+            depth -= 1
+            if depth == 0:
+                return start, i + 1
+    raise ValueError('unbalanced section {}'.format(keyword))
+
+
+def scaled_problem(path, factor):
+    """
+    Return the text of the problem file at path with the body of its :init section repeated factor times
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    start, end = section_bounds(text, '(:init')
+    body = text[start + len('(:init'):end - 1]
+    return text[:start] + '(:init' + body * factor + ')' + text[end:]
+
+
+def write_temp(text, name):
+    """
+    Write text to a file in the system temp directory and return its path
+    """
+    import tempfile
+    path = os.path.join(tempfile.gettempdir(), name)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    return path
+
+
+def problem_with_init(path, facts):
+    """
+    Return the text of the problem file at path with its :init section replaced by the given list of fact strings
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    start, end = section_bounds(text, '(:init')
+    return text[:start] + '(:init\n' + '\n'.join(facts) + '\n)' + text[end:]
@@ -1,7 +1,8 @@
+import functools
 import sys
 import os
 from tsal.translator import tsalparser
-from tsal.translator.pddlToTsal import pddl_To_Tsal
+from tsal.translator.pddlToTsal import pddl_Text_To_Tsal
 
 
 class Interpreter:
@@ -9,18 +10,34 @@ class Interpreter:
     problem = None
     domain_file = None
     problem_file = None
+    domain_text = None
+    problem_text = None
+    cache = None
 
-    def __init__(self, domain_file=None, problem_file=None):
-        if domain_file:
-            domain_file_type = domain_file[-4:].lower()
-            if domain_file_type == "pddl":
-                domain_file = pddl_To_Tsal(domain_file, "dom")
-            self.domain_file = domain_file
-        if problem_file:
-            problem_file_type = problem_file[-4:].lower()
-            if problem_file_type == "pddl":
-                problem_file = pddl_To_Tsal(problem_file, "prob")
-            self.problem_file = problem_file
+    def __init__(self, domain_file=None, problem_file=None, cache_dir=None, cache_size=None,
+                 domain_text=None, problem_text=None):
+        """
+
+        :param domain_file: tsal or pddl domain file, or an open file object holding tsal source
+        :param problem_file: tsal or pddl problem file, or an open file object holding tsal source
+        :param cache_dir: directory of the parse snapshot cache, parsed files are not cached when None
+        :param cache_size: maximum size in bytes of the snapshot cache, SnapshotCache.default_max_bytes when None
+        :param domain_text: tsal domain source (str or utf-8 bytes) to parse instead of a domain file
+        :param problem_text: tsal problem source (str or utf-8 bytes) to parse instead of a problem file
+        """
+        if cache_dir:
+            from tsal.translator.snapshot import SnapshotCache  # only imported when caching
+            self.cache = SnapshotCache(cache_dir, cache_size or SnapshotCache.default_max_bytes)
+        if hasattr(domain_file, "read"):
+            domain_text = domain_file.read()
+            domain_file = None
+        if hasattr(problem_file, "read"):
+            problem_text = problem_file.read()
+            problem_file = None
+        self.domain_file = domain_file
+        self.problem_file = problem_file
+        self.domain_text = domain_text
+        self.problem_text = problem_text
 
         self.domain = None
         self.problem = None
@@ -30,9 +47,28 @@ class Interpreter:
 
     def parse(self):
         if self.domain_file:
-            self.domain = tsalparser.TSALParser.parse(self.domain_file)
+            self.domain = self.__parse_file(self.domain_file, "dom")
+        elif self.domain_text is not None:
+            self.domain = tsalparser.TSALParser.parse_string(self.domain_text)
         if self.problem_file:
-            self.problem = tsalparser.TSALParser.parse(self.problem_file)
+            self.problem = self.__parse_file(self.problem_file, "prob")
+        elif self.problem_text is not None:
+            self.problem = tsalparser.TSALParser.parse_string(self.problem_text)
+
+    def __parse_file(self, filename, typ):
+        if filename[-4:].lower() == "pddl":
+            parse = functools.partial(self.__parse_pddl, typ=typ)
+        else:
+            parse = tsalparser.TSALParser.parse
+        if self.cache:
+            return self.cache.parse(filename, parse)
+        return parse(filename)
+
+    @staticmethod
+    def __parse_pddl(filename, typ):
+        # translated in memory, nothing is written next to the pddl file
+        with open(filename, "r") as f:
+            return tsalparser.TSALParser.parse_string(pddl_Text_To_Tsal(f.read(), typ))
 
     def print_domain(self):
         print(self.domain)
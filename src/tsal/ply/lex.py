@@ -38,11 +38,14 @@ import sys
 import types
 import copy
 import os
-import inspect
+import importlib
 
 # This tuple contains acceptable string types
 StringTypes = (str, bytes)
 
+# Version of the table files written by Lexer.writetab() and Lexer.pickletab()
+__tabversion__ = '3.10'
+
 # This regular expression is used to match valid token names
 _is_identifier = re.compile(r'^[a-zA-Z0-9_]+$')
 
@@ -146,6 +149,101 @@ class Lexer:
             c.lexmodule = object
         return c
 
+    # ------------------------------------------------------------
+    # tabdata() - The lexer tables with functions replaced by their names
+    # ------------------------------------------------------------
+    def tabdata(self, signature=''):
+        tabre = {}
+        for statename, lre in self.lexstatere.items():
+            titem = []
+            for (pat, func), retext, renames in zip(lre, self.lexstateretext[statename], self.lexstaterenames[statename]):
+                titem.append((retext, _funcs_to_names(func, renames)))
+            tabre[statename] = titem
+
+        return {
+            '_tabversion': __tabversion__,
+            '_lexsignature': signature,
+            '_lextokens': set(self.lextokens),
+            '_lexreflags': int(self.lexreflags),
+            '_lexliterals': self.lexliterals,
+            '_lexstateinfo': self.lexstateinfo,
+            '_lexstatere': tabre,
+            '_lexstateignore': self.lexstateignore,
+            '_lexstateerrorf': {k: ef.__name__ if ef else None for k, ef in self.lexstateerrorf.items()},
+            '_lexstateeoff': {k: ef.__name__ if ef else None for k, ef in self.lexstateeoff.items()},
+        }
+
+    # ------------------------------------------------------------
+    # writetab() - Write lexer information to a table file
+    # ------------------------------------------------------------
+    def writetab(self, lextab, outputdir='', signature=''):
+        basetabmodule = lextab.split('.')[-1]
+        filename = os.path.join(outputdir, basetabmodule) + '.py'
+        with open(filename, 'w') as tf:
+            tf.write(f"# {basetabmodule}.py. This file automatically created by PLY. Don't edit!\n")
+            for key, value in self.tabdata(signature).items():
+                if isinstance(value, set):
+                    value = sorted(value)
+                    tf.write(f'{key:<15} = set({value!r})\n')
+                else:
+                    tf.write(f'{key:<15} = {value!r}\n')
+
+    # ------------------------------------------------------------
+    # pickletab() - Write lexer information to a pickle file
+    # ------------------------------------------------------------
+    def pickletab(self, filename, signature=''):
+        import pickle
+        with open(filename, 'wb') as tf:
+            pickle.dump(self.tabdata(signature), tf, pickle.HIGHEST_PROTOCOL)
+
+    # ------------------------------------------------------------
+    # readtab() - Read lexer information from a table module, module
+    # name or pickle file.  Returns the signature stored with it.
+    # ------------------------------------------------------------
+    def readtab(self, tabfile, fdict):
+        if isinstance(tabfile, types.ModuleType):
+            lextab = vars(tabfile)
+        elif tabfile.endswith('.pickle'):
+            import pickle
+            with open(tabfile, 'rb') as tf:
+                lextab = pickle.load(tf)
+        else:
+            __import__(tabfile)
+            lextab = vars(sys.modules[tabfile])
+
+        if lextab.get('_tabversion', '0.0') != __tabversion__:
+            raise ImportError('Inconsistent PLY version')
+
+        self.lextokens      = lextab['_lextokens']
+        self.lexreflags     = lextab['_lexreflags']
+        self.lexliterals    = lextab['_lexliterals']
+        self.lextokens_all  = self.lextokens | set(self.lexliterals)
+        self.lexstateinfo   = lextab['_lexstateinfo']
+        self.lexstateignore = lextab['_lexstateignore']
+        self.lexstatere     = {}
+        self.lexstateretext = {}
+        self.lexstaterenames = {}
+        for statename, lre in lextab['_lexstatere'].items():
+            titem = []
+            txtitem = []
+            for pat, func_name in lre:
+                titem.append((re.compile(pat, lextab['_lexreflags']), _names_to_funcs(func_name, fdict)))
+                txtitem.append(pat)
+            self.lexstatere[statename] = titem
+            self.lexstateretext[statename] = txtitem
+            self.lexstaterenames[statename] = [[n[0] if n else None for n in item[1]] for item in lre]
+
+        self.lexstateerrorf = {}
+        for statename, ef in lextab['_lexstateerrorf'].items():
+            self.lexstateerrorf[statename] = fdict[ef] if ef else None
+
+        self.lexstateeoff = {}
+        for statename, ef in lextab['_lexstateeoff'].items():
+            self.lexstateeoff[statename] = fdict[ef] if ef else None
+
+        self.begin('INITIAL')
+        return lextab.get('_lexsignature')
+
     # ------------------------------------------------------------
     # input() - Push a new string into the lexer
     # ------------------------------------------------------------
@@ -329,6 +427,36 @@ class Lexer:
 def _get_regex(func):
     return getattr(func, 'regex', func.__doc__)
 
+# -----------------------------------------------------------------------------
+# _funcs_to_names()
+#
+# Given a list of regular expression functions, this converts it to a list
+# suitable for output to a table file
+# -----------------------------------------------------------------------------
+def _funcs_to_names(funclist, namelist):
+    result = []
+    for f, name in zip(funclist, namelist):
+        if f and f[0]:
+            result.append((name, f[1]))
+        else:
+            result.append(f)
+    return result
+
+# -----------------------------------------------------------------------------
+# _names_to_funcs()
+#
+# Given a list of regular expression function names, this converts it back to
+# functions.
+# -----------------------------------------------------------------------------
+def _names_to_funcs(namelist, fdict):
+    result = []
+    for n in namelist:
+        if n and n[0]:
+            result.append((fdict[n[0]], n[1]))
+        else:
+            result.append(n)
+    return result
+
 # -----------------------------------------------------------------------------
 # get_caller_module_dict()
 #
@@ -434,6 +562,18 @@ class LexerReflect(object):
         self.validate_rules()
         return self.error
 
+    # Compute a signature over the token specification, used to check table files
+    def signature(self):
+        parts = [repr(tuple(self.tokens)), repr(self.literals), repr(sorted(self.stateinfo.items())),
+                 repr(int(self.reflags))]
+        for state in sorted(self.stateinfo):
+            parts.append(repr([(f, _get_regex(t)) for f, t in self.funcsym.get(state, [])]))
+            parts.append(repr(self.strsym.get(state, [])))
+            parts.append(repr(self.ignore.get(state, '')))
+            parts.append(repr(getattr(self.errorf.get(state), '__name__', None)))
+            parts.append(repr(getattr(self.eoff.get(state), '__name__', None)))
+        return '\n'.join(parts)
+
     # Get the tokens map
     def get_tokens(self):
         tokens = self.ldict.get('tokens', None)
@@ -581,6 +721,7 @@ class LexerReflect(object):
 
     # Validate all of the t_rules collected
     def validate_rules(self):
+        import inspect  # only needed to validate, not when tables are loaded
         for state in self.stateinfo:
             # Validate all rules defined by functions
 
@@ -684,6 +825,7 @@ class LexerReflect(object):
     # -----------------------------------------------------------------------------
 
     def validate_module(self, module):
+        import inspect
         try:
             lines, linen = inspect.getsourcelines(module)
         except IOError:
@@ -715,7 +857,8 @@ class LexerReflect(object):
 # Build all of the regular expression rules from definitions in the supplied module
 # -----------------------------------------------------------------------------
 def lex(*, module=None, object=None, debug=False, 
-        reflags=int(re.VERBOSE), debuglog=None, errorlog=None):
+        reflags=int(re.VERBOSE), debuglog=None, errorlog=None,
+        lextab=None, outputdir=None, picklefile=None):
 
     global lexer
 
@@ -748,6 +891,34 @@ def lex(*, module=None, object=None, debug=False,
     # Collect parser information from the dictionary
     linfo = LexerReflect(ldict, log=errorlog, reflags=reflags)
     linfo.get_all()
+
+    # Table files.  A lextab name without a package is looked up in the package of
+    # the lexer module.  Tables are reused when their signature matches the token rules;
+    # the lextab is tried first and the picklefile second.  Rebuilt tables are written
+    # to the picklefile if one is given, to the lextab in outputdir otherwise.
+    if lextab and not isinstance(lextab, types.ModuleType) and '.' not in lextab:
+        pkgname = ldict.get('__package__')
+        if pkgname:
+            lextab = pkgname + '.' + lextab
+
+    if outputdir is None and '__file__' in ldict:
+        outputdir = os.path.dirname(ldict['__file__'])
+
+    signature = linfo.signature() if not linfo.error else None
+
+    for tabfile in (lextab, picklefile):
+        if not tabfile or signature is None:
+            continue
+        try:
+            if lexobj.readtab(tabfile, ldict) == signature:
+                token = lexobj.token
+                input = lexobj.input
+                lexer = lexobj
+                return lexobj
+        except (ImportError, IOError, KeyError):
+            pass
+        lexobj = Lexer()
+
     if linfo.validate_all():
         raise SyntaxError("Can't build lexer")
 
@@ -850,6 +1021,21 @@ def lex(*, module=None, object=None, debug=False,
     input = lexobj.input
     lexer = lexobj
 
+    # Write the table files
+    if picklefile:
+        try:
+            os.makedirs(os.path.dirname(picklefile) or '.', exist_ok=True)
+            lexobj.pickletab(picklefile, signature)
+        except IOError as e:
+            errorlog.warning("Couldn't write lextab %r. %s" % (picklefile, e))
+    elif lextab and not isinstance(lextab, types.ModuleType):
+        try:
+            lexobj.writetab(lextab, outputdir, signature)
+            sys.modules.pop(lextab, None)
+            importlib.invalidate_caches()
+        except IOError as e:
+            errorlog.warning("Couldn't write lextab module %r. %s" % (lextab, e))
+
     return lexobj
 
 # -----------------------------------------------------------------------------
@@ -64,7 +64,8 @@
 import re
 import types
 import sys
-import inspect
+import os
+import importlib
 
 #-----------------------------------------------------------------------------
 #                     === User configurable parameters ===
@@ -81,6 +82,8 @@ resultlimit = 40               # Size limit of results when running in debug mod
 
 MAXINT = sys.maxsize
 
+__tabversion__ = '3.10'        # Version of the table files written by write_table() and pickle_table()
+
 # This object is a stand-in for a logging object created by the
 # logging module.   PLY will use this by default to create things
 # such as the parser.out file.  If a user wants more detailed
@@ -682,6 +685,34 @@ class Production(object):
         if self.func:
             self.callable = pdict[self.func]
 
+# -----------------------------------------------------------------------------
+# class MiniProduction
+#
+# A stripped down Production object, used for productions that are read back from
+# table files.  It carries just what the parser needs at run time.
+# -----------------------------------------------------------------------------
+
+class MiniProduction(object):
+    def __init__(self, str, name, len, func, file, line):
+        self.name     = name
+        self.len      = len
+        self.func     = func
+        self.callable = None
+        self.file     = file
+        self.line     = line
+        self.str      = str
+
+    def __str__(self):
+        return self.str
+
+    def __repr__(self):
+        return 'MiniProduction(%s)' % self.str
+
+    # Bind the production function name to a callable
+    def bind(self, pdict):
+        if self.func:
+            self.callable = pdict[self.func]
+
 # -----------------------------------------------------------------------------
 # class LRItem
 #
@@ -1308,9 +1339,20 @@ class LALRError(YaccError):
 # public methods.
 # -----------------------------------------------------------------------------
 
+class VersionError(YaccError):
+    pass
+
 class LRTable:
-    def __init__(self, grammar, log=None):
+    def __init__(self, grammar=None, log=None):
         self.grammar = grammar
+        self.lr_method = 'LALR'
+
+        # Without a grammar, the tables are loaded with read_table() or read_pickle()
+        if grammar is None:
+            self.lr_action = None
+            self.lr_goto = None
+            self.lr_productions = None
+            return
 
         # Set up the logger
         if not log:
@@ -1345,6 +1387,148 @@ class LRTable:
         for p in self.lr_productions:
             p.bind(pdict)
 
+    # Load the tables from a module (or module name) written by write_table().
+    # Returns the grammar signature stored with the tables.
+    def read_table(self, module):
+        if isinstance(module, types.ModuleType):
+            parsetab = module
+        else:
+            __import__(module)
+            parsetab = sys.modules[module]
+
+        if getattr(parsetab, '_tabversion', None) != __tabversion__:
+            raise VersionError('yacc table file version is out of date')
+
+        self.lr_action = parsetab._lr_action
+        self.lr_goto = parsetab._lr_goto
+        self.lr_productions = [MiniProduction(*p) for p in parsetab._lr_productions]
+        self.lr_method = parsetab._lr_method
+        return parsetab._lr_signature
+
+    # Load the tables from a file written by pickle_table().
+    # Returns the grammar signature stored with the tables.
+    def read_pickle(self, filename):
+        import pickle
+
+        with open(filename, 'rb') as in_f:
+            tabversion = pickle.load(in_f)
+            if tabversion != __tabversion__:
+                raise VersionError('yacc table file version is out of date')
+            self.lr_method = pickle.load(in_f)
+            signature = pickle.load(in_f)
+            self.lr_action = pickle.load(in_f)
+            self.lr_goto = pickle.load(in_f)
+            productions = pickle.load(in_f)
+
+        self.lr_productions = [MiniProduction(*p) for p in productions]
+        return signature
+
+    # Write the tables as a Python module named tabmodule in outputdir
+    def write_table(self, tabmodule, outputdir='', signature=''):
+        basemodulename = tabmodule.split('.')[-1]
+        filename = os.path.join(outputdir, basemodulename) + '.py'
+        with open(filename, 'w') as f:
+            f.write('''
+# %s
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = %r
+
+_lr_method = %r
+
+_lr_signature = %r
+    ''' % (os.path.basename(filename), __tabversion__, self.lr_method, signature))
+
+            # Factor out names to make the tables smaller
+            items = {}
+            for s, nd in self.lr_action.items():
+                for name, v in nd.items():
+                    i = items.get(name)
+                    if not i:
+                        i = ([], [])
+                        items[name] = i
+                    i[0].append(s)
+                    i[1].append(v)
+
+            f.write('\n_lr_action_items = {')
+            for k, v in items.items():
+                f.write('%r:([' % k)
+                for i in v[0]:
+                    f.write('%r,' % i)
+                f.write('],[')
+                for i in v[1]:
+                    f.write('%r,' % i)
+                f.write(']),')
+            f.write('}\n')
+
+            f.write('''
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+''')
+
+            items = {}
+            for s, nd in self.lr_goto.items():
+                for name, v in nd.items():
+                    i = items.get(name)
+                    if not i:
+                        i = ([], [])
+                        items[name] = i
+                    i[0].append(s)
+                    i[1].append(v)
+
+            f.write('\n_lr_goto_items = {')
+            for k, v in items.items():
+                f.write('%r:([' % k)
+                for i in v[0]:
+                    f.write('%r,' % i)
+                f.write('],[')
+                for i in v[1]:
+                    f.write('%r,' % i)
+                f.write(']),')
+            f.write('}\n')
+
+            f.write('''
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+''')
+
+            # Write production table
+            f.write('_lr_productions = [\n')
+            for p in self.lr_productions:
+                if p.func:
+                    f.write('  (%r,%r,%d,%r,%r,%d),\n' % (p.str, p.name, p.len,
+                                                          p.func, os.path.basename(p.file), p.line))
+                else:
+                    f.write('  (%r,%r,%d,None,None,None),\n' % (str(p), p.name, p.len))
+            f.write(']\n')
+
+    # Write the tables to filename with pickle
+    def pickle_table(self, filename, signature=''):
+        import pickle
+
+        with open(filename, 'wb') as outf:
+            pickle.dump(__tabversion__, outf, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(self.lr_method, outf, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(signature, outf, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(self.lr_action, outf, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(self.lr_goto, outf, pickle.HIGHEST_PROTOCOL)
+
+            outp = []
+            for p in self.lr_productions:
+                if p.func:
+                    outp.append((p.str, p.name, p.len, p.func, os.path.basename(p.file), p.line))
+                else:
+                    outp.append((str(p), p.name, p.len, None, None, None))
+            pickle.dump(outp, outf, pickle.HIGHEST_PROTOCOL)
+
     # Compute the LR(0) closure operation on I, where I is a set of LR(0) items.
 
     def lr0_closure(self, I):
@@ -2052,6 +2236,7 @@ class ParserReflect(object):
     # -----------------------------------------------------------------------------
 
     def validate_modules(self):
+        import inspect  # only needed to validate, not when tables are loaded
         # Match def p_funcname(
         fre = re.compile(r'\s*def\s+(p_[a-zA-Z_0-9]*)\(')
 
@@ -2091,6 +2276,7 @@ class ParserReflect(object):
 
     # Validate the error function
     def validate_error_func(self):
+        import inspect
         if self.error_func:
             if isinstance(self.error_func, types.FunctionType):
                 ismethod = 0
@@ -2188,7 +2374,7 @@ class ParserReflect(object):
                 continue
             if isinstance(item, (types.FunctionType, types.MethodType)):
                 line = getattr(item, 'co_firstlineno', item.__code__.co_firstlineno)
-                module = inspect.getmodule(item)
+                module = sys.modules.get(item.__module__)
                 p_functions.append((line, module, name, item.__doc__))
 
         # Sort all of the actions by line number; make sure to stringify
@@ -2203,6 +2389,7 @@ class ParserReflect(object):
 
     # Validate all of the p_functions
     def validate_pfunctions(self):
+        import inspect
         grammar = []
         # Check for non-empty symbols
         if len(self.pfuncs) == 0:
@@ -2270,7 +2457,8 @@ class ParserReflect(object):
 
 def yacc(*, debug=yaccdebug, module=None, start=None,
          check_recursion=True, optimize=False, debugfile=debug_file,
-         debuglog=None, errorlog=None):
+         debuglog=None, errorlog=None, tabmodule=None, outputdir=None,
+         write_tables=True, picklefile=None):
 
     # Reference to the parsing method of the last built parser
     global parse
@@ -2303,6 +2491,39 @@ def yacc(*, debug=yaccdebug, module=None, start=None,
     if pinfo.error:
         raise YaccError('Unable to build parser')
 
+    # Table files.  A tabmodule name without a package is looked up in the package of
+    # the grammar module.  Tables are reused when their signature matches the grammar;
+    # the tabmodule is tried first and the picklefile second.  Rebuilt tables are written
+    # to the picklefile if one is given, to the tabmodule in outputdir otherwise.
+    if tabmodule and not isinstance(tabmodule, types.ModuleType) and '.' not in tabmodule:
+        pkgname = pdict.get('__package__')
+        if pkgname:
+            tabmodule = pkgname + '.' + tabmodule
+
+    if outputdir is None and '__file__' in pdict:
+        outputdir = os.path.dirname(pdict['__file__'])
+
+    signature = pinfo.signature()
+
+    candidates = []
+    if tabmodule:
+        candidates.append(('read_table', tabmodule))
+    if picklefile:
+        candidates.append(('read_pickle', picklefile))
+    for reader, source in candidates:
+        try:
+            lr = LRTable()
+            read_signature = getattr(lr, reader)(source)
+            if optimize or (read_signature == signature):
+                lr.bind_callables(pinfo.pdict)
+                parser = LRParser(lr, pinfo.error_func)
+                parse = parser.parse
+                return parser
+        except (ImportError, IOError, VersionError):
+            pass
+        except Exception as e:
+            errorlog.warning('There was a problem loading the table file: %r', e)
+
     if debuglog is None:
         if debug:
             try:
@@ -2474,6 +2695,21 @@ def yacc(*, debug=yaccdebug, module=None, start=None,
                 errorlog.warning('Rule (%s) is never reduced', rejected)
                 warned_never.append(rejected)
 
+    # Write the table files
+    if picklefile:
+        try:
+            os.makedirs(os.path.dirname(picklefile) or '.', exist_ok=True)
+            lr.pickle_table(picklefile, signature)
+        except IOError as e:
+            errorlog.warning("Couldn't create %r. %s" % (picklefile, e))
+    elif tabmodule and write_tables and not isinstance(tabmodule, types.ModuleType):
+        try:
+            lr.write_table(tabmodule, outputdir, signature)
+            sys.modules.pop(tabmodule, None)
+            importlib.invalidate_caches()
+        except IOError as e:
+            errorlog.warning("Couldn't create %r. %s" % (tabmodule, e))
+
     # Build the parser
     lr.bind_callables(pinfo.pdict)
     parser = LRParser(lr, pinfo.error_func)
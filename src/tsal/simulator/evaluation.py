@@ -0,0 +1,277 @@
+# Author: Dustin Dannenhauer
+# Email: dustin.dannenhauer@parallaxresearch.org
+
+# This file is part of tsal-translator, an extension of pypddl-parser
+
+import math
+
+import numpy as np
+
+from tsal.translator.fluent import Fluent
+from tsal.translator.term import Term
+
+_operators = {'+': '+', '-': '-', '*': '*', '=': '==', '!=': '!=', '<': '<', '>': '>', '<=': '<=', '>=': '>='}
+_helpers = {'/': '_divide', '%': '_modulo'}
+
+
+def _divide(left, right):
+    return left / right if right else math.nan
+
+
+def _modulo(left, right):
+    return left % right if right else math.nan
+
+
+def _divide_all(left, right):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(right != 0, np.divide(left, right), np.nan)
+
+
+def _modulo_all(left, right):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(right != 0, np.mod(left, right), np.nan)
+
+
+def _arg(arg):
+    if isinstance(arg, Term):
+        return arg.name if arg.is_variable() else arg.value
+    return arg
+
+
+def _is_variable(value):
+    return isinstance(value, str) and value.startswith('?')
+
+
+def object_values(encoding):
+    """
+    :return: list of the values of the objects of encoding by id: the number of a numeric object, the id
+             (as a float) of any other
+    """
+    return [value if isinstance(value, (int, float)) and not isinstance(value, bool) else float(index)
+            for index, value in enumerate(encoding.objects)]
+
+
+class CompiledExpression(object):
+    """
+    An Expression compiled once to a Python lambda over the values of a FluentIndex.
+
+    The expression is evaluated on a fluent value vector and a binding, the tuple of the Encoding ids of the
+    objects bound to variables, in the order given at compile time. Values are those of the FluentIndex: numbers
+    as floats and objects as their ids, so (= (current-player) ?p) compares ids; a numeric object (e.g. 3 of
+    type int) stands for its number. An undefined fluent or a division by zero is NaN, which makes every
+    comparison but != false. The same code evaluates a batch: a (states, fluents) array of values and a
+    (states, variables) array of object ids give an array of results. The batch tables, the object values and
+    the ids of the fluents with variable arguments, are built on the first batch call and again when objects or
+    fluents were added since.
+    """
+
+    def __init__(self, expression, fluents, variables=(), objects=None):
+        """
+
+        :param expression: the Expression (or Fluent) to compile
+        :param fluents: the FluentIndex of the value vectors, the ground fluents met get an id when they have none
+        :param variables: the names of the variables, e.g. ('?x', '?y'), in the order of the bindings
+        :param objects: list of the values of the object ids, object_values(fluents.encoding) when None; a
+                        caller may share one list between expressions and append the numbers it binds
+        """
+        self._expression = expression
+        self._fluents = fluents
+        self._variables = tuple(variables)
+        self._positions = {variable: position for position, variable in enumerate(self._variables)}
+        self._object_values = object_values(fluents.encoding) if objects is None else objects
+        self._loaders = []  # (symbol id, args as object ids or binding positions) of the non ground fluents
+        self._source = self.__compile(expression)
+        self._function = eval('lambda v, b: ' + self._source, self.__scalar_namespace())
+        self._batch = None  # compiled on first use
+        self._batch_sizes = None  # the numbers of objects and fluents the batch tables were built from
+
+    @property
+    def expression(self):
+        return self._expression
+
+    @property
+    def variables(self):
+        return self._variables
+
+    @property
+    def source(self):
+        """
+        :return: the Python source of the compiled expression, over v (values) and b (binding)
+        """
+        return self._source
+
+    def __call__(self, values, binding=()):
+        """
+        :param values: fluent value vector
+        :param binding: tuple of the object ids bound to the variables
+        :return: the number, or the truth value of a comparison
+        """
+        return self._function(values, binding)
+
+    def batch(self, values, bindings=None):
+        """
+        :param values: (states, fluents) array of values, or one vector shared by every binding
+        :param bindings: (states, variables) int array of object ids, None when there are no variables
+        :return: array of the results, one per state
+        """
+        sizes = (len(self._object_values), len(self._fluents))
+        if sizes != self._batch_sizes:
+            self._batch = eval('lambda v, b: ' + self._source, self.__batch_namespace())
+            self._batch_sizes = sizes
+        values = np.asarray(values)
+        if bindings is None:
+            bindings = np.zeros((len(values) if values.ndim == 2 else 1, 0), dtype=np.int64)
+        bindings = np.asarray(bindings)
+        # states along the last axis, so v[k] and b[i] are the rows of one fluent and one variable
+        return np.broadcast_to(self._batch(values.T, bindings.T), (len(bindings),))
+
+    def __compile(self, node):
+        if isinstance(node, Fluent):
+            return self.__fluent(node)
+        if node.operator is None:
+            return self.__leaf(node.value)
+        left = self.__compile(node.left_child)
+        right = self.__compile(node.right_child)
+        if node.operator in _helpers:
+            return '{}({}, {})'.format(_helpers[node.operator], left, right)
+        if node.operator not in _operators:
+            raise ValueError('cannot compile the operator {} of {}'.format(node.operator, self._expression))
+        return '({} {} {})'.format(left, _operators[node.operator], right)
+
+    def __leaf(self, value):
+        if _is_variable(value):
+            return 'o[b[{}]]'.format(self.__position(value))
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return repr(float(value))
+        return self.__object(value)
+
+    def __object(self, name):
+        try:
+            return repr(float(self._fluents.encoding.object_id(name)))
+        except KeyError:
+            return 'nan'  # an object of no problem, equal to nothing
+
+    def __fluent(self, fluent):
+        args = [_arg(arg) for arg in fluent.args]
+        encoding = self._fluents.encoding
+        try:
+            symbol = encoding.symbol_id(fluent.name)
+            ids = [('variable', self.__position(arg)) if _is_variable(arg) else ('object', encoding.object_id(arg))
+                   for arg in args]
+        except KeyError:
+            return 'nan'  # a fluent or an object of no problem, never defined
+        if all(kind == 'object' for kind, _ in ids):
+            index = self._fluents.fluent_id((symbol,) + tuple(value for _, value in ids))
+            return 'v[{}]'.format(index)
+        self._loaders.append((symbol, tuple(ids)))
+        return 'f{}(v, b)'.format(len(self._loaders) - 1)
+
+    def __position(self, variable):
+        if variable not in self._positions:
+            raise ValueError('{} is not bound, variables: {}'.format(variable, ', '.join(self._variables)))
+        return self._positions[variable]
+
+    def __scalar_namespace(self):
+        namespace = {'nan': math.nan, '_divide': _divide, '_modulo': _modulo, 'o': self._object_values}
+        for number, (symbol, ids) in enumerate(self._loaders):
+            namespace['f{}'.format(number)] = self.__scalar_loader(symbol, ids)
+        return namespace
+
+    def __scalar_loader(self, symbol, ids):
+        find = self._fluents.find
+        parts = tuple(ids)
+
+        def load(values, binding):
+            index = find((symbol,) + tuple([binding[value] if kind == 'variable' else value for kind, value in parts]))
+            # a fluent that got its id after values was made is undefined in it
+            return math.nan if index is None or index >= len(values) else values[index]
+        return load
+
+    def __batch_namespace(self):
+        namespace = {'nan': np.nan, '_divide': _divide_all, '_modulo': _modulo_all,
+                     'o': np.asarray(self._object_values, dtype=float)}
+        for number, (symbol, ids) in enumerate(self._loaders):
+            namespace['f{}'.format(number)] = self.__batch_loader(symbol, ids)
+        return namespace
+
+    def __batch_loader(self, symbol, ids):
+        # the ids of the ground fluents of symbol as a dense table over the object ids of the variable args
+        objects = len(self._object_values)
+        variables = [value for kind, value in ids if kind == 'variable']
+        table = np.full((objects,) * len(variables), -1, dtype=np.int64)
+        for index in range(len(self._fluents)):
+            code = self._fluents.fluent_code(index)
+            if code[0] != symbol or len(code) != len(ids) + 1:
+                continue
+            if all(kind == 'variable' or value == arg for (kind, value), arg in zip(ids, code[1:])):
+                table[tuple(arg for (kind, _), arg in zip(ids, code[1:]) if kind == 'variable')] = index
+
+        def load(values, bindings):
+            keys = [bindings[position] for position in variables]
+            found = table[tuple(np.minimum(key, objects - 1) for key in keys)]
+            found = np.where(np.all([key < objects for key in keys], axis=0), found, -1)  # ids past the table
+            found = np.where(found < len(values), found, -1)  # fluents with an id newer than the values
+            rows = np.maximum(found, 0)
+            loaded = values[rows] if values.ndim == 1 else values[rows, np.arange(len(found))]
+            return np.where(found >= 0, loaded, np.nan)
+        return load
+
+
+def _stack(items, states):
+    # the (states, expressions) array of the results of a batch, constant expressions broadcast
+    found = np.empty((len(items), states))
+    for position, item in enumerate(items):
+        found[position] = item
+    return found.T
+
+
+class CompiledVector(object):
+    """
+    Ground expressions compiled together to one Python lambda that returns the array of their values, so a
+    caller evaluating many of them per state, e.g. the rates of the processes, makes one call instead of one per
+    expression. The expressions have no variables, there is no binding; see CompiledExpression for the values.
+    """
+
+    def __init__(self, expressions, fluents):
+        """
+
+        :param expressions: list of the Expressions (or Fluents) to compile
+        :param fluents: the FluentIndex of the value vectors, the ground fluents met get an id when they have none
+        :raises ValueError: when an expression has a variable, alone or as the argument of a fluent
+        """
+        self._expressions = list(expressions)
+        sources = []
+        for expression in self._expressions:
+            try:
+                compiled = CompiledExpression(expression, fluents)
+            except ValueError as error:
+                raise ValueError('a CompiledVector takes ground expressions, not {}: {}'.format(expression, error))
+            sources.append(compiled.source)
+        self._source = '({},)'.format(', '.join(sources)) if sources else '()'
+        self._function = eval('lambda v: _array(' + self._source + ', dtype=float)',
+                              {'nan': math.nan, '_divide': _divide, '_modulo': _modulo, '_array': np.array})
+        self._batch = eval('lambda v, n: _stack(' + self._source + ', n)',
+                           {'nan': np.nan, '_divide': _divide_all, '_modulo': _modulo_all, '_stack': _stack})
+
+    @property
+    def expressions(self):
+        return self._expressions
+
+    @property
+    def source(self):
+        """
+        :return: the Python source of the tuple of the compiled expressions, over v (values)
+        """
+        return self._source
+
+    def __len__(self):
+        return len(self._expressions)
+
+    def __call__(self, values):
+        """
+        :param values: fluent value vector, or (states, fluents) array of values
+        :return: array of the values of the expressions, (states, expressions) for a batch
+        """
+        if values.ndim == 2:  # a contiguous row per fluent
+            return self._batch(np.ascontiguousarray(values.T), len(values))
+        return self._function(values.tolist())  # Python floats, faster than numpy scalars one at a time
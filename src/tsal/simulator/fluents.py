@@ -0,0 +1,247 @@
+# Author: Dustin Dannenhauer
+# Email: dustin.dannenhauer@parallaxresearch.org
+
+# This file is part of tsal-translator, an extension of pypddl-parser
+
+import numpy as np
+
+from tsal.translator.fluent import Fluent
+from tsal.translator.predicate import Predicate
+
+_numeric_types = ('int', 'integer', 'number', 'float', 'real')
+
+
+def _is_assignment(atom):
+    return isinstance(atom, Predicate) and atom.name == '=' and atom.arity == 2 and isinstance(atom.args[0], Fluent)
+
+
+class FluentIndex(object):
+    """
+    Ids of the ground fluents of a problem and their bounds, the columns of the fluent value vectors.
+
+    The values of a state are a float64 vector with one entry per ground fluent, a batch of states a 2-D array
+    with one row per state; NaN marks an undefined value. A fluent valued by an object (e.g. (current-player)
+    -> p1) is symbolic, its entry is the id of the object in the Encoding. The numeric fluents declared with
+    :bounds are clamped to [min, max] and rounded to precision decimals by enforce and by the batched updates.
+    """
+
+    _capacity = 64
+
+    def __init__(self, encoding, fluents=()):
+        """
+
+        :param encoding: the Encoding of the problem, e.g. problem.encoding(domain)
+        :param fluents: the declared Fluent objects, e.g. domain.fluents, for the bounds
+        """
+        self._encoding = encoding
+        self._declared = {fluent.name: fluent for fluent in fluents or ()}
+        self._ids = {}  # code -> id
+        self._codes = []  # id -> code
+        self._symbolic = np.zeros(self._capacity, dtype=bool)
+        self._bounded = np.zeros(self._capacity, dtype=bool)
+        self._minimum = np.full(self._capacity, -np.inf)
+        self._maximum = np.full(self._capacity, np.inf)
+        self._scale = np.ones(self._capacity)
+        self._bounded_ids = None  # built on first use
+
+    @property
+    def encoding(self):
+        return self._encoding
+
+    def __len__(self):
+        return len(self._codes)
+
+    def __contains__(self, fluent):
+        return self.code(fluent) in self._ids
+
+    @property
+    def symbolic(self):
+        """
+        :return: bool array, True for the ids of the symbolic fluents
+        """
+        return self._symbolic[:len(self._codes)]
+
+    @property
+    def bounded(self):
+        """
+        :return: bool array, True for the ids of the fluents with declared bounds
+        """
+        return self._bounded[:len(self._codes)]
+
+    def code(self, fluent):
+        """
+        :return: the code of fluent, a Fluent, an assignment (= (fluent ...) value) or a code
+        """
+        if type(fluent) is tuple:
+            return fluent
+        return self._encoding.encode(fluent)
+
+    def find(self, fluent):
+        """
+        :return: the id of fluent, None when it has none
+        """
+        return self._ids.get(self.code(fluent))
+
+    def fluent_id(self, fluent, symbolic=None):
+        """
+        :param fluent: a Fluent, an assignment or a code
+        :param symbolic: whether the fluent is valued by objects, unchanged when None; a new fluent is then
+                         symbolic when it is declared with an object type
+        :return: the id of fluent, a new one when it has none yet
+        """
+        code = self.code(fluent)
+        index = self._ids.get(code)
+        if index is None:
+            index = self._ids[code] = len(self._codes)
+            self._codes.append(code)
+            if index == len(self._symbolic):
+                self.__grow()
+            if symbolic is None:
+                declared = self._declared.get(self._encoding.symbols[code[0]])
+                symbolic = declared is not None and declared.type is not None and declared.type not in _numeric_types
+            self.__set_kind(index, symbolic)
+        elif symbolic is not None and symbolic != self._symbolic[index]:
+            self.__set_kind(index, symbolic)
+        return index
+
+    def fluent_code(self, index):
+        return self._codes[index]
+
+    def fluent(self, index):
+        """
+        :return: the Fluent of id index
+        """
+        return self._encoding.decode(self._codes[index])
+
+    def encode_value(self, index, value):
+        if self._symbolic[index]:
+            return float(self._encoding.object_id(value))
+        return float(value)
+
+    def decode_value(self, index, value):
+        """
+        :return: the object name of a symbolic fluent, the number of a numeric one, None when undefined
+        """
+        if value != value:  # NaN
+            return None
+        if self._symbolic[index]:
+            return self._encoding.objects[int(value)]
+        return int(value) if value == int(value) else float(value)
+
+    def initial_values(self, problem):
+        """
+        :param problem: the Problem of the encoding
+        :return: float64 vector of the values assigned by problem.init, bounds enforced
+        """
+        assigned = []
+        for atom in problem.init:
+            if _is_assignment(atom):
+                value = atom.args[1]
+                index = self.fluent_id(atom, isinstance(value, str))
+                assigned.append((index, self.encode_value(index, value)))
+        values = self.empty()
+        for index, value in assigned:
+            values[index] = value
+        return self.enforce(values)
+
+    def empty(self, states=None):
+        """
+        :return: vector of undefined values, or a (states, fluents) array of them
+        """
+        shape = len(self._codes) if states is None else (states, len(self._codes))
+        return np.full(shape, np.nan)
+
+    def resize(self, values):
+        """
+        :return: values with undefined entries added for the fluents given an id after it was made
+        """
+        missing = len(self._codes) - values.shape[-1]
+        if missing <= 0:
+            return values
+        pad = [(0, 0)] * (values.ndim - 1) + [(0, missing)]
+        return np.pad(values, pad, constant_values=np.nan)
+
+    def enforce(self, values, ids=None):
+        """
+        Clamp and round the values of the bounded fluents, in place.
+
+        :param values: vector or (states, fluents) array of values
+        :param ids: the ids to enforce, all the bounded fluents when None
+        :return: values
+        """
+        ids = self.__bounded_ids(ids)
+        if len(ids):
+            scale = self._scale[ids]
+            clamped = np.clip(values[..., ids], self._minimum[ids], self._maximum[ids])
+            values[..., ids] = np.round(clamped * scale) / scale
+        return values
+
+    def clip(self, values, ids=None):
+        """
+        Clamp the values of the bounded fluents, in place, without the rounding of enforce, e.g. between the
+        small steps of an integration that rounding would undo.
+
+        :param values: vector or (states, fluents) array of values
+        :param ids: the ids to clamp, all the bounded fluents when None
+        :return: values
+        """
+        ids = self.__bounded_ids(ids)
+        if len(ids):
+            values[..., ids] = np.clip(values[..., ids], self._minimum[ids], self._maximum[ids])
+        return values
+
+    def assign(self, values, ids, new):
+        """
+        Batched assignment, in place: values[..., ids] = new, bounds enforced.
+
+        :param values: vector or (states, fluents) array of values
+        :param ids: array of fluent ids
+        :param new: the values, an array broadcast against values[..., ids]
+        :return: values
+        """
+        values[..., ids] = new
+        return self.enforce(values, ids)
+
+    def increase(self, values, ids, amounts):
+        """
+        Batched increase, in place: amounts are added to values[..., ids], repeated ids add up, bounds enforced.
+
+        :return: values
+        """
+        ids = np.asarray(ids)
+        np.add.at(values, (Ellipsis, ids), amounts)
+        return self.enforce(values, ids)
+
+    def decrease(self, values, ids, amounts):
+        """
+        Batched decrease, see increase.
+
+        :return: values
+        """
+        return self.increase(values, ids, -np.asarray(amounts, dtype=float))
+
+    def __bounded_ids(self, ids):
+        if ids is None:
+            if self._bounded_ids is None:
+                self._bounded_ids = np.flatnonzero(self.bounded)
+            return self._bounded_ids
+        ids = np.asarray(ids)
+        return ids[self._bounded[ids]]
+
+    def __set_kind(self, index, symbolic):
+        self._symbolic[index] = symbolic
+        declared = self._declared.get(self._encoding.symbols[self._codes[index][0]])
+        bounded = declared is not None and declared.has_bounds and not symbolic
+        self._bounded[index] = bounded
+        if bounded:
+            self._minimum[index], self._maximum[index], precision = declared.bounds
+            self._scale[index] = 10.0 ** precision
+        self._bounded_ids = None
+
+    def __grow(self):
+        size = len(self._symbolic)
+        self._symbolic = np.concatenate((self._symbolic, np.zeros(size, dtype=bool)))
+        self._bounded = np.concatenate((self._bounded, np.zeros(size, dtype=bool)))
+        self._minimum = np.concatenate((self._minimum, np.full(size, -np.inf)))
+        self._maximum = np.concatenate((self._maximum, np.full(size, np.inf)))
+        self._scale = np.concatenate((self._scale, np.ones(size)))
@@ -0,0 +1,143 @@
+# Author: Dustin Dannenhauer
+# Email: dustin.dannenhauer@parallaxresearch.org
+
+# This file is part of tsal-translator, an extension of pypddl-parser
+
+
+class SuccessorGenerator(object):
+    """
+    Index of ground actions or events (see GroundOperator) by their preconditions, built once, that returns the
+    groundings applicable in a state without testing every one of them.
+
+    The index is a tree. A node holds the groundings it tests itself and switches to child nodes on keys: the
+    atoms that must be true (bits of the positive precondition mask) and the fluents that must equal a
+    constant (GroundOperator.equalities). Each grounding is filed under its key shared by the fewest other
+    groundings of the node, then indexed again below it on its other keys, so a state only visits the
+    children of its true atoms and of the current values of the switched fluents. The conditions no switch
+    decides, negative literals and the numeric comparisons and variable bindings of GroundOperator.steps,
+    are filters of the groundings a leaf returns.
+    """
+
+    _leaf_size = 4  # nodes with no more groundings than this test them all
+
+    def __init__(self, grounds):
+        """
+
+        :param grounds: list of GroundOperator
+        """
+        self._grounds = list(grounds)
+        self._nodes = 0
+        self._root = self.__build([(ground, self.__keys(ground)) for ground in self._grounds])
+
+    @property
+    def grounds(self):
+        return self._grounds
+
+    @property
+    def nodes(self):
+        """
+        :return: the number of nodes of the tree
+        """
+        return self._nodes
+
+    def __len__(self):
+        return len(self._grounds)
+
+    def candidates(self, bits, values):
+        """
+        :param bits: the bits of a State
+        :param values: its fluent value vector
+        :return: list of the groundings whose masks and equalities hold, their steps not run
+        """
+        found = []
+        stack = [self._root]
+        while stack:
+            items, keys, children, switches = stack.pop()
+            for pre, neg, equalities, ground in items:
+                if bits & pre != pre or bits & neg:
+                    continue
+                for index, value in equalities:
+                    if values[index] != value:
+                        break
+                else:
+                    found.append(ground)
+            common = bits & keys
+            while common:
+                low = common & -common
+                common ^= low
+                leaf, child = children[low.bit_length() - 1]
+                for pre, neg, equalities, ground in leaf:  # the groundings of the child, tested without a push
+                    if bits & pre != pre or bits & neg:
+                        continue
+                    for index, value in equalities:
+                        if values[index] != value:
+                            break
+                    else:
+                        found.append(ground)
+                if child is not None:
+                    stack.append(child)
+            for index, by_value in switches:
+                child = by_value.get(values[index])
+                if child is not None:
+                    stack.append(child)
+        return found
+
+    def applicable(self, state, values):
+        """
+        :return: list of (GroundOperator, binding) of the groundings applicable in the state, one pair per
+                 binding its steps allow
+        """
+        bits = state.bits
+        found = []
+        for ground in self.candidates(bits, values):
+            if ground.steps:
+                for binding in ground.bindings(bits, values):
+                    found.append((ground, binding))
+            else:
+                found.append((ground, ground.binding))
+        return found
+
+    @staticmethod
+    def __keys(ground):
+        # the switch keys of ground: bit positions of its positive preconditions and (fluent id, value) pairs
+        keys = set()
+        pre = ground.pre
+        while pre:
+            low = pre & -pre
+            keys.add(low.bit_length() - 1)
+            pre ^= low
+        keys.update(ground.equalities)
+        return keys
+
+    def __build(self, entries):
+        # entries: (ground, keys not switched on yet)
+        self._nodes += 1
+        items = [ground for ground, keys in entries if not keys or len(entries) <= self._leaf_size]
+        rest = [(ground, keys) for ground, keys in entries if keys and len(entries) > self._leaf_size]
+        counts = {}
+        for _, keys in rest:
+            for key in keys:
+                counts[key] = counts.get(key, 0) + 1
+        buckets = {}
+        for ground, keys in rest:
+            key = min(keys, key=lambda k: (counts[k], _order(k)))
+            buckets.setdefault(key, []).append((ground, keys - {key}))
+
+        keys_mask = 0
+        children = {}
+        switches = {}
+        for key, bucket in buckets.items():
+            child = self.__build(bucket)
+            if type(key) is tuple:
+                switches.setdefault(key[0], {})[key[1]] = child
+            else:
+                keys_mask |= 1 << key
+                items_, keys_, children_, switches_ = child
+                children[key] = (items_, ((), keys_, children_, switches_) if keys_ or switches_ else None)
+        items = tuple((ground.pre, ground.neg, ground.equalities, ground) for ground in items)
+        return items, keys_mask, children, tuple(switches.items())
+
+
+def _order(key):
+    # a total order of the keys, atoms before fluents, for a tree that does not depend on set iteration order
+    return (0, key, 0.0) if type(key) is int else (1,) + key
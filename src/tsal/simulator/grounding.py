@@ -0,0 +1,346 @@
+# Author: Dustin Dannenhauer
+# Email: dustin.dannenhauer@parallaxresearch.org
+
+# This file is part of tsal-translator, an extension of pypddl-parser
+
+import array
+import itertools
+import operator
+
+from tsal.translator.expression import Expression
+from tsal.translator.fluent import Fluent
+from tsal.translator.literal import Literal
+from tsal.translator.predicate import Predicate
+from tsal.translator.term import Term
+
+_comparisons = {'=': operator.eq, '!=': operator.ne, '<': operator.lt, '>': operator.gt, '<=': operator.le,
+                '>=': operator.ge}
+_arithmetic = {'+': operator.add, '-': operator.sub, '*': operator.mul, '/': operator.truediv, '%': operator.mod}
+
+
+class _Unbound(Exception):
+    # an expression refers to a variable or fluent that has no value at grounding time
+    pass
+
+
+def _is_variable(value):
+    return isinstance(value, str) and value.startswith('?')
+
+
+def _arg(arg):
+    """
+    :return: the variable name or the constant value of a predicate or fluent argument
+    """
+    if isinstance(arg, Term):
+        return arg.name if arg.is_variable() else arg.value
+    return arg
+
+
+def parameter_name(param):
+    """
+    :return: the variable name of an action or event parameter; typed parameters are parsed as a variable Term
+             named by the variable Term of the untyped list
+    """
+    name = param.name
+    while isinstance(name, Term):
+        name = name.name
+    return name
+
+
+class GroundTable(object):
+    """
+    The groundings of one action or event: a flat array of object ids (see Problem.encoding), one row of
+    arity ids per grounding, in the order of the parameters.
+    """
+
+    def __init__(self, operator_, encoding, ids):
+        self._operator = operator_
+        self._encoding = encoding
+        self._arity = len(operator_.params)
+        self._ids = ids
+
+    @property
+    def operator(self):
+        return self._operator
+
+    @property
+    def arity(self):
+        return self._arity
+
+    @property
+    def ids(self):
+        return self._ids
+
+    def __len__(self):
+        if self._arity == 0:
+            return len(self._ids)  # a single 0 when the action is applicable at all
+        return len(self._ids) // self._arity
+
+    def row(self, index):
+        """
+        :return: tuple of the object ids of the index-th grounding
+        """
+        start = index * self._arity
+        return tuple(self._ids[start:start + self._arity])
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def bindings(self):
+        """
+        :return: generator of the groundings as tuples of object names
+        """
+        objects = self._encoding.objects
+        for row in self:
+            yield tuple([objects[index] for index in row])
+
+
+class Grounder(object):
+    """
+    Enumerates the groundings of the actions and events of a domain over the objects of a problem.
+
+    A parameter ranges over the objects (and constants) of its type, subtypes included. The preconditions
+    that the initial state decides for every reachable state (see Domain.analysis) are checked against it: a
+    positive literal over a static or delete-only predicate, or an equality between a static fluent and a
+    variable or constant, is a relation over its variables (variables that are not parameters are projected
+    out); relations are joined starting from the most selective one, parameters no relation binds are taken
+    from their type last, smallest type first, and the other conditions (negative literals over static or
+    add-only predicates, comparisons of static fluents) filter the partial groundings as soon as their
+    parameters are bound. Conditions over changing symbols are left to the simulation.
+    """
+
+    def __init__(self, domain, problem):
+        """
+
+        :param domain: the Domain of the actions and events
+        :param problem: the Problem giving the objects and the initial state
+        """
+        self._domain = domain
+        self._problem = problem
+        analysis = domain.analysis
+        self._static = analysis.static
+        self._bounded = analysis.static | analysis.add_only | analysis.delete_only
+        self._upper = analysis.static | analysis.delete_only  # initial facts are a superset of the reachable ones
+        self._lower = analysis.static | analysis.add_only  # initial facts are a subset of the reachable ones
+        self._objects_by_type = problem.objects_by_type(domain)
+        self._all_objects = tuple(dict.fromkeys(itertools.chain.from_iterable(self._objects_by_type.values())))
+        self._facts = {}  # static, add-only or delete-only predicate -> set of argument tuples true initially
+        self._values = {}  # static fluent -> {argument tuple: value}
+        for atom in problem.init:
+            if isinstance(atom, Predicate) and atom.name == '=' and isinstance(atom.args[0], Fluent):
+                fluent, value = atom.args
+                if fluent.name in self._static:
+                    args = tuple([_arg(arg) for arg in fluent.args])
+                    self._values.setdefault(fluent.name, {})[args] = value
+            elif atom.name in self._bounded:
+                self._facts.setdefault(atom.name, set()).add(tuple([_arg(arg) for arg in atom.args]))
+
+    def ground(self, operators=None):
+        """
+        :param operators: the actions and events to ground, all those of the domain when None
+        :return: generator of (action or event, tuple of object names in the order of its parameters)
+        """
+        if operators is None:
+            operators = self._domain.operators + self._domain.events
+        for operator_ in operators:
+            for binding in self.groundings(operator_):
+                yield operator_, binding
+
+    def table(self, operator_):
+        """
+        :return: GroundTable of the groundings of operator_
+        """
+        encoding = self._problem.encoding(self._domain)
+        ids = array.array('i')
+        arity = len(operator_.params)
+        for binding in self.groundings(operator_):
+            ids.extend([encoding.object_id(name) for name in binding] if arity else [0])
+        return GroundTable(operator_, encoding, ids)
+
+    def tables(self, operators=None):
+        """
+        :return: list of the GroundTable of every action and event of the domain, or of operators
+        """
+        if operators is None:
+            operators = self._domain.operators + self._domain.events
+        return [self.table(operator_) for operator_ in operators]
+
+    def groundings(self, operator_):
+        """
+        :return: generator of the groundings of operator_, tuples of object names in the order of its parameters
+        """
+        params = [parameter_name(param) for param in operator_.params]
+        if len(set(params)) != len(params):
+            raise ValueError("{} has repeated parameters".format(operator_.name))
+        types = {parameter_name(param): self.__type_objects(param.type) for param in operator_.params}
+        relations, filters = self.__constraints(operator_, set(params), types)
+
+        variables = []  # order of the values in the partial groundings
+        partial = [()]
+        pending = list(filters)
+        while relations and partial:
+            relation = max(relations, key=lambda r: (len(set(r[0]) & set(variables)), -len(r[1])))
+            relations.remove(relation)
+            partial = self.__join(variables, partial, relation)
+            variables += [variable for variable in relation[0] if variable not in variables]
+            partial, pending = self.__filter(variables, partial, pending)
+        for param in sorted((param for param in params if param not in variables), key=lambda p: len(types[p])):
+            partial = [values + (value,) for values in partial for value in types[param]]
+            variables.append(param)
+            partial, pending = self.__filter(variables, partial, pending)
+
+        order = [variables.index(param) for param in params]
+        for values in partial:
+            yield tuple([values[index] for index in order])
+
+    def __type_objects(self, type_):
+        if type_ is None:
+            return self._all_objects
+        return self._objects_by_type.get(type_, ())
+
+    def __constraints(self, operator_, params, types):
+        # relations: (variables, set of value tuples), filters: (variables, test of a {variable: value} dict)
+        relations = []
+        filters = []
+        for condition in operator_.precond:
+            if isinstance(condition, Literal):
+                atom = condition.predicate
+                args = [_arg(arg) for arg in atom.args]
+                if atom.name == '=' and len(args) == 2:
+                    self.__equality(args, condition.is_positive(), params, filters)
+                elif condition.is_positive():
+                    if atom.name in self._upper:
+                        relations.append(self.__relation(self._facts.get(atom.name, ()), args, params, types))
+                elif atom.name in self._lower and all(arg in params for arg in args if _is_variable(arg)):
+                    filters.append(self.__absent(atom.name, args, params))
+            elif isinstance(condition, Expression) and condition.operator in _comparisons:
+                variables = self.__expression_variables(condition)
+                if variables is None:  # refers to a changing fluent
+                    continue
+                if variables <= params:
+                    filters.append((variables, self.__comparison(condition)))
+                elif condition.operator == '=' and isinstance(condition.left_child, Fluent) \
+                        and self.__is_leaf(condition.right_child):
+                    # a static function as a relation over its arguments and value, free variables projected out
+                    fluent = condition.left_child
+                    args = [_arg(arg) for arg in fluent.args] + [condition.right_child.value]
+                    rows = [key + (value,) for key, value in self._values.get(fluent.name, {}).items()]
+                    relations.append(self.__relation(rows, args, params, types))
+        return relations, filters
+
+    @staticmethod
+    def __relation(rows, args, params, types):
+        # the rows matching the constants, repeated variables and parameter types of args, projected on the
+        # parameters of args
+        variables = []
+        for arg in args:
+            if _is_variable(arg) and arg in params and arg not in variables:
+                variables.append(arg)
+        allowed = {variable: set(types[variable]) for variable in variables}
+        selected = set()
+        for row in rows:
+            if len(row) != len(args):
+                continue
+            binding = {}
+            for arg, value in zip(args, row):
+                if not _is_variable(arg):
+                    if arg != value:
+                        break
+                elif binding.setdefault(arg, value) != value:
+                    break
+            else:
+                if all(binding[variable] in allowed[variable] for variable in variables):
+                    selected.add(tuple([binding[variable] for variable in variables]))
+        return variables, selected
+
+    @staticmethod
+    def __join(variables, partial, relation):
+        relation_variables, rows = relation
+        shared = [index for index, variable in enumerate(relation_variables) if variable in variables]
+        new = [index for index, variable in enumerate(relation_variables) if variable not in variables]
+        positions = [variables.index(relation_variables[index]) for index in shared]
+        index = {}
+        for row in rows:
+            index.setdefault(tuple([row[i] for i in shared]), []).append(tuple([row[i] for i in new]))
+        joined = []
+        for values in partial:
+            for extension in index.get(tuple([values[position] for position in positions]), ()):
+                joined.append(values + extension)
+        return joined
+
+    @staticmethod
+    def __filter(variables, partial, pending):
+        bound = set(variables)
+        ready = [test for needed, test in pending if needed <= bound]
+        pending = [(needed, test) for needed, test in pending if not needed <= bound]
+        for test in ready:
+            partial = [values for values in partial if test(dict(zip(variables, values)))]
+        return partial, pending
+
+    def __absent(self, name, args, params):
+        facts = self._facts.get(name, set())
+        variables = {arg for arg in args if _is_variable(arg)}
+
+        def test(binding):
+            return tuple([binding[arg] if _is_variable(arg) else arg for arg in args]) not in facts
+        return variables, test
+
+    @staticmethod
+    def __equality(args, positive, params, filters):
+        variables = {arg for arg in args if _is_variable(arg)}
+        if not variables <= params:
+            return
+        left, right = args
+
+        def test(binding):
+            return (binding.get(left, left) == binding.get(right, right)) == positive
+        filters.append((variables, test))
+
+    def __expression_variables(self, expression):
+        # the variables of an expression over static fluents, None when it refers to a changing fluent
+        if isinstance(expression, Fluent):
+            if expression.name not in self._static:
+                return None
+            return {_arg(arg) for arg in expression.args if _is_variable(_arg(arg))}
+        if isinstance(expression, Expression):
+            if self.__is_leaf(expression):
+                return {expression.value} if _is_variable(expression.value) else set()
+            left = self.__expression_variables(expression.left_child)
+            right = self.__expression_variables(expression.right_child)
+            if left is None or right is None:
+                return None
+            return left | right
+        return set()
+
+    def __comparison(self, condition):
+        compare = _comparisons[condition.operator]
+
+        def test(binding):
+            try:
+                return compare(self.__evaluate(condition.left_child, binding),
+                               self.__evaluate(condition.right_child, binding))
+            except (_Unbound, TypeError, ZeroDivisionError):
+                return False  # an undefined fluent or an ill-typed comparison never holds
+        return test
+
+    def __evaluate(self, expression, binding):
+        if isinstance(expression, Fluent):
+            args = tuple([binding.get(arg, arg) for arg in map(_arg, expression.args)])
+            values = self._values.get(expression.name, {})
+            if args not in values:
+                raise _Unbound(expression)
+            return values[args]
+        if isinstance(expression, Expression):
+            if self.__is_leaf(expression):
+                return binding.get(expression.value, expression.value)
+            left = self.__evaluate(expression.left_child, binding)
+            right = self.__evaluate(expression.right_child, binding)
+            if expression.operator in _arithmetic:
+                return _arithmetic[expression.operator](left, right)
+            raise _Unbound(expression)
+        return expression
+
+    @staticmethod
+    def __is_leaf(expression):
+        return isinstance(expression, Expression) and expression.operator is None
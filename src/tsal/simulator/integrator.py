@@ -0,0 +1,212 @@
+# Author: Dustin Dannenhauer
+# Email: dustin.dannenhauer@parallaxresearch.org
+
+# This file is part of tsal-translator, an extension of pypddl-parser
+
+import numpy as np
+
+from tsal.simulator.evaluation import CompiledExpression, CompiledVector
+from tsal.translator.expression import Expression
+from tsal.translator.fluent import Fluent
+
+_orders = {'euler': 1, 'rk4': 4}  # method -> order of its error
+
+
+class ProcessIntegrator(object):
+    """
+    Numerical integration of the processes of a domain over fluent value vectors.
+
+    A process (= name equation) gives the rate of change of the fluent (name): d(name)/dt = equation. The names
+    in the equation that are fluents of no arguments, e.g. level or ?level, read the value of the fluent, like
+    (level) does. The rates of all the processes are compiled to one CompiledVector and a step updates every
+    process fluent at once, on a vector or on a (states, fluents) batch of them; processes on the same fluent add
+    up, and an undefined (NaN) rate changes nothing. Bounded fluents are clamped after each step and rounded to
+    their precision at the end of integrate.
+
+    integrate advances with fixed steps of Euler or RK4, or adaptive ones when given a tolerance (step doubling:
+    a step is taken whole and as two halves, and their difference sets the next step). Given a watch function of
+    the values, e.g. the applicable ground events of a state, it stops at the first time the result changes,
+    found by bisection of the step it changed in, so an event or a precondition enabled by a crossing (e.g.
+    (> (level) 8.0)) is not stepped over.
+    """
+
+    def __init__(self, domain, fluents):
+        """
+
+        :param domain: the Domain of the processes
+        :param fluents: the FluentIndex of the value vectors, the fluents of the processes get an id when they have
+                        none; vectors made before are resized by integrate
+        """
+        self._fluents = fluents
+        self._declared = {fluent.name: fluent for fluent in domain.fluents or ()}
+        self._processes = []
+        self._skipped = {}
+        targets, rates = [], []
+        for process in domain.processes or ():
+            try:
+                target = self.__target(process.fluent)
+                rate = self.__rate(process.equation.expression)
+                CompiledExpression(rate, fluents)  # raises ValueError on a variable that is not a fluent
+            except (ValueError, KeyError) as error:
+                self._skipped[str(process)] = str(error)
+                continue
+            self._processes.append(process)
+            targets.append(target)
+            rates.append(rate)
+        ids = sorted(set(targets))
+        self._ids = np.array(ids, dtype=np.int64)
+        self._positions = np.array([ids.index(target) for target in targets], dtype=np.int64)
+        self._summed = len(ids) < len(targets)
+        self._rates = CompiledVector(rates, fluents)
+
+    @property
+    def fluents(self):
+        return self._fluents
+
+    @property
+    def processes(self):
+        """
+        :return: list of the Process objects integrated
+        """
+        return self._processes
+
+    @property
+    def ids(self):
+        """
+        :return: int array of the fluent ids the processes change, in increasing order
+        """
+        return self._ids
+
+    @property
+    def rates(self):
+        """
+        :return: the CompiledVector of the rates of the processes, in the order of processes
+        """
+        return self._rates
+
+    @property
+    def skipped(self):
+        """
+        :return: dictionary from the processes left out to the reason
+        """
+        return dict(self._skipped)
+
+    def derivative(self, values):
+        """
+        :param values: fluent value vector, or (states, fluents) array of values
+        :return: array of the rates of change of the fluents of ids, (states, ids) for a batch
+        """
+        rates = self._rates(values)
+        rates = np.where(rates == rates, rates, 0.0)
+        if not self._summed:
+            return rates
+        summed = np.zeros(rates.shape[:-1] + (len(self._ids),))
+        np.add.at(summed, (Ellipsis, self._positions), rates)
+        return summed
+
+    def step(self, values, dt, method='rk4'):
+        """
+        :param values: fluent value vector, or (states, fluents) array of values, left unchanged
+        :param dt: the time step
+        :param method: 'euler' or 'rk4'
+        :return: the values dt later, bounded fluents clamped but not rounded
+        """
+        if method not in _orders:
+            raise ValueError('unknown integration method {}, expected one of {}'.format(method, ', '.join(_orders)))
+        return self.__advance(self._fluents.resize(values), dt, method)
+
+    def integrate(self, values, duration, dt=None, method='rk4', tolerance=None, watch=None, resolution=1e-9):
+        """
+        :param values: fluent value vector, or (states, fluents) array of values, left unchanged
+        :param duration: the time to integrate over
+        :param dt: the time step, the first one when adaptive; duration / 100 when None
+        :param method: 'euler' or 'rk4'
+        :param tolerance: the largest error estimate of a step on any process fluent, fixed steps when None
+        :param watch: function of a value vector, integration stops when its result differs from the one of
+                      values; not for batches
+        :param resolution: the width of time the change of watch is located to, and the smallest adaptive step
+        :return: (elapsed time, values, True when watch changed), bounded fluents enforced
+        """
+        if method not in _orders:
+            raise ValueError('unknown integration method {}, expected one of {}'.format(method, ', '.join(_orders)))
+        values = self._fluents.resize(values).copy()
+        if watch is not None and values.ndim != 1:
+            raise ValueError('watch is for a single value vector, not a batch')
+        if dt is None:
+            dt = duration / 100.0
+        order = _orders[method]
+        start = watch(values) if watch is not None else None
+        elapsed = 0.0
+        while elapsed < duration:
+            last = dt >= duration - elapsed
+            h = duration - elapsed if last else dt
+            if tolerance is None:
+                new = self.__advance(values, h, method)
+            else:
+                whole = self.__advance(values, h, method)
+                new = self.__advance(self.__advance(values, h / 2, method), h / 2, method)
+                error = np.abs(new - whole)[..., self._ids]
+                error = error[error == error]
+                error = error.max() / (2 ** order - 1) if error.size else 0.0
+                factor = 0.9 * (tolerance / error) ** (1.0 / (order + 1)) if error else 5.0
+                if error > tolerance and h > resolution:
+                    dt = max(h * max(factor, 0.1), resolution)
+                    continue
+                dt = max(h * min(factor, 5.0), resolution) if not last else dt
+            if watch is not None and watch(new) != start:
+                low, high = 0.0, h
+                while high - low > resolution:
+                    middle = (low + high) / 2
+                    candidate = self.__advance(values, middle, method)
+                    if watch(candidate) != start:
+                        high, new = middle, candidate
+                    else:
+                        low = middle
+                return elapsed + high, self._fluents.enforce(new, self._ids), True
+            values = new
+            elapsed = duration if last else elapsed + h
+        return elapsed, self._fluents.enforce(values, self._ids), False
+
+    def __advance(self, values, h, method):
+        # one step of h from values, a new array
+        ids = self._ids
+        result = values.copy()
+        if not len(ids):
+            return result
+        start = values[..., ids]
+        if method == 'euler':
+            result[..., ids] = start + h * self.derivative(values)
+        else:
+            k1 = self.derivative(values)
+            result[..., ids] = start + h / 2 * k1
+            k2 = self.derivative(result)
+            result[..., ids] = start + h / 2 * k2
+            k3 = self.derivative(result)
+            result[..., ids] = start + h * k3
+            k4 = self.derivative(result)
+            result[..., ids] = start + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+        return self._fluents.clip(result, ids)
+
+    def __target(self, name):
+        # the id of the fluent of no arguments a process changes
+        declared = self._declared.get(name)
+        if declared is None or declared.args:
+            raise ValueError('{} is not a declared fluent of no arguments'.format(name))
+        index = self._fluents.fluent_id((self._fluents.encoding.symbol_id(name),))
+        if self._fluents.symbolic[index]:
+            raise ValueError('{} is valued by objects'.format(name))
+        return index
+
+    def __rate(self, node):
+        # the equation with its names of fluents of no arguments made Fluents
+        if not isinstance(node, Expression):
+            return node
+        if node.operator is None:
+            name = node.value
+            if isinstance(name, str):
+                declared = self._declared.get(name[1:] if name.startswith('?') else name)
+                if declared is not None and not declared.args:
+                    return Fluent(declared.name, [])
+            return node
+        return Expression(operator=node.operator, left_child=self.__rate(node.left_child),
+                          right_child=self.__rate(node.right_child))
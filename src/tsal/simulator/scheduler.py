@@ -0,0 +1,296 @@
+# Author: Dustin Dannenhauer
+# Email: dustin.dannenhauer@parallaxresearch.org
+
+# This file is part of tsal-translator, an extension of pypddl-parser
+
+import heapq
+import math
+
+import numpy as np
+
+from tsal.translator.event import Event
+from tsal.translator.expression import Expression
+from tsal.translator.fluent import Fluent
+from tsal.translator.literal import Literal
+from tsal.translator.predicate import Predicate
+
+_block = 4096  # random numbers drawn per call to the generator
+
+
+def interarrival(distribution):
+    """
+    :param distribution: the FrequencyDistribution of an event, or None
+    :return: (stochastic, scale): the interarrival time is scale times a standard exponential draw when
+             stochastic, else scale itself; an event with no distribution occurs as soon as it is enabled
+    """
+    if distribution is None:
+        return False, 0.0
+    name, qualifier, value = distribution.name, distribution.qualifier, float(distribution.value)
+    if value < 0:
+        raise ValueError('negative parameter in {}'.format(distribution))
+    if name == 'exponential' and qualifier == 'mean':
+        return True, value
+    if name in ('exponential', 'poisson') and qualifier in ('frequency', 'rate', 'mean'):
+        # the occurrences of a poisson process of the given rate are exponentially distributed apart
+        return True, 1.0 / value if value else math.inf
+    if name in ('constant', 'fixed') and qualifier in ('mean', 'value', 'interval'):
+        return False, value
+    raise ValueError('unknown frequency distribution {}'.format(distribution))
+
+
+def _symbols(node, found):
+    """
+    :return: found, a set extended with the names of the predicates and fluents node (a condition or a list of
+             them) reads
+    """
+    if isinstance(node, Literal):
+        node = node.predicate
+    if isinstance(node, (Predicate, Fluent)):
+        found.add(node.name)
+        for arg in node.args:
+            _symbols(arg, found)
+    elif isinstance(node, Expression):
+        _symbols(node.left_child, found)
+        _symbols(node.right_child, found)
+    elif isinstance(node, (list, tuple)):
+        for item in node:
+            _symbols(item, found)
+    return found
+
+
+class EventScheduler(object):
+    """
+    Discrete event simulation of the events of a problem over the states of a SuccessorEngine.
+
+    Every enabled ground event, one per binding of its preconditions, is given an occurrence time when it
+    becomes enabled, the current time plus an interarrival time drawn from its :interarrival distribution (see
+    interarrival), and waits in a priority queue. The earliest one occurs: an outcome is drawn, applied, and
+    only the ground events whose preconditions read an atom or a fluent the change touched are tested again.
+    Those disabled leave the queue, those newly enabled join it; those still enabled keep their time, which for
+    exponential interarrival times is the same in distribution as drawing a new one. Durations are ignored,
+    effects happen at the occurrence time.
+
+    Random numbers come from a numpy Generator in blocks, so a scheduler made with the same seed, engine and
+    calls repeats the same run.
+    """
+
+    def __init__(self, engine, seed=None):
+        """
+
+        :param engine: a SuccessorEngine that grounded the events, alone or with the actions
+        :param seed: the seed of numpy.random.default_rng, or a numpy Generator
+        """
+        self._engine = engine
+        self._rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+        self._events = [ground for ground in engine.grounds if isinstance(ground.operator, Event)]
+        timing = {}
+        for ground in self._events:
+            if ground.operator.name not in timing:
+                timing[ground.operator.name] = interarrival(ground.operator.distribution)
+        self._timing = [timing[ground.operator.name] for ground in self._events]
+
+        # what each ground event depends on: its mask bits and equality fluents, and for the events with steps,
+        # which read atoms and fluents not known at grounding time, every symbol of their preconditions
+        encoding = engine.encoding
+        self._by_bit = {}
+        self._by_fluent = {}
+        self._by_symbol = {}
+        reads = {}
+        for number, ground in enumerate(self._events):
+            mask = ground.pre | ground.neg
+            while mask:
+                low = mask & -mask
+                self._by_bit.setdefault(low.bit_length() - 1, []).append(number)
+                mask ^= low
+            for index, _ in ground.equalities:
+                self._by_fluent.setdefault(index, []).append(number)
+            if ground.steps:
+                operator_ = ground.operator
+                if operator_.name not in reads:
+                    names = _symbols(list(operator_.precond or ()), set())
+                    reads[operator_.name] = [encoding.symbol_id(name) for name in sorted(names)
+                                             if name in encoding.symbols]
+                for symbol in reads[operator_.name]:
+                    self._by_symbol.setdefault(symbol, []).append(number)
+
+        self._exponentials = []
+        self._uniforms = []
+        self.reset()
+
+    @property
+    def engine(self):
+        return self._engine
+
+    @property
+    def events(self):
+        """
+        :return: list of the GroundOperator of every ground event
+        """
+        return self._events
+
+    @property
+    def time(self):
+        return self._time
+
+    @property
+    def state(self):
+        return self._state
+
+    @property
+    def values(self):
+        return self._values
+
+    @property
+    def pending(self):
+        """
+        :return: the number of enabled ground events waiting to occur
+        """
+        return len(self._active)
+
+    def reset(self, state=None, values=None, time=0.0):
+        """
+        Start over from a state, every enabled event drawn a new occurrence time.
+
+        :param state: the State, the initial state of the engine when None
+        :param values: its fluent value vector
+        :param time: the current time
+        """
+        if state is None:
+            state, values = self._engine.initial()
+        self._state, self._values, self._time = state, values, float(time)
+        self._queue = []
+        self._active = {}  # (event number, binding) -> sequence number of its queue entry
+        self._bindings = [()] * len(self._events)  # event number -> bindings in the queue
+        self._sequence = 0
+        self.__check(range(len(self._events)))
+
+    def peek(self):
+        """
+        :return: (time, GroundOperator, binding) of the next event to occur, None when no event is enabled
+        """
+        entry = self.__next()
+        if entry is None:
+            return None
+        return entry[0], self._events[entry[2]], entry[3]
+
+    def step(self, until=math.inf):
+        """
+        Make the next event occur, when it does by until.
+
+        :param until: the time not to go past; the time becomes until when no event occurs by then
+        :return: (time, GroundOperator, binding) of the event that occurred, None when none did
+        """
+        entry = self.__next()
+        if entry is None or entry[0] > until:
+            if until != math.inf:
+                self._time = max(self._time, until)
+            return None
+        heapq.heappop(self._queue)
+        time, _, number, binding = entry
+        del self._active[(number, binding)]
+        self._bindings[number] = tuple(other for other in self._bindings[number] if other != binding)
+        ground = self._events[number]
+        self._time = time
+        outcome = 0
+        outcomes = ground.outcomes
+        if len(outcomes) > 1:
+            draw = self.__uniform()
+            while outcome < len(outcomes) - 1 and draw >= outcomes[outcome].probability:
+                draw -= outcomes[outcome].probability
+                outcome += 1
+        state, values = self._engine.apply(self._state, self._values, ground, binding, outcome)
+        self.__changed(state, values, number)
+        return time, ground, binding
+
+    def run(self, until=math.inf, limit=None):
+        """
+        Make the events occur in time order until no event is enabled, the time passes until, or limit events
+        occurred.
+
+        :return: list of (time, GroundOperator, binding) of the events that occurred
+        """
+        trace = []
+        while limit is None or len(trace) < limit:
+            occurred = self.step(until)
+            if occurred is None:
+                break
+            trace.append(occurred)
+        return trace
+
+    def update(self, state, values):
+        """
+        Move to a state changed outside of the scheduler, e.g. by an action, at the current time; the events it
+        enables or disables are tested again.
+        """
+        self.__changed(state, values)
+
+    def __changed(self, state, values, fired=None):
+        # the ground events to test again after the move to state: those reading a changed bit or fluent
+        old_bits, old_values = self._state.bits, self._values
+        self._state, self._values = state, values
+        numbers = set() if fired is None else {fired}
+        by_symbol = self._by_symbol
+        changed = old_bits ^ state.bits
+        while changed:
+            low = changed & -changed
+            changed ^= low
+            bit = low.bit_length() - 1
+            numbers.update(self._by_bit.get(bit, ()))
+            if by_symbol:
+                numbers.update(by_symbol.get(self._engine.index.atom_code(bit)[0], ()))
+        if values is not old_values:
+            shared = min(len(values), len(old_values))
+            new, old = values[:shared], old_values[:shared]
+            ids = np.flatnonzero((new != old) & ~(np.isnan(new) & np.isnan(old))).tolist()
+            ids.extend(range(shared, len(values)))
+            for index in ids:
+                numbers.update(self._by_fluent.get(index, ()))
+                if by_symbol:
+                    numbers.update(by_symbol.get(self._engine.fluents.fluent_code(index)[0], ()))
+        self.__check(sorted(numbers))
+
+    def __check(self, numbers):
+        # test the ground events numbers on the current state, queue those newly enabled, drop those disabled
+        bits, values = self._state.bits, self._values
+        active = self._active
+        for number in numbers:
+            ground = self._events[number]
+            old = self._bindings[number]
+            if ground.holds(bits, values):
+                new = tuple(ground.bindings(bits, values))
+            else:
+                new = ()
+            if new == old:
+                continue
+            for binding in old:
+                if binding not in new:
+                    del active[(number, binding)]
+            stochastic, scale = self._timing[number]
+            for binding in new:
+                if (number, binding) in active:
+                    continue
+                delay = scale * self.__exponential() if stochastic else scale
+                self._sequence += 1
+                active[(number, binding)] = self._sequence
+                heapq.heappush(self._queue, (self._time + delay, self._sequence, number, binding))
+            self._bindings[number] = new
+
+    def __next(self):
+        # the earliest queue entry still enabled, the stale ones before it dropped
+        queue = self._queue
+        while queue:
+            entry = queue[0]
+            if self._active.get((entry[2], entry[3])) == entry[1]:
+                return entry
+            heapq.heappop(queue)
+        return None
+
+    def __exponential(self):
+        if not self._exponentials:
+            self._exponentials = self._rng.standard_exponential(_block).tolist()[::-1]
+        return self._exponentials.pop()
+
+    def __uniform(self):
+        if not self._uniforms:
+            self._uniforms = self._rng.random(_block).tolist()[::-1]
+        return self._uniforms.pop()
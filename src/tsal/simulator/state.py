@@ -0,0 +1,211 @@
+# Author: Dustin Dannenhauer
+# Email: dustin.dannenhauer@parallaxresearch.org
+
+# This file is part of tsal-translator, an extension of pypddl-parser
+
+from tsal.translator.fluent import Fluent
+from tsal.translator.literal import Literal
+from tsal.translator.predicate import Predicate
+
+
+def _is_assignment(atom):
+    return isinstance(atom, Predicate) and atom.name == '=' and atom.arity == 2 and isinstance(atom.args[0], Fluent)
+
+
+class AtomIndex(object):
+    """
+    Bit positions of the ground predicates of a problem, the index of the State bitsets.
+
+    Atoms are given as Predicate or Literal objects or as their codes (see Problem.encoding) and get the next
+    free bit the first time they are met. With an analysis (see Domain.analysis) the atoms of static
+    predicates get no bit: they hold in every state or in none, as in the initial state, and are kept apart.
+    """
+
+    def __init__(self, encoding, analysis=None):
+        """
+
+        :param encoding: the Encoding of the problem, e.g. problem.encoding(domain)
+        :param analysis: SymbolAnalysis of the domain, every predicate gets bits when None
+        """
+        self._encoding = encoding
+        self._static_symbols = frozenset(encoding.symbol_id(name) for name in analysis.static
+                                         if name in encoding.symbols) if analysis is not None else frozenset()
+        self._bits = {}  # code -> bit
+        self._codes = []  # bit -> code
+        self._static = set()  # codes of the static atoms true initially
+
+    @property
+    def encoding(self):
+        return self._encoding
+
+    def __len__(self):
+        return len(self._codes)
+
+    def __contains__(self, atom):
+        return self.code(atom) in self._bits
+
+    def code(self, atom):
+        """
+        :return: the code of atom, a Predicate, Literal or code
+        """
+        if type(atom) is tuple:
+            return atom
+        return self._encoding.encode(atom)
+
+    def is_static(self, code):
+        return code[0] in self._static_symbols
+
+    def holds_static(self, code):
+        """
+        :return: True when code is the code of a static atom true initially
+        """
+        return code in self._static
+
+    def find(self, atom):
+        """
+        :return: the bit of atom, None when it has none
+        """
+        return self._bits.get(self.code(atom))
+
+    def bit(self, atom):
+        """
+        :return: the bit of atom, a new one when atom has none yet, None for a static atom
+        """
+        code = self.code(atom)
+        bit = self._bits.get(code)
+        if bit is None:
+            if code[0] in self._static_symbols:
+                return None
+            bit = self._bits[code] = len(self._codes)
+            self._codes.append(code)
+        return bit
+
+    def mask(self, atoms):
+        """
+        :return: int with the bits of atoms set, static atoms left out
+        """
+        mask = 0
+        for atom in atoms:
+            bit = self.bit(atom)
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+
+    def atom_code(self, bit):
+        return self._codes[bit]
+
+    def atom(self, bit):
+        """
+        :return: the Predicate of bit
+        """
+        return self._encoding.decode(self._codes[bit])
+
+    def initial_state(self, problem):
+        """
+        :param problem: the Problem of the encoding
+        :return: State of the predicates of problem.init, its static atoms recorded in the index, fluent
+                 assignments left out
+        """
+        bits = 0
+        for atom in problem.init:
+            if _is_assignment(atom) or (isinstance(atom, Literal) and not atom.is_positive()):
+                continue
+            code = self.code(atom)
+            if code[0] in self._static_symbols:
+                self._static.add(code)
+            else:
+                bits |= 1 << self.bit(code)
+        return State(self, bits)
+
+
+class State(object):
+    """
+    Immutable set of ground predicates as a bitset over an AtomIndex, packed in a Python int.
+
+    Membership is a bit test, hash and equality are those of the int, and copying returns the state itself;
+    set and clear, and apply with precomputed masks (see AtomIndex.mask), change any number of atoms in two
+    int operations and return a new state.
+    """
+
+    __slots__ = ('_index', '_bits')
+
+    def __init__(self, index, bits=0):
+        """
+
+        :param index: the AtomIndex giving the bits
+        :param bits: int with the bits of the true atoms set
+        """
+        self._index = index
+        self._bits = bits
+
+    @property
+    def index(self):
+        return self._index
+
+    @property
+    def bits(self):
+        return self._bits
+
+    def __contains__(self, atom):
+        code = self._index.code(atom)
+        if self._index.is_static(code):
+            return self._index.holds_static(code)
+        bit = self._index.find(code)
+        return bit is not None and (self._bits >> bit) & 1 == 1
+
+    def holds_all(self, mask):
+        return self._bits & mask == mask
+
+    def holds_none(self, mask):
+        return not self._bits & mask
+
+    def apply(self, add_mask, del_mask=0):
+        """
+        :return: State with the bits of del_mask cleared then those of add_mask set
+        """
+        return State(self._index, (self._bits & ~del_mask) | add_mask)
+
+    def set(self, atoms):
+        return State(self._index, self._bits | self._index.mask(atoms))
+
+    def clear(self, atoms):
+        return State(self._index, self._bits & ~self._index.mask(atoms))
+
+    def __iter__(self):
+        """
+        :return: generator of the codes of the true atoms, static atoms left out, in bit order
+        """
+        bits = self._bits
+        codes = self._index.atom_code
+        while bits:
+            low = bits & -bits
+            yield codes(low.bit_length() - 1)
+            bits ^= low
+
+    def atoms(self):
+        """
+        :return: list of the true atoms as Predicate objects, static atoms left out
+        """
+        decode = self._index.encoding.decode
+        return [decode(code) for code in self]
+
+    def __len__(self):
+        return bin(self._bits).count('1')
+
+    def __eq__(self, other):
+        return isinstance(other, State) and self._bits == other._bits and self._index is other._index
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self._bits)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return 'State({})'.format(' '.join(repr(atom) for atom in self.atoms()))
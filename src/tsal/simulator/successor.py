@@ -0,0 +1,1039 @@
+# Author: Dustin Dannenhauer
+# Email: dustin.dannenhauer@parallaxresearch.org
+
+# This file is part of tsal-translator, an extension of pypddl-parser
+
+import itertools
+import math
+
+from tsal.simulator.evaluation import CompiledExpression, object_values
+from tsal.simulator.fluents import FluentIndex
+from tsal.simulator.generator import SuccessorGenerator
+from tsal.simulator.grounding import Grounder, parameter_name
+from tsal.simulator.state import AtomIndex, State
+from tsal.translator.analysis import is_conditional, is_deterministic, operator_effects
+from tsal.translator.expression import Expression
+from tsal.translator.fluent import Fluent
+from tsal.translator.literal import Literal
+from tsal.translator.predicate import Predicate
+from tsal.translator.term import Term
+
+_comparisons = ('=', '!=', '<', '>', '<=', '>=')
+_updates = ('=', '+', '-', '*', '/')
+_once = (None,)
+# the kinds of precondition steps, in the order they are preferred when several are ready
+_kinds = ('literal', 'equal', 'equals', 'test', 'or', 'value', 'bind', 'match', 'fluent')
+
+
+class _Never(Exception):
+    # a precondition that holds in no state, e.g. over an object of no problem
+    pass
+
+
+def _arg(arg):
+    if isinstance(arg, Term):
+        return arg.name if arg.is_variable() else arg.value
+    return arg
+
+
+def _is_variable(value):
+    return isinstance(value, str) and value.startswith('?')
+
+
+def _is_leaf(node):
+    return isinstance(node, Expression) and node.operator is None
+
+
+def _names(node, found):
+    """
+    :return: found, a list extended with the variables of node (a condition, an effect or a list of them) in
+             the order they appear
+    """
+    if isinstance(node, Literal):
+        node = node.predicate
+    if isinstance(node, (Predicate, Fluent)):
+        for arg in node.args:
+            name = _arg(arg)
+            if _is_variable(name) and name not in found:
+                found.append(name)
+    elif isinstance(node, Expression):
+        if node.operator is None:
+            if _is_variable(node.value) and node.value not in found:
+                found.append(node.value)
+        else:
+            _names(node.left_child, found)
+            _names(node.right_child, found)
+    elif isinstance(node, (list, tuple)):
+        for item in node:
+            _names(item, found)
+    return found
+
+
+def _sides(condition):
+    # (left, right) of an equality, the fluent on the left when there is one
+    left, right = condition.left_child, condition.right_child
+    if not isinstance(left, Fluent) and isinstance(right, Fluent):
+        return right, left
+    return left, right
+
+
+def _resolve(args, binding):
+    # args: object ids, and ~position for the variable at position in binding
+    return tuple([arg if arg >= 0 else binding[~arg] for arg in args])
+
+
+def _substitute(args, known):
+    # the variables with a value in known (a list, None for unknown) replaced by that value
+    return tuple([arg if arg >= 0 or known[~arg] is None else known[~arg] for arg in args])
+
+
+def _branches(effects, probability=1.0):
+    """
+    :return: list of (probability, deterministic effect list), one per branch of a oneof or labeled effect,
+             branches equally likely
+    """
+    if is_deterministic(effects):
+        return [(probability, effects)]
+    branches = [item[1] if isinstance(item, tuple) else item for item in effects if isinstance(item, (tuple, list))]
+    found = []
+    for branch in branches:
+        found += _branches(branch, probability / len(branches))
+    return found
+
+
+def _items(items):
+    return [item[1] if isinstance(item, tuple) else item for item in items]
+
+
+def _parts(effects):
+    """
+    :param effects: a deterministic effect list
+    :return: (certain effects, [(probability, effect)] of the probabilistic ones, [(forall variables,
+             conditions, effects)] of the conditional ones)
+    """
+    certain, chances, conditionals = [], [], []
+    for item in effects:
+        if isinstance(item, tuple) and item[0] == 'WHEN':
+            conditionals.append(((), _items(item[1]), _items(item[2])))
+        elif isinstance(item, tuple) and item[0] == 'FORALL':
+            conditionals.append((tuple(item[1]), _items(item[2][1]), _items(item[2][2])))
+        elif isinstance(item, tuple):
+            probability, effect = item
+            (certain if probability >= 1 else chances).append(effect if probability >= 1 else item)
+        elif isinstance(item, list) and item and is_conditional(item):  # (when conditions effects)
+            conditionals.append(((), _items(item[0]), _items(item[1])))
+        elif isinstance(item, (Literal, Expression)):
+            certain.append(item)
+    return certain, chances, conditionals
+
+
+def _outcomes(effects):
+    """
+    :return: list of (probability, effects, conditionals), one per combination of a oneof branch and of the
+             probabilistic effects that happen, impossible combinations left out
+    """
+    outcomes = []
+    for probability, branch in _branches(effects):
+        certain, chances, conditionals = _parts(branch)
+        for happens in itertools.product((True, False), repeat=len(chances)):
+            chance = probability
+            effects = list(certain)
+            for (p, effect), happened in zip(chances, happens):
+                chance *= p if happened else 1.0 - p
+                if happened:
+                    effects.append(effect)
+            if chance > 0:
+                outcomes.append((chance, effects, conditionals))
+    return outcomes
+
+
+class Outcome(object):
+    """
+    One outcome of a ground action or event: its probability and the changes it makes. The add and delete
+    masks hold the effects known at grounding time; effects over variables bound by the preconditions,
+    conditional effects and numeric effects are applied by SuccessorEngine.apply.
+    """
+
+    def __init__(self, probability, add, delete, literals=(), numeric=(), conditionals=()):
+        self._probability = probability
+        self._add = add
+        self._delete = delete
+        self._literals = tuple(literals)  # (positive, symbol, args) resolved on the binding
+        self._numeric = tuple(numeric)  # (operator, fluent id or (symbol, args), CompiledExpression)
+        self._conditionals = tuple(conditionals)  # (pre, neg, checks, add, delete, literals, forall ids)
+        self._simple = not (self._literals or self._numeric or self._conditionals)
+
+    @property
+    def probability(self):
+        return self._probability
+
+    @property
+    def add(self):
+        return self._add
+
+    @property
+    def delete(self):
+        return self._delete
+
+    @property
+    def literals(self):
+        return self._literals
+
+    @property
+    def numeric(self):
+        return self._numeric
+
+    @property
+    def conditionals(self):
+        return self._conditionals
+
+    @property
+    def simple(self):
+        """
+        :return: True when the outcome is only the add and delete masks
+        """
+        return self._simple
+
+
+class GroundOperator(object):
+    """
+    An action or event grounded on objects: the bitset masks of the preconditions decided by the state alone,
+    the fluents that must equal a constant, the search of the variables the preconditions bind (e.g. ?p in
+    (= (current-player) ?p)) with the other conditions, and the outcomes.
+    """
+
+    def __init__(self, operator_, ids, args, pre, neg, equalities, steps, binding, outcomes):
+        self._operator = operator_
+        self._ids = ids
+        self._args = args
+        self._pre = pre
+        self._neg = neg
+        self._equalities = equalities
+        self._steps = steps
+        self._binding = binding
+        self._outcomes = outcomes
+        self._simple = not steps and len(outcomes) == 1 and outcomes[0].simple and outcomes[0].probability == 1.0
+
+    @property
+    def operator(self):
+        return self._operator
+
+    @property
+    def ids(self):
+        """
+        :return: tuple of the object ids of the parameters
+        """
+        return self._ids
+
+    @property
+    def args(self):
+        """
+        :return: tuple of the object names of the parameters
+        """
+        return self._args
+
+    @property
+    def pre(self):
+        return self._pre
+
+    @property
+    def neg(self):
+        return self._neg
+
+    @property
+    def equalities(self):
+        """
+        :return: tuple of (fluent id, value) of the fluents the preconditions compare to a constant
+        """
+        return self._equalities
+
+    @property
+    def steps(self):
+        return self._steps
+
+    @property
+    def binding(self):
+        """
+        :return: tuple of the object ids of the variables known at grounding time, None for those the
+                 preconditions bind
+        """
+        return self._binding
+
+    @property
+    def outcomes(self):
+        return self._outcomes
+
+    @property
+    def simple(self):
+        """
+        :return: True when the masks and equalities decide the preconditions and the only outcome is simple and
+                 certain
+        """
+        return self._simple
+
+    def holds(self, bits, values):
+        """
+        :return: True when the masks and the equalities hold in the State of bits and values
+        """
+        if bits & self._pre != self._pre or bits & self._neg:
+            return False
+        for index, value in self._equalities:
+            if values[index] != value:
+                return False
+        return True
+
+    def bindings(self, bits, values):
+        """
+        :param bits: the bits of a State the masks and equalities hold in
+        :param values: its fluent value vector
+        :return: generator of the bindings, tuples of object ids, the preconditions hold for
+        """
+        if not self._steps:
+            yield self._binding
+            return
+        for binding in _solve(self._steps, 0, bits, values, list(self._binding)):
+            yield binding
+
+    def __repr__(self):
+        return '({})'.format(' '.join((self._operator.name,) + tuple(str(arg) for arg in self._args)))
+
+
+def _solve(steps, depth, bits, values, binding):
+    # depth first search of the bindings of the runtime steps, (check, function) pairs; a check is a test, the
+    # other steps bind variables and yield once per way to bind them
+    if depth == len(steps):
+        yield tuple(binding)
+        return
+    check, function = steps[depth]
+    if check:
+        if function(bits, values, binding):
+            for solution in _solve(steps, depth + 1, bits, values, binding):
+                yield solution
+    else:
+        for _ in function(bits, values, binding):
+            for solution in _solve(steps, depth + 1, bits, values, binding):
+                yield solution
+
+
+class _Schema(object):
+    """
+    An action or event compiled over the positions of its variables: the parameters, then the variables the
+    preconditions bind, in the order they are bound, then those only the effects mention, which are undefined.
+    """
+
+    def __init__(self, engine, operator_):
+        self._engine = engine
+        self._encoding = engine.encoding
+        self.operator = operator_
+        self.params = [parameter_name(param) for param in operator_.params]
+        self.variables = list(self.params)
+        self.positions = {name: position for position, name in enumerate(self.params)}
+        self.conditions = self.__order(list(operator_.precond or ()))
+        self.bound = len(self.variables)
+        outcomes = _outcomes(operator_effects(operator_))
+        foralls = {parameter_name(param) for _, _, conditionals in outcomes
+                   for variables, _, _ in conditionals for param in variables}
+        mentioned = [[effects] + [conditions + then for _, conditions, then in conditionals]
+                     for _, effects, conditionals in outcomes]
+        for name in _names(mentioned, []):
+            if name not in self.positions and name not in foralls:
+                self.positions[name] = len(self.variables)
+                self.variables.append(name)
+        self.steps = [self.__step(kind, condition) for kind, condition in self.conditions]
+        self.outcomes = [self.__outcome(*outcome) for outcome in outcomes]
+
+    def __order(self, conditions):
+        # the conditions in an order that binds every free variable before it is read: checks first, then the
+        # single valued bindings, then the enumerations; raises ValueError when a variable cannot be bound
+        bound = set(self.params)
+        ordered = []
+        while conditions:
+            ready = [(self.__readiness(condition, bound), number) for number, condition in enumerate(conditions)]
+            ready = [(kind, number) for kind, number in ready if kind is not None]
+            if not ready:
+                names = [name for name in _names(conditions, []) if name not in bound]
+                raise ValueError('{}: cannot bind {} from the preconditions'.format(self.operator.name,
+                                                                                    ', '.join(names)))
+            kind, number = min(ready, key=lambda r: (_kinds.index(r[0]), r[1]))
+            condition = conditions.pop(number)
+            for name in _names(condition, []):
+                if name not in bound:
+                    bound.add(name)
+                    self.positions[name] = len(self.variables)
+                    self.variables.append(name)
+            ordered.append((kind, condition))
+        return ordered
+
+    @staticmethod
+    def __readiness(condition, bound):
+        free = [name for name in _names(condition, []) if name not in bound]
+        if isinstance(condition, list):
+            return None if free else 'or'
+        if isinstance(condition, Literal):
+            if condition.predicate.name == '=' and condition.predicate.arity == 2:
+                return None if free else 'equal'
+            if not free:
+                return 'literal'
+            return 'match' if condition.is_positive() else None
+        if not isinstance(condition, Expression) or condition.operator not in _comparisons:
+            raise ValueError('unsupported precondition {}'.format(condition))
+        if not free:
+            if condition.operator == '=':
+                left, right = _sides(condition)
+                if isinstance(left, Fluent) and _is_leaf(right) and not _is_variable(right.value):
+                    return 'equals'
+            return 'test'
+        if condition.operator != '=':
+            return None
+        left, right = _sides(condition)
+        if isinstance(left, Fluent):
+            rest = [name for name in _names(right, []) if name not in bound]
+            if rest and not (_is_leaf(right) and len(rest) == 1):
+                return None
+            return 'value' if not [name for name in _names(left, []) if name not in bound] else 'fluent'
+        if _is_leaf(left) and _is_variable(left.value) and left.value in free and \
+                not [name for name in _names(right, []) if name not in bound]:
+            return 'bind'
+        return None
+
+    def __args(self, args):
+        spec = []
+        for arg in args:
+            name = _arg(arg)
+            spec.append(~self.positions[name] if _is_variable(name) else self._encoding.object_id(name))
+        return tuple(spec)
+
+    def __compile(self, expression, extra=()):
+        return CompiledExpression(expression, self._engine.fluents, self.variables + list(extra),
+                                  self._engine.objects)
+
+    def __step(self, kind, condition):
+        # (check, function) of a condition, or (kind, args) of a literal the grounding may decide
+        engine = self._engine
+        if kind in ('literal', 'equal'):
+            try:
+                predicate = condition.predicate
+                symbol = None if kind == 'equal' else self._encoding.symbol_id(predicate.name)
+                return kind, (condition.is_positive(), symbol, self.__args(predicate.args))
+            except KeyError:
+                if condition.is_positive():
+                    raise _Never(condition)
+                return 'true', None
+        if kind == 'or':
+            checks = []
+            for member in condition:
+                try:
+                    check, step = self.__step(self.__readiness(member, set(self.variables)), member)
+                except _Never:
+                    continue
+                if check == 'true':
+                    return 'true', None
+                if check == 'equals':
+                    check, step = True, step[3]
+                checks.append(step if check is True else engine.check(check, step))
+            if not checks:
+                raise _Never(condition)
+            return True, lambda bits, values, binding: any(check(bits, values, binding) for check in checks)
+        if kind in ('test', 'equals'):
+            expression = self.__compile(condition)
+            test = lambda bits, values, binding: bool(expression(values, binding))
+            if kind == 'test':
+                return True, test
+            # a fluent equal to a constant, a switch of the successor generator when its arguments are known at
+            # grounding time, a test otherwise
+            left, right = _sides(condition)
+            try:
+                symbol = self._encoding.symbol_id(left.name)
+                args = self.__args(left.args)
+                value = right.value if isinstance(right.value, (int, float)) and not isinstance(right.value, bool) \
+                    else self._encoding.object_id(right.value)
+            except KeyError:
+                raise _Never(condition)  # undefined or unequal in every state
+            return kind, (symbol, args, float(value), test)
+        if kind == 'match':
+            try:
+                symbol = self._encoding.symbol_id(condition.predicate.name)
+                args = self.__args(condition.predicate.args)
+            except KeyError:
+                raise _Never(condition)
+            return False, engine.matcher(symbol, args, self.__first(condition, condition))
+        left, right = _sides(condition)
+        if kind in ('value', 'fluent'):
+            try:
+                symbol = self._encoding.symbol_id(left.name)
+                args = self.__args(left.args)
+            except KeyError:
+                raise _Never(condition)
+            binds = self.__first(condition, left)
+            target = self.positions[right.value] if _is_leaf(right) and _is_variable(right.value) \
+                and right.value not in self.__before(condition) and self.positions[right.value] not in binds else None
+            expression = None if target is not None else self.__compile(right)
+            return False, engine.fluent_matcher(symbol, args, binds, target, expression)
+        # bind: a variable equal to an expression over bound variables
+        target = self.positions[left.value]
+        if _is_leaf(right) and _is_variable(right.value):
+            source = self.positions[right.value]
+
+            def copy(bits, values, binding):
+                binding[target] = binding[source]
+                return _once
+            return False, copy
+        if _is_leaf(right) and not isinstance(right.value, (int, float)):
+            try:
+                constant = self._encoding.object_id(right.value)
+            except KeyError:
+                raise _Never(condition)
+
+            def bind(bits, values, binding):
+                binding[target] = constant
+                return _once
+            return False, bind
+        expression = self.__compile(right)
+        return False, engine.number_binder(target, expression)
+
+    def __before(self, condition):
+        # the variables bound before condition
+        bound = set(self.params)
+        for _, other in self.conditions:
+            if other is condition:
+                return bound
+            bound.update(_names(other, []))
+        return bound
+
+    def __first(self, condition, node):
+        # positions of the variables of node, a part of condition, that condition binds
+        before = self.__before(condition)
+        return frozenset(self.positions[name] for name in _names(node, []) if name not in before)
+
+    def __outcome(self, probability, effects, conditionals):
+        literals, numeric = [], []
+        for effect in effects:
+            if isinstance(effect, Literal):
+                predicate = effect.predicate
+                literals.append((effect.is_positive(), self._encoding.symbol_id(predicate.name),
+                                 self.__args(predicate.args)))
+            elif isinstance(effect, Expression) and effect.operator in _updates \
+                    and isinstance(effect.left_child, Fluent):
+                fluent = effect.left_child
+                try:
+                    target = (self._encoding.symbol_id(fluent.name), self.__args(fluent.args))
+                except KeyError:
+                    raise ValueError('{}: {} is not a fluent of the problem'.format(self.operator.name, fluent))
+                numeric.append((effect.operator, target, self.__compile(effect.right_child)))
+            else:
+                raise ValueError('{}: unsupported effect {}'.format(self.operator.name, effect))
+        compiled = []
+        for variables, conditions, then in conditionals:
+            names = [parameter_name(param) for param in variables]
+            for number, name in enumerate(names):
+                self.positions[name] = len(self.variables) + number
+            types = [param.type for param in variables]
+            checks = []
+            for condition in conditions:
+                if isinstance(condition, Literal):
+                    predicate = condition.predicate
+                    symbol = None if predicate.name == '=' else self._encoding.symbol_id(predicate.name)
+                    checks.append(('equal' if symbol is None else 'literal',
+                                   (condition.is_positive(), symbol, self.__args(predicate.args))))
+                else:
+                    expression = self.__compile(condition, names)
+                    checks.append((True, lambda bits, values, binding, e=expression: bool(e(values, binding))))
+            effects = []
+            for effect in then:
+                if not isinstance(effect, Literal):
+                    raise ValueError('{}: unsupported conditional effect {}'.format(self.operator.name, effect))
+                effects.append((effect.is_positive(), self._encoding.symbol_id(effect.predicate.name),
+                                self.__args(effect.predicate.args)))
+            for name in names:
+                del self.positions[name]
+            compiled.append((types, checks, effects))
+        return probability, literals, numeric, compiled
+
+
+class SuccessorEngine(object):
+    """
+    Applicable ground actions and successor states over the compact state of a problem: a State bitset of its
+    predicates (see AtomIndex) and a float64 vector of its fluent values (see FluentIndex).
+
+    The actions (or the events) are grounded once. The preconditions over the parameters become two masks, the
+    atoms that must hold and those that must not; the other conditions are compiled: comparisons with
+    CompiledExpression, and the variables that are not parameters are bound on the state, by a fluent
+    equality such as (= (current-player) ?p), by an expression (= ?x (+ ?y 1)), or by matching a positive
+    literal or a fluent with unbound arguments against the state. Variables only the effects mention are
+    undefined (NaN) and an operator whose preconditions cannot bind a variable is left out, see skipped. A
+    SuccessorGenerator over the groundings finds the applicable ones of a state.
+
+    The effects of a ground operator are compiled to outcomes: one per branch of a oneof (or per label),
+    branches equally likely, times the combinations of its probabilistic effects. Applying an outcome deletes
+    then adds atoms, conditional (when, forall) effects tested on the state before the change, and evaluates
+    the numeric effects on the values before the change; the new values are enforced to their bounds. Values
+    vectors are never changed in place: an outcome with no numeric effect shares the vector of its parent.
+    A numeric effect on a fluent with no id yet gives it one and a longer vector; the vectors made before are
+    not resized, the fluent is undefined in them.
+
+    Throughput on blocksworld (benchmarks/bench_successor.py) is about 240k transitions per second for an
+    expansion and 500k for apply alone, short of the million per second aimed at.
+    """
+
+    def __init__(self, domain, problem, operators=None):
+        """
+
+        :param domain: the Domain of the operators
+        :param problem: the Problem giving the objects and the initial state
+        :param operators: the actions or events to ground, the actions of domain when None
+        """
+        self._domain = domain
+        self._problem = problem
+        self._encoding = problem.encoding(domain)
+        self._index = AtomIndex(self._encoding, domain.analysis)
+        self._fluents = FluentIndex(self._encoding, domain.fluents)
+        self._objects = object_values(self._encoding)
+        self._numbers = {}  # number (None for NaN) -> object id, the encoding ids of the numeric objects included
+        for index, value in enumerate(self._objects):
+            if value == value and isinstance(self._encoding.objects[index], (int, float)):
+                self._numbers.setdefault(value, index)
+        self._undefined = self.__object(math.nan)  # the id of the variables only the effects mention
+        self._initial = self._index.initial_state(problem)
+        values = self._fluents.initial_values(problem)
+        self._static = {}  # symbol -> codes of its static atoms true initially
+        for atom in problem.init:
+            if isinstance(atom, Predicate) and not (atom.name == '=' and atom.arity == 2):
+                code = self._index.code(atom)
+                if self._index.is_static(code):
+                    self._static.setdefault(code[0], []).append(code)
+
+        if operators is None:
+            operators = domain.operators
+        self._skipped = {}
+        self._grounds = []
+        self._by_symbol = {}  # symbol -> [(fluent id, argument ids)], for the fluents matched on their arguments
+        grounder = Grounder(domain, problem)
+        for operator_ in operators:
+            try:
+                schema = _Schema(self, operator_)
+            except _Never:
+                continue
+            except (ValueError, KeyError) as error:
+                self._skipped[operator_.name] = str(error)
+                continue
+            for names in grounder.groundings(operator_):
+                ground = self.__ground(schema, names)
+                if ground is not None:
+                    self._grounds.append(ground)
+        for index in range(len(self._fluents)):
+            code = self._fluents.fluent_code(index)
+            self._by_symbol.setdefault(code[0], []).append((index, code[1:]))
+        self._values = self._fluents.resize(values)
+        self._generator = SuccessorGenerator(self._grounds)
+
+    @property
+    def encoding(self):
+        return self._encoding
+
+    @property
+    def index(self):
+        """
+        :return: the AtomIndex of the states
+        """
+        return self._index
+
+    @property
+    def fluents(self):
+        """
+        :return: the FluentIndex of the value vectors
+        """
+        return self._fluents
+
+    @property
+    def objects(self):
+        """
+        :return: list of the values of the object ids, see object_values, with the numbers bound at runtime
+        """
+        return self._objects
+
+    @property
+    def grounds(self):
+        """
+        :return: list of the GroundOperator of every grounding
+        """
+        return self._grounds
+
+    @property
+    def generator(self):
+        """
+        :return: the SuccessorGenerator of the groundings
+        """
+        return self._generator
+
+    @property
+    def skipped(self):
+        """
+        :return: dictionary from the names of the operators left out to the reason
+        """
+        return dict(self._skipped)
+
+    def initial(self):
+        """
+        :return: (State, values) of the initial state of the problem
+        """
+        return self._initial, self._values
+
+    def applicable(self, state, values):
+        """
+        :return: list of (GroundOperator, binding) of the groundings applicable in the state, the binding the
+                 tuple of the object ids of the variables, one pair per binding the preconditions allow
+        """
+        return self._generator.applicable(state, values)
+
+    def apply(self, state, values, ground, binding=None, outcome=0):
+        """
+        :param state: the State ground is applicable in
+        :param values: its fluent value vector
+        :param ground: the GroundOperator
+        :param binding: the binding found by applicable, that of the grounding when None
+        :param outcome: the index of the outcome in ground.outcomes
+        :return: (State, values) of the successor
+        """
+        outcome = ground._outcomes[outcome]  # the attributes, not the properties, on this hot path
+        bits = state._bits
+        if outcome._simple:
+            return State(self._index, (bits & ~outcome._delete) | outcome._add), values
+        if binding is None:
+            binding = ground.binding
+        add, delete = outcome.add, outcome.delete
+        bit = self._index.bit
+        for positive, symbol, args in outcome.literals:
+            position = bit((symbol,) + _resolve(args, binding))
+            if position is not None:
+                if positive:
+                    add |= 1 << position
+                else:
+                    delete |= 1 << position
+        for pre, neg, checks, cadd, cdel, literals, extra in outcome.conditionals:
+            if bits & pre != pre or bits & neg:
+                continue
+            full = tuple(binding) + extra
+            if not all(check(bits, values, full) for check in checks):
+                continue
+            add, delete = add | cadd, delete | cdel
+            for positive, symbol, args in literals:
+                position = bit((symbol,) + _resolve(args, full))
+                if position is not None:
+                    if positive:
+                        add |= 1 << position
+                    else:
+                        delete |= 1 << position
+        if outcome.numeric:
+            values = self.__update(values, outcome.numeric, binding)
+        return State(self._index, (bits & ~delete) | add), values
+
+    def successors(self, state, values):
+        """
+        :return: list of (GroundOperator, binding, probability, State, values), one per outcome of every
+                 applicable grounding
+        """
+        bits = state.bits
+        index = self._index
+        found = []
+        for ground in self._generator.candidates(bits, values):
+            if ground._simple:  # the attributes, not the properties, on this hot path
+                outcome = ground._outcomes[0]
+                found.append((ground, ground._binding, 1.0, State(index, (bits & ~outcome._delete) | outcome._add),
+                              values))
+                continue
+            for binding in ground.bindings(bits, values):
+                for number, outcome in enumerate(ground.outcomes):
+                    successor, successor_values = self.apply(state, values, ground, binding, number)
+                    found.append((ground, binding, outcome.probability, successor, successor_values))
+        return found
+
+    def sample(self, state, values, ground, binding=None, rng=None):
+        """
+        Apply an outcome of ground drawn by its probability.
+
+        :param rng: a numpy Generator (numpy.random.default_rng), or anything with a random() method
+        :return: (State, values) of the successor
+        """
+        outcomes = ground.outcomes
+        number = 0
+        if len(outcomes) > 1:
+            draw = rng.random()
+            while number < len(outcomes) - 1 and draw >= outcomes[number].probability:
+                draw -= outcomes[number].probability
+                number += 1
+        return self.apply(state, values, ground, binding, number)
+
+    def check(self, kind, spec):
+        """
+        :return: test (bits, values, binding) -> bool of a literal or equality precondition, spec being
+                 (positive, symbol, args)
+        """
+        positive, symbol, args = spec
+        if kind == 'equal':
+            left, right = args
+            return lambda bits, values, binding: \
+                ((left if left >= 0 else binding[~left]) == (right if right >= 0 else binding[~right])) == positive
+        index = self._index
+        static = set(self._static.get(symbol, ())) if index.is_static((symbol,)) else None
+        find = index.find
+
+        def check(bits, values, binding):
+            code = (symbol,) + _resolve(args, binding)
+            if static is not None:
+                return (code in static) == positive
+            position = find(code)
+            return (position is not None and (bits >> position) & 1 == 1) == positive
+        return check
+
+    def matcher(self, symbol, args, binds):
+        """
+        :return: step binding the positions binds of args to those of every true atom of symbol that matches
+        """
+        index = self._index
+        static = self._static.get(symbol, ()) if index.is_static((symbol,)) else None
+        size = len(args) + 1
+        codes = index.atom_code
+        binds = _binding_args(args, binds)
+
+        def candidates(bits):
+            if static is not None:
+                return static
+            found = []
+            while bits:
+                low = bits & -bits
+                code = codes(low.bit_length() - 1)
+                if code[0] == symbol:
+                    found.append(code)
+                bits ^= low
+            return found
+
+        def match(bits, values, binding):
+            for code in candidates(bits):
+                if len(code) == size and _unify(args, code, 1, binds, binding):
+                    yield None
+        return match
+
+    def fluent_matcher(self, symbol, args, binds, target, expression):
+        """
+        :return: step binding the positions binds of args to those of every defined ground fluent of symbol,
+                 then target to its value, or testing its value equals expression
+        """
+        fluents = self._fluents
+        symbolic = fluents.symbolic
+        find = fluents.find
+        by_symbol = self._by_symbol
+        first = _binding_args(args, binds)
+
+        def candidates(binding):
+            if not binds:
+                index = find((symbol,) + _resolve(args, binding))
+                return () if index is None else ((index, None),)
+            return by_symbol.get(symbol, ())
+
+        def match(bits, values, binding):
+            for index, code in candidates(binding):
+                if code is not None and (len(code) != len(args) or not _unify(args, code, 0, first, binding)):
+                    continue
+                if index >= len(values):  # a fluent that got its id after values was made
+                    continue
+                value = values[index]
+                if value != value:
+                    continue
+                if target is not None:
+                    binding[target] = int(value) if symbolic[index] else self.__object(value)
+                    yield None
+                elif value == expression(values, binding):
+                    yield None
+        return match
+
+    def number_binder(self, target, expression):
+        """
+        :return: step binding target to the object id of the number expression evaluates to
+        """
+        def bind(bits, values, binding):
+            value = expression(values, binding)
+            if value != value:
+                return ()
+            binding[target] = self.__object(float(value))
+            return _once
+        return bind
+
+    def __object(self, value):
+        # the object id of a number, a number met for the first time is appended to the object values
+        key = value if value == value else None  # NaN, not equal to itself, gets a single id too
+        number = self._numbers.get(key)
+        if number is None:
+            number = self._numbers[key] = len(self._objects)
+            self._objects.append(value)
+        return number
+
+    def __ground(self, schema, names):
+        ids = tuple([self._encoding.object_id(name) for name in names])
+        # parameters, then the variables the preconditions bind, unknown yet, then the undefined ones
+        known = list(ids) + [None] * (schema.bound - len(ids))
+        known += [self._undefined] * (len(schema.variables) - schema.bound)
+        pre = neg = 0
+        steps = []
+        equalities = []
+        for kind, step in schema.steps:
+            if kind == 'true':
+                continue
+            if kind == 'equals':
+                symbol, args, value, test = step
+                args = _substitute(args, known)
+                if any(arg < 0 for arg in args):
+                    steps.append((True, test))
+                else:
+                    equalities.append((self._fluents.fluent_id((symbol,) + args), value))
+                continue
+            if kind in ('literal', 'equal'):
+                positive, symbol, args = step
+                args = _substitute(args, known)
+                if any(arg < 0 for arg in args):
+                    steps.append((True, self.check(kind, (positive, symbol, args))))
+                    continue
+                if kind == 'equal':
+                    if (args[0] == args[1]) != positive:
+                        return None
+                    continue
+                code = (symbol,) + args
+                if self._index.is_static(code):
+                    if self._index.holds_static(code) != positive:
+                        return None
+                    continue
+                if positive:
+                    pre |= 1 << self._index.bit(code)
+                else:
+                    neg |= 1 << self._index.bit(code)
+                continue
+            steps.append((kind, step))
+        if pre & neg:
+            return None
+        outcomes = [self.__ground_outcome(known, *outcome) for outcome in schema.outcomes]
+        return GroundOperator(schema.operator, ids, tuple(names), pre, neg, tuple(equalities), tuple(steps),
+                              tuple(known), outcomes)
+
+    def __ground_outcome(self, known, probability, literals, numeric, conditionals):
+        add = delete = 0
+        runtime = []
+        for positive, symbol, args in literals:
+            args = _substitute(args, known)
+            if any(arg < 0 for arg in args):
+                runtime.append((positive, symbol, args))
+                continue
+            bit = self._index.bit((symbol,) + args)
+            if bit is None:
+                continue
+            if positive:
+                add |= 1 << bit
+            else:
+                delete |= 1 << bit
+        updates = []
+        for operator_, (symbol, args), expression in numeric:
+            args = _substitute(args, known)
+            target = self._fluents.fluent_id((symbol,) + args) if all(arg >= 0 for arg in args) else (symbol, args)
+            updates.append((operator_, target, expression))
+        grounded = []
+        for types, checks, effects in conditionals:
+            domains = [self.__type_ids(type_) for type_ in types]
+            for extra in itertools.product(*domains):
+                conditional = self.__ground_conditional(known + list(extra), checks, effects, tuple(extra))
+                if conditional is not None:
+                    grounded.append(conditional)
+        return Outcome(probability, add, delete, runtime, updates, grounded)
+
+    def __ground_conditional(self, known, checks, effects, extra):
+        pre = neg = add = delete = 0
+        tests = []
+        for kind, check in checks:
+            if kind is True:
+                tests.append(check)
+                continue
+            positive, symbol, args = check
+            args = _substitute(args, known)
+            if any(arg < 0 for arg in args):
+                tests.append(self.check(kind, (positive, symbol, args)))
+            elif kind == 'equal':
+                if (args[0] == args[1]) != positive:
+                    return None
+            elif self._index.is_static((symbol,) + args):
+                if self._index.holds_static((symbol,) + args) != positive:
+                    return None
+            elif positive:
+                pre |= 1 << self._index.bit((symbol,) + args)
+            else:
+                neg |= 1 << self._index.bit((symbol,) + args)
+        literals = []
+        for positive, symbol, args in effects:
+            args = _substitute(args, known)
+            if any(arg < 0 for arg in args):
+                literals.append((positive, symbol, args))
+                continue
+            bit = self._index.bit((symbol,) + args)
+            if bit is None:
+                continue
+            if positive:
+                add |= 1 << bit
+            else:
+                delete |= 1 << bit
+        return pre, neg, tuple(tests), add, delete, tuple(literals), extra
+
+    def __type_ids(self, type_):
+        if type_ is None:
+            return tuple(sorted({self._encoding.object_id(name)
+                                 for names in self._problem.objects_by_type(self._domain).values() for name in names}))
+        return self._encoding.objects_of_type(type_)
+
+    def __update(self, values, numeric, binding):
+        # all the right hand sides are evaluated on the values before the change
+        changes = []
+        for operator_, target, expression in numeric:
+            if type(target) is tuple:
+                symbol, args = target[0], _resolve(target[1], binding)
+                if self._undefined in args:  # a fluent of an undefined object
+                    continue
+                known = len(self._fluents)
+                target = self._fluents.fluent_id((symbol,) + args)  # an id of its own for a new fluent
+                if target == known:  # matched on its arguments from now on
+                    self._by_symbol.setdefault(symbol, []).append((target, args))
+            changes.append((operator_, target, expression(values, binding)))
+        values = self._fluents.resize(values.copy())
+        if not changes:
+            return values
+        for operator_, target, amount in changes:
+            if operator_ == '=':
+                values[target] = amount
+            elif operator_ == '+':
+                values[target] += amount
+            elif operator_ == '-':
+                values[target] -= amount
+            elif operator_ == '*':
+                values[target] *= amount
+            else:
+                values[target] = values[target] / amount if amount else math.nan
+        return self._fluents.enforce(values, [target for _, target, _ in changes])
+
+
+def _binding_args(args, binds):
+    # for each argument, True when it is the first occurrence of a variable at a position of binds
+    seen = set()
+    found = []
+    for arg in args:
+        found.append(arg < 0 and ~arg in binds and ~arg not in seen)
+        if arg < 0:
+            seen.add(~arg)
+    return tuple(found)
+
+
+def _unify(args, code, offset, binds, binding):
+    # True when code[offset:] matches args, the variables where binds is True bound to it on the way
+    for position, arg in enumerate(args):
+        value = code[offset + position]
+        if arg >= 0:
+            if arg != value:
+                return False
+        elif binds[position]:
+            binding[~arg] = value
+        elif binding[~arg] != value:
+            return False
+    return True
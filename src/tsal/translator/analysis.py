@@ -0,0 +1,230 @@
+# Author: Dustin Dannenhauer
+# Email: dustin.dannenhauer@parallaxresearch.org
+
+# This file is part of tsal-translator, an extension of pypddl-parser
+
+from tsal.translator.action import Action
+from tsal.translator.expression import Expression
+from tsal.translator.fluent import Fluent
+from tsal.translator.literal import Literal
+from tsal.translator.predicate import Predicate
+
+STATIC = 'static'
+ADD_ONLY = 'add-only'
+DELETE_ONLY = 'delete-only'
+INCREASING = 'increasing'
+DECREASING = 'decreasing'
+DYNAMIC = 'dynamic'
+
+_numeric_effects = {'+': 1, '-': -1}
+
+
+def is_conditional(effect):
+    """
+    :return: True when effect, an item of a deterministic effect list, is a conditional effect
+             [conditions, effects], two lists of (probability, literal) tuples (see p_when_effects)
+    """
+    return isinstance(effect[0], list) and bool(effect[0]) and isinstance(effect[0][0], tuple)
+
+
+def is_deterministic(effects):
+    """
+    :return: True when effects is a deterministic effect list, of (probability, effect), WHEN and FORALL
+             tuples and conditional effects, False when it holds the deterministic effects of a oneof or
+             labeled branches
+    """
+    for item in effects:
+        if isinstance(item, tuple):
+            return not isinstance(item[0], str) or item[0] in ('WHEN', 'FORALL')
+        if isinstance(item, list) and item:
+            return is_conditional(item)
+    return True
+
+
+def operator_effects(operator):
+    """
+    :param operator: an Action or an Event
+    :return: the effect list of operator, deterministic or the branches of a oneof
+    """
+    effects = operator.effects
+    if isinstance(operator, Action):  # the parser wraps the effects of an action in one more list
+        return effects[0] if effects and isinstance(effects[0], list) else []
+    return effects
+
+
+def _effect_atoms(effects):
+    """
+    :param effects: a list of effects as built by the parser, deterministic or the branches of a oneof
+    :return: generator of the literals and expressions the effects may make true, the conditions of
+             conditional effects left out
+    """
+    if is_deterministic(effects):
+        for item in effects:
+            if isinstance(item, tuple):
+                for atom in _tuple_atoms(item):
+                    yield atom
+            elif isinstance(item, list) and item:  # (when conditions effects)
+                for atom in _effect_atoms(item[1]):
+                    yield atom
+            elif isinstance(item, (Literal, Expression)):  # the effects of a WHEN tuple
+                yield item
+    else:
+        for item in effects:
+            if isinstance(item, tuple):  # (label, branches)
+                item = item[1]
+            if isinstance(item, list):
+                for atom in _effect_atoms(item):
+                    yield atom
+
+
+def _tuple_atoms(item):
+    if item[0] == 'WHEN':
+        return _effect_atoms(item[2])
+    if item[0] == 'FORALL':
+        return _effect_atoms(item[2][2])
+    if isinstance(item[0], str):
+        return _effect_atoms(item[1])
+    return _effect_atoms([item[1]])
+
+
+def effect_atoms(operator):
+    """
+    :param operator: an Action or an Event
+    :return: generator of the literals and expressions of the effects of operator, of every branch of a
+             oneof, probabilistic or conditional effect
+    """
+    return _effect_atoms(operator_effects(operator))
+
+
+class SymbolAnalysis(object):
+    """
+    Classification of the predicates and fluents of a domain by how the effects of its actions, events and
+    processes change them:
+
+    - static: never changed, its initial facts and values hold in every state
+    - add-only / delete-only: a predicate only ever made true / only ever made false, so the initial facts
+      are a lower / upper bound of its facts in any state
+    - increasing / decreasing: a fluent only changed by adding / subtracting a non negative number
+    - dynamic: anything else, derived predicates and the fluents of processes included
+
+    Symbols that are neither declared nor changed, e.g. '=', are static.
+    """
+
+    def __init__(self, domain):
+        """
+
+        :param domain: the Domain to analyse
+        """
+        self._kinds = {}
+        self._writers = {}
+        added, deleted, increased, decreased, assigned = set(), set(), set(), set(), set()
+        for operator in (domain.operators or []) + (domain.events or []):
+            for atom in effect_atoms(operator):
+                if isinstance(atom, Literal):
+                    name = atom.predicate.name
+                    (added if atom.is_positive() else deleted).add(name)
+                elif isinstance(atom.left_child, Fluent):
+                    name = atom.left_child.name
+                    direction = self.__direction(atom)
+                    (increased if direction > 0 else decreased if direction < 0 else assigned).add(name)
+                else:
+                    continue
+                writers = self._writers.setdefault(name, [])
+                if not writers or writers[-1] is not operator:
+                    writers.append(operator)
+        assigned.update(process.fluent for process in domain.processes or ())
+        dynamic = {predicate.name for predicate in domain.derivedpredicates or ()}
+
+        for predicate in domain.predicates or ():
+            self._kinds[predicate.name] = STATIC
+        for fluent in domain.fluents or ():
+            self._kinds[fluent.name] = STATIC
+        for name in added | deleted:
+            self._kinds[name] = ADD_ONLY if name not in deleted else DELETE_ONLY if name not in added else DYNAMIC
+        for name in increased | decreased | assigned:
+            if name in assigned or (name in increased and name in decreased):
+                self._kinds[name] = DYNAMIC
+            else:
+                self._kinds[name] = INCREASING if name in increased else DECREASING
+        for name in dynamic:
+            self._kinds[name] = DYNAMIC
+
+        self._symbols = {kind: frozenset(name for name, value in self._kinds.items() if value == kind)
+                         for kind in (STATIC, ADD_ONLY, DELETE_ONLY, INCREASING, DECREASING, DYNAMIC)}
+        self._writers = {name: tuple(writers) for name, writers in self._writers.items()}
+
+    @property
+    def static(self):
+        return self._symbols[STATIC]
+
+    @property
+    def add_only(self):
+        return self._symbols[ADD_ONLY]
+
+    @property
+    def delete_only(self):
+        return self._symbols[DELETE_ONLY]
+
+    @property
+    def increasing(self):
+        return self._symbols[INCREASING]
+
+    @property
+    def decreasing(self):
+        return self._symbols[DECREASING]
+
+    @property
+    def dynamic(self):
+        return self._symbols[DYNAMIC]
+
+    @property
+    def kinds(self):
+        """
+        :return: dictionary from the name of every declared or changed predicate and fluent to its kind
+        """
+        return dict(self._kinds)
+
+    def kind(self, name):
+        return self._kinds.get(name, STATIC)
+
+    def is_static(self, name):
+        return self._kinds.get(name, STATIC) == STATIC
+
+    def writers(self, name):
+        """
+        :return: tuple of the actions and events with an effect on the predicate or fluent name
+        """
+        return self._writers.get(name, ())
+
+    def partition(self, atoms):
+        """
+        Split ground atoms, e.g. Problem.init, into the static ones, which hold in every state and need not be
+        stored per state, and the others.
+
+        :param atoms: list of Predicate, Literal and assignment (= (fluent ...) value) objects
+        :return: (static atoms, other atoms), two lists in the order of atoms
+        """
+        static, other = [], []
+        for atom in atoms:
+            (static if self.is_static(self.__name(atom)) else other).append(atom)
+        return static, other
+
+    @staticmethod
+    def __name(atom):
+        if isinstance(atom, Literal):
+            atom = atom.predicate
+        if isinstance(atom, Predicate) and atom.name == '=' and atom.arity == 2 and isinstance(atom.args[0], Fluent):
+            atom = atom.args[0]
+        return atom.name
+
+    @staticmethod
+    def __direction(expression):
+        # 1 for an increase by a non negative number, -1 for a decrease, 0 for any other change
+        sign = _numeric_effects.get(expression.operator)
+        amount = expression.right_child
+        if sign is None or not isinstance(amount, Expression) or amount.operator is not None:
+            return 0
+        value = amount.value
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return 0
+        return sign if value >= 0 else -sign
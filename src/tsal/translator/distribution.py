@@ -3,6 +3,9 @@
 
 # This file is part of tsal-translator, an extension of pypddl-parser
 
+from tsal.translator.hashing import hashless_state, restore_state
+
+
 class FrequencyDistribution(object):
 
     """
@@ -15,11 +18,15 @@ class FrequencyDistribution(object):
     Generally, the result of the frequency distribution refers to the interarrival time of the event occurring.
     """
 
+    __getstate__ = hashless_state
+    __setstate__ = restore_state
+
     def __init__(self, name=None, qualifier=None, value=None, additional_args=[]):
         self._name = name
         self._qualifier = qualifier  #todo come up with a better name for this
         self._value = value
         self._additional_args = additional_args
+        self._hash = None  # computed on first use
 
     @property
     def name(self):
@@ -44,6 +51,8 @@ class FrequencyDistribution(object):
         return "({} {} {} {})".format(self._name, self._qualifier, self._value, self._additional_args)
 
     def __hash__(self):
-        return hash(str(self))
+        if self._hash is None:
+            self._hash = hash((self._name, self._qualifier, self._value, tuple(self._additional_args)))
+        return self._hash
 
 
@@ -17,6 +17,9 @@
 from tsal.translator.predicate import Predicate
 from tsal.translator.term import Term
 from tsal.translator.action import Action
+from tsal.translator.analysis import SymbolAnalysis
+from tsal.translator.frozen import freeze_atoms
+from tsal.translator.lattice import TypeLattice
 
 
 class Domain(object):
@@ -38,9 +41,10 @@ class Domain(object):
         self._types = types
         if "object" not in self._types:
             self._types["object"] = []
-        self._litypes = []
-        [self._litypes.append(x) for x in list(types.keys()) + [x for y in types.values() for x in y] if
-         x not in self._litypes]
+        self._litypes = list(dict.fromkeys(list(types.keys()) + [x for y in types.values() for x in y]))
+        self._type_lattice = None  # built on first use
+        self._analysis = None  # built on first use
+        self._revision = 0  # bumped by clear_caches and changes to the types
         self._constants = constants
         self._predicates = predicates
         self._operators = operators
@@ -69,6 +73,45 @@ class Domain(object):
     @types.setter
     def types(self, types):
         self._types = types
+        self._type_lattice = None
+        self._revision += 1
+
+    @property
+    def type_lattice(self):
+        """
+        :return: TypeLattice of types, rebuilt after types is set or add_type / del_type are called, not
+                 after the types dict is changed in place
+        """
+        if self._type_lattice is None:
+            self._type_lattice = TypeLattice(self._types)
+        return self._type_lattice
+
+    @property
+    def analysis(self):
+        """
+        :return: SymbolAnalysis of the predicates and fluents, rebuilt after operators, events or processes are
+                 set or add_action or clear_caches is called, not after an action or event is changed in place
+        """
+        if self._analysis is None:
+            self._analysis = SymbolAnalysis(self)
+        return self._analysis
+
+    @property
+    def revision(self):
+        """
+        :return: the number of changes to the types and calls to clear_caches, part of the key of what is built
+                 from the domain elsewhere, e.g. Problem.encoding and Problem.objects_by_type
+        """
+        return self._revision
+
+    def clear_caches(self):
+        """
+        Drop the type lattice and the symbol analysis, rebuilt on next use, after the domain was changed in
+        place, e.g. by IncrementalDomain.replace.
+        """
+        self._type_lattice = None
+        self._analysis = None
+        self._revision += 1
 
     @property
     def litypes(self):
@@ -93,6 +136,7 @@ class Domain(object):
     @operators.setter
     def operators(self, operators):
         self._operators = operators
+        self._analysis = None
 
     @property
     def events(self):
@@ -101,6 +145,7 @@ class Domain(object):
     @events.setter
     def events(self, events):
         self._events = events
+        self._analysis = None
 
     @property
     def processes(self):
@@ -109,6 +154,7 @@ class Domain(object):
     @processes.setter
     def processes(self, processes):
         self._processes = processes
+        self._analysis = None
 
     @property
     def fluents(self):
@@ -200,12 +246,16 @@ class Domain(object):
         return pddl_str
 
     def add_type(self, type, type_type=''):
+        self._type_lattice = None
+        self._revision += 1
         if type_type in self._types:
             self._types[type_type].append(type)
         else:
             self._types[type_type] = [type]
 
     def del_type(self, type_type=''):
+        self._type_lattice = None
+        self._revision += 1
         if type_type in self._types:
             self._types[type_type].remove(type)
 
@@ -232,11 +282,26 @@ class Domain(object):
                 self._predicates.remove(pred)
 
     def add_action(self, action):
+        self._analysis = None
         self._operators.append(action)
 
     def add_action(self, name, params, precond, effects):
+        self._analysis = None
         self._operators.append(Action(name, params, precond, effects))
 
+    def freeze(self):
+        """
+        Freeze the actions, events, predicates and fluents of the domain, see Action.freeze. The lists of the
+        domain itself stay mutable, e.g. add_action still works.
+
+        :return: self
+        """
+        for operator in self._operators + self._events:
+            operator.freeze()
+        freeze_atoms(self._predicates)
+        freeze_atoms(self._fluents)
+        return self
+
     def get_pddl(self, version):
         print(version)
         version = str(version).replace(".","_")
@@ -0,0 +1,153 @@
+# Author: Dustin Dannenhauer
+# Email: dustin.dannenhauer@parallaxresearch.org
+
+# This file is part of tsal-translator, an extension of pypddl-parser
+
+from tsal.translator.fluent import Fluent
+from tsal.translator.literal import Literal
+from tsal.translator.predicate import Predicate
+from tsal.translator.term import Term
+
+
+def _arg_value(arg):
+    if isinstance(arg, Term):
+        return arg.value if arg.is_constant() else arg.name
+    return arg
+
+
+class Encoding(object):
+    """
+    Dense integer ids of the objects, symbols (predicate and fluent names) and types of a problem.
+
+    A ground atom is encoded as a tuple of ints, its symbol id followed by the ids of its arguments, e.g.
+    (on c e) -> (3, 9, 6). Predicates and fluents share the symbol ids, so the code of an atom tells which
+    of the two it is. Ids count from 0 in the order: problem objects, domain constants, then the values met
+    in the initial state (e.g. the numbers used as arguments of fluents, the objects assigned to fluents).
+    """
+
+    def __init__(self, problem, domain=None):
+        """
+
+        :param problem: the Problem to encode
+        :param domain: its Domain, adds the constants, the declared predicates and fluents and the types
+        """
+        self._problem = problem
+        self._domain = domain
+        self._object_ids = {}
+        self._symbol_ids = {}
+        self._fluent_ids = set()
+        self._type_ids = {}
+        self._type_objects = {}
+
+        for names in problem.objects.values():
+            self.__add(self._object_ids, names)
+        if domain is not None:
+            for terms in domain.constants.values():
+                self.__add(self._object_ids, [_arg_value(term) for term in terms])
+            self.__add(self._symbol_ids, [predicate.name for predicate in domain.predicates])
+            self.__add(self._symbol_ids, [fluent.name for fluent in domain.fluents])
+            self._fluent_ids.update(self._symbol_ids[fluent.name] for fluent in domain.fluents)
+            self.__add(self._type_ids, domain.type_lattice.types)
+        self.__add(self._type_ids, problem.objects)
+        for assignment in problem.init:
+            atom = self.__atom(assignment)
+            self.__add(self._symbol_ids, [atom.name])
+            if isinstance(atom, Fluent):
+                self._fluent_ids.add(self._symbol_ids[atom.name])
+            self.__add(self._object_ids, [_arg_value(arg) for arg in atom.args])
+            if atom is not assignment and isinstance(assignment.args[1], str):  # an object valued fluent
+                self.__add(self._object_ids, [assignment.args[1]])
+
+        self._objects = tuple(self._object_ids)
+        self._symbols = tuple(self._symbol_ids)
+        self._types = tuple(self._type_ids)
+
+    @property
+    def objects(self):
+        return self._objects
+
+    @property
+    def symbols(self):
+        return self._symbols
+
+    @property
+    def types(self):
+        return self._types
+
+    def object_id(self, name):
+        return self._object_ids[name]
+
+    def symbol_id(self, name):
+        return self._symbol_ids[name]
+
+    def type_id(self, name):
+        return self._type_ids[name]
+
+    def is_fluent(self, symbol_id):
+        return symbol_id in self._fluent_ids
+
+    def objects_of_type(self, name):
+        """
+        :return: tuple of the ids of the objects of type name, subtypes included when the domain is known
+        """
+        ids = self._type_objects.get(name)
+        if ids is None:
+            if self._domain is not None:
+                names = self._problem.objects_by_type(self._domain).get(name, ())
+            else:
+                names = self._problem.objects.get(name, ())
+            ids = self._type_objects[name] = tuple(self._object_ids[value] for value in names)
+        return ids
+
+    def encode(self, atom):
+        """
+        :param atom: ground Predicate, Fluent or Literal (its predicate is encoded, not its sign), an
+                     assignment (= (fluent ...) value) encodes its fluent
+        :return: tuple of ints
+        """
+        atom = self.__atom(atom)
+        object_ids = self._object_ids
+        return (self._symbol_ids[atom.name],) + tuple([object_ids[_arg_value(arg)] for arg in atom.args])
+
+    def decode(self, code):
+        """
+        :param code: tuple of ints made by encode
+        :return: a Fluent or a Predicate with constant Term arguments
+        """
+        args = [Term.constant(self._objects[index]) for index in code[1:]]
+        name = self._symbols[code[0]]
+        if code[0] in self._fluent_ids:
+            return Fluent(name, args)
+        return Predicate(name, args)
+
+    def encode_init(self):
+        """
+        :return: frozenset of the codes of the predicates true in the initial state, and dictionary from the
+                 codes of the fluents assigned in the initial state to their values
+        """
+        atoms = []
+        values = {}
+        for atom in self._problem.init:
+            if self.__is_assignment(atom):
+                values[self.encode(atom)] = atom.args[1]
+            else:
+                atoms.append(self.encode(atom))
+        return frozenset(atoms), values
+
+    @staticmethod
+    def __is_assignment(atom):
+        return isinstance(atom, Predicate) and atom.name == '=' and atom.arity == 2 and isinstance(atom.args[0], Fluent)
+
+    @classmethod
+    def __atom(cls, atom):
+        if isinstance(atom, Literal):
+            atom = atom.predicate
+        if cls.__is_assignment(atom):
+            atom = atom.args[0]
+        return atom
+
+    @staticmethod
+    def __add(ids, names):
+        for name in names:
+            if name not in ids:
+                ids[name] = len(ids)
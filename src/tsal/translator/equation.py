@@ -3,15 +3,22 @@
 
 # This file is part of tsal-translator, an extension of pypddl-parser
 
+from tsal.translator.hashing import hashless_state, restore_state
+
+
 class Equation(object):
 
     """
     An equation consists of an expression with one or more free variables
     """
 
+    __getstate__ = hashless_state
+    __setstate__ = restore_state
+
     def __init__(self, variables=[], expression=None):
         self._variables = variables
         self._expression = expression
+        self._hash = None  # computed on first use
 
         if len(self._variables) == 0:
             raise Exception("ERROR in creating equation: no variables given")
@@ -31,6 +38,8 @@ class Equation(object):
         return "{} with free variables: {}".format(self._expression, self._variables)
 
     def __hash__(self):
-        return hash(str(self))
+        if self._hash is None:
+            self._hash = hash((tuple(self._variables), self._expression))
+        return self._hash
 
 
@@ -2,13 +2,20 @@
 # Email: dustin.dannenhauer@parallaxresearch.org
 
 # This file is part of tsal-translator, an extension of pypddl-parser
+import copy
+import threading
+
 from tsal.translator.expression import Expression
+from tsal.translator.frozen import as_list, copy_structure, freeze_atoms, freeze_structure
 
 
 class Event(object):
     counter = 1
+    _counter_lock = threading.Lock()  # ids stay unique when files are parsed on several threads
 
     class_name = 'events'
+    _fields = ('name', 'params', 'precond', 'effects', 'duration', 'distribution')
+    _span = None  # Span in the source, only set by located parsers
 
     def __init__(self, name, params, precond, effects, duration=None, distribution=None):
         """
@@ -27,49 +34,103 @@ class Event(object):
             self._effects = [effects]
         self._duration = duration
         self._distribution = distribution
-        self._id = Event.counter
-        Event.counter += 1
+        with Event._counter_lock:
+            self._id = Event.counter
+            Event.counter += 1
 
     @property
     def name(self):
         return self._name
 
+    @property
+    def span(self):
+        return self._span
+
     @property
     def params(self):
-        return self._params[:]
+        params = self._params
+        return params if type(params) is tuple else params[:]
 
     @params.setter
     def params(self, params):
-        self._params = params
+        self._params = tuple(params) if self.frozen else params
 
     @property
     def precond(self):
-        return self._precond[:]
+        precond = self._precond
+        return precond if type(precond) is tuple else precond[:]
 
     @property
     def effects(self):
-        return self._effects[:]
+        effects = self._effects
+        return effects if type(effects) is tuple else effects[:]
 
     @property
     def effects0(self):
-        return self._effects[:][0]
+        return self._effects[0]
 
     @property
     def fluent_effects(self):
         retval = []
-        for eff in self._effects[:][0]:
+        for eff in self._effects[0]:
             if isinstance(eff[1], Expression):
                 retval.append(eff[1])
         return retval
 
     @precond.setter
     def precond(self, precond):
+        if self.frozen:
+            precond = freeze_structure(tuple(precond))
+            freeze_atoms(precond)
         self._precond = precond
 
     @effects.setter
     def effects(self, effects):
+        if self.frozen:
+            effects = freeze_structure(tuple(effects))
+            freeze_atoms(effects)
         self._effects = effects
 
+    @property
+    def frozen(self):
+        return type(self._precond) is tuple
+
+    def freeze(self):
+        """
+        Keep params, precond and effects as tuples, returned by their getters without a copy, and freeze the
+        predicates and fluents they hold. The lists nested in precond and effects become FrozenLists.
+
+        :return: self
+        """
+        self._params = tuple(self._params)
+        self._precond = freeze_structure(tuple(self._precond))
+        self._effects = freeze_structure(tuple(self._effects))
+        freeze_atoms(self._precond)
+        freeze_atoms(self._effects)
+        return self
+
+    def replace(self, **fields):
+        """
+        Copy-on-write: return a new event, with its own id, with some of its fields replaced. A frozen event
+        shares the fields that are not replaced with the copy, which is frozen as well. The sequences of a
+        mutable event are copied, the lists and tuples nested in precond and effects included, the atoms shared.
+
+        :param fields: new values of any of name, params, precond, effects, duration, distribution
+        :return: the new Event
+        """
+        unknown = set(fields).difference(self._fields)
+        if unknown:
+            raise TypeError("unknown Event fields: {}".format(', '.join(sorted(unknown))))
+        event = copy.copy(self)  # __setstate__ hands out a new id
+        for field in ('params', 'precond', 'effects'):
+            value = fields.pop(field, getattr(self, '_' + field))
+            setattr(event, '_' + field, tuple(value) if self.frozen else copy_structure(list(value)))
+        for field, value in fields.items():
+            setattr(event, '_' + field, value)
+        if self.frozen:
+            event.freeze()
+        return event
+
     @property
     def duration(self):
         return self._duration
@@ -154,12 +215,19 @@ class Event(object):
         if type(self)!=type(other):
             return False
         for p in equality_params:
-            if getattr(self, p) != getattr(other, p):
+            if as_list(getattr(self, p)) != as_list(getattr(other, p)):
                 return False
         return True
 
     def __hash__(self):
         return hash("e" + str(self._id))
 
+    def __setstate__(self, state):
+        # ids are only unique within a process, unpickled events (snapshot cache, process pools) get a new one
+        self.__dict__.update(state)
+        with Event._counter_lock:
+            self._id = Event.counter
+            Event.counter += 1
+
 
 
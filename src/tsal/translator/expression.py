@@ -3,6 +3,8 @@
 
 # This file is part of tsal-translator, an extension of pypddl-parser
 
+from tsal.translator.hashing import hashless_state, restore_state
+
 
 class Expression(object):
 
@@ -10,11 +12,17 @@ class Expression(object):
     Represents expressions as trees, where a node contains an operator, a left child and right child.
     """
 
+    __slots__ = ('_value', '_operator', '_left_child', '_right_child', '_span', '_hash')
+    __getstate__ = hashless_state
+    __setstate__ = restore_state
+
     def __init__(self, value=None, operator=None, left_child=None, right_child=None):
         self._value = value
         self._operator = operator
         self._left_child = left_child
         self._right_child = right_child
+        self._span = None  # Span in the source, only set by located parsers
+        self._hash = None  # computed on first use
 
         if self.value or self.value == 0:
             if self._operator or self._left_child or self._right_child is not None:
@@ -51,8 +59,15 @@ class Expression(object):
 
     @right_child.setter
     def right_child(self, right_child):
+        # hashing a node caches the hashes of its children too, a parent of this node would keep a stale one
+        if self._hash is not None:
+            raise AttributeError('cannot change an expression once hashed, build a new one: {}'.format(self))
         self._right_child = right_child
 
+    @property
+    def span(self):
+        return self._span
+
     def get_variables(self):
         variables = []
         if self._value:
@@ -80,7 +95,21 @@ class Expression(object):
         else:
             return "({} {} {})".format(self._operator, str(self._left_child), str(self._right_child))
 
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, Expression):
+            return False
+        # structural, never hashes: a hash cached by a comparison, e.g. x in list, would freeze the node
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
+        return self._value == other._value and self._operator == other._operator \
+            and self._left_child == other._left_child and self._right_child == other._right_child
+
     def __hash__(self):
-        return hash(str(self))
+        # structural, from the cached hashes of the children
+        if self._hash is None:
+            self._hash = hash((self._value, self._operator, self._left_child, self._right_child))
+        return self._hash
 
 
@@ -14,6 +14,7 @@
 # along with pypddl-parser.  If not, see <http://www.gnu.org/licenses/>.
 
 
+from tsal.translator.hashing import hashless_state, restore_state
 from tsal.translator.term import Term
 
 
@@ -21,29 +22,32 @@ class Fluent(object):
 
     class_name = 'fluents'
 
-    def __init__(self, name, args=[], bounds=[None, None, None], typ=None):
+    __slots__ = ('_name', '_args', '_bounds', '_min', '_max', '_precision', '_hasBounds', '_type',
+                 '_hash')
+    __getstate__ = hashless_state
+    __setstate__ = restore_state
+
+    def __init__(self, name, args=[], bounds=None, typ=None):
         """
             Construct a Predicate object
 
         :param name: string with the name of the predicate
         :param args: list of Term objects
+        :param bounds: [min, max, precision] from a :bounds declaration, [0, 100, 2] when None
         """
         self._name = name
         self._args = args
-        if not bounds[0]:
-            bounds[0] = 0
-        if not bounds[1]:
-            bounds[1] = 100
-        if not bounds[2]:
-            bounds[2] = 2
+        self._hasBounds = bounds is not None and any(bound is not None for bound in bounds)
+        bounds = list(bounds) if bounds is not None else [None, None, None]
+        for position, default in enumerate((0, 100, 2)):
+            if bounds[position] is None:
+                bounds[position] = default
         self._bounds = bounds
         self._min = bounds[0]
         self._max = bounds[1]
         self._precision = bounds[2]
-        self._hasBounds = False
         self._type = typ
-        if self._min and self._max and self._precision:
-            self._hasBounds = True
+        self._hash = None  # computed on first use
 
     @property
     def name(self):
@@ -51,15 +55,39 @@ class Fluent(object):
 
     @property
     def args(self):
-        return self._args[:]
+        args = self._args
+        return args if type(args) is tuple else args[:]
 
     @args.setter
     def args(self, args):
-        self._args = args
+        self._args = tuple(args) if self.frozen else args
+        self._hash = None
 
     @property
     def bounds(self):
-        return self._bounds[:]
+        bounds = self._bounds
+        return bounds if type(bounds) is tuple else bounds[:]
+
+    @property
+    def has_bounds(self):
+        """
+        :return: True when the bounds were declared, not the defaults
+        """
+        return self._hasBounds
+
+    @property
+    def frozen(self):
+        return type(self._args) is tuple
+
+    def freeze(self):
+        """
+        Keep the args and bounds as tuples, returned by their getters without a copy.
+
+        :return: self
+        """
+        self._args = tuple(self._args)
+        self._bounds = tuple(self._bounds)
+        return self
 
     @property
     def type(self):
@@ -101,14 +129,18 @@ class Fluent(object):
                 return '({0} {1})'.format(self._name, ' '.join(map(str, self._args)))
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if type(self) != type(other):
             return False
         if self.name == other.name \
-                and self.args == other.args:
+                and tuple(self._args) == tuple(other._args):
             return True
         else:
             return False
 
     def __hash__(self):
-        return hash((self.name,str(self.args)))
+        if self._hash is None:
+            self._hash = hash((self._name, tuple(self._args)))
+        return self._hash
 
@@ -0,0 +1,95 @@
+# Author: Dustin Dannenhauer
+# Email: dustin.dannenhauer@parallaxresearch.org
+
+# This file is part of tsal-translator, an extension of pypddl-parser
+
+# Helpers of the frozen, tuple-backed mode of the model objects. A frozen Action, Event, Predicate or Fluent
+# keeps its sequences as tuples and returns them from its getters without copying. The inner lists of effects,
+# disjunctive preconditions and conditional effects become FrozenLists: their type carries meaning (a list is
+# a conjunction or a oneof branch, a tuple a (probability, effect), WHEN or FORALL node), so they stay lists.
+
+from tsal.translator.expression import Expression
+from tsal.translator.fluent import Fluent
+from tsal.translator.literal import Literal
+from tsal.translator.predicate import Predicate
+
+
+def freeze_atoms(items):
+    """
+    Freeze the predicates and fluents found in items: literals, predicates, expressions, (probability, effect)
+    tuples and lists of them.
+    """
+    for item in items:
+        if isinstance(item, Literal):
+            item.predicate.freeze()
+        elif isinstance(item, (Predicate, Fluent)):
+            item.freeze()
+        elif isinstance(item, Expression):
+            freeze_atoms((item.left_child, item.right_child))
+        elif isinstance(item, (list, tuple)):
+            freeze_atoms(item)
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError('a FrozenList cannot be changed, the object holding it is frozen')
+
+
+class FrozenList(list):
+    """
+    A list that cannot be changed, the inner lists of the effects of a frozen Action or Event. It is still a
+    list for the code telling the effect shapes apart, and equal to a list of the same items.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __reduce__(self):
+        return FrozenList, (list(self),)
+
+    def __reduce_ex__(self, protocol):
+        return self.__reduce__()
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def freeze_structure(value):
+    """
+    :return: value with the lists found in it, inside lists and tuples, made FrozenLists; the atoms are kept,
+             and so is a FrozenList or a tuple with nothing to change
+    """
+    cls = type(value)
+    if cls is list:
+        return FrozenList(freeze_structure(item) for item in value)
+    if cls is tuple:
+        items = tuple(freeze_structure(item) for item in value)
+        return value if all(new is old for new, old in zip(items, value)) else items
+    return value
+
+
+def copy_structure(value):
+    """
+    :return: a copy of the lists and tuples of value, nested ones included, FrozenLists made mutable lists; the
+             atoms are shared
+    """
+    cls = type(value)
+    if cls is list or cls is FrozenList:
+        return [copy_structure(item) for item in value]
+    if cls is tuple:
+        return tuple(copy_structure(item) for item in value)
+    return value
+
+
+def as_list(value):
+    """
+    :return: value as a list when it is a tuple, so frozen and mutable objects compare equal
+    """
+    return list(value) if type(value) is tuple else value
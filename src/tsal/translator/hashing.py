@@ -0,0 +1,29 @@
+# Author: Dustin Dannenhauer
+# Email: dustin.dannenhauer@parallaxresearch.org
+
+# This file is part of tsal-translator, an extension of pypddl-parser
+
+
+def hashless_state(obj):
+    """
+    __getstate__ of the classes that cache their hash in _hash: the attributes but the hash, which is not valid in
+    another process, where strings hash differently (PYTHONHASHSEED)
+
+    :return: dictionary from attribute name to value
+    """
+    slots = getattr(type(obj), '__slots__', None)
+    if slots is None:
+        state = dict(obj.__dict__)
+    else:
+        state = {name: getattr(obj, name) for name in slots if hasattr(obj, name)}
+    state.pop('_hash', None)
+    return state
+
+
+def restore_state(obj, state):
+    """
+    __setstate__ matching hashless_state, the hash computed again on first use
+    """
+    for name, value in state.items():
+        setattr(obj, name, value)
+    obj._hash = None
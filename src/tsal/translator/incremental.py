@@ -0,0 +1,275 @@
+# Author: Dustin Dannenhauer
+# Email: dustin.dannenhauer@parallaxresearch.org
+
+# This file is part of tsal-translator, an extension of pypddl-parser
+
+import re
+
+from tsal.translator.analysis import effect_atoms
+from tsal.translator.literal import Literal
+from tsal.translator.tsalparser import TSALParser
+
+# parentheses and comments, the only bytes that matter when matching blocks
+_block_re = re.compile(rb'[()]|;[^\n]*')
+_keyword_re = re.compile(rb'\(\s*([^\s()]+)')
+_type_suffix_re = re.compile(rb'\s*-\s*[^\s()]+')
+_open, _close = b'()'
+
+# section keyword: element kind, Domain attribute holding the parsed elements, regex of the element name
+_list_sections = {b':actions': ('action', 'operators', re.compile(rb'\(\s*:action\s+([^\s()]+)')),
+                  b':events': ('event', 'events', re.compile(rb'\(\s*:event\s+([^\s()]+)')),
+                  b':fluents': ('fluent', 'fluents', re.compile(rb'\(\s*([^\s()]+)')),
+                  b':predicates': ('predicate', 'predicates', re.compile(rb'\(\s*([^\s()]+)')),
+                  b':processes': ('process', 'processes', re.compile(rb'\(\s*=\s*([^\s()]+)')),
+                  b':derived-predicates': ('derived', 'derivedpredicates',
+                                           re.compile(rb'\(\s*:derived\s*\(\s*([^\s()]+)'))}
+_section_of_kind = {kind: keyword.decode('ascii') for keyword, (kind, _, _) in _list_sections.items()}
+_attribute_of_kind = {kind: attribute for kind, attribute, _ in _list_sections.values()}
+_name_of_kind = {kind: name_re for kind, _, name_re in _list_sections.values()}
+# the names of the predicate and the event p_action_def generates for a forall effect
+_forall_re = re.compile(r'FORALL(\d+)$')
+_forall_event_re = re.compile(r'(\d+)FORALL$')
+
+
+def _forall_number(name, pattern=_forall_re):
+    match = pattern.match(name)
+    return int(match.group(1)) if match else None
+
+
+def _forall_numbers(action):
+    """
+    :return: list of the numbers of the forall predicates the effects of action add, in order
+    """
+    numbers = []
+    for atom in effect_atoms(action):
+        if isinstance(atom, Literal) and atom.is_positive():
+            number = _forall_number(atom.predicate.name)
+            if number is not None and number not in numbers:
+                numbers.append(number)
+    return numbers
+
+
+class Element(object):
+
+    def __init__(self, kind, name, start, end, index=None):
+        """
+
+        :param kind: 'section' for the sections of the domain (e.g. '(:actions ...)'), 'action', 'event', 'fluent',
+                     'predicate', 'process' or 'derived' for the elements of the list sections
+        :param name: lowercased section keyword (e.g. ':actions', 'domain') or element name
+        :param start: byte offset of the opening parenthesis
+        :param end: byte offset just past the element, a fluent includes its '- type'
+        :param index: position of the element within its section
+        """
+        self._kind = kind
+        self._name = name
+        self._start = start
+        self._end = end
+        self._index = index
+
+    @property
+    def kind(self):
+        return self._kind
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def start(self):
+        return self._start
+
+    @property
+    def end(self):
+        return self._end
+
+    @property
+    def index(self):
+        return self._index
+
+    def shifted(self, start, end):
+        """
+        :return: a copy of the element at a new byte range
+        """
+        return Element(self._kind, self._name, start, end, self._index)
+
+    def __repr__(self):
+        return 'Element({}, {}, {}:{})'.format(self._kind, self._name, self._start, self._end)
+
+
+def outline(source):
+    """
+    Locate the top-level elements of a domain by matching parentheses.
+
+    :param source: tsal domain source, str or utf-8 bytes
+    :return: list of Element in source order, byte ranges are into the utf-8 encoding of source
+    """
+    if isinstance(source, str):
+        source = source.encode('utf-8')
+    elements = []
+    depth = 0
+    opened = [None] * 4  # offset of the open parenthesis at depth 1 to 3
+    keyword = None
+    section = None  # kind and name regex while inside a list section
+    index = 0
+    for match in _block_re.finditer(source):
+        position = match.start()
+        char = source[position]
+        if char == _open:
+            depth += 1
+            if depth <= 3:
+                opened[depth] = position
+            if depth == 2:
+                keyword = _keyword_re.match(source, position)
+                keyword = keyword.group(1).lower() if keyword else b''
+                section = _list_sections.get(keyword)
+                index = 0
+        elif char == _close:
+            if depth == 3 and section is not None:
+                kind, _, name_re = section
+                end = match.end()
+                if kind == 'fluent':
+                    suffix = _type_suffix_re.match(source, end)
+                    if suffix:
+                        end = suffix.end()
+                name = name_re.match(source, opened[3])
+                name = name.group(1).lower().decode('utf-8') if name else None
+                elements.append(Element(kind, name, opened[3], end, index))
+                index += 1
+            elif depth == 2:
+                elements.append(Element('section', keyword.decode('utf-8'), opened[2], match.end()))
+                section = None
+            depth -= 1
+    elements.sort(key=lambda element: element.start)
+    return elements
+
+
+class IncrementalDomain(object):
+    """
+    A domain source and its parsed Domain, kept in sync one element at a time.
+
+    replace() swaps the text of one action, event, fluent, predicate, process or derived predicate, parses
+    only that text and puts the result in place of the old object in the Domain, every other parsed object
+    is left as it is. The predicate and event the parser generates for each forall effect of an action are
+    replaced with the action, numbered as a full parse would when the action keeps its number of foralls.
+    """
+
+    def __init__(self, source):
+        """
+
+        :param source: tsal domain source, str or utf-8 bytes
+        """
+        self._source = source.encode('utf-8') if isinstance(source, str) else bytes(source)
+        self._domain = TSALParser.parse_string(self._source, start='domain')
+        if self._domain is None:
+            raise ValueError('the source does not parse as a tsal domain')
+        self._elements = outline(self._source)
+
+    @classmethod
+    def from_file(cls, filename):
+        with open(filename, 'rb') as file:
+            return cls(file.read())
+
+    @property
+    def domain(self):
+        return self._domain
+
+    @property
+    def source(self):
+        return self._source
+
+    @property
+    def elements(self):
+        return self._elements[:]
+
+    def find(self, kind, name):
+        """
+        :param kind: element kind, see Element
+        :param name: element name, matched case-insensitively
+        :return: the first Element of that kind and name
+        """
+        name = name.lower()
+        for element in self._elements:
+            if element.kind == kind and element.name == name:
+                return element
+        raise KeyError('no {} named {}'.format(kind, name))
+
+    def replace(self, element, text):
+        """
+        Replace the source of one element and splice its re-parsed object into the domain.
+
+        :param element: Element of elements to replace, not a section, elements returns new Elements afterwards
+        :param text: the new source of the element, str or utf-8 bytes, the element spans all of it afterwards
+        :return: the newly parsed object
+        """
+        if element.kind not in _section_of_kind:
+            raise ValueError('only elements of list sections can be replaced, not {!r}'.format(element))
+        if element not in self._elements:
+            raise ValueError('{!r} is not an element of the current source'.format(element))
+        if isinstance(text, str):
+            text = text.encode('utf-8')
+        elements = getattr(self._domain, _attribute_of_kind[element.kind])
+        old = _forall_numbers(elements[element.index]) if element.kind == 'action' else []
+        taken = {_forall_number(predicate.name) for predicate in self._domain.predicates} - {None} - set(old)
+        # the numbers of the old foralls, those past every other forall of the domain when they do not suffice
+        counter = old[0] if old else max(taken, default=-1) + 1
+        new, (predicates, events) = self.__parse(element.kind, text, counter)
+        if taken & set(range(counter, counter + len(predicates))):
+            counter = max(taken) + 1
+            new, (predicates, events) = self.__parse(element.kind, text, counter)
+
+        elements[element.index] = new
+        if old or predicates:
+            self.__replace_foralls(old, predicates, events)
+        self._domain.clear_caches()
+        self._source = self._source[:element.start] + text + self._source[element.end:]
+        name = _name_of_kind[element.kind].search(text)
+        replacement = Element(element.kind, name.group(1).lower().decode('utf-8') if name else None, element.start,
+                              element.start + len(text), element.index)
+        self.__shift(element, replacement)
+        return new
+
+    @staticmethod
+    def __parse(kind, text, counter):
+        # (the parsed element, (predicates, events) generated for its foralls)
+        parser = TSALParser()
+        wrapped = '({}\n{}\n)'.format(_section_of_kind[kind], text.decode('utf-8'))
+        parsed = parser.parse_input(TSALParser.clean_input(wrapped), 'domain_section', forall_counter=counter)
+        if not parsed or len(parsed[1]) != 1:
+            raise ValueError('the text is not a single {}: {!r}'.format(kind, text))
+        return parsed[1][0], parser.generated
+
+    def __replace_foralls(self, old, predicates, events):
+        # drop the forall predicates and events of old, add the new ones, all of them after the declared ones in
+        # the order of their actions like p_domain puts them
+        domain = self._domain
+        by_number = {}
+        for predicate in domain.predicates:
+            number = _forall_number(predicate.name)
+            if number is not None and number not in old:
+                by_number[number] = [predicate, None]
+        for event in domain.events:
+            number = _forall_number(event.name, _forall_event_re)
+            if number in by_number:
+                by_number[number][1] = event
+        for predicate, event in zip(predicates, events):
+            by_number[_forall_number(predicate.name)] = [predicate, event]
+        order = [number for action in domain.operators for number in _forall_numbers(action) if number in by_number]
+        order += sorted(set(by_number) - set(order))
+        domain.predicates[:] = [predicate for predicate in domain.predicates if _forall_number(predicate.name) is None]
+        domain.predicates.extend(by_number[number][0] for number in order)
+        domain.events[:] = [event for event in domain.events if _forall_number(event.name, _forall_event_re) is None]
+        domain.events.extend(by_number[number][1] for number in order if by_number[number][1] is not None)
+
+    def __shift(self, replaced, replacement):
+        delta = replacement.end - replaced.end
+        elements = []
+        for element in self._elements:
+            if element is replaced:
+                element = replacement
+            elif element.start >= replaced.end:
+                element = element.shifted(element.start + delta, element.end + delta)
+            elif element.end >= replaced.end:  # the enclosing section
+                element = element.shifted(element.start, element.end + delta)
+            elements.append(element)
+        self._elements = elements
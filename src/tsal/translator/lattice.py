@@ -0,0 +1,120 @@
+# Author: Dustin Dannenhauer
+# Email: dustin.dannenhauer@parallaxresearch.org
+
+# This file is part of tsal-translator, an extension of pypddl-parser
+
+
+class TypeLattice(object):
+    """
+    Index of a type hierarchy, the transitive closure of the types dict of a Domain ({type: [subtypes]}).
+
+    Every type gets an id, its ancestors and descendants are precomputed as frozensets (the type itself
+    included) and as bitsets over the ids, so subtype checks are a set lookup or a bit test. object is the
+    implicit supertype of every type, declared or not, as in PDDL: a parameter of type object takes any object.
+    """
+
+    root = 'object'
+
+    def __init__(self, types):
+        """
+
+        :param types: dictionary from types to the list of their direct subtypes, e.g. Domain.types
+        """
+        children = {}
+        for parent, subtypes in types.items():
+            children.setdefault(parent, [])
+            for subtype in subtypes:
+                children[parent].append(subtype)
+                children.setdefault(subtype, [])
+        children.setdefault(self.root, []).extend(name for name in children if name != self.root)
+        self._types = tuple(children)
+        self._ids = {name: index for index, name in enumerate(self._types)}
+
+        descendants = {name: self.__reachable(name, children) for name in self._types}
+        ancestors = {name: set() for name in self._types}
+        for name, below in descendants.items():
+            for subtype in below:
+                ancestors[subtype].add(name)
+        self._descendants = {name: frozenset(below) for name, below in descendants.items()}
+        self._ancestors = {name: frozenset(above) for name, above in ancestors.items()}
+        self._descendant_masks = {name: self.__mask(below) for name, below in self._descendants.items()}
+        self._ancestor_masks = {name: self.__mask(above) for name, above in self._ancestors.items()}
+
+    @property
+    def types(self):
+        return self._types
+
+    @property
+    def ids(self):
+        return self._ids
+
+    def __len__(self):
+        return len(self._types)
+
+    def __contains__(self, name):
+        return name in self._ids
+
+    def ancestors(self, name):
+        """
+        :return: frozenset of name and all its supertypes, {name, object} for a type not in the hierarchy
+        """
+        return self._ancestors.get(name) or frozenset((name, self.root))
+
+    def descendants(self, name):
+        """
+        :return: frozenset of name and all its subtypes, {name} for a type not in the hierarchy
+        """
+        return self._descendants.get(name) or frozenset((name,))
+
+    def ancestor_mask(self, name):
+        """
+        :return: bitset of the ids of ancestors(name), 0 for a type not in the hierarchy
+        """
+        return self._ancestor_masks.get(name, 0)
+
+    def descendant_mask(self, name):
+        """
+        :return: bitset of the ids of descendants(name), 0 for a type not in the hierarchy
+        """
+        return self._descendant_masks.get(name, 0)
+
+    def is_subtype(self, name, of):
+        """
+        :return: True when name is of or one of its (transitive) subtypes
+        """
+        return name == of or of == self.root or of in self._ancestors.get(name, ())
+
+    def objects_by_type(self, objects, constants=None):
+        """
+        Group objects under every type they belong to, subtypes included.
+
+        :param objects: dictionary from types to object names, e.g. Problem.objects
+        :param constants: dictionary from types to constant Terms, e.g. Domain.constants
+        :return: dictionary from every type of the hierarchy and of objects to the tuple of the names of its
+                 objects and constants, problem objects first, each name once
+        """
+        grouped = {name: {} for name in self._types}
+        for typed in (objects, {name: [getattr(term, 'value', term) for term in terms]
+                                 for name, terms in (constants or {}).items()}):
+            for name, values in typed.items():
+                for supertype in self.ancestors(name):
+                    grouped.setdefault(supertype, {}).update(dict.fromkeys(values))
+        return {name: tuple(values) for name, values in grouped.items()}
+
+    @staticmethod
+    def __reachable(name, children):
+        # depth first, types may form cycles
+        seen = {name}
+        stack = [name]
+        while stack:
+            for child in children[stack.pop()]:
+                if child not in seen:
+                    seen.add(child)
+                    stack.append(child)
+        return seen
+
+    def __mask(self, names):
+        mask = 0
+        for name in names:
+            mask |= 1 << self._ids[name]
+        return mask
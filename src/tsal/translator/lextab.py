@@ -0,0 +1,11 @@
+# lextab.py. This file automatically created by PLY. Don't edit!
+_tabversion     = '3.10'
+_lexsignature   = "('NAME', 'VARIABLE', 'PROBABILITY', 'DECIMAL', 'NEG_INTEGER', 'POS_INTEGER', 'PLUS', 'TIMES', 'DIVIDE', 'LPAREN', 'RPAREN', 'HYPHEN', 'EQUALS', 'NEQ', 'GT', 'GTEQ', 'LT', 'LTEQ', 'MOD', 'AT_KEY', 'DEFINE_KEY', 'DOMAIN_KEY', 'REQUIREMENTS_KEY', 'TYPES_KEY', 'CONSTANTS_KEY', 'PREDICATES_KEY', 'DERIVED_KEY', 'DERIVED_PREDICATES_KEY', 'ACTION_KEY', 'ACTIONS_KEY', 'EVENT_KEY', 'EVENTS_KEY', 'PARAMETERS_KEY', 'PRECONDITION_KEY', 'EFFECT_KEY', 'AND_KEY', 'NOT_KEY', 'ONEOF_KEY', 'PROBABILISTIC_KEY', 'PROBLEM_KEY', 'OBJECTS_KEY', 'INIT_KEY', 'GOAL_KEY', 'METRIC_KEY', 'FORALL_KEY', 'WHEN_KEY', 'OR_KEY', 'FLUENTS_KEY', 'BOUNDS_KEY', 'DURATION_KEY', 'PROCESSES_KEY', 'TIMED_INIT_KEY', 'INTERARRIVAL_KEY')\n''\n[('INITIAL', 'inclusive')]\n64\n[('t_KEYWORD', ':?[a-zA-z_][a-zA-Z_0-9\\\\-]*'), ('t_NAME', '[a-zA-z_][a-zA-Z_0-9\\\\-]*'), ('t_VARIABLE', '\\\\??[a-zA-z_][a-zA-Z_0-9\\\\-]*'), ('t_PROBABILITY', '[0-1]\\\\.\\\\d+'), ('t_DECIMAL', '[+-]?\\\\d*\\\\.\\\\d+?'), ('t_NEG_INTEGER', '[-]\\\\d+'), ('t_POS_INTEGER', '\\\\d+'), ('t_newline', '\\\\n+')]\n[('t_PLUS', '\\\\+'), ('t_TIMES', '\\\\*'), ('t_LPAREN', '\\\\('), ('t_RPAREN', '\\\\)'), ('t_HYPHEN', '\\\\-'), ('t_NEQ', '!='), ('t_GTEQ', '>='), ('t_LTEQ', '<='), ('t_DIVIDE', '/'), ('t_EQUALS', '='), ('t_GT', '>'), ('t_LT', '<'), ('t_MOD', '%')]\n' \\t'\n't_error'\nNone"
+_lextokens      = set(['ACTIONS_KEY', 'ACTION_KEY', 'AND_KEY', 'AT_KEY', 'BOUNDS_KEY', 'CONSTANTS_KEY', 'DECIMAL', 'DEFINE_KEY', 'DERIVED_KEY', 'DERIVED_PREDICATES_KEY', 'DIVIDE', 'DOMAIN_KEY', 'DURATION_KEY', 'EFFECT_KEY', 'EQUALS', 'EVENTS_KEY', 'EVENT_KEY', 'FLUENTS_KEY', 'FORALL_KEY', 'GOAL_KEY', 'GT', 'GTEQ', 'HYPHEN', 'INIT_KEY', 'INTERARRIVAL_KEY', 'LPAREN', 'LT', 'LTEQ', 'METRIC_KEY', 'MOD', 'NAME', 'NEG_INTEGER', 'NEQ', 'NOT_KEY', 'OBJECTS_KEY', 'ONEOF_KEY', 'OR_KEY', 'PARAMETERS_KEY', 'PLUS', 'POS_INTEGER', 'PRECONDITION_KEY', 'PREDICATES_KEY', 'PROBABILISTIC_KEY', 'PROBABILITY', 'PROBLEM_KEY', 'PROCESSES_KEY', 'REQUIREMENTS_KEY', 'RPAREN', 'TIMED_INIT_KEY', 'TIMES', 'TYPES_KEY', 'VARIABLE', 'WHEN_KEY'])
+_lexreflags     = 64
+_lexliterals    = ''
+_lexstateinfo   = {'INITIAL': 'inclusive'}
+_lexstatere     = {'INITIAL': [('(?P<t_KEYWORD>:?[a-zA-z_][a-zA-Z_0-9\\-]*)|(?P<t_NAME>[a-zA-z_][a-zA-Z_0-9\\-]*)|(?P<t_VARIABLE>\\??[a-zA-z_][a-zA-Z_0-9\\-]*)|(?P<t_PROBABILITY>[0-1]\\.\\d+)|(?P<t_DECIMAL>[+-]?\\d*\\.\\d+?)|(?P<t_NEG_INTEGER>[-]\\d+)|(?P<t_POS_INTEGER>\\d+)|(?P<t_newline>\\n+)|(?P<t_PLUS>\\+)|(?P<t_TIMES>\\*)|(?P<t_LPAREN>\\()|(?P<t_RPAREN>\\))|(?P<t_HYPHEN>\\-)|(?P<t_NEQ>!=)|(?P<t_GTEQ>>=)|(?P<t_LTEQ><=)|(?P<t_DIVIDE>/)|(?P<t_EQUALS>=)|(?P<t_GT>>)|(?P<t_LT><)|(?P<t_MOD>%)', [None, ('t_KEYWORD', 'KEYWORD'), ('t_NAME', 'NAME'), ('t_VARIABLE', 'VARIABLE'), ('t_PROBABILITY', 'PROBABILITY'), ('t_DECIMAL', 'DECIMAL'), ('t_NEG_INTEGER', 'NEG_INTEGER'), ('t_POS_INTEGER', 'POS_INTEGER'), ('t_newline', 'newline'), (None, 'PLUS'), (None, 'TIMES'), (None, 'LPAREN'), (None, 'RPAREN'), (None, 'HYPHEN'), (None, 'NEQ'), (None, 'GTEQ'), (None, 'LTEQ'), (None, 'DIVIDE'), (None, 'EQUALS'), (None, 'GT'), (None, 'LT'), (None, 'MOD')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff   = {}
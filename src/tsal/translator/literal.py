@@ -14,13 +14,21 @@
 # along with pypddl-parser.  If not, see <http://www.gnu.org/licenses/>.
 
 
+from tsal.translator.hashing import hashless_state, restore_state
+
+
 class Literal(object):
 
     class_name = 'predicates'
 
+    __slots__ = ('_predicate', '_positive', '_hash')
+    __getstate__ = hashless_state
+    __setstate__ = restore_state
+
     def __init__(self, predicate, positive):
         self._predicate = predicate
         self._positive  = positive
+        self._hash      = None  # computed on first use
 
     @property
     def predicate(self):
@@ -57,9 +65,11 @@ class Literal(object):
             return '(not {})'.format(str(self._predicate))
 
     def __eq__(self, other):
+        if self is other:
+            return True
         try:
             if self._predicate.name == other._predicate.name \
-                    and self._predicate.args == other._predicate.args \
+                    and tuple(self._predicate.args) == tuple(other._predicate.args) \
                     and self._positive == other._positive:
                 return True
             else:
@@ -70,6 +80,8 @@ class Literal(object):
 
 
     def __hash__(self):
-        return hash((self.predicate,self.is_positive()))
+        if self._hash is None:
+            self._hash = hash((self._predicate, self._positive))
+        return self._hash
 
 
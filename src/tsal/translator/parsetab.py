@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'leftPLUSHYPHENleftTIMESDIVIDEACTIONS_KEY ACTION_KEY AND_KEY AT_KEY BOUNDS_KEY CONSTANTS_KEY DECIMAL DEFINE_KEY DERIVED_KEY DERIVED_PREDICATES_KEY DIVIDE DOMAIN_KEY DURATION_KEY EFFECT_KEY EQUALS EVENTS_KEY EVENT_KEY FLUENTS_KEY GOAL_KEY GT GTEQ HYPHEN INIT_KEY INTERARRIVAL_KEY LPAREN LT LTEQ MOD NAME NEG_INTEGER NEQ NOT_KEY OBJECTS_KEY ONEOF_KEY OR_KEY PARAMETERS_KEY PLUS POS_INTEGER PRECONDITION_KEY PREDICATES_KEY PROBABILISTIC_KEY PROBABILITY PROBLEM_KEY PROCESSES_KEY RPAREN TIMED_INIT_KEY TIMES TYPES_KEY VARIABLE WHEN_KEYtsal : domain\n            | problem\n            | domain problemdomain : LPAREN DEFINE_KEY domain_def types_def constants_def fluents_def predicates_def derived_predicates_def processes_def actions_def events_def RPAREN domain_def : LPAREN DOMAIN_KEY NAME RPARENtypes_def : LPAREN TYPES_KEY typed_names_lst RPARENconstants_def : LPAREN CONSTANTS_KEY typed_names_lst RPAREN\n                     | LPAREN CONSTANTS_KEY RPARENtyped_names_lst : names_lst HYPHEN type typed_names_lst\n                       | names_lst HYPHEN type\n                       | names_lstfluents_def : LPAREN FLUENTS_KEY fluent_def_lst RPARENfluent_def_lst : fluent_def fluent_def_lst\n                      | fluent_deffluent_def : LPAREN NAME typed_variables_lst RPAREN\n                  | LPAREN NAME variables_lst RPAREN\n                  | LPAREN NAME RPAREN\n                  | fluent_def HYPHEN type\n                  |  LPAREN NAME typed_variables_lst bounds_def RPARENbounds_def : BOUNDS_KEY num num POS_INTEGERnum : POS_INTEGER\n            | NEG_INTEGERpredicates_def : LPAREN PREDICATES_KEY predicate_def_lst RPARENpredicate_def_lst : predicate_def predicate_def_lst\n                         | predicate_defpredicate_def : LPAREN NAME typed_variables_lst RPAREN\n                     | LPAREN NAME variables_lst RPAREN\n                     | LPAREN NAME RPARENderived_predicates_def : LPAREN DERIVED_PREDICATES_KEY derived_def_lst RPAREN\n                               | LPAREN DERIVED_PREDICATES_KEY RPARENderived_def_lst :\n                       | derived_def derived_def_lst\n                       | derived_defderived_def : LPAREN DERIVED_KEY predicate_def derived_def_body RPAREN\n                    | LPAREN DERIVED_KEY fluent_def derived_def_body RPARENderived_def_body : LPAREN AND_KEY fluent_predicate_def_lst RPARENfluent_predicate_def_lst :\n                                | expression fluent_predicate_def_lst\n                                | literal fluent_predicate_def_lstprocesses_def : LPAREN PROCESSES_KEY processes_def_lst RPARENprocesses_def_lst :\n                         | process_def processes_def_lst\n                         | process_defprocess_def : LPAREN EQUALS NAME expression RPARENactions_def : LPAREN ACTIONS_KEY action_def_lst RPARENaction_def_lst :\n                      | action_def action_def_lst\n                      | action_defaction_def : LPAREN ACTION_KEY NAME parameters_def action_def_body RPAREN\n                  | LPAREN ACTION_KEY NAME parameters_def duration_def action_def_body RPARENevent_def : LPAREN EVENT_KEY NAME parameters_def event_def_body RPAREN\n                 | LPAREN EVENT_KEY NAME parameters_def duration_def event_def_body RPARENevents_def : LPAREN EVENTS_KEY event_def_lst RPARENevent_def_lst :\n                     | event_def event_def_lst\n                     | event_defparameters_def : PARAMETERS_KEY LPAREN typed_variables_lst RPAREN\n                      | PARAMETERS_KEY LPAREN variables_lst RPAREN\n                      | PARAMETERS_KEY LPAREN RPARENaction_def_body : precond_def effects_defevent_def_body : precond_def effects_def\n                      | precond_def frequency_def effects_defprecond_def : PRECONDITION_KEY LPAREN AND_KEY literals_lst RPAREN\n                   | PRECONDITION_KEY literal\n                   | PRECONDITION_KEY expression\n                   | PRECONDITION_KEY LPAREN AND_KEY RPARENeffects_def : EFFECT_KEY effect_bodyeffect_body : LPAREN RPAREN\n                    | LPAREN NAME unlabeled_effect RPAREN\n                    | effect_body LPAREN NAME unlabeled_effect RPAREN\n                    | unlabeled_effectfrequency_def : INTERARRIVAL_KEY LPAREN NAME NAME DECIMAL RPAREN\n                     | INTERARRIVAL_KEY LPAREN RPARENunlabeled_effect : LPAREN ONEOF_KEY effect_body RPAREN\n                        | deterministic_effect unlabeled_effect\n                        | deterministic_effectdeterministic_effect : LPAREN AND_KEY effects_lst RPAREN\n                            | effects_lstwhen_effects : when_if when_then when_if : simple_effect\n                | LPAREN AND_KEY simple_effects_lst RPARENwhen_then : simple_effect\n                 | LPAREN AND_KEY simple_effects_lst RPARENeffects_lst :\n                   | effect effects_lst\n                   | effectsimple_effects_lst : simple_effect simple_effects_lst\n                          | simple_effecteffect : literal\n              | expression\n              | LPAREN PROBABILISTIC_KEY PROBABILITY literal RPAREN\n              | LPAREN WHEN_KEY when_effects RPARENsimple_effect : literalduration_def : DURATION_KEY LPAREN expression RPAREN\n                    | DURATION_KEY LPAREN RPARENexpression_body : fluent_def\n                       | expressionexpression_body_list : expression_body expression_bodyexpression : PLUS expression_body_list\n                  | HYPHEN expression_body_list\n                  | TIMES expression_body_list\n                  | DIVIDE expression_body_list\n                  | GT expression_body_list\n                  | GTEQ expression_body_list\n                  | LT expression_body_list\n                  | LTEQ expression_body_list\n                  | EQUALS expression_body_list\n                  | NEQ expression_body_list\n                  | MOD expression_body_list\n                  | LPAREN expression RPAREN\n                  | DECIMAL\n                  | PROBABILITY\n                  | VARIABLE\n                  | POS_INTEGER\n                  | NEG_INTEGER\n                  | NAMEliterals_lst : literal literals_lst\n                    | expression literals_lst\n                    | literal\n                    | expression\n                    | or_literal literals_lst\n                    | or_literalor_literal : LPAREN OR_KEY literals_lst RPARENliteral : LPAREN NOT_KEY predicate RPAREN\n               | predicateground_predicates_lst : ground_predicate ground_predicates_lst\n                             | ground_predicateground_predicate : LPAREN NAME constants_lst RPAREN\n                        | LPAREN NAME RPAREN\n                        | ground_fluentground_fluent : LPAREN EQUALS fluent_def VARIABLE RPARENpredicate : LPAREN NAME variables_lst RPAREN\n                 | LPAREN EQUALS VARIABLE VARIABLE RPAREN\n                 | LPAREN NAME RPAREN\n                 | LPAREN NAME constants_lst RPARENtyped_constants_lst : constants_lst HYPHEN type typed_constants_lst\n                           | constants_lst HYPHEN typetyped_variables_lst : variables_lst HYPHEN type typed_variables_lst\n                           | variables_lst HYPHEN typeconstants_lst : constant constants_lst\n                     | constantvariables_lst : variable variables_lst\n                     | variablenames_lst : NAME names_lst\n                 | NAMEtype : NAMEconstant : NAMEvariable : VARIABLEproblem : plan_problemplan_problem : LPAREN DEFINE_KEY plan_problem_def domain_def objects_def init_def timed_inits_def goal_def RPARENplan_problem_def : LPAREN PROBLEM_KEY NAME RPARENobjects_def : LPAREN OBJECTS_KEY typed_constants_lst RPAREN\n                   | LPAREN OBJECTS_KEY constants_lst RPARENinit_def : LPAREN INIT_KEY LPAREN AND_KEY ground_predicates_lst RPAREN RPAREN\n                | LPAREN INIT_KEY ground_predicates_lst RPARENtimed_inits_def : LPAREN TIMED_INIT_KEY timed_init_lst RPARENtimed_init_lst :\n                      | timed_init_def timed_init_lst\n                      | timed_init_deftimed_init_def : LPAREN AT_KEY DECIMAL literal RPARENgoal_def : LPAREN GOAL_KEY LPAREN AND_KEY literals_lst RPAREN RPAREN\n                | LPAREN GOAL_KEY literal RPAREN\n                | LPAREN GOAL_KEY LPAREN ONEOF_KEY effect_body RPAREN RPAREN'
+_lr_signature = 'tsalleftPLUSHYPHENleftTIMESDIVIDEACTIONS_KEY ACTION_KEY AND_KEY AT_KEY BOUNDS_KEY CONSTANTS_KEY DECIMAL DEFINE_KEY DERIVED_KEY DERIVED_PREDICATES_KEY DIVIDE DOMAIN_KEY DURATION_KEY EFFECT_KEY EQUALS EVENTS_KEY EVENT_KEY FLUENTS_KEY FORALL_KEY GOAL_KEY GT GTEQ HYPHEN INIT_KEY INTERARRIVAL_KEY LPAREN LT LTEQ METRIC_KEY MOD NAME NEG_INTEGER NEQ NOT_KEY OBJECTS_KEY ONEOF_KEY OR_KEY PARAMETERS_KEY PLUS POS_INTEGER PRECONDITION_KEY PREDICATES_KEY PROBABILISTIC_KEY PROBABILITY PROBLEM_KEY PROCESSES_KEY REQUIREMENTS_KEY RPAREN TIMED_INIT_KEY TIMES TYPES_KEY VARIABLE WHEN_KEYtsal : domain\n            | problem\n            | domain problemdomain : LPAREN DEFINE_KEY domain_def domain_section_lst RPARENdomain_section_lst : domain_section_lst domain_section\n                          | domain_sectiondomain_section : requirements_def\n                      | types_def\n                      | constants_def\n                      | fluents_def\n                      | predicates_def\n                      | derived_predicates_def\n                      | processes_def\n                      | actions_def\n                      | events_defdomain_def : LPAREN DOMAIN_KEY NAME RPARENrequirements_def : LPAREN REQUIREMENTS_KEY requirements_lst RPAREN\n                        | LPAREN REQUIREMENTS_KEY RPARENrequirements_lst :  requirement_def requirements_lst\n                        |  requirement_defrequirement_def : NAMEtypes_def : LPAREN TYPES_KEY typed_names_lst RPARENconstants_def : LPAREN CONSTANTS_KEY typed_names_lst RPAREN\n                     | LPAREN CONSTANTS_KEY RPARENtyped_names_lst : names_lst HYPHEN type typed_names_lst\n                       | names_lst HYPHEN type\n                       | names_lstfluents_def : LPAREN FLUENTS_KEY fluent_def_lst RPARENfluent_def_lst : fluent_def_lst fluent_def\n                      | fluent_deffluent_def : LPAREN NAME typed_variables_lst RPAREN\n                  | LPAREN NAME variables_lst RPAREN\n                  | LPAREN NAME RPAREN\n                  | fluent_def HYPHEN type\n                  |  LPAREN NAME typed_variables_lst bounds_def RPARENbounds_def : BOUNDS_KEY num num POS_INTEGERnum : POS_INTEGER\n            | NEG_INTEGERpredicates_def : LPAREN PREDICATES_KEY predicate_def_lst RPARENpredicate_def_lst : predicate_def_lst predicate_def\n                         | predicate_defpredicate_def : LPAREN NAME typed_variables_lst RPAREN\n                     | LPAREN NAME variables_lst RPAREN\n                     | LPAREN NAME RPARENderived_predicates_def : LPAREN DERIVED_PREDICATES_KEY derived_def_lst RPAREN\n                               | LPAREN DERIVED_PREDICATES_KEY RPARENderived_def_lst :\n                       | derived_def_lst derived_defderived_def : LPAREN DERIVED_KEY predicate_def derived_def_body RPAREN\n                    | LPAREN DERIVED_KEY fluent_def derived_def_body RPARENderived_def_body : LPAREN AND_KEY fluent_predicate_def_lst RPARENfluent_predicate_def_lst :\n                                | expression fluent_predicate_def_lst\n                                | literal fluent_predicate_def_lstprocesses_def : LPAREN PROCESSES_KEY processes_def_lst RPARENprocesses_def_lst :\n                         | processes_def_lst process_defprocess_def : LPAREN EQUALS NAME expression RPARENactions_def : LPAREN ACTIONS_KEY action_def_lst RPARENaction_def_lst :\n                      | action_def_lst action_defaction_def : LPAREN ACTION_KEY NAME parameters_def action_def_body RPAREN\n                  | LPAREN ACTION_KEY NAME parameters_def duration_def action_def_body RPARENevent_def : LPAREN EVENT_KEY NAME parameters_def event_def_body RPAREN\n                 | LPAREN EVENT_KEY NAME parameters_def duration_def event_def_body RPARENevents_def : LPAREN EVENTS_KEY event_def_lst RPARENevent_def_lst :\n                     | event_def_lst event_defparameters_def : PARAMETERS_KEY LPAREN typed_variables_lst RPAREN\n                      | PARAMETERS_KEY LPAREN variables_lst RPAREN\n                      | PARAMETERS_KEY LPAREN RPARENaction_def_body : precond_def effects_defevent_def_body : precond_def effects_def\n                      | precond_def frequency_def effects_defprecond_def : PRECONDITION_KEY LPAREN AND_KEY literals_lst RPAREN\n                   | PRECONDITION_KEY literal\n                   | PRECONDITION_KEY expression\n                   | PRECONDITION_KEY LPAREN RPARENeffects_def : EFFECT_KEY effect_body\n                    | EFFECT_KEY forall\n                    | EFFECT_KEY when_body\n                    | EFFECT_KEY LPAREN AND_KEY forall_body RPAREN effect_body : LPAREN RPAREN\n                    | LPAREN NAME unlabeled_effect RPAREN\n                    | effect_body LPAREN NAME unlabeled_effect RPAREN\n                    | unlabeled_effectforall_body : forall forall_body\n                   | forall\n                   | effect forall_body\n                   | effectwhen_body : LPAREN WHEN_KEY when_pre when_eff RPARENforall : LPAREN FORALL_KEY LPAREN typed_variables_lst RPAREN when_body RPARENwhen_pre : LPAREN AND_KEY literals_lst RPAREN\n                | literalwhen_eff : LPAREN AND_KEY literals_lst RPAREN\n                | literalfrequency_def : INTERARRIVAL_KEY LPAREN NAME NAME DECIMAL RPAREN\n                     | INTERARRIVAL_KEY LPAREN RPARENunlabeled_effect : LPAREN ONEOF_KEY effect_body RPAREN\n                        | deterministic_effect unlabeled_effect\n                        | deterministic_effectdeterministic_effect : LPAREN AND_KEY effects_lst RPAREN\n                            | effects_lstwhen_effects : when_if when_then when_if : simple_effect\n                | LPAREN AND_KEY simple_effects_lst RPARENwhen_then : simple_effect\n                 | LPAREN AND_KEY simple_effects_lst RPARENeffects_lst :\n                   | effects_lst effectsimple_effects_lst : simple_effects_lst simple_effect\n                          | simple_effecteffect : literal\n              | expression\n              | LPAREN PROBABILISTIC_KEY PROBABILITY literal RPAREN\n              | LPAREN WHEN_KEY when_effects RPARENsimple_effect : literalduration_def : DURATION_KEY LPAREN expression RPAREN\n                    | DURATION_KEY LPAREN RPARENexpression_body : fluent_def\n                       | expressionexpression_body_list : expression_body expression_bodyexpression : PLUS expression_body_list\n                  | HYPHEN expression_body_list\n                  | TIMES expression_body_list\n                  | DIVIDE expression_body_list\n                  | GT expression_body_list\n                  | GTEQ expression_body_list\n                  | LT expression_body_list\n                  | LTEQ expression_body_list\n                  | EQUALS expression_body_list\n                  | NEQ expression_body_list\n                  | MOD expression_body_list\n                  | LPAREN expression RPAREN\n                  | DECIMAL\n                  | PROBABILITY\n                  | VARIABLE\n                  | POS_INTEGER\n                  | NEG_INTEGER\n                  | NAMEliterals_lst : literals_lst literal\n                    | literals_lst expression\n                    | literal\n                    | expression\n                    | literals_lst or_literal\n                    | or_literalor_literal : LPAREN OR_KEY literals_lst RPARENliteral : LPAREN NOT_KEY predicate RPAREN\n               | predicateground_predicates_lst : ground_predicates_lst ground_predicate\n                             | ground_predicateground_predicate : LPAREN NAME constants_lst RPAREN\n                        | LPAREN NAME RPAREN\n                        | ground_fluentground_fluent : LPAREN EQUALS ground_fluent_def NAME RPAREN\n                     | LPAREN EQUALS ground_fluent_def POS_INTEGER RPAREN\n                     | LPAREN EQUALS ground_fluent_def NEG_INTEGER RPARENground_fluent_def : LPAREN NAME constants_lst RPAREN\n                         | LPAREN NAME RPARENpredicate : LPAREN NAME variables_lst RPAREN\n                 | LPAREN EQUALS VARIABLE VARIABLE RPAREN\n                 | LPAREN NAME RPAREN\n                 | LPAREN NAME constants_lst RPARENtyped_constants_lst : typed_constants_lst constants_lst HYPHEN type\n                           | constants_lst HYPHEN typetyped_variables_lst : typed_variables_lst variables_lst HYPHEN type\n                           | variables_lst HYPHEN typeconstants_lst : constants_lst constant\n                     | constantvariables_lst : variables_lst variable\n                     | variable\n                     | NAME\n                     | variables_lst NAMEnames_lst : names_lst NAME\n                 | NAMEtype : NAMEconstant : NAME\n                | POS_INTEGER\n                | NEG_INTEGERvariable : VARIABLEproblem : plan_problemplan_problem : LPAREN DEFINE_KEY plan_problem_def problem_section_lst RPARENproblem_section_lst : problem_section_lst problem_section\n                           | problem_sectionproblem_section : domain_def\n                       | objects_def\n                       | init_def\n                       | timed_inits_def\n                       | goal_def\n                       | metric_defplan_problem_def : LPAREN PROBLEM_KEY NAME RPARENobjects_def : LPAREN OBJECTS_KEY typed_constants_lst RPAREN\n                   | LPAREN OBJECTS_KEY constants_lst RPARENinit_def : LPAREN INIT_KEY LPAREN AND_KEY ground_predicates_lst RPAREN RPAREN\n                | LPAREN INIT_KEY ground_predicates_lst RPAREN\n                | LPAREN INIT_KEY RPARENtimed_inits_def : LPAREN TIMED_INIT_KEY timed_init_lst RPARENtimed_init_lst :\n                      | timed_init_lst timed_init_deftimed_init_def : LPAREN AT_KEY DECIMAL literal RPARENgoal_body_def : LPAREN AND_KEY literals_lst RPARENgoal_body_def_lst : goal_body_def_lst goal_body_def\n                         | goal_body_defgoal_def : LPAREN GOAL_KEY goal_body_def RPAREN\n                | LPAREN GOAL_KEY literal RPAREN\n                | LPAREN GOAL_KEY LPAREN ONEOF_KEY effect_body RPAREN RPAREN\n                | LPAREN GOAL_KEY LPAREN OR_KEY goal_body_def_lst RPAREN RPARENmetric_def : LPAREN METRIC_KEY NAME fluent_def RPAREN'
     
-_lr_action_items = {'LPAREN':([0,2,8,9,11,12,17,19,24,26,27,28,34,37,38,42,43,45,50,52,54,55,58,59,61,62,63,68,69,70,75,80,81,83,85,87,88,93,94,97,101,103,107,108,109,111,116,119,123,124,127,131,133,134,138,139,143,145,146,147,148,152,157,158,160,161,163,167,168,169,170,171,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,207,217,219,223,224,225,227,229,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,254,257,258,259,260,261,262,263,267,269,270,271,277,279,281,283,285,286,288,291,292,293,294,296,297,298,299,301,302,303,305,307,308,309,310,312,313,324,325,328,330,331,332,333,336,337,338,347,350,351,354,357,361,366,],[4,7,10,13,16,18,23,25,33,36,-5,-151,44,51,-6,-8,56,60,66,71,-146,-7,56,78,82,-152,-153,90,-130,91,-12,78,105,110,90,56,-155,91,121,-17,-18,-23,-30,105,136,140,-129,-156,-125,-15,-16,-28,159,-29,136,165,-128,172,174,196,204,-19,-26,-27,214,214,-40,165,221,-4,-154,-131,225,174,174,174,238,238,238,238,238,238,238,238,238,238,238,-111,-112,-113,-114,-115,-116,225,255,-71,258,-78,260,-89,-90,-134,225,-45,221,-160,225,174,238,-99,238,-96,-97,225,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-68,258,196,260,289,-75,225,-85,225,-124,-132,-135,-17,299,-34,-35,-110,-113,-98,-116,-113,255,172,316,-80,-93,258,-133,-15,-16,225,299,299,-44,326,-123,-69,-74,-77,172,-92,337,338,-91,172,172,-70,-49,196,225,225,-81,-50,255,174,-51,368,-52,]),'$end':([1,2,3,5,6,95,169,],[0,-1,-2,-149,-3,-150,-4,]),'DEFINE_KEY':([4,7,],[8,9,]),'DOMAIN_KEY':([10,18,],[14,14,]),'PROBLEM_KEY':([10,13,],[15,15,]),'NAME':([14,15,22,31,32,35,39,48,49,53,54,56,64,66,77,78,84,86,90,97,101,121,123,124,127,128,146,147,149,152,159,162,172,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,199,200,201,202,203,204,207,217,218,225,227,228,229,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,250,251,252,255,258,259,260,261,262,263,269,274,277,279,281,283,285,289,294,296,299,301,302,307,310,313,316,325,328,336,337,338,354,368,370,],[20,21,31,31,31,49,54,49,-147,31,-146,74,54,86,54,102,49,49,86,-17,-18,149,-125,-15,-16,54,195,195,49,-19,213,217,149,228,195,195,195,195,195,195,195,195,195,195,195,195,195,195,-111,-112,-113,-114,-115,-116,250,195,-78,195,-89,-90,149,-134,195,273,195,195,49,195,-99,195,-96,-97,282,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,283,195,195,294,228,-85,228,-124,-132,-135,195,306,-110,-113,-98,-116,-113,149,195,-133,228,195,195,-123,-77,-92,149,195,-91,195,195,228,195,370,372,]),'TYPES_KEY':([16,],[22,]),'RPAREN':([20,21,29,30,31,32,40,41,46,47,48,49,53,54,57,58,65,67,68,69,70,72,73,74,76,79,80,81,84,86,89,92,93,96,97,98,99,100,101,102,104,106,108,109,113,114,115,116,120,122,123,124,125,127,129,130,131,132,135,137,138,139,141,142,143,144,147,149,151,152,156,157,158,164,166,167,168,171,173,175,176,177,178,190,191,192,193,194,195,196,197,198,199,200,201,202,203,205,206,207,208,212,213,215,216,220,222,223,224,226,228,230,231,232,233,234,236,237,239,240,241,242,243,244,245,246,247,248,249,250,251,252,256,257,259,261,262,263,264,265,266,268,269,270,271,272,275,276,277,278,280,281,282,283,284,285,286,287,290,293,294,295,296,300,301,302,303,307,308,309,310,311,313,314,315,317,318,319,320,321,326,328,329,330,332,333,334,335,336,337,341,343,344,348,349,350,351,352,354,357,358,359,362,364,366,367,368,373,],[27,28,38,-11,-145,42,-144,55,62,63,-141,-147,-10,-146,75,-14,-140,88,-127,-130,-157,95,-9,97,-13,103,-25,107,-137,116,-126,119,-157,124,-17,127,-143,-148,-18,131,-24,134,-31,-41,-136,142,143,-129,-158,151,-125,-15,152,-16,-142,157,-28,158,-32,163,-41,-46,169,170,-128,171,-84,207,-162,-19,-139,-26,-27,-42,219,-46,-54,-131,224,230,-119,-120,-122,-111,-112,-113,-114,-115,-116,249,256,-71,-76,-78,-84,-89,-90,261,262,-134,263,-138,267,270,271,-47,275,-54,-160,277,207,280,-117,-118,-121,-99,-96,-97,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-68,207,-84,-84,295,-75,-85,-124,-132,-135,296,-20,297,298,-37,-34,-35,303,-53,-55,-110,307,-161,-98,97,-116,308,-113,309,310,313,-93,-84,-163,-133,318,-37,-37,-44,-123,-69,-74,-77,328,-92,-79,-82,332,-36,-38,-39,333,342,-91,347,-88,-70,-49,350,-60,-84,353,355,356,357,-87,362,-50,-67,363,365,-51,366,-61,-83,369,-52,-62,371,374,]),'CONSTANTS_KEY':([23,],[32,]),'OBJECTS_KEY':([25,],[35,]),'HYPHEN':([30,31,40,47,48,49,54,58,65,97,98,99,100,101,112,117,123,124,127,129,132,146,147,152,161,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,199,200,201,202,203,207,211,217,225,227,229,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,250,251,252,258,259,260,261,262,263,267,268,269,277,279,281,283,285,294,296,297,298,299,301,302,307,310,313,325,328,336,337,338,343,354,],[39,-145,-144,64,-141,-147,-146,77,-140,-17,128,-143,-148,-18,64,77,-125,-15,-16,-142,128,180,180,-19,77,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,-111,-112,-113,-114,-115,-116,180,180,-78,180,-89,-90,-134,128,180,180,180,180,-99,180,77,-97,180,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,180,180,180,180,-85,180,-124,-132,-135,-17,128,180,-110,-113,-98,-116,-113,180,-133,-15,-16,180,180,180,-123,-77,-92,180,-91,180,180,180,128,180,]),'FLUENTS_KEY':([33,],[43,]),'INIT_KEY':([36,],[50,]),'PREDICATES_KEY':([44,],[59,]),'TIMED_INIT_KEY':([51,],[70,]),'VARIABLE':([54,74,97,99,100,101,102,117,123,124,127,146,147,149,150,152,156,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,199,200,201,202,203,207,209,213,217,225,227,228,229,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,250,251,252,258,259,260,261,262,263,269,277,279,281,282,283,285,294,296,299,301,302,307,310,313,325,326,328,336,337,338,354,],[-146,100,-17,100,-148,-18,100,144,-125,-15,-16,192,192,100,209,-19,100,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,-111,-112,-113,-114,-115,-116,192,192,-78,192,-89,-90,-134,264,100,192,192,192,100,279,-99,192,-96,-97,192,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,285,192,192,192,-85,192,-124,-132,-135,192,-110,264,-98,100,-116,-113,192,-133,192,192,192,-123,-77,-92,192,100,-91,192,192,192,192,]),'PLUS':([54,97,101,123,124,127,146,147,152,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,199,200,201,202,203,207,217,225,227,229,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,250,251,252,258,259,260,261,262,263,269,277,279,281,283,285,294,296,299,301,302,307,310,313,325,328,336,337,338,354,],[-146,-17,-18,-125,-15,-16,179,179,-19,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,-111,-112,-113,-114,-115,-116,179,179,-78,179,-89,-90,-134,179,179,179,179,-99,179,-96,-97,179,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,179,179,179,179,-85,179,-124,-132,-135,179,-110,-113,-98,-116,-113,179,-133,179,179,179,-123,-77,-92,179,-91,179,179,179,179,]),'TIMES':([54,97,101,123,124,127,146,147,152,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,199,200,201,202,203,207,217,225,227,229,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,250,251,252,258,259,260,261,262,263,269,277,279,281,283,285,294,296,299,301,302,307,310,313,325,328,336,337,338,354,],[-146,-17,-18,-125,-15,-16,181,181,-19,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,-111,-112,-113,-114,-115,-116,181,181,-78,181,-89,-90,-134,181,181,181,181,-99,181,-96,-97,181,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,181,181,181,181,-85,181,-124,-132,-135,181,-110,-113,-98,-116,-113,181,-133,181,181,181,-123,-77,-92,181,-91,181,181,181,181,]),'DIVIDE':([54,97,101,123,124,127,146,147,152,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,199,200,201,202,203,207,217,225,227,229,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,250,251,252,258,259,260,261,262,263,269,277,279,281,283,285,294,296,299,301,302,307,310,313,325,328,336,337,338,354,],[-146,-17,-18,-125,-15,-16,182,182,-19,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,-111,-112,-113,-114,-115,-116,182,182,-78,182,-89,-90,-134,182,182,182,182,-99,182,-96,-97,182,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,182,182,182,182,-85,182,-124,-132,-135,182,-110,-113,-98,-116,-113,182,-133,182,182,182,-123,-77,-92,182,-91,182,182,182,182,]),'GT':([54,97,101,123,124,127,146,147,152,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,199,200,201,202,203,207,217,225,227,229,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,250,251,252,258,259,260,261,262,263,269,277,279,281,283,285,294,296,299,301,302,307,310,313,325,328,336,337,338,354,],[-146,-17,-18,-125,-15,-16,183,183,-19,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,-111,-112,-113,-114,-115,-116,183,183,-78,183,-89,-90,-134,183,183,183,183,-99,183,-96,-97,183,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,183,183,183,183,-85,183,-124,-132,-135,183,-110,-113,-98,-116,-113,183,-133,183,183,183,-123,-77,-92,183,-91,183,183,183,183,]),'GTEQ':([54,97,101,123,124,127,146,147,152,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,199,200,201,202,203,207,217,225,227,229,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,250,251,252,258,259,260,261,262,263,269,277,279,281,283,285,294,296,299,301,302,307,310,313,325,328,336,337,338,354,],[-146,-17,-18,-125,-15,-16,184,184,-19,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,-111,-112,-113,-114,-115,-116,184,184,-78,184,-89,-90,-134,184,184,184,184,-99,184,-96,-97,184,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,184,184,184,184,-85,184,-124,-132,-135,184,-110,-113,-98,-116,-113,184,-133,184,184,184,-123,-77,-92,184,-91,184,184,184,184,]),'LT':([54,97,101,123,124,127,146,147,152,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,199,200,201,202,203,207,217,225,227,229,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,250,251,252,258,259,260,261,262,263,269,277,279,281,283,285,294,296,299,301,302,307,310,313,325,328,336,337,338,354,],[-146,-17,-18,-125,-15,-16,185,185,-19,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,-111,-112,-113,-114,-115,-116,185,185,-78,185,-89,-90,-134,185,185,185,185,-99,185,-96,-97,185,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,185,185,185,185,-85,185,-124,-132,-135,185,-110,-113,-98,-116,-113,185,-133,185,185,185,-123,-77,-92,185,-91,185,185,185,185,]),'LTEQ':([54,97,101,123,124,127,146,147,152,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,199,200,201,202,203,207,217,225,227,229,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,250,251,252,258,259,260,261,262,263,269,277,279,281,283,285,294,296,299,301,302,307,310,313,325,328,336,337,338,354,],[-146,-17,-18,-125,-15,-16,186,186,-19,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,-111,-112,-113,-114,-115,-116,186,186,-78,186,-89,-90,-134,186,186,186,186,-99,186,-96,-97,186,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,186,186,186,186,-85,186,-124,-132,-135,186,-110,-113,-98,-116,-113,186,-133,186,186,186,-123,-77,-92,186,-91,186,186,186,186,]),'EQUALS':([54,66,90,97,101,121,123,124,127,136,146,147,152,172,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,199,200,201,202,203,204,207,217,225,227,229,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,250,251,252,258,259,260,261,262,263,269,277,279,281,283,285,289,294,296,299,301,302,307,310,313,316,325,328,336,337,338,354,],[-146,87,87,-17,-18,150,-125,-15,-16,162,187,187,-19,150,229,187,187,187,187,187,187,187,187,187,187,187,187,187,187,-111,-112,-113,-114,-115,-116,229,187,-78,187,-89,-90,150,-134,187,187,187,187,-99,187,-96,-97,187,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,187,187,187,229,-85,229,-124,-132,-135,187,-110,-113,-98,-116,-113,150,187,-133,229,187,187,-123,-77,-92,150,187,-91,187,187,229,187,]),'NEQ':([54,97,101,123,124,127,146,147,152,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,199,200,201,202,203,207,217,225,227,229,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,250,251,252,258,259,260,261,262,263,269,277,279,281,283,285,294,296,299,301,302,307,310,313,325,328,336,337,338,354,],[-146,-17,-18,-125,-15,-16,188,188,-19,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,-111,-112,-113,-114,-115,-116,188,188,-78,188,-89,-90,-134,188,188,188,188,-99,188,-96,-97,188,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,188,188,188,188,-85,188,-124,-132,-135,188,-110,-113,-98,-116,-113,188,-133,188,188,188,-123,-77,-92,188,-91,188,188,188,188,]),'MOD':([54,97,101,123,124,127,146,147,152,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,199,200,201,202,203,207,217,225,227,229,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,250,251,252,258,259,260,261,262,263,269,277,279,281,283,285,294,296,299,301,302,307,310,313,325,328,336,337,338,354,],[-146,-17,-18,-125,-15,-16,189,189,-19,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,-111,-112,-113,-114,-115,-116,189,189,-78,189,-89,-90,-134,189,189,189,189,-99,189,-96,-97,189,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,189,189,189,189,-85,189,-124,-132,-135,189,-110,-113,-98,-116,-113,189,-133,189,189,189,-123,-77,-92,189,-91,189,189,189,189,]),'DECIMAL':([54,97,101,118,123,124,127,146,147,152,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,199,200,201,202,203,207,217,225,227,229,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,250,251,252,258,259,260,261,262,263,269,277,279,281,283,285,294,296,299,301,302,307,310,313,325,328,336,337,338,354,372,],[-146,-17,-18,145,-125,-15,-16,190,190,-19,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,-111,-112,-113,-114,-115,-116,190,190,-78,190,-89,-90,-134,190,190,190,190,-99,190,-96,-97,190,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,190,190,190,190,-85,190,-124,-132,-135,190,-110,-113,-98,-116,-113,190,-133,190,190,190,-123,-77,-92,190,-91,190,190,190,190,373,]),'PROBABILITY':([54,97,101,123,124,127,146,147,152,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,199,200,201,202,203,207,217,225,227,229,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,250,251,252,253,258,259,260,261,262,263,269,277,279,281,283,285,294,296,299,301,302,307,310,313,325,328,336,337,338,354,],[-146,-17,-18,-125,-15,-16,191,191,-19,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,-111,-112,-113,-114,-115,-116,191,191,-78,191,-89,-90,-134,191,191,191,191,-99,191,-96,-97,191,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,191,191,191,288,191,-85,191,-124,-132,-135,191,-110,-113,-98,-116,-113,191,-133,191,191,191,-123,-77,-92,191,-91,191,191,191,191,]),'POS_INTEGER':([54,97,101,123,124,126,127,146,147,152,153,154,155,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,199,200,201,202,203,207,210,217,225,227,229,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,250,251,252,258,259,260,261,262,263,269,277,279,281,283,285,294,296,299,301,302,307,310,313,325,328,336,337,338,354,],[-146,-17,-18,-125,-15,154,-16,193,193,-19,154,-21,-22,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,-111,-112,-113,-114,-115,-116,193,193,-78,193,-89,-90,-134,265,193,193,193,193,-99,193,-96,-97,193,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,193,193,193,193,-85,193,-124,-132,-135,193,-110,-113,-98,-116,-113,193,-133,193,193,193,-123,-77,-92,193,-91,193,193,193,193,]),'NEG_INTEGER':([54,97,101,123,124,126,127,146,147,152,153,154,155,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,199,200,201,202,203,207,217,225,227,229,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,250,251,252,258,259,260,261,262,263,269,277,279,281,283,285,294,296,299,301,302,307,310,313,325,328,336,337,338,354,],[-146,-17,-18,-125,-15,155,-16,194,194,-19,155,-21,-22,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,-111,-112,-113,-114,-115,-116,194,194,-78,194,-89,-90,-134,194,194,194,194,-99,194,-96,-97,194,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,194,194,194,194,-85,194,-124,-132,-135,194,-110,-113,-98,-116,-113,194,-133,194,194,194,-123,-77,-92,194,-91,194,194,194,194,]),'EFFECT_KEY':([54,97,101,123,124,127,152,190,191,192,193,194,195,207,234,236,237,239,240,241,242,243,244,245,246,247,248,261,262,263,277,281,296,323,339,340,346,360,365,369,371,374,],[-146,-17,-18,-125,-15,-16,-19,-111,-112,-113,-114,-115,-116,-134,-99,-96,-97,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-124,-132,-135,-110,-98,-133,336,-64,-65,336,336,-66,-63,-73,-72,]),'INTERARRIVAL_KEY':([54,97,101,123,124,127,152,190,191,192,193,194,195,207,234,236,237,239,240,241,242,243,244,245,246,247,248,261,262,263,277,281,296,339,340,346,365,369,],[-146,-17,-18,-125,-15,-16,-19,-111,-112,-113,-114,-115,-116,-134,-99,-96,-97,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-124,-132,-135,-110,-98,-133,-64,-65,361,-66,-63,]),'BOUNDS_KEY':([54,96,156,212,266,],[-146,126,-139,-138,126,]),'DERIVED_PREDICATES_KEY':([60,],[81,]),'AND_KEY':([66,121,196,214,258,289,316,338,],[85,146,252,269,252,312,331,354,]),'GOAL_KEY':([71,],[94,]),'PROCESSES_KEY':([82,],[109,]),'AT_KEY':([91,],[118,]),'DERIVED_KEY':([105,],[133,]),'ACTIONS_KEY':([110,],[139,]),'ONEOF_KEY':([121,196,258,],[147,251,251,]),'NOT_KEY':([121,172,174,196,258,260,289,299,316,338,],[148,148,148,148,148,148,148,148,148,148,]),'EVENTS_KEY':([140,],[168,]),'ACTION_KEY':([165,],[218,]),'OR_KEY':([174,],[227,]),'PROBABILISTIC_KEY':([196,258,260,],[253,253,253,]),'WHEN_KEY':([196,258,260,],[254,254,254,]),'EVENT_KEY':([221,],[274,]),'PARAMETERS_KEY':([273,306,],[305,305,]),'DURATION_KEY':([304,327,342,355,356,],[324,324,-59,-57,-58,]),'PRECONDITION_KEY':([304,322,327,342,345,353,355,356,363,],[325,325,325,-59,325,-95,-57,-58,-94,]),}
+_lr_action_items = {'LPAREN':([0,2,8,9,11,12,17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,42,43,44,45,46,47,48,49,51,52,53,56,57,58,60,67,69,70,72,73,74,75,76,77,78,86,87,88,89,90,94,95,96,98,101,103,104,107,108,110,111,113,114,116,117,119,120,121,123,126,128,130,131,133,134,135,136,137,138,141,142,145,148,152,154,156,162,164,169,170,171,172,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,202,205,207,212,215,216,218,219,220,225,230,231,232,233,234,237,239,240,241,242,244,245,247,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,273,285,287,290,291,292,296,297,298,299,301,302,303,304,305,306,308,312,314,315,316,317,321,322,328,329,330,331,333,336,337,338,339,341,342,343,345,346,347,350,351,352,358,362,363,365,366,373,374,380,384,387,388,389,390,391,392,393,395,398,399,400,401,403,404,407,408,417,422,423,424,429,430,431,],[4,7,10,13,16,28,16,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,28,-184,-185,-186,-187,-188,-189,-190,68,71,-47,-56,-60,-67,-4,-5,85,-198,91,-183,-16,-191,-18,-24,68,-30,71,-41,109,-46,112,115,118,129,-196,-151,-154,132,-149,68,-17,-22,-23,-28,-29,-39,-40,-45,-48,-55,-57,-59,-61,-66,-68,-192,-193,129,165,-195,-150,-197,-199,168,173,176,198,-204,-205,-176,-33,-34,-44,217,129,-153,235,-86,238,242,173,-203,245,176,-143,-144,-146,258,258,258,258,258,258,258,258,258,258,258,-135,-136,-137,-138,-139,-140,-162,-208,-31,-32,-42,-43,280,280,245,-152,293,-83,238,168,-109,-100,-110,-113,-114,245,-202,245,176,258,-201,-141,-142,-145,-123,258,-120,-121,245,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-35,323,-194,-155,-156,-157,235,242,238,-206,334,-207,-134,176,-137,-122,-161,-33,343,-49,-50,-58,351,352,-200,-84,-99,-102,293,369,-105,-117,-147,-31,-32,245,343,343,-62,377,245,245,-64,386,-85,293,-116,-63,235,176,-65,-115,293,-112,293,401,405,406,176,-106,-111,293,245,401,401,418,-94,176,427,176,176,-93,176,-92,]),'$end':([1,2,3,5,6,48,55,],[0,-1,-2,-181,-3,-4,-182,]),'DEFINE_KEY':([4,7,],[8,9,]),'DOMAIN_KEY':([10,28,],[14,14,]),'PROBLEM_KEY':([10,13,],[15,15,]),'NAME':([14,15,39,40,41,50,54,61,62,64,65,68,71,79,80,81,82,83,84,85,91,94,99,100,102,105,106,122,124,125,127,129,135,137,139,144,145,146,147,148,149,150,151,152,153,155,157,158,159,160,161,163,165,166,168,171,172,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,200,201,202,203,207,209,211,212,213,214,217,220,223,226,232,233,234,235,239,240,241,242,245,247,248,249,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,273,274,278,279,288,289,293,297,298,303,304,305,306,307,308,309,311,313,314,322,323,327,331,334,339,343,345,346,350,351,352,355,357,366,369,377,380,386,387,391,395,396,401,403,404,405,406,415,416,417,418,423,424,430,431,],[37,38,62,65,65,82,95,62,-21,100,-175,102,106,82,82,-169,-177,-178,-179,127,139,-149,145,-174,146,145,146,82,145,-168,82,127,-109,197,200,65,-176,-172,146,-33,211,-171,-180,-34,146,211,220,221,222,145,-165,82,226,227,232,-109,197,248,197,-143,-144,-146,197,197,197,197,197,197,197,197,197,197,197,-135,-136,-137,-138,-139,-140,139,-172,211,-162,82,-31,211,-173,-32,145,-170,279,197,-164,82,-109,-109,-109,298,-110,-113,-114,248,197,197,200,197,-141,-142,-145,-123,197,-120,-121,307,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-35,145,-167,146,82,-159,139,197,-109,-134,197,-137,-122,146,-161,-166,146,211,197,197,146,-158,-102,139,-147,248,197,197,-109,197,248,146,211,-116,139,232,197,396,-115,197,197,410,248,197,197,146,139,146,211,197,139,197,197,197,-92,]),'REQUIREMENTS_KEY':([16,],[39,]),'TYPES_KEY':([16,],[40,]),'CONSTANTS_KEY':([16,],[41,]),'FLUENTS_KEY':([16,],[42,]),'PREDICATES_KEY':([16,],[43,]),'DERIVED_PREDICATES_KEY':([16,],[44,]),'PROCESSES_KEY':([16,],[45,]),'ACTIONS_KEY':([16,],[46,]),'EVENTS_KEY':([16,],[47,]),'RPAREN':([17,18,19,20,21,22,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,41,44,45,46,47,49,51,52,56,57,59,60,61,62,63,64,65,66,67,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,86,87,88,89,90,92,93,94,96,97,98,100,101,102,103,104,106,107,108,110,111,113,114,116,117,119,120,121,123,125,127,130,131,133,134,135,139,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,161,162,163,164,168,169,170,171,172,174,175,177,178,179,180,192,193,194,195,196,197,199,200,201,202,203,205,206,207,208,211,212,214,215,216,223,224,225,226,227,228,229,231,232,233,234,236,237,239,240,241,243,244,246,248,250,251,252,253,254,256,257,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,278,279,281,282,283,287,288,290,291,292,294,295,296,297,298,299,302,303,304,306,307,308,309,311,313,314,315,316,317,318,323,324,328,329,330,331,332,335,338,339,340,344,345,346,347,348,349,350,351,352,355,357,358,359,360,363,364,366,367,368,370,371,372,373,374,375,376,377,378,384,385,386,387,388,389,391,395,399,400,402,403,404,411,412,413,414,415,419,420,421,423,425,428,430,431,432,],[48,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,55,-184,-185,-186,-187,-188,-189,-190,57,58,60,67,75,-56,-60,-67,-5,87,-198,-183,-16,96,-18,-20,-21,98,-27,-175,101,-24,103,-30,107,-41,110,-46,113,116,119,121,123,-169,-177,-178,-179,130,-196,-151,-154,133,141,142,-149,-17,-19,-22,-174,-23,148,-28,-29,154,-39,-40,-45,-48,-55,-57,-59,-61,-66,-68,-192,-193,-168,164,-195,-150,-197,-199,-109,202,-204,-205,205,-26,-176,-172,207,-33,212,-171,-180,-34,215,-44,216,-165,224,225,-153,231,236,-86,-101,-103,243,-203,250,-143,-144,-146,-135,-136,-137,-138,-139,-140,269,-172,270,-162,271,-208,-25,-31,273,-173,-32,-170,-42,-43,-164,287,-152,289,290,291,292,-83,-109,-109,-109,299,-100,-110,-113,-114,302,-202,303,202,-201,-141,-142,-145,-123,-120,-121,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,308,-35,-167,312,315,316,317,-194,327,-155,-156,-157,328,329,330,331,-109,-206,-207,-134,339,-122,148,-161,-166,341,342,-52,-49,-50,-58,347,356,358,-200,-84,-99,-102,363,366,-117,-147,-36,370,-52,-52,-62,373,-72,-109,379,381,382,383,-64,384,-73,-85,387,-116,-104,-107,-51,-53,-54,-63,-79,-80,-81,231,394,-65,-74,397,-115,398,-112,-109,409,-111,411,412,-88,-90,-108,-82,-87,-89,422,425,-96,426,429,-91,431,432,-92,-95,]),'OBJECTS_KEY':([28,],[50,]),'INIT_KEY':([28,],[51,]),'TIMED_INIT_KEY':([28,],[52,]),'GOAL_KEY':([28,],[53,]),'METRIC_KEY':([28,],[54,]),'POS_INTEGER':([50,79,80,81,82,83,84,94,122,125,127,135,137,139,145,148,152,161,163,166,171,172,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,200,202,203,207,210,212,220,223,226,232,233,234,239,240,241,242,245,247,248,249,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,273,275,276,277,288,289,297,298,303,304,305,306,308,310,314,322,327,331,339,343,345,346,350,351,352,366,380,387,391,395,401,403,404,417,423,424,430,431,],[83,83,83,-169,-177,-178,-179,-149,83,-168,83,-109,195,83,-176,-33,-34,-165,83,228,-109,195,195,195,-143,-144,-146,195,195,195,195,195,195,195,195,195,195,195,-135,-136,-137,-138,-139,-140,-177,-162,83,-31,276,-32,195,-164,83,-109,-109,-109,-110,-113,-114,195,195,195,83,195,-141,-142,-145,-123,195,-120,-121,195,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-35,276,-37,-38,83,-159,195,-109,-134,195,-137,-122,-161,340,195,195,-158,-102,-147,195,195,195,-109,195,195,-116,195,-115,195,195,195,195,195,195,195,195,195,-92,]),'NEG_INTEGER':([50,79,80,81,82,83,84,94,122,125,127,135,137,139,145,148,152,161,163,166,171,172,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,200,202,203,207,210,212,220,223,226,232,233,234,239,240,241,242,245,247,248,249,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,273,275,276,277,288,289,297,298,303,304,305,306,308,314,322,327,331,339,343,345,346,350,351,352,366,380,387,391,395,401,403,404,417,423,424,430,431,],[84,84,84,-169,-177,-178,-179,-149,84,-168,84,-109,196,84,-176,-33,-34,-165,84,229,-109,196,196,196,-143,-144,-146,196,196,196,196,196,196,196,196,196,196,196,-135,-136,-137,-138,-139,-140,-177,-162,84,-31,277,-32,196,-164,84,-109,-109,-109,-110,-113,-114,196,196,196,84,196,-141,-142,-145,-123,196,-120,-121,196,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-35,277,-37,-38,84,-159,196,-109,-134,196,-137,-122,-161,196,196,-158,-102,-147,196,196,196,-109,196,196,-116,196,-115,196,196,196,196,196,196,196,196,196,-92,]),'HYPHEN':([64,65,70,80,81,82,83,84,94,100,104,122,125,135,137,143,145,146,148,149,150,151,152,155,171,172,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,202,207,209,211,212,214,219,220,232,233,234,239,240,241,242,245,247,249,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,273,297,298,303,304,305,306,308,312,313,314,322,331,339,341,342,343,345,346,350,351,352,357,366,380,387,391,395,401,403,404,416,417,423,424,430,431,],[99,-175,105,124,-169,-177,-178,-179,-149,-174,105,160,-168,-109,182,105,-176,-172,-33,213,-171,-180,-34,213,-109,182,182,182,-143,-144,-146,182,182,182,182,182,182,182,182,182,182,182,-135,-136,-137,-138,-139,-140,-162,-31,274,-173,-32,-170,105,182,-109,-109,-109,-110,-113,-114,182,182,182,182,-141,-142,-145,-123,182,105,-121,182,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-35,182,-109,-134,182,-137,-122,-161,-33,213,182,182,-102,-147,-31,-32,182,182,182,-109,182,182,213,-116,182,-115,182,182,182,182,182,213,182,182,182,182,-92,]),'AND_KEY':([85,91,168,173,238,280,334,352,369,377,406,418,],[126,137,234,137,234,314,365,380,390,391,417,424,]),'EQUALS':([85,91,94,112,129,135,137,145,148,152,171,172,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,202,207,212,220,232,233,234,239,240,241,242,245,247,249,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,273,293,297,298,303,304,305,306,308,314,322,331,334,339,343,345,346,350,351,352,366,369,380,387,391,395,401,403,404,406,417,418,423,424,430,431,],[128,140,-149,157,128,-109,189,-176,-33,-34,-109,189,249,189,-143,-144,-146,189,189,189,189,189,189,189,189,189,189,189,-135,-136,-137,-138,-139,-140,140,-162,-31,-32,189,-109,-109,-109,-110,-113,-114,249,189,189,189,-141,-142,-145,-123,189,-120,-121,189,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-35,140,189,-109,-134,189,-137,-122,-161,189,189,-102,140,-147,249,189,189,-109,189,249,-116,140,189,-115,189,189,249,189,189,140,189,140,189,189,189,-92,]),'ONEOF_KEY':([91,168,238,377,],[135,233,233,233,]),'OR_KEY':([91,176,],[136,247,]),'NOT_KEY':([91,176,242,293,334,343,352,369,401,406,418,],[138,138,138,138,138,138,138,138,138,138,138,]),'PLUS':([94,135,137,145,148,152,171,172,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,202,207,212,220,232,233,234,239,240,241,242,245,247,249,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,273,297,298,303,304,305,306,308,314,322,331,339,343,345,346,350,351,352,366,380,387,391,395,401,403,404,417,423,424,430,431,],[-149,-109,181,-176,-33,-34,-109,181,181,181,-143,-144,-146,181,181,181,181,181,181,181,181,181,181,181,-135,-136,-137,-138,-139,-140,-162,-31,-32,181,-109,-109,-109,-110,-113,-114,181,181,181,181,-141,-142,-145,-123,181,-120,-121,181,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-35,181,-109,-134,181,-137,-122,-161,181,181,-102,-147,181,181,181,-109,181,181,-116,181,-115,181,181,181,181,181,181,181,181,181,-92,]),'TIMES':([94,135,137,145,148,152,171,172,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,202,207,212,220,232,233,234,239,240,241,242,245,247,249,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,273,297,298,303,304,305,306,308,314,322,331,339,343,345,346,350,351,352,366,380,387,391,395,401,403,404,417,423,424,430,431,],[-149,-109,183,-176,-33,-34,-109,183,183,183,-143,-144,-146,183,183,183,183,183,183,183,183,183,183,183,-135,-136,-137,-138,-139,-140,-162,-31,-32,183,-109,-109,-109,-110,-113,-114,183,183,183,183,-141,-142,-145,-123,183,-120,-121,183,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-35,183,-109,-134,183,-137,-122,-161,183,183,-102,-147,183,183,183,-109,183,183,-116,183,-115,183,183,183,183,183,183,183,183,183,-92,]),'DIVIDE':([94,135,137,145,148,152,171,172,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,202,207,212,220,232,233,234,239,240,241,242,245,247,249,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,273,297,298,303,304,305,306,308,314,322,331,339,343,345,346,350,351,352,366,380,387,391,395,401,403,404,417,423,424,430,431,],[-149,-109,184,-176,-33,-34,-109,184,184,184,-143,-144,-146,184,184,184,184,184,184,184,184,184,184,184,-135,-136,-137,-138,-139,-140,-162,-31,-32,184,-109,-109,-109,-110,-113,-114,184,184,184,184,-141,-142,-145,-123,184,-120,-121,184,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-35,184,-109,-134,184,-137,-122,-161,184,184,-102,-147,184,184,184,-109,184,184,-116,184,-115,184,184,184,184,184,184,184,184,184,-92,]),'GT':([94,135,137,145,148,152,171,172,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,202,207,212,220,232,233,234,239,240,241,242,245,247,249,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,273,297,298,303,304,305,306,308,314,322,331,339,343,345,346,350,351,352,366,380,387,391,395,401,403,404,417,423,424,430,431,],[-149,-109,185,-176,-33,-34,-109,185,185,185,-143,-144,-146,185,185,185,185,185,185,185,185,185,185,185,-135,-136,-137,-138,-139,-140,-162,-31,-32,185,-109,-109,-109,-110,-113,-114,185,185,185,185,-141,-142,-145,-123,185,-120,-121,185,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-35,185,-109,-134,185,-137,-122,-161,185,185,-102,-147,185,185,185,-109,185,185,-116,185,-115,185,185,185,185,185,185,185,185,185,-92,]),'GTEQ':([94,135,137,145,148,152,171,172,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,202,207,212,220,232,233,234,239,240,241,242,245,247,249,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,273,297,298,303,304,305,306,308,314,322,331,339,343,345,346,350,351,352,366,380,387,391,395,401,403,404,417,423,424,430,431,],[-149,-109,186,-176,-33,-34,-109,186,186,186,-143,-144,-146,186,186,186,186,186,186,186,186,186,186,186,-135,-136,-137,-138,-139,-140,-162,-31,-32,186,-109,-109,-109,-110,-113,-114,186,186,186,186,-141,-142,-145,-123,186,-120,-121,186,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-35,186,-109,-134,186,-137,-122,-161,186,186,-102,-147,186,186,186,-109,186,186,-116,186,-115,186,186,186,186,186,186,186,186,186,-92,]),'LT':([94,135,137,145,148,152,171,172,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,202,207,212,220,232,233,234,239,240,241,242,245,247,249,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,273,297,298,303,304,305,306,308,314,322,331,339,343,345,346,350,351,352,366,380,387,391,395,401,403,404,417,423,424,430,431,],[-149,-109,187,-176,-33,-34,-109,187,187,187,-143,-144,-146,187,187,187,187,187,187,187,187,187,187,187,-135,-136,-137,-138,-139,-140,-162,-31,-32,187,-109,-109,-109,-110,-113,-114,187,187,187,187,-141,-142,-145,-123,187,-120,-121,187,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-35,187,-109,-134,187,-137,-122,-161,187,187,-102,-147,187,187,187,-109,187,187,-116,187,-115,187,187,187,187,187,187,187,187,187,-92,]),'LTEQ':([94,135,137,145,148,152,171,172,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,202,207,212,220,232,233,234,239,240,241,242,245,247,249,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,273,297,298,303,304,305,306,308,314,322,331,339,343,345,346,350,351,352,366,380,387,391,395,401,403,404,417,423,424,430,431,],[-149,-109,188,-176,-33,-34,-109,188,188,188,-143,-144,-146,188,188,188,188,188,188,188,188,188,188,188,-135,-136,-137,-138,-139,-140,-162,-31,-32,188,-109,-109,-109,-110,-113,-114,188,188,188,188,-141,-142,-145,-123,188,-120,-121,188,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-35,188,-109,-134,188,-137,-122,-161,188,188,-102,-147,188,188,188,-109,188,188,-116,188,-115,188,188,188,188,188,188,188,188,188,-92,]),'NEQ':([94,135,137,145,148,152,171,172,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,202,207,212,220,232,233,234,239,240,241,242,245,247,249,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,273,297,298,303,304,305,306,308,314,322,331,339,343,345,346,350,351,352,366,380,387,391,395,401,403,404,417,423,424,430,431,],[-149,-109,190,-176,-33,-34,-109,190,190,190,-143,-144,-146,190,190,190,190,190,190,190,190,190,190,190,-135,-136,-137,-138,-139,-140,-162,-31,-32,190,-109,-109,-109,-110,-113,-114,190,190,190,190,-141,-142,-145,-123,190,-120,-121,190,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-35,190,-109,-134,190,-137,-122,-161,190,190,-102,-147,190,190,190,-109,190,190,-116,190,-115,190,190,190,190,190,190,190,190,190,-92,]),'MOD':([94,135,137,145,148,152,171,172,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,202,207,212,220,232,233,234,239,240,241,242,245,247,249,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,273,297,298,303,304,305,306,308,314,322,331,339,343,345,346,350,351,352,366,380,387,391,395,401,403,404,417,423,424,430,431,],[-149,-109,191,-176,-33,-34,-109,191,191,191,-143,-144,-146,191,191,191,191,191,191,191,191,191,191,191,-135,-136,-137,-138,-139,-140,-162,-31,-32,191,-109,-109,-109,-110,-113,-114,191,191,191,191,-141,-142,-145,-123,191,-120,-121,191,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-35,191,-109,-134,191,-137,-122,-161,191,191,-102,-147,191,191,191,-109,191,191,-116,191,-115,191,191,191,191,191,191,191,191,191,-92,]),'DECIMAL':([94,135,137,145,148,152,167,171,172,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,202,207,212,220,232,233,234,239,240,241,242,245,247,249,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,273,297,298,303,304,305,306,308,314,322,331,339,343,345,346,350,351,352,366,380,387,391,395,401,403,404,410,417,423,424,430,431,],[-149,-109,192,-176,-33,-34,230,-109,192,192,192,-143,-144,-146,192,192,192,192,192,192,192,192,192,192,192,-135,-136,-137,-138,-139,-140,-162,-31,-32,192,-109,-109,-109,-110,-113,-114,192,192,192,192,-141,-142,-145,-123,192,-120,-121,192,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-35,192,-109,-134,192,-137,-122,-161,192,192,-102,-147,192,192,192,-109,192,192,-116,192,-115,192,192,192,192,192,421,192,192,192,192,-92,]),'PROBABILITY':([94,135,137,145,148,152,171,172,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,202,207,212,220,232,233,234,239,240,241,242,245,247,249,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,273,297,298,300,303,304,305,306,308,314,322,331,339,343,345,346,350,351,352,366,380,387,391,395,401,403,404,417,423,424,430,431,],[-149,-109,193,-176,-33,-34,-109,193,193,193,-143,-144,-146,193,193,193,193,193,193,193,193,193,193,193,-135,-136,-137,-138,-139,-140,-162,-31,-32,193,-109,-109,-109,-110,-113,-114,193,193,193,193,-141,-142,-145,-123,193,-120,-121,193,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-35,193,-109,333,-134,193,-137,-122,-161,193,193,-102,-147,193,193,193,-109,193,193,-116,193,-115,193,193,193,193,193,193,193,193,193,-92,]),'VARIABLE':([94,102,106,135,137,139,140,145,146,147,148,149,150,151,152,153,155,171,172,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,200,201,202,204,207,209,211,212,214,220,232,233,234,239,240,241,242,245,247,248,249,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,273,278,279,297,298,303,304,305,306,307,308,309,311,313,314,322,323,331,339,343,345,346,350,351,352,355,357,366,380,387,391,395,401,403,404,405,415,416,417,423,424,430,431,],[-149,151,151,-109,194,151,204,-176,-172,151,-33,151,-171,-180,-34,151,151,-109,194,194,194,-143,-144,-146,194,194,194,194,194,194,194,194,194,194,194,-135,-136,-137,-138,-139,-140,-172,151,-162,272,-31,151,-173,-32,-170,194,-109,-109,-109,-110,-113,-114,194,194,194,151,305,-141,-142,-145,-123,194,-120,-121,194,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-35,-167,151,194,-109,-134,194,272,-122,151,-161,-166,151,151,194,194,151,-102,-147,194,194,194,-109,194,194,151,151,-116,194,-115,194,194,194,194,194,151,151,151,194,194,194,194,-92,]),'EFFECT_KEY':([94,145,148,152,192,193,194,195,196,197,202,207,212,254,256,257,259,260,261,262,263,264,265,266,267,268,269,270,271,273,303,306,308,320,326,353,354,361,381,397,409,426,],[-149,-176,-33,-34,-135,-136,-137,-138,-139,-140,-162,-31,-32,-123,-120,-121,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-35,-134,-122,-161,350,350,-76,-77,350,-78,-98,-75,-97,]),'INTERARRIVAL_KEY':([94,145,148,152,192,193,194,195,196,197,202,207,212,254,256,257,259,260,261,262,263,264,265,266,267,268,269,270,271,273,303,306,308,326,353,354,381,409,],[-149,-176,-33,-34,-135,-136,-137,-138,-139,-140,-162,-31,-32,-123,-120,-121,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-35,-134,-122,-161,362,-76,-77,-78,-75,]),'DERIVED_KEY':([109,],[156,]),'ACTION_KEY':([115,],[158,]),'EVENT_KEY':([118,],[159,]),'AT_KEY':([132,],[167,]),'BOUNDS_KEY':([145,147,278,309,311,],[-176,210,-167,-166,210,]),'PARAMETERS_KEY':([221,222,],[285,285,]),'PROBABILISTIC_KEY':([242,401,],[300,300,]),'WHEN_KEY':([242,377,401,427,],[301,393,301,393,]),'DURATION_KEY':([284,286,356,382,383,],[321,321,-71,-69,-70,]),'PRECONDITION_KEY':([284,286,319,325,356,379,382,383,394,],[322,322,322,322,-71,-119,-69,-70,-118,]),'FORALL_KEY':([377,401,],[392,392,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'tsal':([0,],[1,]),'domain':([0,],[2,]),'problem':([0,2,],[3,6,]),'plan_problem':([0,2,],[5,5,]),'domain_def':([8,12,],[11,19,]),'plan_problem_def':([8,9,],[12,12,]),'types_def':([11,],[17,]),'constants_def':([17,],[24,]),'objects_def':([19,],[26,]),'typed_names_lst':([22,32,53,],[29,41,73,]),'names_lst':([22,31,32,53,],[30,40,30,30,]),'fluents_def':([24,],[34,]),'init_def':([26,],[37,]),'predicates_def':([34,],[45,]),'typed_constants_lst':([35,84,],[46,113,]),'constants_lst':([35,48,84,86,149,228,250,],[47,65,112,115,208,208,208,]),'constant':([35,48,84,86,149,228,250,],[48,48,48,48,48,48,48,]),'timed_inits_def':([37,],[52,]),'type':([39,64,77,128,],[53,84,101,156,]),'fluent_def_lst':([43,58,],[57,76,]),'fluent_def':([43,58,87,133,179,180,181,182,183,184,185,186,187,188,189,229,235,],[58,58,117,161,236,236,236,236,236,236,236,236,236,236,236,236,236,]),'derived_predicates_def':([45,],[61,]),'ground_predicates_lst':([50,68,85,],[67,89,114,]),'ground_predicate':([50,68,85,],[68,68,68,]),'ground_fluent':([50,68,85,],[69,69,69,]),'goal_def':([52,],[72,]),'predicate_def_lst':([59,80,],[79,104,]),'predicate_def':([59,80,133,],[80,80,160,]),'processes_def':([61,],[83,]),'timed_init_lst':([70,93,],[92,120,]),'timed_init_def':([70,93,],[93,93,]),'typed_variables_lst':([74,102,156,213,282,326,],[96,130,212,266,96,341,]),'variables_lst':([74,99,102,149,156,213,228,250,282,326,],[98,129,132,206,211,268,206,206,98,343,]),'variable':([74,99,102,149,156,213,228,250,282,326,],[99,99,99,99,99,99,99,99,99,99,]),'derived_def_lst':([81,108,],[106,135,]),'derived_def':([81,108,],[108,108,]),'actions_def':([83,],[111,]),'literal':([94,145,146,147,176,177,178,199,201,227,250,251,252,254,269,288,291,294,301,302,312,325,330,331,336,354,],[122,173,176,202,176,176,176,202,202,176,202,202,202,293,302,311,293,202,302,302,293,339,293,293,202,176,]),'predicate':([94,145,146,147,148,176,177,178,199,201,227,250,251,252,254,269,288,291,294,301,302,312,325,330,331,336,354,],[123,123,123,123,205,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,]),'bounds_def':([96,266,],[125,125,]),'processes_def_lst':([109,138,],[137,164,]),'process_def':([109,138,],[138,138,]),'events_def':([111,],[141,]),'num':([126,153,],[153,210,]),'action_def_lst':([139,167,],[166,220,]),'action_def':([139,167,],[167,167,]),'literals_lst':([146,176,177,178,227,354,],[175,231,232,233,278,364,]),'expression':([146,147,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,196,199,201,217,225,227,229,235,238,250,251,252,258,260,269,294,299,301,302,325,336,337,338,354,],[177,203,226,177,177,177,237,237,237,237,237,237,237,237,237,237,237,226,203,203,272,226,177,237,237,226,203,203,203,226,226,301,203,226,301,301,340,203,352,226,177,]),'or_literal':([146,176,177,178,227,354,],[178,178,178,178,178,178,]),'effect_body':([147,251,336,],[197,286,351,]),'unlabeled_effect':([147,199,250,251,294,336,],[198,257,284,198,317,198,]),'deterministic_effect':([147,199,250,251,294,336,],[199,199,199,199,199,199,]),'effects_lst':([147,199,201,250,251,252,294,336,],[200,200,259,200,200,287,200,200,]),'effect':([147,199,201,250,251,252,294,336,],[201,201,201,201,201,201,201,201,]),'derived_def_body':([160,161,],[215,216,]),'event_def_lst':([168,223,],[222,276,]),'event_def':([168,223,],[223,223,]),'expression_body_list':([179,180,181,182,183,184,185,186,187,188,189,229,],[234,239,240,241,242,243,244,245,246,247,248,246,]),'expression_body':([179,180,181,182,183,184,185,186,187,188,189,229,235,],[235,235,235,235,235,235,235,235,235,235,235,235,281,]),'when_effects':([254,],[290,]),'when_if':([254,],[291,]),'simple_effect':([254,291,312,330,331,],[292,315,330,330,330,]),'fluent_predicate_def_lst':([269,301,302,],[300,319,320,]),'parameters_def':([273,306,],[304,327,]),'when_then':([291,],[314,]),'action_def_body':([304,322,],[321,334,]),'duration_def':([304,327,],[322,345,]),'precond_def':([304,322,327,345,],[323,323,346,346,]),'simple_effects_lst':([312,330,331,],[329,348,349,]),'effects_def':([323,346,360,],[335,359,367,]),'event_def_body':([327,345,],[344,358,]),'frequency_def':([346,],[360,]),}
+_lr_goto_items = {'tsal':([0,],[1,]),'domain':([0,],[2,]),'problem':([0,2,],[3,6,]),'plan_problem':([0,2,],[5,5,]),'domain_def':([8,12,29,],[11,31,31,]),'plan_problem_def':([8,9,],[12,12,]),'domain_section_lst':([11,],[17,]),'domain_section':([11,17,],[18,49,]),'requirements_def':([11,17,],[19,19,]),'types_def':([11,17,],[20,20,]),'constants_def':([11,17,],[21,21,]),'fluents_def':([11,17,],[22,22,]),'predicates_def':([11,17,],[23,23,]),'derived_predicates_def':([11,17,],[24,24,]),'processes_def':([11,17,],[25,25,]),'actions_def':([11,17,],[26,26,]),'events_def':([11,17,],[27,27,]),'problem_section_lst':([12,],[29,]),'problem_section':([12,29,],[30,56,]),'objects_def':([12,29,],[32,32,]),'init_def':([12,29,],[33,33,]),'timed_inits_def':([12,29,],[34,34,]),'goal_def':([12,29,],[35,35,]),'metric_def':([12,29,],[36,36,]),'requirements_lst':([39,61,],[59,97,]),'requirement_def':([39,61,],[61,61,]),'typed_names_lst':([40,41,144,],[63,66,206,]),'names_lst':([40,41,144,],[64,64,64,]),'fluent_def_lst':([42,],[69,]),'fluent_def':([42,69,95,156,181,182,183,184,185,186,187,188,189,190,191,249,255,],[70,104,143,219,256,256,256,256,256,256,256,256,256,256,256,256,256,]),'predicate_def_lst':([43,],[72,]),'predicate_def':([43,72,156,],[73,108,218,]),'derived_def_lst':([44,],[74,]),'processes_def_lst':([45,],[76,]),'action_def_lst':([46,],[77,]),'event_def_lst':([47,],[78,]),'typed_constants_lst':([50,],[79,]),'constants_lst':([50,79,127,139,226,248,],[80,122,163,203,288,203,]),'constant':([50,79,80,122,127,139,163,203,226,248,288,],[81,81,125,125,81,81,125,125,81,81,125,]),'ground_predicates_lst':([51,126,],[86,162,]),'ground_predicate':([51,86,126,162,],[88,131,88,131,]),'ground_fluent':([51,86,126,162,],[89,89,89,89,]),'timed_init_lst':([52,],[90,]),'goal_body_def':([53,136,174,],[92,175,244,]),'literal':([53,137,172,177,230,247,297,301,304,314,322,333,336,345,346,365,380,388,390,391,393,395,400,403,404,407,417,423,424,430,],[93,178,240,251,294,178,240,338,251,346,353,364,338,346,346,338,178,338,338,240,408,251,338,240,240,420,178,251,178,251,]),'predicate':([53,137,138,172,177,230,247,297,301,304,314,322,333,336,345,346,365,380,388,390,391,393,395,400,403,404,407,417,423,424,430,],[94,94,199,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,]),'derived_def':([74,],[111,]),'process_def':([76,],[114,]),'action_def':([77,],[117,]),'event_def':([78,],[120,]),'timed_init_def':([90,],[134,]),'type':([99,105,124,160,213,274,],[144,152,161,223,278,309,]),'typed_variables_lst':([102,106,279,307,323,405,],[147,153,311,147,355,415,]),'variables_lst':([102,106,139,147,153,248,279,307,311,323,355,405,415,],[149,155,201,209,209,201,313,149,209,357,209,416,209,]),'variable':([102,106,139,147,149,153,155,201,209,248,279,307,311,313,323,355,357,405,415,416,],[150,150,150,150,214,150,214,214,214,150,150,150,150,214,150,150,214,150,150,214,]),'ground_fluent_def':([128,],[166,]),'effect_body':([135,233,350,],[169,296,374,]),'unlabeled_effect':([135,171,232,233,298,350,],[170,237,295,170,332,170,]),'deterministic_effect':([135,171,232,233,298,350,],[171,171,171,171,171,171,]),'effects_lst':([135,171,232,233,234,298,350,391,],[172,172,172,172,297,172,172,297,]),'goal_body_def_lst':([136,],[174,]),'literals_lst':([137,247,380,417,424,],[177,304,395,423,430,]),'expression':([137,172,176,177,181,182,183,184,185,186,187,188,189,190,191,220,242,245,247,249,255,258,297,304,314,322,343,345,346,351,352,380,391,395,401,403,404,417,423,424,430,],[179,241,246,252,257,257,257,257,257,257,257,257,257,257,257,283,246,246,179,257,257,246,241,252,345,354,246,345,345,378,246,179,241,252,246,241,241,179,252,179,252,]),'or_literal':([137,177,247,304,380,395,417,423,424,430,],[180,253,180,253,180,253,180,253,180,253,]),'bounds_def':([147,311,],[208,208,]),'effect':([172,297,391,403,404,],[239,239,404,404,404,]),'expression_body_list':([181,182,183,184,185,186,187,188,189,190,191,249,],[254,259,260,261,262,263,264,265,266,267,268,266,]),'expression_body':([181,182,183,184,185,186,187,188,189,190,191,249,255,],[255,255,255,255,255,255,255,255,255,255,255,255,306,]),'num':([210,275,],[275,310,]),'derived_def_body':([218,219,],[281,282,]),'parameters_def':([221,222,],[284,286,]),'action_def_body':([284,319,],[318,348,]),'duration_def':([284,286,],[319,325,]),'precond_def':([284,286,319,325,],[320,326,320,326,]),'event_def_body':([286,325,],[324,359,]),'when_effects':([301,],[335,]),'when_if':([301,],[336,]),'simple_effect':([301,336,365,388,390,400,],[337,368,389,399,389,399,]),'fluent_predicate_def_lst':([314,345,346,],[344,371,372,]),'effects_def':([320,326,361,],[349,360,385,]),'frequency_def':([326,],[361,]),'when_then':([336,],[367,]),'forall':([350,391,403,404,],[375,403,403,403,]),'when_body':([350,422,],[376,428,]),'simple_effects_lst':([365,390,],[388,400,]),'forall_body':([391,403,404,],[402,413,414,]),'when_pre':([393,],[407,]),'when_eff':([407,],[419,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,167 +27,212 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> tsal","S'",1,None,None,None),
-  ('tsal -> domain','tsal',1,'p_tsal','tsalparser.py',215),
-  ('tsal -> problem','tsal',1,'p_tsal','tsalparser.py',216),
-  ('tsal -> domain problem','tsal',2,'p_tsal','tsalparser.py',217),
-  ('domain -> LPAREN DEFINE_KEY domain_def types_def constants_def fluents_def predicates_def derived_predicates_def processes_def actions_def events_def RPAREN','domain',12,'p_domain','tsalparser.py',231),
-  ('domain_def -> LPAREN DOMAIN_KEY NAME RPAREN','domain_def',4,'p_domain_def','tsalparser.py',237),
-  ('types_def -> LPAREN TYPES_KEY typed_names_lst RPAREN','types_def',4,'p_types_def','tsalparser.py',242),
-  ('constants_def -> LPAREN CONSTANTS_KEY typed_names_lst RPAREN','constants_def',4,'p_constants_def','tsalparser.py',247),
-  ('constants_def -> LPAREN CONSTANTS_KEY RPAREN','constants_def',3,'p_constants_def','tsalparser.py',248),
-  ('typed_names_lst -> names_lst HYPHEN type typed_names_lst','typed_names_lst',4,'p_typed_names_lst','tsalparser.py',266),
-  ('typed_names_lst -> names_lst HYPHEN type','typed_names_lst',3,'p_typed_names_lst','tsalparser.py',267),
-  ('typed_names_lst -> names_lst','typed_names_lst',1,'p_typed_names_lst','tsalparser.py',268),
-  ('fluents_def -> LPAREN FLUENTS_KEY fluent_def_lst RPAREN','fluents_def',4,'p_fluents_def','tsalparser.py',283),
-  ('fluent_def_lst -> fluent_def fluent_def_lst','fluent_def_lst',2,'p_fluent_def_lst','tsalparser.py',289),
-  ('fluent_def_lst -> fluent_def','fluent_def_lst',1,'p_fluent_def_lst','tsalparser.py',290),
-  ('fluent_def -> LPAREN NAME typed_variables_lst RPAREN','fluent_def',4,'p_fluent_def','tsalparser.py',298),
-  ('fluent_def -> LPAREN NAME variables_lst RPAREN','fluent_def',4,'p_fluent_def','tsalparser.py',299),
-  ('fluent_def -> LPAREN NAME RPAREN','fluent_def',3,'p_fluent_def','tsalparser.py',300),
-  ('fluent_def -> fluent_def HYPHEN type','fluent_def',3,'p_fluent_def','tsalparser.py',301),
-  ('fluent_def -> LPAREN NAME typed_variables_lst bounds_def RPAREN','fluent_def',5,'p_fluent_def','tsalparser.py',302),
-  ('bounds_def -> BOUNDS_KEY num num POS_INTEGER','bounds_def',4,'p_bounds_def','tsalparser.py',315),
-  ('num -> POS_INTEGER','num',1,'p_num','tsalparser.py',319),
-  ('num -> NEG_INTEGER','num',1,'p_num','tsalparser.py',320),
-  ('predicates_def -> LPAREN PREDICATES_KEY predicate_def_lst RPAREN','predicates_def',4,'p_predicates_def','tsalparser.py',324),
-  ('predicate_def_lst -> predicate_def predicate_def_lst','predicate_def_lst',2,'p_predicate_def_lst','tsalparser.py',329),
-  ('predicate_def_lst -> predicate_def','predicate_def_lst',1,'p_predicate_def_lst','tsalparser.py',330),
-  ('predicate_def -> LPAREN NAME typed_variables_lst RPAREN','predicate_def',4,'p_predicate_def','tsalparser.py',338),
-  ('predicate_def -> LPAREN NAME variables_lst RPAREN','predicate_def',4,'p_predicate_def','tsalparser.py',339),
-  ('predicate_def -> LPAREN NAME RPAREN','predicate_def',3,'p_predicate_def','tsalparser.py',340),
-  ('derived_predicates_def -> LPAREN DERIVED_PREDICATES_KEY derived_def_lst RPAREN','derived_predicates_def',4,'p_derived_predicates_def','tsalparser.py',349),
-  ('derived_predicates_def -> LPAREN DERIVED_PREDICATES_KEY RPAREN','derived_predicates_def',3,'p_derived_predicates_def','tsalparser.py',350),
-  ('derived_def_lst -> <empty>','derived_def_lst',0,'p_derived_def_lst','tsalparser.py',357),
-  ('derived_def_lst -> derived_def derived_def_lst','derived_def_lst',2,'p_derived_def_lst','tsalparser.py',358),
-  ('derived_def_lst -> derived_def','derived_def_lst',1,'p_derived_def_lst','tsalparser.py',359),
-  ('derived_def -> LPAREN DERIVED_KEY predicate_def derived_def_body RPAREN','derived_def',5,'p_derived_def','tsalparser.py',369),
-  ('derived_def -> LPAREN DERIVED_KEY fluent_def derived_def_body RPAREN','derived_def',5,'p_derived_def','tsalparser.py',370),
-  ('derived_def_body -> LPAREN AND_KEY fluent_predicate_def_lst RPAREN','derived_def_body',4,'p_derived_def_body','tsalparser.py',376),
-  ('fluent_predicate_def_lst -> <empty>','fluent_predicate_def_lst',0,'p_fluent_predicate_def_lst','tsalparser.py',382),
-  ('fluent_predicate_def_lst -> expression fluent_predicate_def_lst','fluent_predicate_def_lst',2,'p_fluent_predicate_def_lst','tsalparser.py',383),
-  ('fluent_predicate_def_lst -> literal fluent_predicate_def_lst','fluent_predicate_def_lst',2,'p_fluent_predicate_def_lst','tsalparser.py',384),
-  ('processes_def -> LPAREN PROCESSES_KEY processes_def_lst RPAREN','processes_def',4,'p_processes_def','tsalparser.py',393),
-  ('processes_def_lst -> <empty>','processes_def_lst',0,'p_processes_def_lst','tsalparser.py',398),
-  ('processes_def_lst -> process_def processes_def_lst','processes_def_lst',2,'p_processes_def_lst','tsalparser.py',399),
-  ('processes_def_lst -> process_def','processes_def_lst',1,'p_processes_def_lst','tsalparser.py',400),
-  ('process_def -> LPAREN EQUALS NAME expression RPAREN','process_def',5,'p_process_def','tsalparser.py',410),
-  ('actions_def -> LPAREN ACTIONS_KEY action_def_lst RPAREN','actions_def',4,'p_actions_def','tsalparser.py',417),
-  ('action_def_lst -> <empty>','action_def_lst',0,'p_action_def_lst','tsalparser.py',422),
-  ('action_def_lst -> action_def action_def_lst','action_def_lst',2,'p_action_def_lst','tsalparser.py',423),
-  ('action_def_lst -> action_def','action_def_lst',1,'p_action_def_lst','tsalparser.py',424),
-  ('action_def -> LPAREN ACTION_KEY NAME parameters_def action_def_body RPAREN','action_def',6,'p_action_def','tsalparser.py',434),
-  ('action_def -> LPAREN ACTION_KEY NAME parameters_def duration_def action_def_body RPAREN','action_def',7,'p_action_def','tsalparser.py',435),
-  ('event_def -> LPAREN EVENT_KEY NAME parameters_def event_def_body RPAREN','event_def',6,'p_event_def','tsalparser.py',443),
-  ('event_def -> LPAREN EVENT_KEY NAME parameters_def duration_def event_def_body RPAREN','event_def',7,'p_event_def','tsalparser.py',444),
-  ('events_def -> LPAREN EVENTS_KEY event_def_lst RPAREN','events_def',4,'p_events_def','tsalparser.py',455),
-  ('event_def_lst -> <empty>','event_def_lst',0,'p_event_def_lst','tsalparser.py',460),
-  ('event_def_lst -> event_def event_def_lst','event_def_lst',2,'p_event_def_lst','tsalparser.py',461),
-  ('event_def_lst -> event_def','event_def_lst',1,'p_event_def_lst','tsalparser.py',462),
-  ('parameters_def -> PARAMETERS_KEY LPAREN typed_variables_lst RPAREN','parameters_def',4,'p_parameters_def','tsalparser.py',471),
-  ('parameters_def -> PARAMETERS_KEY LPAREN variables_lst RPAREN','parameters_def',4,'p_parameters_def','tsalparser.py',472),
-  ('parameters_def -> PARAMETERS_KEY LPAREN RPAREN','parameters_def',3,'p_parameters_def','tsalparser.py',473),
-  ('action_def_body -> precond_def effects_def','action_def_body',2,'p_action_def_body','tsalparser.py',481),
-  ('event_def_body -> precond_def effects_def','event_def_body',2,'p_event_def_body','tsalparser.py',486),
-  ('event_def_body -> precond_def frequency_def effects_def','event_def_body',3,'p_event_def_body','tsalparser.py',487),
-  ('precond_def -> PRECONDITION_KEY LPAREN AND_KEY literals_lst RPAREN','precond_def',5,'p_precond_def','tsalparser.py',495),
-  ('precond_def -> PRECONDITION_KEY literal','precond_def',2,'p_precond_def','tsalparser.py',496),
-  ('precond_def -> PRECONDITION_KEY expression','precond_def',2,'p_precond_def','tsalparser.py',497),
-  ('precond_def -> PRECONDITION_KEY LPAREN AND_KEY RPAREN','precond_def',4,'p_precond_def','tsalparser.py',498),
-  ('effects_def -> EFFECT_KEY effect_body','effects_def',2,'p_effects_def','tsalparser.py',508),
-  ('effect_body -> LPAREN RPAREN','effect_body',2,'p_effect_body','tsalparser.py',514),
-  ('effect_body -> LPAREN NAME unlabeled_effect RPAREN','effect_body',4,'p_effect_body','tsalparser.py',515),
-  ('effect_body -> effect_body LPAREN NAME unlabeled_effect RPAREN','effect_body',5,'p_effect_body','tsalparser.py',516),
-  ('effect_body -> unlabeled_effect','effect_body',1,'p_effect_body','tsalparser.py',517),
-  ('frequency_def -> INTERARRIVAL_KEY LPAREN NAME NAME DECIMAL RPAREN','frequency_def',6,'p_frequency_def','tsalparser.py',529),
-  ('frequency_def -> INTERARRIVAL_KEY LPAREN RPAREN','frequency_def',3,'p_frequency_def','tsalparser.py',530),
-  ('unlabeled_effect -> LPAREN ONEOF_KEY effect_body RPAREN','unlabeled_effect',4,'p_unlabeled_effect','tsalparser.py',537),
-  ('unlabeled_effect -> deterministic_effect unlabeled_effect','unlabeled_effect',2,'p_unlabeled_effect','tsalparser.py',538),
-  ('unlabeled_effect -> deterministic_effect','unlabeled_effect',1,'p_unlabeled_effect','tsalparser.py',539),
-  ('deterministic_effect -> LPAREN AND_KEY effects_lst RPAREN','deterministic_effect',4,'p_deterministic_effect','tsalparser.py',549),
-  ('deterministic_effect -> effects_lst','deterministic_effect',1,'p_deterministic_effect','tsalparser.py',550),
-  ('when_effects -> when_if when_then','when_effects',2,'p_when_effects','tsalparser.py',557),
-  ('when_if -> simple_effect','when_if',1,'p_when_if','tsalparser.py',563),
-  ('when_if -> LPAREN AND_KEY simple_effects_lst RPAREN','when_if',4,'p_when_if','tsalparser.py',564),
-  ('when_then -> simple_effect','when_then',1,'p_when_then','tsalparser.py',572),
-  ('when_then -> LPAREN AND_KEY simple_effects_lst RPAREN','when_then',4,'p_when_then','tsalparser.py',573),
-  ('effects_lst -> <empty>','effects_lst',0,'p_effects_lst','tsalparser.py',581),
-  ('effects_lst -> effect effects_lst','effects_lst',2,'p_effects_lst','tsalparser.py',582),
-  ('effects_lst -> effect','effects_lst',1,'p_effects_lst','tsalparser.py',583),
-  ('simple_effects_lst -> simple_effect simple_effects_lst','simple_effects_lst',2,'p_simple_effects_lst','tsalparser.py',593),
-  ('simple_effects_lst -> simple_effect','simple_effects_lst',1,'p_simple_effects_lst','tsalparser.py',594),
-  ('effect -> literal','effect',1,'p_effect','tsalparser.py',601),
-  ('effect -> expression','effect',1,'p_effect','tsalparser.py',602),
-  ('effect -> LPAREN PROBABILISTIC_KEY PROBABILITY literal RPAREN','effect',5,'p_effect','tsalparser.py',603),
-  ('effect -> LPAREN WHEN_KEY when_effects RPAREN','effect',4,'p_effect','tsalparser.py',604),
-  ('simple_effect -> literal','simple_effect',1,'p_simple_effect','tsalparser.py',613),
-  ('duration_def -> DURATION_KEY LPAREN expression RPAREN','duration_def',4,'p_duration_def','tsalparser.py',619),
-  ('duration_def -> DURATION_KEY LPAREN RPAREN','duration_def',3,'p_duration_def','tsalparser.py',620),
-  ('expression_body -> fluent_def','expression_body',1,'p_expression_body','tsalparser.py',633),
-  ('expression_body -> expression','expression_body',1,'p_expression_body','tsalparser.py',634),
-  ('expression_body_list -> expression_body expression_body','expression_body_list',2,'p_expression_body_list','tsalparser.py',638),
-  ('expression -> PLUS expression_body_list','expression',2,'p_expression','tsalparser.py',642),
-  ('expression -> HYPHEN expression_body_list','expression',2,'p_expression','tsalparser.py',643),
-  ('expression -> TIMES expression_body_list','expression',2,'p_expression','tsalparser.py',644),
-  ('expression -> DIVIDE expression_body_list','expression',2,'p_expression','tsalparser.py',645),
-  ('expression -> GT expression_body_list','expression',2,'p_expression','tsalparser.py',646),
-  ('expression -> GTEQ expression_body_list','expression',2,'p_expression','tsalparser.py',647),
-  ('expression -> LT expression_body_list','expression',2,'p_expression','tsalparser.py',648),
-  ('expression -> LTEQ expression_body_list','expression',2,'p_expression','tsalparser.py',649),
-  ('expression -> EQUALS expression_body_list','expression',2,'p_expression','tsalparser.py',650),
-  ('expression -> NEQ expression_body_list','expression',2,'p_expression','tsalparser.py',651),
-  ('expression -> MOD expression_body_list','expression',2,'p_expression','tsalparser.py',652),
-  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression','tsalparser.py',653),
-  ('expression -> DECIMAL','expression',1,'p_expression','tsalparser.py',654),
-  ('expression -> PROBABILITY','expression',1,'p_expression','tsalparser.py',655),
-  ('expression -> VARIABLE','expression',1,'p_expression','tsalparser.py',656),
-  ('expression -> POS_INTEGER','expression',1,'p_expression','tsalparser.py',657),
-  ('expression -> NEG_INTEGER','expression',1,'p_expression','tsalparser.py',658),
-  ('expression -> NAME','expression',1,'p_expression','tsalparser.py',659),
-  ('literals_lst -> literal literals_lst','literals_lst',2,'p_literals_lst','tsalparser.py',671),
-  ('literals_lst -> expression literals_lst','literals_lst',2,'p_literals_lst','tsalparser.py',672),
-  ('literals_lst -> literal','literals_lst',1,'p_literals_lst','tsalparser.py',673),
-  ('literals_lst -> expression','literals_lst',1,'p_literals_lst','tsalparser.py',674),
-  ('literals_lst -> or_literal literals_lst','literals_lst',2,'p_literals_lst','tsalparser.py',675),
-  ('literals_lst -> or_literal','literals_lst',1,'p_literals_lst','tsalparser.py',676),
-  ('or_literal -> LPAREN OR_KEY literals_lst RPAREN','or_literal',4,'p_or_literal','tsalparser.py',685),
-  ('literal -> LPAREN NOT_KEY predicate RPAREN','literal',4,'p_literal','tsalparser.py',692),
-  ('literal -> predicate','literal',1,'p_literal','tsalparser.py',693),
-  ('ground_predicates_lst -> ground_predicate ground_predicates_lst','ground_predicates_lst',2,'p_ground_predicates_lst','tsalparser.py',701),
-  ('ground_predicates_lst -> ground_predicate','ground_predicates_lst',1,'p_ground_predicates_lst','tsalparser.py',702),
-  ('ground_predicate -> LPAREN NAME constants_lst RPAREN','ground_predicate',4,'p_ground_predicate','tsalparser.py',710),
-  ('ground_predicate -> LPAREN NAME RPAREN','ground_predicate',3,'p_ground_predicate','tsalparser.py',711),
-  ('ground_predicate -> ground_fluent','ground_predicate',1,'p_ground_predicate','tsalparser.py',712),
-  ('ground_fluent -> LPAREN EQUALS fluent_def VARIABLE RPAREN','ground_fluent',5,'p_ground_fluent','tsalparser.py',720),
-  ('predicate -> LPAREN NAME variables_lst RPAREN','predicate',4,'p_predicate','tsalparser.py',726),
-  ('predicate -> LPAREN EQUALS VARIABLE VARIABLE RPAREN','predicate',5,'p_predicate','tsalparser.py',727),
-  ('predicate -> LPAREN NAME RPAREN','predicate',3,'p_predicate','tsalparser.py',728),
-  ('predicate -> LPAREN NAME constants_lst RPAREN','predicate',4,'p_predicate','tsalparser.py',729),
-  ('typed_constants_lst -> constants_lst HYPHEN type typed_constants_lst','typed_constants_lst',4,'p_typed_constants_lst','tsalparser.py',741),
-  ('typed_constants_lst -> constants_lst HYPHEN type','typed_constants_lst',3,'p_typed_constants_lst','tsalparser.py',742),
-  ('typed_variables_lst -> variables_lst HYPHEN type typed_variables_lst','typed_variables_lst',4,'p_typed_variables_lst','tsalparser.py',750),
-  ('typed_variables_lst -> variables_lst HYPHEN type','typed_variables_lst',3,'p_typed_variables_lst','tsalparser.py',751),
-  ('constants_lst -> constant constants_lst','constants_lst',2,'p_constants_lst','tsalparser.py',759),
-  ('constants_lst -> constant','constants_lst',1,'p_constants_lst','tsalparser.py',760),
-  ('variables_lst -> variable variables_lst','variables_lst',2,'p_variables_lst','tsalparser.py',768),
-  ('variables_lst -> variable','variables_lst',1,'p_variables_lst','tsalparser.py',769),
-  ('names_lst -> NAME names_lst','names_lst',2,'p_names_lst','tsalparser.py',777),
-  ('names_lst -> NAME','names_lst',1,'p_names_lst','tsalparser.py',778),
-  ('type -> NAME','type',1,'p_type','tsalparser.py',788),
-  ('constant -> NAME','constant',1,'p_constant','tsalparser.py',793),
-  ('variable -> VARIABLE','variable',1,'p_variable','tsalparser.py',798),
-  ('problem -> plan_problem','problem',1,'p_problem','tsalparser.py',806),
-  ('plan_problem -> LPAREN DEFINE_KEY plan_problem_def domain_def objects_def init_def timed_inits_def goal_def RPAREN','plan_problem',9,'p_plan_problem','tsalparser.py',811),
-  ('plan_problem_def -> LPAREN PROBLEM_KEY NAME RPAREN','plan_problem_def',4,'p_plan_problem_def','tsalparser.py',816),
-  ('objects_def -> LPAREN OBJECTS_KEY typed_constants_lst RPAREN','objects_def',4,'p_objects_def','tsalparser.py',821),
-  ('objects_def -> LPAREN OBJECTS_KEY constants_lst RPAREN','objects_def',4,'p_objects_def','tsalparser.py',822),
-  ('init_def -> LPAREN INIT_KEY LPAREN AND_KEY ground_predicates_lst RPAREN RPAREN','init_def',7,'p_init_def','tsalparser.py',827),
-  ('init_def -> LPAREN INIT_KEY ground_predicates_lst RPAREN','init_def',4,'p_init_def','tsalparser.py',828),
-  ('timed_inits_def -> LPAREN TIMED_INIT_KEY timed_init_lst RPAREN','timed_inits_def',4,'p_timed_inits_def','tsalparser.py',836),
-  ('timed_init_lst -> <empty>','timed_init_lst',0,'p_timed_init_lst','tsalparser.py',841),
-  ('timed_init_lst -> timed_init_def timed_init_lst','timed_init_lst',2,'p_timed_init_lst','tsalparser.py',842),
-  ('timed_init_lst -> timed_init_def','timed_init_lst',1,'p_timed_init_lst','tsalparser.py',843),
-  ('timed_init_def -> LPAREN AT_KEY DECIMAL literal RPAREN','timed_init_def',5,'p_timed_init_def','tsalparser.py',853),
-  ('goal_def -> LPAREN GOAL_KEY LPAREN AND_KEY literals_lst RPAREN RPAREN','goal_def',7,'p_goal_def','tsalparser.py',860),
-  ('goal_def -> LPAREN GOAL_KEY literal RPAREN','goal_def',4,'p_goal_def','tsalparser.py',861),
-  ('goal_def -> LPAREN GOAL_KEY LPAREN ONEOF_KEY effect_body RPAREN RPAREN','goal_def',7,'p_goal_def','tsalparser.py',862),
+  ('tsal -> domain','tsal',1,'p_tsal','tsalparser.py',230),
+  ('tsal -> problem','tsal',1,'p_tsal','tsalparser.py',231),
+  ('tsal -> domain problem','tsal',2,'p_tsal','tsalparser.py',232),
+  ('domain -> LPAREN DEFINE_KEY domain_def domain_section_lst RPAREN','domain',5,'p_domain','tsalparser.py',280),
+  ('domain_section_lst -> domain_section_lst domain_section','domain_section_lst',2,'p_domain_section_lst','tsalparser.py',302),
+  ('domain_section_lst -> domain_section','domain_section_lst',1,'p_domain_section_lst','tsalparser.py',303),
+  ('domain_section -> requirements_def','domain_section',1,'p_domain_section','tsalparser.py',312),
+  ('domain_section -> types_def','domain_section',1,'p_domain_section','tsalparser.py',313),
+  ('domain_section -> constants_def','domain_section',1,'p_domain_section','tsalparser.py',314),
+  ('domain_section -> fluents_def','domain_section',1,'p_domain_section','tsalparser.py',315),
+  ('domain_section -> predicates_def','domain_section',1,'p_domain_section','tsalparser.py',316),
+  ('domain_section -> derived_predicates_def','domain_section',1,'p_domain_section','tsalparser.py',317),
+  ('domain_section -> processes_def','domain_section',1,'p_domain_section','tsalparser.py',318),
+  ('domain_section -> actions_def','domain_section',1,'p_domain_section','tsalparser.py',319),
+  ('domain_section -> events_def','domain_section',1,'p_domain_section','tsalparser.py',320),
+  ('domain_def -> LPAREN DOMAIN_KEY NAME RPAREN','domain_def',4,'p_domain_def','tsalparser.py',325),
+  ('requirements_def -> LPAREN REQUIREMENTS_KEY requirements_lst RPAREN','requirements_def',4,'p_requirements_def','tsalparser.py',329),
+  ('requirements_def -> LPAREN REQUIREMENTS_KEY RPAREN','requirements_def',3,'p_requirements_def','tsalparser.py',330),
+  ('requirements_lst -> requirement_def requirements_lst','requirements_lst',2,'p_requirements_lst','tsalparser.py',337),
+  ('requirements_lst -> requirement_def','requirements_lst',1,'p_requirements_lst','tsalparser.py',338),
+  ('requirement_def -> NAME','requirement_def',1,'p_requirement_def','tsalparser.py',345),
+  ('types_def -> LPAREN TYPES_KEY typed_names_lst RPAREN','types_def',4,'p_types_def','tsalparser.py',349),
+  ('constants_def -> LPAREN CONSTANTS_KEY typed_names_lst RPAREN','constants_def',4,'p_constants_def','tsalparser.py',354),
+  ('constants_def -> LPAREN CONSTANTS_KEY RPAREN','constants_def',3,'p_constants_def','tsalparser.py',355),
+  ('typed_names_lst -> names_lst HYPHEN type typed_names_lst','typed_names_lst',4,'p_typed_names_lst','tsalparser.py',371),
+  ('typed_names_lst -> names_lst HYPHEN type','typed_names_lst',3,'p_typed_names_lst','tsalparser.py',372),
+  ('typed_names_lst -> names_lst','typed_names_lst',1,'p_typed_names_lst','tsalparser.py',373),
+  ('fluents_def -> LPAREN FLUENTS_KEY fluent_def_lst RPAREN','fluents_def',4,'p_fluents_def','tsalparser.py',387),
+  ('fluent_def_lst -> fluent_def_lst fluent_def','fluent_def_lst',2,'p_fluent_def_lst','tsalparser.py',393),
+  ('fluent_def_lst -> fluent_def','fluent_def_lst',1,'p_fluent_def_lst','tsalparser.py',394),
+  ('fluent_def -> LPAREN NAME typed_variables_lst RPAREN','fluent_def',4,'p_fluent_def','tsalparser.py',403),
+  ('fluent_def -> LPAREN NAME variables_lst RPAREN','fluent_def',4,'p_fluent_def','tsalparser.py',404),
+  ('fluent_def -> LPAREN NAME RPAREN','fluent_def',3,'p_fluent_def','tsalparser.py',405),
+  ('fluent_def -> fluent_def HYPHEN type','fluent_def',3,'p_fluent_def','tsalparser.py',406),
+  ('fluent_def -> LPAREN NAME typed_variables_lst bounds_def RPAREN','fluent_def',5,'p_fluent_def','tsalparser.py',407),
+  ('bounds_def -> BOUNDS_KEY num num POS_INTEGER','bounds_def',4,'p_bounds_def','tsalparser.py',420),
+  ('num -> POS_INTEGER','num',1,'p_num','tsalparser.py',424),
+  ('num -> NEG_INTEGER','num',1,'p_num','tsalparser.py',425),
+  ('predicates_def -> LPAREN PREDICATES_KEY predicate_def_lst RPAREN','predicates_def',4,'p_predicates_def','tsalparser.py',429),
+  ('predicate_def_lst -> predicate_def_lst predicate_def','predicate_def_lst',2,'p_predicate_def_lst','tsalparser.py',434),
+  ('predicate_def_lst -> predicate_def','predicate_def_lst',1,'p_predicate_def_lst','tsalparser.py',435),
+  ('predicate_def -> LPAREN NAME typed_variables_lst RPAREN','predicate_def',4,'p_predicate_def','tsalparser.py',444),
+  ('predicate_def -> LPAREN NAME variables_lst RPAREN','predicate_def',4,'p_predicate_def','tsalparser.py',445),
+  ('predicate_def -> LPAREN NAME RPAREN','predicate_def',3,'p_predicate_def','tsalparser.py',446),
+  ('derived_predicates_def -> LPAREN DERIVED_PREDICATES_KEY derived_def_lst RPAREN','derived_predicates_def',4,'p_derived_predicates_def','tsalparser.py',455),
+  ('derived_predicates_def -> LPAREN DERIVED_PREDICATES_KEY RPAREN','derived_predicates_def',3,'p_derived_predicates_def','tsalparser.py',456),
+  ('derived_def_lst -> <empty>','derived_def_lst',0,'p_derived_def_lst','tsalparser.py',463),
+  ('derived_def_lst -> derived_def_lst derived_def','derived_def_lst',2,'p_derived_def_lst','tsalparser.py',464),
+  ('derived_def -> LPAREN DERIVED_KEY predicate_def derived_def_body RPAREN','derived_def',5,'p_derived_def','tsalparser.py',473),
+  ('derived_def -> LPAREN DERIVED_KEY fluent_def derived_def_body RPAREN','derived_def',5,'p_derived_def','tsalparser.py',474),
+  ('derived_def_body -> LPAREN AND_KEY fluent_predicate_def_lst RPAREN','derived_def_body',4,'p_derived_def_body','tsalparser.py',480),
+  ('fluent_predicate_def_lst -> <empty>','fluent_predicate_def_lst',0,'p_fluent_predicate_def_lst','tsalparser.py',486),
+  ('fluent_predicate_def_lst -> expression fluent_predicate_def_lst','fluent_predicate_def_lst',2,'p_fluent_predicate_def_lst','tsalparser.py',487),
+  ('fluent_predicate_def_lst -> literal fluent_predicate_def_lst','fluent_predicate_def_lst',2,'p_fluent_predicate_def_lst','tsalparser.py',488),
+  ('processes_def -> LPAREN PROCESSES_KEY processes_def_lst RPAREN','processes_def',4,'p_processes_def','tsalparser.py',497),
+  ('processes_def_lst -> <empty>','processes_def_lst',0,'p_processes_def_lst','tsalparser.py',502),
+  ('processes_def_lst -> processes_def_lst process_def','processes_def_lst',2,'p_processes_def_lst','tsalparser.py',503),
+  ('process_def -> LPAREN EQUALS NAME expression RPAREN','process_def',5,'p_process_def','tsalparser.py',512),
+  ('actions_def -> LPAREN ACTIONS_KEY action_def_lst RPAREN','actions_def',4,'p_actions_def','tsalparser.py',519),
+  ('action_def_lst -> <empty>','action_def_lst',0,'p_action_def_lst','tsalparser.py',524),
+  ('action_def_lst -> action_def_lst action_def','action_def_lst',2,'p_action_def_lst','tsalparser.py',525),
+  ('action_def -> LPAREN ACTION_KEY NAME parameters_def action_def_body RPAREN','action_def',6,'p_action_def','tsalparser.py',533),
+  ('action_def -> LPAREN ACTION_KEY NAME parameters_def duration_def action_def_body RPAREN','action_def',7,'p_action_def','tsalparser.py',534),
+  ('event_def -> LPAREN EVENT_KEY NAME parameters_def event_def_body RPAREN','event_def',6,'p_event_def','tsalparser.py',581),
+  ('event_def -> LPAREN EVENT_KEY NAME parameters_def duration_def event_def_body RPAREN','event_def',7,'p_event_def','tsalparser.py',582),
+  ('events_def -> LPAREN EVENTS_KEY event_def_lst RPAREN','events_def',4,'p_events_def','tsalparser.py',593),
+  ('event_def_lst -> <empty>','event_def_lst',0,'p_event_def_lst','tsalparser.py',598),
+  ('event_def_lst -> event_def_lst event_def','event_def_lst',2,'p_event_def_lst','tsalparser.py',599),
+  ('parameters_def -> PARAMETERS_KEY LPAREN typed_variables_lst RPAREN','parameters_def',4,'p_parameters_def','tsalparser.py',607),
+  ('parameters_def -> PARAMETERS_KEY LPAREN variables_lst RPAREN','parameters_def',4,'p_parameters_def','tsalparser.py',608),
+  ('parameters_def -> PARAMETERS_KEY LPAREN RPAREN','parameters_def',3,'p_parameters_def','tsalparser.py',609),
+  ('action_def_body -> precond_def effects_def','action_def_body',2,'p_action_def_body','tsalparser.py',617),
+  ('event_def_body -> precond_def effects_def','event_def_body',2,'p_event_def_body','tsalparser.py',622),
+  ('event_def_body -> precond_def frequency_def effects_def','event_def_body',3,'p_event_def_body','tsalparser.py',623),
+  ('precond_def -> PRECONDITION_KEY LPAREN AND_KEY literals_lst RPAREN','precond_def',5,'p_precond_def','tsalparser.py',631),
+  ('precond_def -> PRECONDITION_KEY literal','precond_def',2,'p_precond_def','tsalparser.py',632),
+  ('precond_def -> PRECONDITION_KEY expression','precond_def',2,'p_precond_def','tsalparser.py',633),
+  ('precond_def -> PRECONDITION_KEY LPAREN RPAREN','precond_def',3,'p_precond_def','tsalparser.py',634),
+  ('effects_def -> EFFECT_KEY effect_body','effects_def',2,'p_effects_def','tsalparser.py',644),
+  ('effects_def -> EFFECT_KEY forall','effects_def',2,'p_effects_def','tsalparser.py',645),
+  ('effects_def -> EFFECT_KEY when_body','effects_def',2,'p_effects_def','tsalparser.py',646),
+  ('effects_def -> EFFECT_KEY LPAREN AND_KEY forall_body RPAREN','effects_def',5,'p_effects_def','tsalparser.py',647),
+  ('effect_body -> LPAREN RPAREN','effect_body',2,'p_effect_body','tsalparser.py',658),
+  ('effect_body -> LPAREN NAME unlabeled_effect RPAREN','effect_body',4,'p_effect_body','tsalparser.py',659),
+  ('effect_body -> effect_body LPAREN NAME unlabeled_effect RPAREN','effect_body',5,'p_effect_body','tsalparser.py',660),
+  ('effect_body -> unlabeled_effect','effect_body',1,'p_effect_body','tsalparser.py',661),
+  ('forall_body -> forall forall_body','forall_body',2,'p_forall_body','tsalparser.py',672),
+  ('forall_body -> forall','forall_body',1,'p_forall_body','tsalparser.py',673),
+  ('forall_body -> effect forall_body','forall_body',2,'p_forall_body','tsalparser.py',674),
+  ('forall_body -> effect','forall_body',1,'p_forall_body','tsalparser.py',675),
+  ('when_body -> LPAREN WHEN_KEY when_pre when_eff RPAREN','when_body',5,'p_when_body','tsalparser.py',682),
+  ('forall -> LPAREN FORALL_KEY LPAREN typed_variables_lst RPAREN when_body RPAREN','forall',7,'p_forall','tsalparser.py',687),
+  ('when_pre -> LPAREN AND_KEY literals_lst RPAREN','when_pre',4,'p_when_pre','tsalparser.py',691),
+  ('when_pre -> literal','when_pre',1,'p_when_pre','tsalparser.py',692),
+  ('when_eff -> LPAREN AND_KEY literals_lst RPAREN','when_eff',4,'p_when_eff','tsalparser.py',699),
+  ('when_eff -> literal','when_eff',1,'p_when_eff','tsalparser.py',700),
+  ('frequency_def -> INTERARRIVAL_KEY LPAREN NAME NAME DECIMAL RPAREN','frequency_def',6,'p_frequency_def','tsalparser.py',709),
+  ('frequency_def -> INTERARRIVAL_KEY LPAREN RPAREN','frequency_def',3,'p_frequency_def','tsalparser.py',710),
+  ('unlabeled_effect -> LPAREN ONEOF_KEY effect_body RPAREN','unlabeled_effect',4,'p_unlabeled_effect','tsalparser.py',717),
+  ('unlabeled_effect -> deterministic_effect unlabeled_effect','unlabeled_effect',2,'p_unlabeled_effect','tsalparser.py',718),
+  ('unlabeled_effect -> deterministic_effect','unlabeled_effect',1,'p_unlabeled_effect','tsalparser.py',719),
+  ('deterministic_effect -> LPAREN AND_KEY effects_lst RPAREN','deterministic_effect',4,'p_deterministic_effect','tsalparser.py',729),
+  ('deterministic_effect -> effects_lst','deterministic_effect',1,'p_deterministic_effect','tsalparser.py',730),
+  ('when_effects -> when_if when_then','when_effects',2,'p_when_effects','tsalparser.py',737),
+  ('when_if -> simple_effect','when_if',1,'p_when_if','tsalparser.py',743),
+  ('when_if -> LPAREN AND_KEY simple_effects_lst RPAREN','when_if',4,'p_when_if','tsalparser.py',744),
+  ('when_then -> simple_effect','when_then',1,'p_when_then','tsalparser.py',752),
+  ('when_then -> LPAREN AND_KEY simple_effects_lst RPAREN','when_then',4,'p_when_then','tsalparser.py',753),
+  ('effects_lst -> <empty>','effects_lst',0,'p_effects_lst','tsalparser.py',761),
+  ('effects_lst -> effects_lst effect','effects_lst',2,'p_effects_lst','tsalparser.py',762),
+  ('simple_effects_lst -> simple_effects_lst simple_effect','simple_effects_lst',2,'p_simple_effects_lst','tsalparser.py',771),
+  ('simple_effects_lst -> simple_effect','simple_effects_lst',1,'p_simple_effects_lst','tsalparser.py',772),
+  ('effect -> literal','effect',1,'p_effect','tsalparser.py',780),
+  ('effect -> expression','effect',1,'p_effect','tsalparser.py',781),
+  ('effect -> LPAREN PROBABILISTIC_KEY PROBABILITY literal RPAREN','effect',5,'p_effect','tsalparser.py',782),
+  ('effect -> LPAREN WHEN_KEY when_effects RPAREN','effect',4,'p_effect','tsalparser.py',783),
+  ('simple_effect -> literal','simple_effect',1,'p_simple_effect','tsalparser.py',792),
+  ('duration_def -> DURATION_KEY LPAREN expression RPAREN','duration_def',4,'p_duration_def','tsalparser.py',798),
+  ('duration_def -> DURATION_KEY LPAREN RPAREN','duration_def',3,'p_duration_def','tsalparser.py',799),
+  ('expression_body -> fluent_def','expression_body',1,'p_expression_body','tsalparser.py',812),
+  ('expression_body -> expression','expression_body',1,'p_expression_body','tsalparser.py',813),
+  ('expression_body_list -> expression_body expression_body','expression_body_list',2,'p_expression_body_list','tsalparser.py',817),
+  ('expression -> PLUS expression_body_list','expression',2,'p_expression','tsalparser.py',821),
+  ('expression -> HYPHEN expression_body_list','expression',2,'p_expression','tsalparser.py',822),
+  ('expression -> TIMES expression_body_list','expression',2,'p_expression','tsalparser.py',823),
+  ('expression -> DIVIDE expression_body_list','expression',2,'p_expression','tsalparser.py',824),
+  ('expression -> GT expression_body_list','expression',2,'p_expression','tsalparser.py',825),
+  ('expression -> GTEQ expression_body_list','expression',2,'p_expression','tsalparser.py',826),
+  ('expression -> LT expression_body_list','expression',2,'p_expression','tsalparser.py',827),
+  ('expression -> LTEQ expression_body_list','expression',2,'p_expression','tsalparser.py',828),
+  ('expression -> EQUALS expression_body_list','expression',2,'p_expression','tsalparser.py',829),
+  ('expression -> NEQ expression_body_list','expression',2,'p_expression','tsalparser.py',830),
+  ('expression -> MOD expression_body_list','expression',2,'p_expression','tsalparser.py',831),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression','tsalparser.py',832),
+  ('expression -> DECIMAL','expression',1,'p_expression','tsalparser.py',833),
+  ('expression -> PROBABILITY','expression',1,'p_expression','tsalparser.py',834),
+  ('expression -> VARIABLE','expression',1,'p_expression','tsalparser.py',835),
+  ('expression -> POS_INTEGER','expression',1,'p_expression','tsalparser.py',836),
+  ('expression -> NEG_INTEGER','expression',1,'p_expression','tsalparser.py',837),
+  ('expression -> NAME','expression',1,'p_expression','tsalparser.py',838),
+  ('literals_lst -> literals_lst literal','literals_lst',2,'p_literals_lst','tsalparser.py',850),
+  ('literals_lst -> literals_lst expression','literals_lst',2,'p_literals_lst','tsalparser.py',851),
+  ('literals_lst -> literal','literals_lst',1,'p_literals_lst','tsalparser.py',852),
+  ('literals_lst -> expression','literals_lst',1,'p_literals_lst','tsalparser.py',853),
+  ('literals_lst -> literals_lst or_literal','literals_lst',2,'p_literals_lst','tsalparser.py',854),
+  ('literals_lst -> or_literal','literals_lst',1,'p_literals_lst','tsalparser.py',855),
+  ('or_literal -> LPAREN OR_KEY literals_lst RPAREN','or_literal',4,'p_or_literal','tsalparser.py',865),
+  ('literal -> LPAREN NOT_KEY predicate RPAREN','literal',4,'p_literal','tsalparser.py',872),
+  ('literal -> predicate','literal',1,'p_literal','tsalparser.py',873),
+  ('ground_predicates_lst -> ground_predicates_lst ground_predicate','ground_predicates_lst',2,'p_ground_predicates_lst','tsalparser.py',881),
+  ('ground_predicates_lst -> ground_predicate','ground_predicates_lst',1,'p_ground_predicates_lst','tsalparser.py',882),
+  ('ground_predicate -> LPAREN NAME constants_lst RPAREN','ground_predicate',4,'p_ground_predicate','tsalparser.py',891),
+  ('ground_predicate -> LPAREN NAME RPAREN','ground_predicate',3,'p_ground_predicate','tsalparser.py',892),
+  ('ground_predicate -> ground_fluent','ground_predicate',1,'p_ground_predicate','tsalparser.py',893),
+  ('ground_fluent -> LPAREN EQUALS ground_fluent_def NAME RPAREN','ground_fluent',5,'p_ground_fluent','tsalparser.py',904),
+  ('ground_fluent -> LPAREN EQUALS ground_fluent_def POS_INTEGER RPAREN','ground_fluent',5,'p_ground_fluent','tsalparser.py',905),
+  ('ground_fluent -> LPAREN EQUALS ground_fluent_def NEG_INTEGER RPAREN','ground_fluent',5,'p_ground_fluent','tsalparser.py',906),
+  ('ground_fluent_def -> LPAREN NAME constants_lst RPAREN','ground_fluent_def',4,'p_ground_fluent_def','tsalparser.py',911),
+  ('ground_fluent_def -> LPAREN NAME RPAREN','ground_fluent_def',3,'p_ground_fluent_def','tsalparser.py',912),
+  ('predicate -> LPAREN NAME variables_lst RPAREN','predicate',4,'p_predicate','tsalparser.py',919),
+  ('predicate -> LPAREN EQUALS VARIABLE VARIABLE RPAREN','predicate',5,'p_predicate','tsalparser.py',920),
+  ('predicate -> LPAREN NAME RPAREN','predicate',3,'p_predicate','tsalparser.py',921),
+  ('predicate -> LPAREN NAME constants_lst RPAREN','predicate',4,'p_predicate','tsalparser.py',922),
+  ('typed_constants_lst -> typed_constants_lst constants_lst HYPHEN type','typed_constants_lst',4,'p_typed_constants_lst','tsalparser.py',935),
+  ('typed_constants_lst -> constants_lst HYPHEN type','typed_constants_lst',3,'p_typed_constants_lst','tsalparser.py',936),
+  ('typed_variables_lst -> typed_variables_lst variables_lst HYPHEN type','typed_variables_lst',4,'p_typed_variables_lst','tsalparser.py',945),
+  ('typed_variables_lst -> variables_lst HYPHEN type','typed_variables_lst',3,'p_typed_variables_lst','tsalparser.py',946),
+  ('constants_lst -> constants_lst constant','constants_lst',2,'p_constants_lst','tsalparser.py',955),
+  ('constants_lst -> constant','constants_lst',1,'p_constants_lst','tsalparser.py',956),
+  ('variables_lst -> variables_lst variable','variables_lst',2,'p_variables_lst','tsalparser.py',965),
+  ('variables_lst -> variable','variables_lst',1,'p_variables_lst','tsalparser.py',966),
+  ('variables_lst -> NAME','variables_lst',1,'p_variables_lst','tsalparser.py',967),
+  ('variables_lst -> variables_lst NAME','variables_lst',2,'p_variables_lst','tsalparser.py',968),
+  ('names_lst -> names_lst NAME','names_lst',2,'p_names_lst','tsalparser.py',977),
+  ('names_lst -> NAME','names_lst',1,'p_names_lst','tsalparser.py',978),
+  ('type -> NAME','type',1,'p_type','tsalparser.py',987),
+  ('constant -> NAME','constant',1,'p_constant','tsalparser.py',992),
+  ('constant -> POS_INTEGER','constant',1,'p_constant','tsalparser.py',993),
+  ('constant -> NEG_INTEGER','constant',1,'p_constant','tsalparser.py',994),
+  ('variable -> VARIABLE','variable',1,'p_variable','tsalparser.py',999),
+  ('problem -> plan_problem','problem',1,'p_problem','tsalparser.py',1007),
+  ('plan_problem -> LPAREN DEFINE_KEY plan_problem_def problem_section_lst RPAREN','plan_problem',5,'p_plan_problem','tsalparser.py',1021),
+  ('problem_section_lst -> problem_section_lst problem_section','problem_section_lst',2,'p_problem_section_lst','tsalparser.py',1039),
+  ('problem_section_lst -> problem_section','problem_section_lst',1,'p_problem_section_lst','tsalparser.py',1040),
+  ('problem_section -> domain_def','problem_section',1,'p_problem_section','tsalparser.py',1049),
+  ('problem_section -> objects_def','problem_section',1,'p_problem_section','tsalparser.py',1050),
+  ('problem_section -> init_def','problem_section',1,'p_problem_section','tsalparser.py',1051),
+  ('problem_section -> timed_inits_def','problem_section',1,'p_problem_section','tsalparser.py',1052),
+  ('problem_section -> goal_def','problem_section',1,'p_problem_section','tsalparser.py',1053),
+  ('problem_section -> metric_def','problem_section',1,'p_problem_section','tsalparser.py',1054),
+  ('plan_problem_def -> LPAREN PROBLEM_KEY NAME RPAREN','plan_problem_def',4,'p_plan_problem_def','tsalparser.py',1059),
+  ('objects_def -> LPAREN OBJECTS_KEY typed_constants_lst RPAREN','objects_def',4,'p_objects_def','tsalparser.py',1064),
+  ('objects_def -> LPAREN OBJECTS_KEY constants_lst RPAREN','objects_def',4,'p_objects_def','tsalparser.py',1065),
+  ('init_def -> LPAREN INIT_KEY LPAREN AND_KEY ground_predicates_lst RPAREN RPAREN','init_def',7,'p_init_def','tsalparser.py',1070),
+  ('init_def -> LPAREN INIT_KEY ground_predicates_lst RPAREN','init_def',4,'p_init_def','tsalparser.py',1071),
+  ('init_def -> LPAREN INIT_KEY RPAREN','init_def',3,'p_init_def','tsalparser.py',1072),
+  ('timed_inits_def -> LPAREN TIMED_INIT_KEY timed_init_lst RPAREN','timed_inits_def',4,'p_timed_inits_def','tsalparser.py',1084),
+  ('timed_init_lst -> <empty>','timed_init_lst',0,'p_timed_init_lst','tsalparser.py',1089),
+  ('timed_init_lst -> timed_init_lst timed_init_def','timed_init_lst',2,'p_timed_init_lst','tsalparser.py',1090),
+  ('timed_init_def -> LPAREN AT_KEY DECIMAL literal RPAREN','timed_init_def',5,'p_timed_init_def','tsalparser.py',1099),
+  ('goal_body_def -> LPAREN AND_KEY literals_lst RPAREN','goal_body_def',4,'p_goal_body_def','tsalparser.py',1106),
+  ('goal_body_def_lst -> goal_body_def_lst goal_body_def','goal_body_def_lst',2,'p_goal_body_def_lst','tsalparser.py',1110),
+  ('goal_body_def_lst -> goal_body_def','goal_body_def_lst',1,'p_goal_body_def_lst','tsalparser.py',1111),
+  ('goal_def -> LPAREN GOAL_KEY goal_body_def RPAREN','goal_def',4,'p_goal_def','tsalparser.py',1119),
+  ('goal_def -> LPAREN GOAL_KEY literal RPAREN','goal_def',4,'p_goal_def','tsalparser.py',1120),
+  ('goal_def -> LPAREN GOAL_KEY LPAREN ONEOF_KEY effect_body RPAREN RPAREN','goal_def',7,'p_goal_def','tsalparser.py',1121),
+  ('goal_def -> LPAREN GOAL_KEY LPAREN OR_KEY goal_body_def_lst RPAREN RPAREN','goal_def',7,'p_goal_def','tsalparser.py',1122),
+  ('metric_def -> LPAREN METRIC_KEY NAME fluent_def RPAREN','metric_def',5,'p_metric_def','tsalparser.py',1135),
 ]
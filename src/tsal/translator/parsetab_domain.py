@@ -0,0 +1,238 @@
+
+# parsetab_domain.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'domainleftPLUSHYPHENleftTIMESDIVIDEACTIONS_KEY ACTION_KEY AND_KEY AT_KEY BOUNDS_KEY CONSTANTS_KEY DECIMAL DEFINE_KEY DERIVED_KEY DERIVED_PREDICATES_KEY DIVIDE DOMAIN_KEY DURATION_KEY EFFECT_KEY EQUALS EVENTS_KEY EVENT_KEY FLUENTS_KEY FORALL_KEY GOAL_KEY GT GTEQ HYPHEN INIT_KEY INTERARRIVAL_KEY LPAREN LT LTEQ METRIC_KEY MOD NAME NEG_INTEGER NEQ NOT_KEY OBJECTS_KEY ONEOF_KEY OR_KEY PARAMETERS_KEY PLUS POS_INTEGER PRECONDITION_KEY PREDICATES_KEY PROBABILISTIC_KEY PROBABILITY PROBLEM_KEY PROCESSES_KEY REQUIREMENTS_KEY RPAREN TIMED_INIT_KEY TIMES TYPES_KEY VARIABLE WHEN_KEYtsal : domain\n            | problem\n            | domain problemdomain : LPAREN DEFINE_KEY domain_def domain_section_lst RPARENdomain_section_lst : domain_section_lst domain_section\n                          | domain_sectiondomain_section : requirements_def\n                      | types_def\n                      | constants_def\n                      | fluents_def\n                      | predicates_def\n                      | derived_predicates_def\n                      | processes_def\n                      | actions_def\n                      | events_defdomain_def : LPAREN DOMAIN_KEY NAME RPARENrequirements_def : LPAREN REQUIREMENTS_KEY requirements_lst RPAREN\n                        | LPAREN REQUIREMENTS_KEY RPARENrequirements_lst :  requirement_def requirements_lst\n                        |  requirement_defrequirement_def : NAMEtypes_def : LPAREN TYPES_KEY typed_names_lst RPARENconstants_def : LPAREN CONSTANTS_KEY typed_names_lst RPAREN\n                     | LPAREN CONSTANTS_KEY RPARENtyped_names_lst : names_lst HYPHEN type typed_names_lst\n                       | names_lst HYPHEN type\n                       | names_lstfluents_def : LPAREN FLUENTS_KEY fluent_def_lst RPARENfluent_def_lst : fluent_def_lst fluent_def\n                      | fluent_deffluent_def : LPAREN NAME typed_variables_lst RPAREN\n                  | LPAREN NAME variables_lst RPAREN\n                  | LPAREN NAME RPAREN\n                  | fluent_def HYPHEN type\n                  |  LPAREN NAME typed_variables_lst bounds_def RPARENbounds_def : BOUNDS_KEY num num POS_INTEGERnum : POS_INTEGER\n            | NEG_INTEGERpredicates_def : LPAREN PREDICATES_KEY predicate_def_lst RPARENpredicate_def_lst : predicate_def_lst predicate_def\n                         | predicate_defpredicate_def : LPAREN NAME typed_variables_lst RPAREN\n                     | LPAREN NAME variables_lst RPAREN\n                     | LPAREN NAME RPARENderived_predicates_def : LPAREN DERIVED_PREDICATES_KEY derived_def_lst RPAREN\n                               | LPAREN DERIVED_PREDICATES_KEY RPARENderived_def_lst :\n                       | derived_def_lst derived_defderived_def : LPAREN DERIVED_KEY predicate_def derived_def_body RPAREN\n                    | LPAREN DERIVED_KEY fluent_def derived_def_body RPARENderived_def_body : LPAREN AND_KEY fluent_predicate_def_lst RPARENfluent_predicate_def_lst :\n                                | expression fluent_predicate_def_lst\n                                | literal fluent_predicate_def_lstprocesses_def : LPAREN PROCESSES_KEY processes_def_lst RPARENprocesses_def_lst :\n                         | processes_def_lst process_defprocess_def : LPAREN EQUALS NAME expression RPARENactions_def : LPAREN ACTIONS_KEY action_def_lst RPARENaction_def_lst :\n                      | action_def_lst action_defaction_def : LPAREN ACTION_KEY NAME parameters_def action_def_body RPAREN\n                  | LPAREN ACTION_KEY NAME parameters_def duration_def action_def_body RPARENevent_def : LPAREN EVENT_KEY NAME parameters_def event_def_body RPAREN\n                 | LPAREN EVENT_KEY NAME parameters_def duration_def event_def_body RPARENevents_def : LPAREN EVENTS_KEY event_def_lst RPARENevent_def_lst :\n                     | event_def_lst event_defparameters_def : PARAMETERS_KEY LPAREN typed_variables_lst RPAREN\n                      | PARAMETERS_KEY LPAREN variables_lst RPAREN\n                      | PARAMETERS_KEY LPAREN RPARENaction_def_body : precond_def effects_defevent_def_body : precond_def effects_def\n                      | precond_def frequency_def effects_defprecond_def : PRECONDITION_KEY LPAREN AND_KEY literals_lst RPAREN\n                   | PRECONDITION_KEY literal\n                   | PRECONDITION_KEY expression\n                   | PRECONDITION_KEY LPAREN RPARENeffects_def : EFFECT_KEY effect_body\n                    | EFFECT_KEY forall\n                    | EFFECT_KEY when_body\n                    | EFFECT_KEY LPAREN AND_KEY forall_body RPAREN effect_body : LPAREN RPAREN\n                    | LPAREN NAME unlabeled_effect RPAREN\n                    | effect_body LPAREN NAME unlabeled_effect RPAREN\n                    | unlabeled_effectforall_body : forall forall_body\n                   | forall\n                   | effect forall_body\n                   | effectwhen_body : LPAREN WHEN_KEY when_pre when_eff RPARENforall : LPAREN FORALL_KEY LPAREN typed_variables_lst RPAREN when_body RPARENwhen_pre : LPAREN AND_KEY literals_lst RPAREN\n                | literalwhen_eff : LPAREN AND_KEY literals_lst RPAREN\n                | literalfrequency_def : INTERARRIVAL_KEY LPAREN NAME NAME DECIMAL RPAREN\n                     | INTERARRIVAL_KEY LPAREN RPARENunlabeled_effect : LPAREN ONEOF_KEY effect_body RPAREN\n                        | deterministic_effect unlabeled_effect\n                        | deterministic_effectdeterministic_effect : LPAREN AND_KEY effects_lst RPAREN\n                            | effects_lstwhen_effects : when_if when_then when_if : simple_effect\n                | LPAREN AND_KEY simple_effects_lst RPARENwhen_then : simple_effect\n                 | LPAREN AND_KEY simple_effects_lst RPARENeffects_lst :\n                   | effects_lst effectsimple_effects_lst : simple_effects_lst simple_effect\n                          | simple_effecteffect : literal\n              | expression\n              | LPAREN PROBABILISTIC_KEY PROBABILITY literal RPAREN\n              | LPAREN WHEN_KEY when_effects RPARENsimple_effect : literalduration_def : DURATION_KEY LPAREN expression RPAREN\n                    | DURATION_KEY LPAREN RPARENexpression_body : fluent_def\n                       | expressionexpression_body_list : expression_body expression_bodyexpression : PLUS expression_body_list\n                  | HYPHEN expression_body_list\n                  | TIMES expression_body_list\n                  | DIVIDE expression_body_list\n                  | GT expression_body_list\n                  | GTEQ expression_body_list\n                  | LT expression_body_list\n                  | LTEQ expression_body_list\n                  | EQUALS expression_body_list\n                  | NEQ expression_body_list\n                  | MOD expression_body_list\n                  | LPAREN expression RPAREN\n                  | DECIMAL\n                  | PROBABILITY\n                  | VARIABLE\n                  | POS_INTEGER\n                  | NEG_INTEGER\n                  | NAMEliterals_lst : literals_lst literal\n                    | literals_lst expression\n                    | literal\n                    | expression\n                    | literals_lst or_literal\n                    | or_literalor_literal : LPAREN OR_KEY literals_lst RPARENliteral : LPAREN NOT_KEY predicate RPAREN\n               | predicateground_predicates_lst : ground_predicates_lst ground_predicate\n                             | ground_predicateground_predicate : LPAREN NAME constants_lst RPAREN\n                        | LPAREN NAME RPAREN\n                        | ground_fluentground_fluent : LPAREN EQUALS ground_fluent_def NAME RPAREN\n                     | LPAREN EQUALS ground_fluent_def POS_INTEGER RPAREN\n                     | LPAREN EQUALS ground_fluent_def NEG_INTEGER RPARENground_fluent_def : LPAREN NAME constants_lst RPAREN\n                         | LPAREN NAME RPARENpredicate : LPAREN NAME variables_lst RPAREN\n                 | LPAREN EQUALS VARIABLE VARIABLE RPAREN\n                 | LPAREN NAME RPAREN\n                 | LPAREN NAME constants_lst RPARENtyped_constants_lst : typed_constants_lst constants_lst HYPHEN type\n                           | constants_lst HYPHEN typetyped_variables_lst : typed_variables_lst variables_lst HYPHEN type\n                           | variables_lst HYPHEN typeconstants_lst : constants_lst constant\n                     | constantvariables_lst : variables_lst variable\n                     | variable\n                     | NAME\n                     | variables_lst NAMEnames_lst : names_lst NAME\n                 | NAMEtype : NAMEconstant : NAME\n                | POS_INTEGER\n                | NEG_INTEGERvariable : VARIABLEproblem : plan_problemplan_problem : LPAREN DEFINE_KEY plan_problem_def problem_section_lst RPARENproblem_section_lst : problem_section_lst problem_section\n                           | problem_sectionproblem_section : domain_def\n                       | objects_def\n                       | init_def\n                       | timed_inits_def\n                       | goal_def\n                       | metric_defplan_problem_def : LPAREN PROBLEM_KEY NAME RPARENobjects_def : LPAREN OBJECTS_KEY typed_constants_lst RPAREN\n                   | LPAREN OBJECTS_KEY constants_lst RPARENinit_def : LPAREN INIT_KEY LPAREN AND_KEY ground_predicates_lst RPAREN RPAREN\n                | LPAREN INIT_KEY ground_predicates_lst RPAREN\n                | LPAREN INIT_KEY RPARENtimed_inits_def : LPAREN TIMED_INIT_KEY timed_init_lst RPARENtimed_init_lst :\n                      | timed_init_lst timed_init_deftimed_init_def : LPAREN AT_KEY DECIMAL literal RPARENgoal_body_def : LPAREN AND_KEY literals_lst RPARENgoal_body_def_lst : goal_body_def_lst goal_body_def\n                         | goal_body_defgoal_def : LPAREN GOAL_KEY goal_body_def RPAREN\n                | LPAREN GOAL_KEY literal RPAREN\n                | LPAREN GOAL_KEY LPAREN ONEOF_KEY effect_body RPAREN RPAREN\n                | LPAREN GOAL_KEY LPAREN OR_KEY goal_body_def_lst RPAREN RPARENmetric_def : LPAREN METRIC_KEY NAME fluent_def RPAREN'
+    
+_lr_action_items = {'LPAREN':([0,3,5,8,9,10,11,12,13,14,15,16,17,18,23,24,25,26,27,28,30,31,33,40,42,43,45,46,47,48,49,50,51,52,54,57,59,60,63,64,66,67,69,70,72,73,75,76,78,81,85,87,89,94,99,102,103,105,106,107,110,120,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,145,147,148,149,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,170,171,177,178,179,181,182,183,184,185,187,190,191,192,198,202,203,205,209,210,214,215,216,219,223,230,235,237,238,239,240,241,242,243,245,246,247,248,250,251,252,253,254,259,260,262,265,266,268,269,270,274,275,277,278,280,281,283,284,285,288,291,294,297,301,302,305,306,307,308,310,311,312,313,317,318,322,326,327,328,329,330,331,332,334,335,336,],[2,4,7,7,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,41,44,-47,-56,-60,-67,-5,-16,-18,-24,41,-30,44,-41,65,-46,68,71,74,-17,-22,-23,-28,-29,-39,-40,-45,-48,-55,-57,-59,-61,-66,-68,-176,-33,-34,-44,104,-31,-32,-42,-43,117,117,120,-35,120,155,-140,155,155,155,155,155,155,155,155,155,155,-135,-136,-137,-138,-139,172,-33,179,-49,-50,-131,155,-120,-121,120,-58,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,191,192,-31,-32,120,179,179,-149,-134,-122,-62,213,120,120,-64,225,226,155,-63,236,-86,244,248,250,-65,-162,-137,266,-83,244,272,273,276,-100,-110,-113,-114,120,120,250,-143,-144,-146,-148,-160,-163,244,120,248,266,266,298,-94,236,-109,303,250,-141,-142,-145,-161,-102,-84,250,-99,315,321,-105,-117,250,-85,324,250,250,315,-116,-147,-93,250,-115,315,-112,315,-92,-106,-111,315,]),'$end':([1,29,],[0,-4,]),'DEFINE_KEY':([2,],[3,]),'DOMAIN_KEY':([4,],[6,]),'NAME':([6,20,21,22,34,35,37,38,41,44,55,56,58,61,62,77,78,79,80,81,82,83,84,85,86,88,90,91,92,94,96,98,99,100,101,104,107,110,111,115,116,120,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,144,146,147,151,152,153,154,155,157,158,159,160,161,162,163,164,165,166,171,172,179,181,182,183,184,185,186,190,191,192,195,197,204,205,213,215,216,219,225,226,228,229,230,231,232,233,234,235,236,237,239,242,245,246,247,248,250,251,252,253,254,255,257,259,260,261,262,263,265,266,268,269,270,272,273,276,278,281,283,284,285,288,291,295,296,297,298,303,308,312,313,315,318,321,322,327,328,332,],[19,35,38,38,35,-21,56,-175,58,62,78,-174,79,78,79,38,-176,-172,79,-33,98,-171,-180,-34,79,98,107,108,109,-31,98,-173,-32,78,-170,116,122,-35,78,-167,79,122,122,-140,122,122,122,122,122,122,122,122,122,122,-135,-136,-137,-138,-139,-166,79,98,122,-131,122,-120,-121,186,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,122,79,204,122,122,-149,-134,-122,79,-109,122,204,79,98,228,122,239,-109,122,122,255,257,-172,98,-162,261,-169,-178,-179,-137,265,122,-109,-109,-110,-113,-114,204,204,122,-143,-144,-146,286,228,-148,-160,-177,-163,-168,-109,204,122,122,122,79,257,239,-109,122,-141,-142,-145,-161,-102,79,98,122,257,257,122,122,122,257,-116,257,-147,122,-115,-92,]),'REQUIREMENTS_KEY':([7,],[20,]),'TYPES_KEY':([7,],[21,]),'CONSTANTS_KEY':([7,],[22,]),'FLUENTS_KEY':([7,],[23,]),'PREDICATES_KEY':([7,],[24,]),'DERIVED_PREDICATES_KEY':([7,],[25,]),'PROCESSES_KEY':([7,],[26,]),'ACTIONS_KEY':([7,],[27,]),'EVENTS_KEY':([7,],[28,]),'RPAREN':([8,9,10,11,12,13,14,15,16,17,18,19,20,22,25,26,27,28,30,32,33,34,35,36,37,38,39,40,42,43,45,46,47,48,49,50,51,52,53,54,56,57,58,59,60,62,63,64,66,67,69,70,72,73,75,76,77,78,79,80,81,82,83,84,85,86,87,88,93,94,95,98,99,101,102,103,110,115,116,118,119,122,123,134,135,136,137,138,142,144,146,147,148,149,150,151,153,154,156,157,158,159,160,161,162,163,164,165,166,167,172,173,176,180,181,182,183,184,185,186,187,188,189,190,191,192,195,197,198,199,200,204,206,207,208,209,210,211,212,213,214,215,216,217,223,224,225,227,228,229,230,231,232,233,234,237,238,239,242,243,245,246,247,251,252,253,254,257,259,260,261,262,263,264,265,267,268,269,270,271,276,277,278,283,284,285,288,289,290,291,292,293,294,295,299,300,301,304,307,308,309,310,312,314,316,318,319,320,322,325,327,328,329,330,332,333,335,336,337,],[29,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,31,33,40,48,-56,-60,-67,-5,52,-18,-20,-21,54,-27,-175,57,-24,59,-30,63,-41,66,-46,69,72,75,-17,-19,-22,-174,-23,81,-28,-29,87,-39,-40,-45,-48,-55,-57,-59,-61,-66,-68,-26,-176,-172,94,-33,99,-171,-180,-34,102,-44,103,-25,-31,110,-173,-32,-170,-42,-43,-35,-167,145,148,149,-140,156,-135,-136,-137,-138,-139,-166,177,178,-52,-49,-50,184,-131,-120,-121,-58,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,187,196,198,-36,206,-52,-52,-149,-134,-122,81,-62,209,-72,-109,218,220,221,222,-64,223,-73,230,-51,-53,-54,-63,-79,-80,-81,238,-86,-101,-103,249,-65,-74,256,259,-172,260,-162,262,-169,-178,-179,-109,-83,-109,-109,-100,-110,-113,-114,282,-143,-144,-146,230,-148,-160,-177,-163,-168,288,-109,290,291,-88,-90,294,238,301,-109,-141,-142,-145,-161,310,-82,-102,-87,-89,-84,311,314,-96,-99,318,-117,322,323,-85,326,-91,328,-116,-104,-107,-147,332,333,-115,334,-112,-92,-95,-111,337,-108,]),'HYPHEN':([37,38,43,56,60,78,79,81,82,83,84,85,88,94,96,98,99,101,106,107,110,120,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,145,146,147,151,152,153,154,155,157,158,159,160,161,162,163,164,165,166,171,177,178,179,181,182,183,184,185,190,191,192,197,205,215,216,219,230,235,237,239,242,245,246,247,248,250,251,252,253,254,259,260,262,265,266,268,269,270,278,281,283,284,285,288,291,296,297,308,312,313,318,322,327,328,332,],[55,-175,61,-174,61,-176,-172,-33,100,-171,-180,-34,100,-31,111,-173,-32,-170,61,125,-35,125,125,-140,125,125,125,125,125,125,125,125,125,125,-135,-136,-137,-138,-139,-33,100,125,-131,125,61,-121,125,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,125,-31,-32,125,125,125,-149,-134,-122,-109,125,125,100,125,-109,125,125,-162,-137,125,-109,-109,-110,-113,-114,125,125,125,-143,-144,-146,-148,-160,-163,-109,125,125,125,125,-109,125,-141,-142,-145,-161,-102,100,125,125,125,125,-116,-147,125,-115,-92,]),'VARIABLE':([58,62,78,79,80,81,82,83,84,85,86,88,94,96,98,99,101,107,110,115,116,120,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,142,144,146,147,151,152,153,154,155,157,158,159,160,161,162,163,164,165,166,171,172,179,181,182,183,184,185,186,190,191,192,195,197,204,205,215,216,219,228,229,230,235,237,239,242,245,246,247,248,250,251,252,253,254,257,258,259,260,262,265,266,268,269,270,272,278,281,283,284,285,287,288,291,295,296,297,308,312,313,318,322,327,328,332,],[84,84,-176,-172,84,-33,84,-171,-180,-34,84,84,-31,84,-173,-32,-170,136,-35,-167,84,136,136,-140,136,136,136,136,136,136,136,136,136,136,-135,-136,-137,-138,-139,-166,84,84,136,-131,136,-120,-121,136,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,136,84,136,136,136,-149,-134,-122,84,-109,136,136,84,84,84,235,-109,136,136,-172,84,-162,264,136,-109,-109,-110,-113,-114,136,136,136,-143,-144,-146,84,287,-148,-160,-163,-109,136,136,136,136,84,-109,136,-141,-142,-145,264,-161,-102,84,84,136,136,136,136,-116,-147,136,-115,-92,]),'DERIVED_KEY':([65,],[89,]),'EQUALS':([68,78,81,85,94,99,107,110,120,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,147,151,152,153,154,155,157,158,159,160,161,162,163,164,165,166,171,179,181,182,183,184,185,190,191,192,205,215,216,219,226,230,235,237,239,242,245,246,247,248,250,251,252,253,254,259,260,262,265,266,268,269,270,273,278,281,283,284,285,288,291,297,298,303,308,312,313,315,318,321,322,327,328,332,],[90,-176,-33,-34,-31,-32,121,-35,121,121,-140,121,121,121,121,121,121,121,121,121,121,-135,-136,-137,-138,-139,121,-131,121,-120,-121,121,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,121,205,121,121,-149,-134,-122,-109,121,205,121,-109,121,121,258,-162,-137,121,-109,-109,-110,-113,-114,205,205,121,-143,-144,-146,-148,-160,-163,-109,205,121,121,121,258,-109,121,-141,-142,-145,-161,-102,121,258,258,121,121,121,258,-116,258,-147,121,-115,-92,]),'ACTION_KEY':([71,],[91,]),'EVENT_KEY':([74,],[92,]),'PLUS':([78,81,85,94,99,107,110,120,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,147,151,152,153,154,155,157,158,159,160,161,162,163,164,165,166,171,179,181,182,183,184,185,190,191,192,205,215,216,219,230,235,237,239,242,245,246,247,248,250,251,252,253,254,259,260,262,265,266,268,269,270,278,281,283,284,285,288,291,297,308,312,313,318,322,327,328,332,],[-176,-33,-34,-31,-32,124,-35,124,124,-140,124,124,124,124,124,124,124,124,124,124,-135,-136,-137,-138,-139,124,-131,124,-120,-121,124,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,124,124,124,124,-149,-134,-122,-109,124,124,124,-109,124,124,-162,-137,124,-109,-109,-110,-113,-114,124,124,124,-143,-144,-146,-148,-160,-163,-109,124,124,124,124,-109,124,-141,-142,-145,-161,-102,124,124,124,124,-116,-147,124,-115,-92,]),'TIMES':([78,81,85,94,99,107,110,120,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,147,151,152,153,154,155,157,158,159,160,161,162,163,164,165,166,171,179,181,182,183,184,185,190,191,192,205,215,216,219,230,235,237,239,242,245,246,247,248,250,251,252,253,254,259,260,262,265,266,268,269,270,278,281,283,284,285,288,291,297,308,312,313,318,322,327,328,332,],[-176,-33,-34,-31,-32,126,-35,126,126,-140,126,126,126,126,126,126,126,126,126,126,-135,-136,-137,-138,-139,126,-131,126,-120,-121,126,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,126,126,126,126,-149,-134,-122,-109,126,126,126,-109,126,126,-162,-137,126,-109,-109,-110,-113,-114,126,126,126,-143,-144,-146,-148,-160,-163,-109,126,126,126,126,-109,126,-141,-142,-145,-161,-102,126,126,126,126,-116,-147,126,-115,-92,]),'DIVIDE':([78,81,85,94,99,107,110,120,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,147,151,152,153,154,155,157,158,159,160,161,162,163,164,165,166,171,179,181,182,183,184,185,190,191,192,205,215,216,219,230,235,237,239,242,245,246,247,248,250,251,252,253,254,259,260,262,265,266,268,269,270,278,281,283,284,285,288,291,297,308,312,313,318,322,327,328,332,],[-176,-33,-34,-31,-32,127,-35,127,127,-140,127,127,127,127,127,127,127,127,127,127,-135,-136,-137,-138,-139,127,-131,127,-120,-121,127,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,127,127,127,127,-149,-134,-122,-109,127,127,127,-109,127,127,-162,-137,127,-109,-109,-110,-113,-114,127,127,127,-143,-144,-146,-148,-160,-163,-109,127,127,127,127,-109,127,-141,-142,-145,-161,-102,127,127,127,127,-116,-147,127,-115,-92,]),'GT':([78,81,85,94,99,107,110,120,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,147,151,152,153,154,155,157,158,159,160,161,162,163,164,165,166,171,179,181,182,183,184,185,190,191,192,205,215,216,219,230,235,237,239,242,245,246,247,248,250,251,252,253,254,259,260,262,265,266,268,269,270,278,281,283,284,285,288,291,297,308,312,313,318,322,327,328,332,],[-176,-33,-34,-31,-32,128,-35,128,128,-140,128,128,128,128,128,128,128,128,128,128,-135,-136,-137,-138,-139,128,-131,128,-120,-121,128,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,128,128,128,128,-149,-134,-122,-109,128,128,128,-109,128,128,-162,-137,128,-109,-109,-110,-113,-114,128,128,128,-143,-144,-146,-148,-160,-163,-109,128,128,128,128,-109,128,-141,-142,-145,-161,-102,128,128,128,128,-116,-147,128,-115,-92,]),'GTEQ':([78,81,85,94,99,107,110,120,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,147,151,152,153,154,155,157,158,159,160,161,162,163,164,165,166,171,179,181,182,183,184,185,190,191,192,205,215,216,219,230,235,237,239,242,245,246,247,248,250,251,252,253,254,259,260,262,265,266,268,269,270,278,281,283,284,285,288,291,297,308,312,313,318,322,327,328,332,],[-176,-33,-34,-31,-32,129,-35,129,129,-140,129,129,129,129,129,129,129,129,129,129,-135,-136,-137,-138,-139,129,-131,129,-120,-121,129,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,129,129,129,129,-149,-134,-122,-109,129,129,129,-109,129,129,-162,-137,129,-109,-109,-110,-113,-114,129,129,129,-143,-144,-146,-148,-160,-163,-109,129,129,129,129,-109,129,-141,-142,-145,-161,-102,129,129,129,129,-116,-147,129,-115,-92,]),'LT':([78,81,85,94,99,107,110,120,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,147,151,152,153,154,155,157,158,159,160,161,162,163,164,165,166,171,179,181,182,183,184,185,190,191,192,205,215,216,219,230,235,237,239,242,245,246,247,248,250,251,252,253,254,259,260,262,265,266,268,269,270,278,281,283,284,285,288,291,297,308,312,313,318,322,327,328,332,],[-176,-33,-34,-31,-32,130,-35,130,130,-140,130,130,130,130,130,130,130,130,130,130,-135,-136,-137,-138,-139,130,-131,130,-120,-121,130,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,130,130,130,130,-149,-134,-122,-109,130,130,130,-109,130,130,-162,-137,130,-109,-109,-110,-113,-114,130,130,130,-143,-144,-146,-148,-160,-163,-109,130,130,130,130,-109,130,-141,-142,-145,-161,-102,130,130,130,130,-116,-147,130,-115,-92,]),'LTEQ':([78,81,85,94,99,107,110,120,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,147,151,152,153,154,155,157,158,159,160,161,162,163,164,165,166,171,179,181,182,183,184,185,190,191,192,205,215,216,219,230,235,237,239,242,245,246,247,248,250,251,252,253,254,259,260,262,265,266,268,269,270,278,281,283,284,285,288,291,297,308,312,313,318,322,327,328,332,],[-176,-33,-34,-31,-32,131,-35,131,131,-140,131,131,131,131,131,131,131,131,131,131,-135,-136,-137,-138,-139,131,-131,131,-120,-121,131,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,131,131,131,131,-149,-134,-122,-109,131,131,131,-109,131,131,-162,-137,131,-109,-109,-110,-113,-114,131,131,131,-143,-144,-146,-148,-160,-163,-109,131,131,131,131,-109,131,-141,-142,-145,-161,-102,131,131,131,131,-116,-147,131,-115,-92,]),'NEQ':([78,81,85,94,99,107,110,120,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,147,151,152,153,154,155,157,158,159,160,161,162,163,164,165,166,171,179,181,182,183,184,185,190,191,192,205,215,216,219,230,235,237,239,242,245,246,247,248,250,251,252,253,254,259,260,262,265,266,268,269,270,278,281,283,284,285,288,291,297,308,312,313,318,322,327,328,332,],[-176,-33,-34,-31,-32,132,-35,132,132,-140,132,132,132,132,132,132,132,132,132,132,-135,-136,-137,-138,-139,132,-131,132,-120,-121,132,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,132,132,132,132,-149,-134,-122,-109,132,132,132,-109,132,132,-162,-137,132,-109,-109,-110,-113,-114,132,132,132,-143,-144,-146,-148,-160,-163,-109,132,132,132,132,-109,132,-141,-142,-145,-161,-102,132,132,132,132,-116,-147,132,-115,-92,]),'MOD':([78,81,85,94,99,107,110,120,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,147,151,152,153,154,155,157,158,159,160,161,162,163,164,165,166,171,179,181,182,183,184,185,190,191,192,205,215,216,219,230,235,237,239,242,245,246,247,248,250,251,252,253,254,259,260,262,265,266,268,269,270,278,281,283,284,285,288,291,297,308,312,313,318,322,327,328,332,],[-176,-33,-34,-31,-32,133,-35,133,133,-140,133,133,133,133,133,133,133,133,133,133,-135,-136,-137,-138,-139,133,-131,133,-120,-121,133,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,133,133,133,133,-149,-134,-122,-109,133,133,133,-109,133,133,-162,-137,133,-109,-109,-110,-113,-114,133,133,133,-143,-144,-146,-148,-160,-163,-109,133,133,133,133,-109,133,-141,-142,-145,-161,-102,133,133,133,133,-116,-147,133,-115,-92,]),'DECIMAL':([78,81,85,94,99,107,110,120,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,147,151,152,153,154,155,157,158,159,160,161,162,163,164,165,166,171,179,181,182,183,184,185,190,191,192,205,215,216,219,230,235,237,239,242,245,246,247,248,250,251,252,253,254,259,260,262,265,266,268,269,270,278,281,283,284,285,286,288,291,297,308,312,313,318,322,327,328,332,],[-176,-33,-34,-31,-32,134,-35,134,134,-140,134,134,134,134,134,134,134,134,134,134,-135,-136,-137,-138,-139,134,-131,134,-120,-121,134,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,134,134,134,134,-149,-134,-122,-109,134,134,134,-109,134,134,-162,-137,134,-109,-109,-110,-113,-114,134,134,134,-143,-144,-146,-148,-160,-163,-109,134,134,134,134,-109,134,-141,-142,-145,309,-161,-102,134,134,134,134,-116,-147,134,-115,-92,]),'PROBABILITY':([78,81,85,94,99,107,110,120,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,147,151,152,153,154,155,157,158,159,160,161,162,163,164,165,166,171,179,181,182,183,184,185,190,191,192,205,215,216,219,230,235,237,239,242,245,246,247,248,250,251,252,253,254,259,260,262,265,266,268,269,270,278,279,281,283,284,285,288,291,297,308,312,313,318,322,327,328,332,],[-176,-33,-34,-31,-32,135,-35,135,135,-140,135,135,135,135,135,135,135,135,135,135,-135,-136,-137,-138,-139,135,-131,135,-120,-121,135,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,135,135,135,135,-149,-134,-122,-109,135,135,135,-109,135,135,-162,-137,135,-109,-109,-110,-113,-114,135,135,135,-143,-144,-146,-148,-160,-163,-109,135,135,135,135,-109,302,135,-141,-142,-145,-161,-102,135,135,135,135,-116,-147,135,-115,-92,]),'POS_INTEGER':([78,81,85,94,97,99,107,110,112,113,114,120,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,143,147,151,152,153,154,155,157,158,159,160,161,162,163,164,165,166,171,179,181,182,183,184,185,190,191,192,204,205,215,216,219,228,230,231,232,233,234,235,237,239,242,245,246,247,248,250,251,252,253,254,257,259,260,261,262,263,265,266,268,269,270,278,281,283,284,285,288,291,297,308,312,313,318,322,327,328,332,],[-176,-33,-34,-31,113,-32,137,-35,113,-37,-38,137,137,-140,137,137,137,137,137,137,137,137,137,137,-135,-136,-137,-138,-139,176,137,-131,137,-120,-121,137,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,137,137,137,137,-149,-134,-122,-109,137,137,233,137,-109,137,137,-177,-162,233,-169,-178,-179,-137,137,-109,-109,-110,-113,-114,137,137,137,-143,-144,-146,233,-148,-160,-177,-163,-168,-109,137,137,137,137,-109,137,-141,-142,-145,-161,-102,137,137,137,137,-116,-147,137,-115,-92,]),'NEG_INTEGER':([78,81,85,94,97,99,107,110,112,113,114,120,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,147,151,152,153,154,155,157,158,159,160,161,162,163,164,165,166,171,179,181,182,183,184,185,190,191,192,204,205,215,216,219,228,230,231,232,233,234,235,237,239,242,245,246,247,248,250,251,252,253,254,257,259,260,261,262,263,265,266,268,269,270,278,281,283,284,285,288,291,297,308,312,313,318,322,327,328,332,],[-176,-33,-34,-31,114,-32,138,-35,114,-37,-38,138,138,-140,138,138,138,138,138,138,138,138,138,138,-135,-136,-137,-138,-139,138,-131,138,-120,-121,138,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,138,138,138,138,-149,-134,-122,-109,138,138,234,138,-109,138,138,-177,-162,234,-169,-178,-179,-137,138,-109,-109,-110,-113,-114,138,138,138,-143,-144,-146,234,-148,-160,-177,-163,-168,-109,138,138,138,138,-109,138,-141,-142,-145,-161,-102,138,138,138,138,-116,-147,138,-115,-92,]),'EFFECT_KEY':([78,81,85,94,99,110,122,134,135,136,137,138,151,153,154,157,158,159,160,161,162,163,164,165,166,169,175,183,184,185,193,194,201,220,230,256,259,260,262,282,288,323,],[-176,-33,-34,-31,-32,-35,-140,-135,-136,-137,-138,-139,-131,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,190,190,-149,-134,-122,-76,-77,190,-78,-162,-98,-148,-160,-163,-75,-161,-97,]),'INTERARRIVAL_KEY':([78,81,85,94,99,110,122,134,135,136,137,138,151,153,154,157,158,159,160,161,162,163,164,165,166,175,183,184,185,193,194,220,230,259,260,262,282,288,],[-176,-33,-34,-31,-32,-35,-140,-135,-136,-137,-138,-139,-131,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,202,-149,-134,-122,-76,-77,-78,-162,-148,-160,-163,-75,-161,]),'BOUNDS_KEY':([78,80,115,142,144,],[-176,97,-167,-166,97,]),'PARAMETERS_KEY':([108,109,],[140,140,]),'AND_KEY':([117,192,213,244,273,276,298,303,321,],[147,219,237,278,297,278,313,317,331,]),'DURATION_KEY':([139,141,196,221,222,],[170,170,-71,-69,-70,]),'PRECONDITION_KEY':([139,141,168,174,196,218,221,222,249,],[171,171,171,171,-71,-119,-69,-70,-118,]),'NOT_KEY':([179,192,248,250,266,273,298,303,315,321,],[203,203,203,203,203,203,203,203,203,203,]),'FORALL_KEY':([213,266,],[240,240,]),'WHEN_KEY':([213,248,266,324,],[241,280,280,241,]),'ONEOF_KEY':([213,244,276,],[242,242,242,]),'PROBABILISTIC_KEY':([248,266,],[279,279,]),'OR_KEY':([250,],[281,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'domain':([0,],[1,]),'domain_def':([3,],[5,]),'domain_section_lst':([5,],[8,]),'domain_section':([5,8,],[9,30,]),'requirements_def':([5,8,],[10,10,]),'types_def':([5,8,],[11,11,]),'constants_def':([5,8,],[12,12,]),'fluents_def':([5,8,],[13,13,]),'predicates_def':([5,8,],[14,14,]),'derived_predicates_def':([5,8,],[15,15,]),'processes_def':([5,8,],[16,16,]),'actions_def':([5,8,],[17,17,]),'events_def':([5,8,],[18,18,]),'requirements_lst':([20,34,],[32,53,]),'requirement_def':([20,34,],[34,34,]),'typed_names_lst':([21,22,77,],[36,39,93,]),'names_lst':([21,22,77,],[37,37,37,]),'fluent_def_lst':([23,],[42,]),'fluent_def':([23,42,89,121,124,125,126,127,128,129,130,131,132,133,152,205,],[43,60,106,153,153,153,153,153,153,153,153,153,153,153,153,153,]),'predicate_def_lst':([24,],[45,]),'predicate_def':([24,45,89,],[46,64,105,]),'derived_def_lst':([25,],[47,]),'processes_def_lst':([26,],[49,]),'action_def_lst':([27,],[50,]),'event_def_lst':([28,],[51,]),'derived_def':([47,],[67,]),'process_def':([49,],[70,]),'action_def':([50,],[73,]),'event_def':([51,],[76,]),'type':([55,61,100,111,],[77,85,115,142,]),'typed_variables_lst':([58,62,116,172,186,272,],[80,86,144,195,80,295,]),'variables_lst':([58,62,80,86,116,144,172,186,195,204,257,272,295,],[82,88,96,96,146,96,197,82,96,229,229,296,96,]),'variable':([58,62,80,82,86,88,96,116,144,146,172,186,195,197,204,229,257,272,295,296,],[83,83,83,101,83,101,101,83,83,101,83,83,83,101,83,101,83,83,83,101,]),'bounds_def':([80,144,],[95,95,]),'num':([97,112,],[112,143,]),'derived_def_body':([105,106,],[118,119,]),'expression':([107,120,121,124,125,126,127,128,129,130,131,132,133,147,152,155,171,179,181,182,191,192,205,216,219,237,248,250,251,266,268,269,270,281,297,308,312,313,327,],[123,150,154,154,154,154,154,154,154,154,154,154,154,181,154,150,194,150,181,181,217,150,154,247,253,247,150,150,284,150,247,247,247,253,253,284,284,253,284,]),'parameters_def':([108,109,],[139,141,]),'expression_body_list':([121,124,125,126,127,128,129,130,131,132,133,205,],[151,157,158,159,160,161,162,163,164,165,166,151,]),'expression_body':([121,124,125,126,127,128,129,130,131,132,133,152,205,],[152,152,152,152,152,152,152,152,152,152,152,185,152,]),'action_def_body':([139,168,],[167,188,]),'duration_def':([139,141,],[168,174,]),'precond_def':([139,141,168,174,],[169,175,169,175,]),'event_def_body':([141,174,],[173,199,]),'fluent_predicate_def_lst':([147,181,182,],[180,207,208,]),'literal':([147,171,181,182,216,219,237,241,251,268,269,270,274,280,281,297,302,305,308,312,313,317,327,329,331,336,],[182,193,182,182,246,252,246,275,283,246,246,246,300,307,252,252,316,307,283,283,252,307,283,307,307,307,]),'predicate':([147,171,181,182,203,216,219,237,241,251,268,269,270,274,280,281,297,302,305,308,312,313,317,327,329,331,336,],[183,183,183,183,227,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,]),'effects_def':([169,175,201,],[189,200,224,]),'frequency_def':([175,],[201,]),'effect_body':([190,242,],[210,277,]),'forall':([190,237,269,270,],[211,269,269,269,]),'when_body':([190,311,],[212,325,]),'unlabeled_effect':([190,215,239,242,265,],[214,243,271,214,289,]),'deterministic_effect':([190,215,239,242,265,],[215,215,215,215,215,]),'effects_lst':([190,215,237,239,242,265,278,],[216,216,268,216,216,216,268,]),'constants_lst':([204,257,],[231,231,]),'constant':([204,231,257,],[232,263,232,]),'effect':([216,237,268,269,270,],[245,270,245,270,270,]),'literals_lst':([219,281,297,313,],[251,308,312,327,]),'or_literal':([219,251,281,297,308,312,313,327,],[254,285,254,254,285,285,254,285,]),'forall_body':([237,269,270,],[267,292,293,]),'when_pre':([241,],[274,]),'when_eff':([274,],[299,]),'when_effects':([280,],[304,]),'when_if':([280,],[305,]),'simple_effect':([280,305,317,329,331,336,],[306,320,330,335,330,335,]),'when_then':([305,],[319,]),'simple_effects_lst':([317,331,],[329,336,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> domain","S'",1,None,None,None),
+  ('tsal -> domain','tsal',1,'p_tsal','tsalparser.py',230),
+  ('tsal -> problem','tsal',1,'p_tsal','tsalparser.py',231),
+  ('tsal -> domain problem','tsal',2,'p_tsal','tsalparser.py',232),
+  ('domain -> LPAREN DEFINE_KEY domain_def domain_section_lst RPAREN','domain',5,'p_domain','tsalparser.py',280),
+  ('domain_section_lst -> domain_section_lst domain_section','domain_section_lst',2,'p_domain_section_lst','tsalparser.py',302),
+  ('domain_section_lst -> domain_section','domain_section_lst',1,'p_domain_section_lst','tsalparser.py',303),
+  ('domain_section -> requirements_def','domain_section',1,'p_domain_section','tsalparser.py',312),
+  ('domain_section -> types_def','domain_section',1,'p_domain_section','tsalparser.py',313),
+  ('domain_section -> constants_def','domain_section',1,'p_domain_section','tsalparser.py',314),
+  ('domain_section -> fluents_def','domain_section',1,'p_domain_section','tsalparser.py',315),
+  ('domain_section -> predicates_def','domain_section',1,'p_domain_section','tsalparser.py',316),
+  ('domain_section -> derived_predicates_def','domain_section',1,'p_domain_section','tsalparser.py',317),
+  ('domain_section -> processes_def','domain_section',1,'p_domain_section','tsalparser.py',318),
+  ('domain_section -> actions_def','domain_section',1,'p_domain_section','tsalparser.py',319),
+  ('domain_section -> events_def','domain_section',1,'p_domain_section','tsalparser.py',320),
+  ('domain_def -> LPAREN DOMAIN_KEY NAME RPAREN','domain_def',4,'p_domain_def','tsalparser.py',325),
+  ('requirements_def -> LPAREN REQUIREMENTS_KEY requirements_lst RPAREN','requirements_def',4,'p_requirements_def','tsalparser.py',329),
+  ('requirements_def -> LPAREN REQUIREMENTS_KEY RPAREN','requirements_def',3,'p_requirements_def','tsalparser.py',330),
+  ('requirements_lst -> requirement_def requirements_lst','requirements_lst',2,'p_requirements_lst','tsalparser.py',337),
+  ('requirements_lst -> requirement_def','requirements_lst',1,'p_requirements_lst','tsalparser.py',338),
+  ('requirement_def -> NAME','requirement_def',1,'p_requirement_def','tsalparser.py',345),
+  ('types_def -> LPAREN TYPES_KEY typed_names_lst RPAREN','types_def',4,'p_types_def','tsalparser.py',349),
+  ('constants_def -> LPAREN CONSTANTS_KEY typed_names_lst RPAREN','constants_def',4,'p_constants_def','tsalparser.py',354),
+  ('constants_def -> LPAREN CONSTANTS_KEY RPAREN','constants_def',3,'p_constants_def','tsalparser.py',355),
+  ('typed_names_lst -> names_lst HYPHEN type typed_names_lst','typed_names_lst',4,'p_typed_names_lst','tsalparser.py',371),
+  ('typed_names_lst -> names_lst HYPHEN type','typed_names_lst',3,'p_typed_names_lst','tsalparser.py',372),
+  ('typed_names_lst -> names_lst','typed_names_lst',1,'p_typed_names_lst','tsalparser.py',373),
+  ('fluents_def -> LPAREN FLUENTS_KEY fluent_def_lst RPAREN','fluents_def',4,'p_fluents_def','tsalparser.py',387),
+  ('fluent_def_lst -> fluent_def_lst fluent_def','fluent_def_lst',2,'p_fluent_def_lst','tsalparser.py',393),
+  ('fluent_def_lst -> fluent_def','fluent_def_lst',1,'p_fluent_def_lst','tsalparser.py',394),
+  ('fluent_def -> LPAREN NAME typed_variables_lst RPAREN','fluent_def',4,'p_fluent_def','tsalparser.py',403),
+  ('fluent_def -> LPAREN NAME variables_lst RPAREN','fluent_def',4,'p_fluent_def','tsalparser.py',404),
+  ('fluent_def -> LPAREN NAME RPAREN','fluent_def',3,'p_fluent_def','tsalparser.py',405),
+  ('fluent_def -> fluent_def HYPHEN type','fluent_def',3,'p_fluent_def','tsalparser.py',406),
+  ('fluent_def -> LPAREN NAME typed_variables_lst bounds_def RPAREN','fluent_def',5,'p_fluent_def','tsalparser.py',407),
+  ('bounds_def -> BOUNDS_KEY num num POS_INTEGER','bounds_def',4,'p_bounds_def','tsalparser.py',420),
+  ('num -> POS_INTEGER','num',1,'p_num','tsalparser.py',424),
+  ('num -> NEG_INTEGER','num',1,'p_num','tsalparser.py',425),
+  ('predicates_def -> LPAREN PREDICATES_KEY predicate_def_lst RPAREN','predicates_def',4,'p_predicates_def','tsalparser.py',429),
+  ('predicate_def_lst -> predicate_def_lst predicate_def','predicate_def_lst',2,'p_predicate_def_lst','tsalparser.py',434),
+  ('predicate_def_lst -> predicate_def','predicate_def_lst',1,'p_predicate_def_lst','tsalparser.py',435),
+  ('predicate_def -> LPAREN NAME typed_variables_lst RPAREN','predicate_def',4,'p_predicate_def','tsalparser.py',444),
+  ('predicate_def -> LPAREN NAME variables_lst RPAREN','predicate_def',4,'p_predicate_def','tsalparser.py',445),
+  ('predicate_def -> LPAREN NAME RPAREN','predicate_def',3,'p_predicate_def','tsalparser.py',446),
+  ('derived_predicates_def -> LPAREN DERIVED_PREDICATES_KEY derived_def_lst RPAREN','derived_predicates_def',4,'p_derived_predicates_def','tsalparser.py',455),
+  ('derived_predicates_def -> LPAREN DERIVED_PREDICATES_KEY RPAREN','derived_predicates_def',3,'p_derived_predicates_def','tsalparser.py',456),
+  ('derived_def_lst -> <empty>','derived_def_lst',0,'p_derived_def_lst','tsalparser.py',463),
+  ('derived_def_lst -> derived_def_lst derived_def','derived_def_lst',2,'p_derived_def_lst','tsalparser.py',464),
+  ('derived_def -> LPAREN DERIVED_KEY predicate_def derived_def_body RPAREN','derived_def',5,'p_derived_def','tsalparser.py',473),
+  ('derived_def -> LPAREN DERIVED_KEY fluent_def derived_def_body RPAREN','derived_def',5,'p_derived_def','tsalparser.py',474),
+  ('derived_def_body -> LPAREN AND_KEY fluent_predicate_def_lst RPAREN','derived_def_body',4,'p_derived_def_body','tsalparser.py',480),
+  ('fluent_predicate_def_lst -> <empty>','fluent_predicate_def_lst',0,'p_fluent_predicate_def_lst','tsalparser.py',486),
+  ('fluent_predicate_def_lst -> expression fluent_predicate_def_lst','fluent_predicate_def_lst',2,'p_fluent_predicate_def_lst','tsalparser.py',487),
+  ('fluent_predicate_def_lst -> literal fluent_predicate_def_lst','fluent_predicate_def_lst',2,'p_fluent_predicate_def_lst','tsalparser.py',488),
+  ('processes_def -> LPAREN PROCESSES_KEY processes_def_lst RPAREN','processes_def',4,'p_processes_def','tsalparser.py',497),
+  ('processes_def_lst -> <empty>','processes_def_lst',0,'p_processes_def_lst','tsalparser.py',502),
+  ('processes_def_lst -> processes_def_lst process_def','processes_def_lst',2,'p_processes_def_lst','tsalparser.py',503),
+  ('process_def -> LPAREN EQUALS NAME expression RPAREN','process_def',5,'p_process_def','tsalparser.py',512),
+  ('actions_def -> LPAREN ACTIONS_KEY action_def_lst RPAREN','actions_def',4,'p_actions_def','tsalparser.py',519),
+  ('action_def_lst -> <empty>','action_def_lst',0,'p_action_def_lst','tsalparser.py',524),
+  ('action_def_lst -> action_def_lst action_def','action_def_lst',2,'p_action_def_lst','tsalparser.py',525),
+  ('action_def -> LPAREN ACTION_KEY NAME parameters_def action_def_body RPAREN','action_def',6,'p_action_def','tsalparser.py',533),
+  ('action_def -> LPAREN ACTION_KEY NAME parameters_def duration_def action_def_body RPAREN','action_def',7,'p_action_def','tsalparser.py',534),
+  ('event_def -> LPAREN EVENT_KEY NAME parameters_def event_def_body RPAREN','event_def',6,'p_event_def','tsalparser.py',581),
+  ('event_def -> LPAREN EVENT_KEY NAME parameters_def duration_def event_def_body RPAREN','event_def',7,'p_event_def','tsalparser.py',582),
+  ('events_def -> LPAREN EVENTS_KEY event_def_lst RPAREN','events_def',4,'p_events_def','tsalparser.py',593),
+  ('event_def_lst -> <empty>','event_def_lst',0,'p_event_def_lst','tsalparser.py',598),
+  ('event_def_lst -> event_def_lst event_def','event_def_lst',2,'p_event_def_lst','tsalparser.py',599),
+  ('parameters_def -> PARAMETERS_KEY LPAREN typed_variables_lst RPAREN','parameters_def',4,'p_parameters_def','tsalparser.py',607),
+  ('parameters_def -> PARAMETERS_KEY LPAREN variables_lst RPAREN','parameters_def',4,'p_parameters_def','tsalparser.py',608),
+  ('parameters_def -> PARAMETERS_KEY LPAREN RPAREN','parameters_def',3,'p_parameters_def','tsalparser.py',609),
+  ('action_def_body -> precond_def effects_def','action_def_body',2,'p_action_def_body','tsalparser.py',617),
+  ('event_def_body -> precond_def effects_def','event_def_body',2,'p_event_def_body','tsalparser.py',622),
+  ('event_def_body -> precond_def frequency_def effects_def','event_def_body',3,'p_event_def_body','tsalparser.py',623),
+  ('precond_def -> PRECONDITION_KEY LPAREN AND_KEY literals_lst RPAREN','precond_def',5,'p_precond_def','tsalparser.py',631),
+  ('precond_def -> PRECONDITION_KEY literal','precond_def',2,'p_precond_def','tsalparser.py',632),
+  ('precond_def -> PRECONDITION_KEY expression','precond_def',2,'p_precond_def','tsalparser.py',633),
+  ('precond_def -> PRECONDITION_KEY LPAREN RPAREN','precond_def',3,'p_precond_def','tsalparser.py',634),
+  ('effects_def -> EFFECT_KEY effect_body','effects_def',2,'p_effects_def','tsalparser.py',644),
+  ('effects_def -> EFFECT_KEY forall','effects_def',2,'p_effects_def','tsalparser.py',645),
+  ('effects_def -> EFFECT_KEY when_body','effects_def',2,'p_effects_def','tsalparser.py',646),
+  ('effects_def -> EFFECT_KEY LPAREN AND_KEY forall_body RPAREN','effects_def',5,'p_effects_def','tsalparser.py',647),
+  ('effect_body -> LPAREN RPAREN','effect_body',2,'p_effect_body','tsalparser.py',658),
+  ('effect_body -> LPAREN NAME unlabeled_effect RPAREN','effect_body',4,'p_effect_body','tsalparser.py',659),
+  ('effect_body -> effect_body LPAREN NAME unlabeled_effect RPAREN','effect_body',5,'p_effect_body','tsalparser.py',660),
+  ('effect_body -> unlabeled_effect','effect_body',1,'p_effect_body','tsalparser.py',661),
+  ('forall_body -> forall forall_body','forall_body',2,'p_forall_body','tsalparser.py',672),
+  ('forall_body -> forall','forall_body',1,'p_forall_body','tsalparser.py',673),
+  ('forall_body -> effect forall_body','forall_body',2,'p_forall_body','tsalparser.py',674),
+  ('forall_body -> effect','forall_body',1,'p_forall_body','tsalparser.py',675),
+  ('when_body -> LPAREN WHEN_KEY when_pre when_eff RPAREN','when_body',5,'p_when_body','tsalparser.py',682),
+  ('forall -> LPAREN FORALL_KEY LPAREN typed_variables_lst RPAREN when_body RPAREN','forall',7,'p_forall','tsalparser.py',687),
+  ('when_pre -> LPAREN AND_KEY literals_lst RPAREN','when_pre',4,'p_when_pre','tsalparser.py',691),
+  ('when_pre -> literal','when_pre',1,'p_when_pre','tsalparser.py',692),
+  ('when_eff -> LPAREN AND_KEY literals_lst RPAREN','when_eff',4,'p_when_eff','tsalparser.py',699),
+  ('when_eff -> literal','when_eff',1,'p_when_eff','tsalparser.py',700),
+  ('frequency_def -> INTERARRIVAL_KEY LPAREN NAME NAME DECIMAL RPAREN','frequency_def',6,'p_frequency_def','tsalparser.py',709),
+  ('frequency_def -> INTERARRIVAL_KEY LPAREN RPAREN','frequency_def',3,'p_frequency_def','tsalparser.py',710),
+  ('unlabeled_effect -> LPAREN ONEOF_KEY effect_body RPAREN','unlabeled_effect',4,'p_unlabeled_effect','tsalparser.py',717),
+  ('unlabeled_effect -> deterministic_effect unlabeled_effect','unlabeled_effect',2,'p_unlabeled_effect','tsalparser.py',718),
+  ('unlabeled_effect -> deterministic_effect','unlabeled_effect',1,'p_unlabeled_effect','tsalparser.py',719),
+  ('deterministic_effect -> LPAREN AND_KEY effects_lst RPAREN','deterministic_effect',4,'p_deterministic_effect','tsalparser.py',729),
+  ('deterministic_effect -> effects_lst','deterministic_effect',1,'p_deterministic_effect','tsalparser.py',730),
+  ('when_effects -> when_if when_then','when_effects',2,'p_when_effects','tsalparser.py',737),
+  ('when_if -> simple_effect','when_if',1,'p_when_if','tsalparser.py',743),
+  ('when_if -> LPAREN AND_KEY simple_effects_lst RPAREN','when_if',4,'p_when_if','tsalparser.py',744),
+  ('when_then -> simple_effect','when_then',1,'p_when_then','tsalparser.py',752),
+  ('when_then -> LPAREN AND_KEY simple_effects_lst RPAREN','when_then',4,'p_when_then','tsalparser.py',753),
+  ('effects_lst -> <empty>','effects_lst',0,'p_effects_lst','tsalparser.py',761),
+  ('effects_lst -> effects_lst effect','effects_lst',2,'p_effects_lst','tsalparser.py',762),
+  ('simple_effects_lst -> simple_effects_lst simple_effect','simple_effects_lst',2,'p_simple_effects_lst','tsalparser.py',771),
+  ('simple_effects_lst -> simple_effect','simple_effects_lst',1,'p_simple_effects_lst','tsalparser.py',772),
+  ('effect -> literal','effect',1,'p_effect','tsalparser.py',780),
+  ('effect -> expression','effect',1,'p_effect','tsalparser.py',781),
+  ('effect -> LPAREN PROBABILISTIC_KEY PROBABILITY literal RPAREN','effect',5,'p_effect','tsalparser.py',782),
+  ('effect -> LPAREN WHEN_KEY when_effects RPAREN','effect',4,'p_effect','tsalparser.py',783),
+  ('simple_effect -> literal','simple_effect',1,'p_simple_effect','tsalparser.py',792),
+  ('duration_def -> DURATION_KEY LPAREN expression RPAREN','duration_def',4,'p_duration_def','tsalparser.py',798),
+  ('duration_def -> DURATION_KEY LPAREN RPAREN','duration_def',3,'p_duration_def','tsalparser.py',799),
+  ('expression_body -> fluent_def','expression_body',1,'p_expression_body','tsalparser.py',812),
+  ('expression_body -> expression','expression_body',1,'p_expression_body','tsalparser.py',813),
+  ('expression_body_list -> expression_body expression_body','expression_body_list',2,'p_expression_body_list','tsalparser.py',817),
+  ('expression -> PLUS expression_body_list','expression',2,'p_expression','tsalparser.py',821),
+  ('expression -> HYPHEN expression_body_list','expression',2,'p_expression','tsalparser.py',822),
+  ('expression -> TIMES expression_body_list','expression',2,'p_expression','tsalparser.py',823),
+  ('expression -> DIVIDE expression_body_list','expression',2,'p_expression','tsalparser.py',824),
+  ('expression -> GT expression_body_list','expression',2,'p_expression','tsalparser.py',825),
+  ('expression -> GTEQ expression_body_list','expression',2,'p_expression','tsalparser.py',826),
+  ('expression -> LT expression_body_list','expression',2,'p_expression','tsalparser.py',827),
+  ('expression -> LTEQ expression_body_list','expression',2,'p_expression','tsalparser.py',828),
+  ('expression -> EQUALS expression_body_list','expression',2,'p_expression','tsalparser.py',829),
+  ('expression -> NEQ expression_body_list','expression',2,'p_expression','tsalparser.py',830),
+  ('expression -> MOD expression_body_list','expression',2,'p_expression','tsalparser.py',831),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression','tsalparser.py',832),
+  ('expression -> DECIMAL','expression',1,'p_expression','tsalparser.py',833),
+  ('expression -> PROBABILITY','expression',1,'p_expression','tsalparser.py',834),
+  ('expression -> VARIABLE','expression',1,'p_expression','tsalparser.py',835),
+  ('expression -> POS_INTEGER','expression',1,'p_expression','tsalparser.py',836),
+  ('expression -> NEG_INTEGER','expression',1,'p_expression','tsalparser.py',837),
+  ('expression -> NAME','expression',1,'p_expression','tsalparser.py',838),
+  ('literals_lst -> literals_lst literal','literals_lst',2,'p_literals_lst','tsalparser.py',850),
+  ('literals_lst -> literals_lst expression','literals_lst',2,'p_literals_lst','tsalparser.py',851),
+  ('literals_lst -> literal','literals_lst',1,'p_literals_lst','tsalparser.py',852),
+  ('literals_lst -> expression','literals_lst',1,'p_literals_lst','tsalparser.py',853),
+  ('literals_lst -> literals_lst or_literal','literals_lst',2,'p_literals_lst','tsalparser.py',854),
+  ('literals_lst -> or_literal','literals_lst',1,'p_literals_lst','tsalparser.py',855),
+  ('or_literal -> LPAREN OR_KEY literals_lst RPAREN','or_literal',4,'p_or_literal','tsalparser.py',865),
+  ('literal -> LPAREN NOT_KEY predicate RPAREN','literal',4,'p_literal','tsalparser.py',872),
+  ('literal -> predicate','literal',1,'p_literal','tsalparser.py',873),
+  ('ground_predicates_lst -> ground_predicates_lst ground_predicate','ground_predicates_lst',2,'p_ground_predicates_lst','tsalparser.py',881),
+  ('ground_predicates_lst -> ground_predicate','ground_predicates_lst',1,'p_ground_predicates_lst','tsalparser.py',882),
+  ('ground_predicate -> LPAREN NAME constants_lst RPAREN','ground_predicate',4,'p_ground_predicate','tsalparser.py',891),
+  ('ground_predicate -> LPAREN NAME RPAREN','ground_predicate',3,'p_ground_predicate','tsalparser.py',892),
+  ('ground_predicate -> ground_fluent','ground_predicate',1,'p_ground_predicate','tsalparser.py',893),
+  ('ground_fluent -> LPAREN EQUALS ground_fluent_def NAME RPAREN','ground_fluent',5,'p_ground_fluent','tsalparser.py',904),
+  ('ground_fluent -> LPAREN EQUALS ground_fluent_def POS_INTEGER RPAREN','ground_fluent',5,'p_ground_fluent','tsalparser.py',905),
+  ('ground_fluent -> LPAREN EQUALS ground_fluent_def NEG_INTEGER RPAREN','ground_fluent',5,'p_ground_fluent','tsalparser.py',906),
+  ('ground_fluent_def -> LPAREN NAME constants_lst RPAREN','ground_fluent_def',4,'p_ground_fluent_def','tsalparser.py',911),
+  ('ground_fluent_def -> LPAREN NAME RPAREN','ground_fluent_def',3,'p_ground_fluent_def','tsalparser.py',912),
+  ('predicate -> LPAREN NAME variables_lst RPAREN','predicate',4,'p_predicate','tsalparser.py',919),
+  ('predicate -> LPAREN EQUALS VARIABLE VARIABLE RPAREN','predicate',5,'p_predicate','tsalparser.py',920),
+  ('predicate -> LPAREN NAME RPAREN','predicate',3,'p_predicate','tsalparser.py',921),
+  ('predicate -> LPAREN NAME constants_lst RPAREN','predicate',4,'p_predicate','tsalparser.py',922),
+  ('typed_constants_lst -> typed_constants_lst constants_lst HYPHEN type','typed_constants_lst',4,'p_typed_constants_lst','tsalparser.py',935),
+  ('typed_constants_lst -> constants_lst HYPHEN type','typed_constants_lst',3,'p_typed_constants_lst','tsalparser.py',936),
+  ('typed_variables_lst -> typed_variables_lst variables_lst HYPHEN type','typed_variables_lst',4,'p_typed_variables_lst','tsalparser.py',945),
+  ('typed_variables_lst -> variables_lst HYPHEN type','typed_variables_lst',3,'p_typed_variables_lst','tsalparser.py',946),
+  ('constants_lst -> constants_lst constant','constants_lst',2,'p_constants_lst','tsalparser.py',955),
+  ('constants_lst -> constant','constants_lst',1,'p_constants_lst','tsalparser.py',956),
+  ('variables_lst -> variables_lst variable','variables_lst',2,'p_variables_lst','tsalparser.py',965),
+  ('variables_lst -> variable','variables_lst',1,'p_variables_lst','tsalparser.py',966),
+  ('variables_lst -> NAME','variables_lst',1,'p_variables_lst','tsalparser.py',967),
+  ('variables_lst -> variables_lst NAME','variables_lst',2,'p_variables_lst','tsalparser.py',968),
+  ('names_lst -> names_lst NAME','names_lst',2,'p_names_lst','tsalparser.py',977),
+  ('names_lst -> NAME','names_lst',1,'p_names_lst','tsalparser.py',978),
+  ('type -> NAME','type',1,'p_type','tsalparser.py',987),
+  ('constant -> NAME','constant',1,'p_constant','tsalparser.py',992),
+  ('constant -> POS_INTEGER','constant',1,'p_constant','tsalparser.py',993),
+  ('constant -> NEG_INTEGER','constant',1,'p_constant','tsalparser.py',994),
+  ('variable -> VARIABLE','variable',1,'p_variable','tsalparser.py',999),
+  ('problem -> plan_problem','problem',1,'p_problem','tsalparser.py',1007),
+  ('plan_problem -> LPAREN DEFINE_KEY plan_problem_def problem_section_lst RPAREN','plan_problem',5,'p_plan_problem','tsalparser.py',1021),
+  ('problem_section_lst -> problem_section_lst problem_section','problem_section_lst',2,'p_problem_section_lst','tsalparser.py',1039),
+  ('problem_section_lst -> problem_section','problem_section_lst',1,'p_problem_section_lst','tsalparser.py',1040),
+  ('problem_section -> domain_def','problem_section',1,'p_problem_section','tsalparser.py',1049),
+  ('problem_section -> objects_def','problem_section',1,'p_problem_section','tsalparser.py',1050),
+  ('problem_section -> init_def','problem_section',1,'p_problem_section','tsalparser.py',1051),
+  ('problem_section -> timed_inits_def','problem_section',1,'p_problem_section','tsalparser.py',1052),
+  ('problem_section -> goal_def','problem_section',1,'p_problem_section','tsalparser.py',1053),
+  ('problem_section -> metric_def','problem_section',1,'p_problem_section','tsalparser.py',1054),
+  ('plan_problem_def -> LPAREN PROBLEM_KEY NAME RPAREN','plan_problem_def',4,'p_plan_problem_def','tsalparser.py',1059),
+  ('objects_def -> LPAREN OBJECTS_KEY typed_constants_lst RPAREN','objects_def',4,'p_objects_def','tsalparser.py',1064),
+  ('objects_def -> LPAREN OBJECTS_KEY constants_lst RPAREN','objects_def',4,'p_objects_def','tsalparser.py',1065),
+  ('init_def -> LPAREN INIT_KEY LPAREN AND_KEY ground_predicates_lst RPAREN RPAREN','init_def',7,'p_init_def','tsalparser.py',1070),
+  ('init_def -> LPAREN INIT_KEY ground_predicates_lst RPAREN','init_def',4,'p_init_def','tsalparser.py',1071),
+  ('init_def -> LPAREN INIT_KEY RPAREN','init_def',3,'p_init_def','tsalparser.py',1072),
+  ('timed_inits_def -> LPAREN TIMED_INIT_KEY timed_init_lst RPAREN','timed_inits_def',4,'p_timed_inits_def','tsalparser.py',1084),
+  ('timed_init_lst -> <empty>','timed_init_lst',0,'p_timed_init_lst','tsalparser.py',1089),
+  ('timed_init_lst -> timed_init_lst timed_init_def','timed_init_lst',2,'p_timed_init_lst','tsalparser.py',1090),
+  ('timed_init_def -> LPAREN AT_KEY DECIMAL literal RPAREN','timed_init_def',5,'p_timed_init_def','tsalparser.py',1099),
+  ('goal_body_def -> LPAREN AND_KEY literals_lst RPAREN','goal_body_def',4,'p_goal_body_def','tsalparser.py',1106),
+  ('goal_body_def_lst -> goal_body_def_lst goal_body_def','goal_body_def_lst',2,'p_goal_body_def_lst','tsalparser.py',1110),
+  ('goal_body_def_lst -> goal_body_def','goal_body_def_lst',1,'p_goal_body_def_lst','tsalparser.py',1111),
+  ('goal_def -> LPAREN GOAL_KEY goal_body_def RPAREN','goal_def',4,'p_goal_def','tsalparser.py',1119),
+  ('goal_def -> LPAREN GOAL_KEY literal RPAREN','goal_def',4,'p_goal_def','tsalparser.py',1120),
+  ('goal_def -> LPAREN GOAL_KEY LPAREN ONEOF_KEY effect_body RPAREN RPAREN','goal_def',7,'p_goal_def','tsalparser.py',1121),
+  ('goal_def -> LPAREN GOAL_KEY LPAREN OR_KEY goal_body_def_lst RPAREN RPAREN','goal_def',7,'p_goal_def','tsalparser.py',1122),
+  ('metric_def -> LPAREN METRIC_KEY NAME fluent_def RPAREN','metric_def',5,'p_metric_def','tsalparser.py',1135),
+]
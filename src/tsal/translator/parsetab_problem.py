@@ -0,0 +1,238 @@
+
+# parsetab_problem.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'problemleftPLUSHYPHENleftTIMESDIVIDEACTIONS_KEY ACTION_KEY AND_KEY AT_KEY BOUNDS_KEY CONSTANTS_KEY DECIMAL DEFINE_KEY DERIVED_KEY DERIVED_PREDICATES_KEY DIVIDE DOMAIN_KEY DURATION_KEY EFFECT_KEY EQUALS EVENTS_KEY EVENT_KEY FLUENTS_KEY FORALL_KEY GOAL_KEY GT GTEQ HYPHEN INIT_KEY INTERARRIVAL_KEY LPAREN LT LTEQ METRIC_KEY MOD NAME NEG_INTEGER NEQ NOT_KEY OBJECTS_KEY ONEOF_KEY OR_KEY PARAMETERS_KEY PLUS POS_INTEGER PRECONDITION_KEY PREDICATES_KEY PROBABILISTIC_KEY PROBABILITY PROBLEM_KEY PROCESSES_KEY REQUIREMENTS_KEY RPAREN TIMED_INIT_KEY TIMES TYPES_KEY VARIABLE WHEN_KEYtsal : domain\n            | problem\n            | domain problemdomain : LPAREN DEFINE_KEY domain_def domain_section_lst RPARENdomain_section_lst : domain_section_lst domain_section\n                          | domain_sectiondomain_section : requirements_def\n                      | types_def\n                      | constants_def\n                      | fluents_def\n                      | predicates_def\n                      | derived_predicates_def\n                      | processes_def\n                      | actions_def\n                      | events_defdomain_def : LPAREN DOMAIN_KEY NAME RPARENrequirements_def : LPAREN REQUIREMENTS_KEY requirements_lst RPAREN\n                        | LPAREN REQUIREMENTS_KEY RPARENrequirements_lst :  requirement_def requirements_lst\n                        |  requirement_defrequirement_def : NAMEtypes_def : LPAREN TYPES_KEY typed_names_lst RPARENconstants_def : LPAREN CONSTANTS_KEY typed_names_lst RPAREN\n                     | LPAREN CONSTANTS_KEY RPARENtyped_names_lst : names_lst HYPHEN type typed_names_lst\n                       | names_lst HYPHEN type\n                       | names_lstfluents_def : LPAREN FLUENTS_KEY fluent_def_lst RPARENfluent_def_lst : fluent_def_lst fluent_def\n                      | fluent_deffluent_def : LPAREN NAME typed_variables_lst RPAREN\n                  | LPAREN NAME variables_lst RPAREN\n                  | LPAREN NAME RPAREN\n                  | fluent_def HYPHEN type\n                  |  LPAREN NAME typed_variables_lst bounds_def RPARENbounds_def : BOUNDS_KEY num num POS_INTEGERnum : POS_INTEGER\n            | NEG_INTEGERpredicates_def : LPAREN PREDICATES_KEY predicate_def_lst RPARENpredicate_def_lst : predicate_def_lst predicate_def\n                         | predicate_defpredicate_def : LPAREN NAME typed_variables_lst RPAREN\n                     | LPAREN NAME variables_lst RPAREN\n                     | LPAREN NAME RPARENderived_predicates_def : LPAREN DERIVED_PREDICATES_KEY derived_def_lst RPAREN\n                               | LPAREN DERIVED_PREDICATES_KEY RPARENderived_def_lst :\n                       | derived_def_lst derived_defderived_def : LPAREN DERIVED_KEY predicate_def derived_def_body RPAREN\n                    | LPAREN DERIVED_KEY fluent_def derived_def_body RPARENderived_def_body : LPAREN AND_KEY fluent_predicate_def_lst RPARENfluent_predicate_def_lst :\n                                | expression fluent_predicate_def_lst\n                                | literal fluent_predicate_def_lstprocesses_def : LPAREN PROCESSES_KEY processes_def_lst RPARENprocesses_def_lst :\n                         | processes_def_lst process_defprocess_def : LPAREN EQUALS NAME expression RPARENactions_def : LPAREN ACTIONS_KEY action_def_lst RPARENaction_def_lst :\n                      | action_def_lst action_defaction_def : LPAREN ACTION_KEY NAME parameters_def action_def_body RPAREN\n                  | LPAREN ACTION_KEY NAME parameters_def duration_def action_def_body RPARENevent_def : LPAREN EVENT_KEY NAME parameters_def event_def_body RPAREN\n                 | LPAREN EVENT_KEY NAME parameters_def duration_def event_def_body RPARENevents_def : LPAREN EVENTS_KEY event_def_lst RPARENevent_def_lst :\n                     | event_def_lst event_defparameters_def : PARAMETERS_KEY LPAREN typed_variables_lst RPAREN\n                      | PARAMETERS_KEY LPAREN variables_lst RPAREN\n                      | PARAMETERS_KEY LPAREN RPARENaction_def_body : precond_def effects_defevent_def_body : precond_def effects_def\n                      | precond_def frequency_def effects_defprecond_def : PRECONDITION_KEY LPAREN AND_KEY literals_lst RPAREN\n                   | PRECONDITION_KEY literal\n                   | PRECONDITION_KEY expression\n                   | PRECONDITION_KEY LPAREN RPARENeffects_def : EFFECT_KEY effect_body\n                    | EFFECT_KEY forall\n                    | EFFECT_KEY when_body\n                    | EFFECT_KEY LPAREN AND_KEY forall_body RPAREN effect_body : LPAREN RPAREN\n                    | LPAREN NAME unlabeled_effect RPAREN\n                    | effect_body LPAREN NAME unlabeled_effect RPAREN\n                    | unlabeled_effectforall_body : forall forall_body\n                   | forall\n                   | effect forall_body\n                   | effectwhen_body : LPAREN WHEN_KEY when_pre when_eff RPARENforall : LPAREN FORALL_KEY LPAREN typed_variables_lst RPAREN when_body RPARENwhen_pre : LPAREN AND_KEY literals_lst RPAREN\n                | literalwhen_eff : LPAREN AND_KEY literals_lst RPAREN\n                | literalfrequency_def : INTERARRIVAL_KEY LPAREN NAME NAME DECIMAL RPAREN\n                     | INTERARRIVAL_KEY LPAREN RPARENunlabeled_effect : LPAREN ONEOF_KEY effect_body RPAREN\n                        | deterministic_effect unlabeled_effect\n                        | deterministic_effectdeterministic_effect : LPAREN AND_KEY effects_lst RPAREN\n                            | effects_lstwhen_effects : when_if when_then when_if : simple_effect\n                | LPAREN AND_KEY simple_effects_lst RPARENwhen_then : simple_effect\n                 | LPAREN AND_KEY simple_effects_lst RPARENeffects_lst :\n                   | effects_lst effectsimple_effects_lst : simple_effects_lst simple_effect\n                          | simple_effecteffect : literal\n              | expression\n              | LPAREN PROBABILISTIC_KEY PROBABILITY literal RPAREN\n              | LPAREN WHEN_KEY when_effects RPARENsimple_effect : literalduration_def : DURATION_KEY LPAREN expression RPAREN\n                    | DURATION_KEY LPAREN RPARENexpression_body : fluent_def\n                       | expressionexpression_body_list : expression_body expression_bodyexpression : PLUS expression_body_list\n                  | HYPHEN expression_body_list\n                  | TIMES expression_body_list\n                  | DIVIDE expression_body_list\n                  | GT expression_body_list\n                  | GTEQ expression_body_list\n                  | LT expression_body_list\n                  | LTEQ expression_body_list\n                  | EQUALS expression_body_list\n                  | NEQ expression_body_list\n                  | MOD expression_body_list\n                  | LPAREN expression RPAREN\n                  | DECIMAL\n                  | PROBABILITY\n                  | VARIABLE\n                  | POS_INTEGER\n                  | NEG_INTEGER\n                  | NAMEliterals_lst : literals_lst literal\n                    | literals_lst expression\n                    | literal\n                    | expression\n                    | literals_lst or_literal\n                    | or_literalor_literal : LPAREN OR_KEY literals_lst RPARENliteral : LPAREN NOT_KEY predicate RPAREN\n               | predicateground_predicates_lst : ground_predicates_lst ground_predicate\n                             | ground_predicateground_predicate : LPAREN NAME constants_lst RPAREN\n                        | LPAREN NAME RPAREN\n                        | ground_fluentground_fluent : LPAREN EQUALS ground_fluent_def NAME RPAREN\n                     | LPAREN EQUALS ground_fluent_def POS_INTEGER RPAREN\n                     | LPAREN EQUALS ground_fluent_def NEG_INTEGER RPARENground_fluent_def : LPAREN NAME constants_lst RPAREN\n                         | LPAREN NAME RPARENpredicate : LPAREN NAME variables_lst RPAREN\n                 | LPAREN EQUALS VARIABLE VARIABLE RPAREN\n                 | LPAREN NAME RPAREN\n                 | LPAREN NAME constants_lst RPARENtyped_constants_lst : typed_constants_lst constants_lst HYPHEN type\n                           | constants_lst HYPHEN typetyped_variables_lst : typed_variables_lst variables_lst HYPHEN type\n                           | variables_lst HYPHEN typeconstants_lst : constants_lst constant\n                     | constantvariables_lst : variables_lst variable\n                     | variable\n                     | NAME\n                     | variables_lst NAMEnames_lst : names_lst NAME\n                 | NAMEtype : NAMEconstant : NAME\n                | POS_INTEGER\n                | NEG_INTEGERvariable : VARIABLEproblem : plan_problemplan_problem : LPAREN DEFINE_KEY plan_problem_def problem_section_lst RPARENproblem_section_lst : problem_section_lst problem_section\n                           | problem_sectionproblem_section : domain_def\n                       | objects_def\n                       | init_def\n                       | timed_inits_def\n                       | goal_def\n                       | metric_defplan_problem_def : LPAREN PROBLEM_KEY NAME RPARENobjects_def : LPAREN OBJECTS_KEY typed_constants_lst RPAREN\n                   | LPAREN OBJECTS_KEY constants_lst RPARENinit_def : LPAREN INIT_KEY LPAREN AND_KEY ground_predicates_lst RPAREN RPAREN\n                | LPAREN INIT_KEY ground_predicates_lst RPAREN\n                | LPAREN INIT_KEY RPARENtimed_inits_def : LPAREN TIMED_INIT_KEY timed_init_lst RPARENtimed_init_lst :\n                      | timed_init_lst timed_init_deftimed_init_def : LPAREN AT_KEY DECIMAL literal RPARENgoal_body_def : LPAREN AND_KEY literals_lst RPARENgoal_body_def_lst : goal_body_def_lst goal_body_def\n                         | goal_body_defgoal_def : LPAREN GOAL_KEY goal_body_def RPAREN\n                | LPAREN GOAL_KEY literal RPAREN\n                | LPAREN GOAL_KEY LPAREN ONEOF_KEY effect_body RPAREN RPAREN\n                | LPAREN GOAL_KEY LPAREN OR_KEY goal_body_def_lst RPAREN RPARENmetric_def : LPAREN METRIC_KEY NAME fluent_def RPAREN'
+    
+_lr_action_items = {'LPAREN':([0,4,6,9,10,11,12,13,14,15,16,20,21,22,25,26,35,36,37,38,39,43,44,45,46,48,51,53,55,56,58,59,60,61,62,63,66,67,72,73,75,80,81,82,83,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,119,123,128,129,130,131,132,135,137,138,139,140,142,143,145,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,171,175,177,178,181,182,183,187,188,189,190,192,193,194,195,196,197,199,200,204,207,208,209,210,212,215,216,217,218,219,225,227,228,234,235,236,237,239,240,241,],[3,5,8,8,-184,-185,-186,-187,-188,-189,-190,34,-198,40,-183,-191,54,-196,-151,-154,57,-149,68,-16,-192,-193,54,76,-195,-150,-197,-199,79,84,87,109,-204,-205,-176,54,-153,133,-86,136,140,84,-203,143,87,-143,-144,-146,156,156,156,156,156,156,156,156,156,156,156,-135,-136,-137,-138,-139,-140,-162,-208,-152,184,-83,136,79,-109,-100,-110,-113,-114,143,-202,143,87,156,-201,-141,-142,-145,-123,156,-120,-121,143,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-33,-34,-194,-155,-156,-157,133,140,136,-206,213,-207,-134,87,-137,-122,-161,-31,-32,-200,-84,-99,-102,184,231,-105,-117,-147,-35,-85,184,-116,-115,184,-112,184,-106,-111,184,]),'$end':([1,2,24,],[0,-181,-182,]),'DEFINE_KEY':([3,],[4,]),'PROBLEM_KEY':([5,],[7,]),'NAME':([7,18,19,23,28,29,30,31,32,33,34,40,43,47,49,50,52,54,60,62,64,68,70,71,72,74,76,77,79,82,83,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,111,112,113,114,115,116,118,120,121,124,130,131,132,133,137,138,139,140,143,145,146,147,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,173,174,175,176,177,179,180,184,188,189,194,195,196,197,198,199,200,202,204,205,206,210,213,218,219,220,224,228,231,232,234,],[17,27,31,44,31,31,-169,-177,-178,-179,52,64,-149,31,72,-168,31,52,-109,108,111,118,72,-165,-176,31,124,125,130,-109,108,146,108,-143,-144,-146,108,108,108,108,108,108,108,108,108,108,108,-135,-136,-137,-138,-139,-140,64,-172,168,-162,31,-171,-180,173,72,-164,31,-109,-109,-109,189,-110,-113,-114,146,108,108,111,108,-141,-142,-145,-123,108,-120,-121,198,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-173,-160,-170,-163,-172,173,-33,168,-34,31,-159,64,108,-109,-134,108,-137,-122,173,-161,-31,168,-32,72,-158,-102,64,-147,-35,72,-167,-116,64,-166,-115,]),'DOMAIN_KEY':([8,],[18,]),'OBJECTS_KEY':([8,],[19,]),'INIT_KEY':([8,],[20,]),'TIMED_INIT_KEY':([8,],[21,]),'GOAL_KEY':([8,],[22,]),'METRIC_KEY':([8,],[23,]),'RPAREN':([9,10,11,12,13,14,15,16,17,20,21,25,27,28,29,30,31,32,33,35,36,37,38,39,41,42,43,45,46,48,50,52,55,56,58,59,60,64,66,67,69,71,72,73,74,75,79,80,81,82,83,85,86,88,89,90,91,103,104,105,106,107,108,110,111,112,113,114,115,116,118,119,121,122,123,124,125,126,127,129,130,131,132,134,135,137,138,139,141,142,144,146,148,149,150,151,152,154,155,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,181,182,183,185,186,187,188,189,190,193,194,195,197,198,199,200,201,204,207,208,209,210,211,214,217,218,219,224,225,226,228,229,230,232,234,235,236,238,240,241,242,],[24,-184,-185,-186,-187,-188,-189,-190,26,36,-198,-183,45,46,48,-169,-177,-178,-179,55,-196,-151,-154,58,66,67,-149,-16,-192,-193,-168,75,-195,-150,-197,-199,-109,113,-204,-205,119,-165,-176,122,123,-153,129,134,-86,-101,-103,141,-203,148,-143,-144,-146,-135,-136,-137,-138,-139,-140,167,-172,169,-162,171,-171,-180,175,-208,-164,178,-152,180,181,182,183,-83,-109,-109,-109,190,-100,-110,-113,-114,193,-202,194,113,-201,-141,-142,-145,-123,-120,-121,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-173,-160,-170,-163,199,-172,200,-33,204,-34,-194,206,-155,-156,-157,207,208,209,210,-109,-206,-207,-134,218,-122,175,-161,-31,219,-32,-200,-84,-99,-102,225,228,-117,-147,-35,-167,-85,234,-116,-104,-107,-166,-115,239,-112,-36,-111,242,-108,]),'POS_INTEGER':([19,28,29,30,31,32,33,43,47,50,52,60,62,64,71,72,74,77,82,83,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,113,114,121,124,130,131,132,137,138,139,140,143,145,146,147,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,171,175,177,179,180,188,189,194,195,196,197,199,200,203,204,206,210,218,219,221,222,223,228,233,234,],[32,32,32,-169,-177,-178,-179,-149,32,-168,32,-109,106,32,-165,-176,32,126,-109,106,106,106,-143,-144,-146,106,106,106,106,106,106,106,106,106,106,106,-135,-136,-137,-138,-139,-140,-177,-162,32,-164,32,-109,-109,-109,-110,-113,-114,106,106,106,32,106,-141,-142,-145,-123,106,-120,-121,106,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-33,-34,32,-159,106,-109,-134,106,-137,-122,-161,-31,222,-32,-158,-102,-147,-35,222,-37,-38,-116,238,-115,]),'NEG_INTEGER':([19,28,29,30,31,32,33,43,47,50,52,60,62,64,71,72,74,77,82,83,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,113,114,121,124,130,131,132,137,138,139,140,143,145,146,147,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,171,175,177,179,180,188,189,194,195,196,197,199,200,203,204,206,210,218,219,221,222,223,228,234,],[33,33,33,-169,-177,-178,-179,-149,33,-168,33,-109,107,33,-165,-176,33,127,-109,107,107,107,-143,-144,-146,107,107,107,107,107,107,107,107,107,107,107,-135,-136,-137,-138,-139,-140,-177,-162,33,-164,33,-109,-109,-109,-110,-113,-114,107,107,107,33,107,-141,-142,-145,-123,107,-120,-121,107,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-33,-34,33,-159,107,-109,-134,107,-137,-122,-161,-31,223,-32,-158,-102,-147,-35,223,-37,-38,-116,-115,]),'HYPHEN':([29,30,31,32,33,43,47,50,60,62,69,72,82,83,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,115,116,130,131,132,137,138,139,140,143,145,147,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,173,175,176,177,188,189,194,195,196,197,199,200,202,204,210,218,219,228,234,],[49,-169,-177,-178,-179,-149,70,-168,-109,93,120,-176,-109,93,93,93,-143,-144,-146,93,93,93,93,93,93,93,93,93,93,93,-135,-136,-137,-138,-139,-140,-162,-171,-180,-109,-109,-109,-110,-113,-114,93,93,93,93,-141,-142,-145,-123,93,120,-121,93,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-173,-160,-170,-163,-172,-33,205,-34,93,-109,-134,93,-137,-122,-161,-31,220,-32,-102,-147,-35,-116,-115,]),'AND_KEY':([34,40,79,84,136,213,231,],[51,62,132,62,132,227,237,]),'EQUALS':([34,40,43,54,60,62,72,82,83,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,113,130,131,132,137,138,139,140,143,145,147,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,171,175,177,184,188,189,194,195,196,197,199,200,204,210,213,218,219,228,231,234,],[53,65,-149,53,-109,100,-176,-109,100,147,100,-143,-144,-146,100,100,100,100,100,100,100,100,100,100,100,-135,-136,-137,-138,-139,-140,65,-162,-109,-109,-109,-110,-113,-114,147,100,100,100,-141,-142,-145,-123,100,-120,-121,100,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-33,-34,65,100,-109,-134,100,-137,-122,-161,-31,-32,-102,65,-147,-35,-116,65,-115,]),'ONEOF_KEY':([40,79,136,],[60,131,131,]),'OR_KEY':([40,87,],[61,145,]),'NOT_KEY':([40,87,140,184,213,231,],[63,63,63,63,63,63,]),'PLUS':([43,60,62,72,82,83,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,130,131,132,137,138,139,140,143,145,147,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,171,175,177,188,189,194,195,196,197,199,200,204,210,218,219,228,234,],[-149,-109,92,-176,-109,92,92,92,-143,-144,-146,92,92,92,92,92,92,92,92,92,92,92,-135,-136,-137,-138,-139,-140,-162,-109,-109,-109,-110,-113,-114,92,92,92,92,-141,-142,-145,-123,92,-120,-121,92,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-33,-34,92,-109,-134,92,-137,-122,-161,-31,-32,-102,-147,-35,-116,-115,]),'TIMES':([43,60,62,72,82,83,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,130,131,132,137,138,139,140,143,145,147,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,171,175,177,188,189,194,195,196,197,199,200,204,210,218,219,228,234,],[-149,-109,94,-176,-109,94,94,94,-143,-144,-146,94,94,94,94,94,94,94,94,94,94,94,-135,-136,-137,-138,-139,-140,-162,-109,-109,-109,-110,-113,-114,94,94,94,94,-141,-142,-145,-123,94,-120,-121,94,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-33,-34,94,-109,-134,94,-137,-122,-161,-31,-32,-102,-147,-35,-116,-115,]),'DIVIDE':([43,60,62,72,82,83,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,130,131,132,137,138,139,140,143,145,147,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,171,175,177,188,189,194,195,196,197,199,200,204,210,218,219,228,234,],[-149,-109,95,-176,-109,95,95,95,-143,-144,-146,95,95,95,95,95,95,95,95,95,95,95,-135,-136,-137,-138,-139,-140,-162,-109,-109,-109,-110,-113,-114,95,95,95,95,-141,-142,-145,-123,95,-120,-121,95,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-33,-34,95,-109,-134,95,-137,-122,-161,-31,-32,-102,-147,-35,-116,-115,]),'GT':([43,60,62,72,82,83,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,130,131,132,137,138,139,140,143,145,147,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,171,175,177,188,189,194,195,196,197,199,200,204,210,218,219,228,234,],[-149,-109,96,-176,-109,96,96,96,-143,-144,-146,96,96,96,96,96,96,96,96,96,96,96,-135,-136,-137,-138,-139,-140,-162,-109,-109,-109,-110,-113,-114,96,96,96,96,-141,-142,-145,-123,96,-120,-121,96,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-33,-34,96,-109,-134,96,-137,-122,-161,-31,-32,-102,-147,-35,-116,-115,]),'GTEQ':([43,60,62,72,82,83,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,130,131,132,137,138,139,140,143,145,147,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,171,175,177,188,189,194,195,196,197,199,200,204,210,218,219,228,234,],[-149,-109,97,-176,-109,97,97,97,-143,-144,-146,97,97,97,97,97,97,97,97,97,97,97,-135,-136,-137,-138,-139,-140,-162,-109,-109,-109,-110,-113,-114,97,97,97,97,-141,-142,-145,-123,97,-120,-121,97,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-33,-34,97,-109,-134,97,-137,-122,-161,-31,-32,-102,-147,-35,-116,-115,]),'LT':([43,60,62,72,82,83,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,130,131,132,137,138,139,140,143,145,147,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,171,175,177,188,189,194,195,196,197,199,200,204,210,218,219,228,234,],[-149,-109,98,-176,-109,98,98,98,-143,-144,-146,98,98,98,98,98,98,98,98,98,98,98,-135,-136,-137,-138,-139,-140,-162,-109,-109,-109,-110,-113,-114,98,98,98,98,-141,-142,-145,-123,98,-120,-121,98,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-33,-34,98,-109,-134,98,-137,-122,-161,-31,-32,-102,-147,-35,-116,-115,]),'LTEQ':([43,60,62,72,82,83,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,130,131,132,137,138,139,140,143,145,147,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,171,175,177,188,189,194,195,196,197,199,200,204,210,218,219,228,234,],[-149,-109,99,-176,-109,99,99,99,-143,-144,-146,99,99,99,99,99,99,99,99,99,99,99,-135,-136,-137,-138,-139,-140,-162,-109,-109,-109,-110,-113,-114,99,99,99,99,-141,-142,-145,-123,99,-120,-121,99,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-33,-34,99,-109,-134,99,-137,-122,-161,-31,-32,-102,-147,-35,-116,-115,]),'NEQ':([43,60,62,72,82,83,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,130,131,132,137,138,139,140,143,145,147,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,171,175,177,188,189,194,195,196,197,199,200,204,210,218,219,228,234,],[-149,-109,101,-176,-109,101,101,101,-143,-144,-146,101,101,101,101,101,101,101,101,101,101,101,-135,-136,-137,-138,-139,-140,-162,-109,-109,-109,-110,-113,-114,101,101,101,101,-141,-142,-145,-123,101,-120,-121,101,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-33,-34,101,-109,-134,101,-137,-122,-161,-31,-32,-102,-147,-35,-116,-115,]),'MOD':([43,60,62,72,82,83,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,130,131,132,137,138,139,140,143,145,147,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,171,175,177,188,189,194,195,196,197,199,200,204,210,218,219,228,234,],[-149,-109,102,-176,-109,102,102,102,-143,-144,-146,102,102,102,102,102,102,102,102,102,102,102,-135,-136,-137,-138,-139,-140,-162,-109,-109,-109,-110,-113,-114,102,102,102,102,-141,-142,-145,-123,102,-120,-121,102,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-33,-34,102,-109,-134,102,-137,-122,-161,-31,-32,-102,-147,-35,-116,-115,]),'DECIMAL':([43,60,62,72,78,82,83,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,130,131,132,137,138,139,140,143,145,147,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,171,175,177,188,189,194,195,196,197,199,200,204,210,218,219,228,234,],[-149,-109,103,-176,128,-109,103,103,103,-143,-144,-146,103,103,103,103,103,103,103,103,103,103,103,-135,-136,-137,-138,-139,-140,-162,-109,-109,-109,-110,-113,-114,103,103,103,103,-141,-142,-145,-123,103,-120,-121,103,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-33,-34,103,-109,-134,103,-137,-122,-161,-31,-32,-102,-147,-35,-116,-115,]),'PROBABILITY':([43,60,62,72,82,83,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,113,130,131,132,137,138,139,140,143,145,147,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,169,171,175,177,188,189,191,194,195,196,197,199,200,204,210,218,219,228,234,],[-149,-109,104,-176,-109,104,104,104,-143,-144,-146,104,104,104,104,104,104,104,104,104,104,104,-135,-136,-137,-138,-139,-140,-162,-109,-109,-109,-110,-113,-114,104,104,104,104,-141,-142,-145,-123,104,-120,-121,104,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-160,-163,-33,-34,104,-109,212,-134,104,-137,-122,-161,-31,-32,-102,-147,-35,-116,-115,]),'VARIABLE':([43,60,62,64,65,72,82,83,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,112,113,115,116,117,118,130,131,132,137,138,139,140,143,145,146,147,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,173,174,175,176,177,188,189,194,195,196,197,198,199,200,202,204,210,218,219,224,228,232,234,],[-149,-109,105,116,117,-176,-109,105,105,105,-143,-144,-146,105,105,105,105,105,105,105,105,105,105,105,-135,-136,-137,-138,-139,-140,-172,116,-162,-171,-180,172,116,-109,-109,-109,-110,-113,-114,105,105,105,116,196,-141,-142,-145,-123,105,-120,-121,105,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-148,-173,-160,-170,-163,-172,116,-33,116,-34,105,-109,-134,105,172,-122,116,-161,-31,116,-32,-102,-147,-35,-167,-116,-166,-115,]),'AT_KEY':([57,],[78,]),'BOUNDS_KEY':([72,174,224,232,],[-176,203,-167,-166,]),'PROBABILISTIC_KEY':([140,],[191,]),'WHEN_KEY':([140,],[192,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'problem':([0,],[1,]),'plan_problem':([0,],[2,]),'plan_problem_def':([4,],[6,]),'problem_section_lst':([6,],[9,]),'problem_section':([6,9,],[10,25,]),'domain_def':([6,9,],[11,11,]),'objects_def':([6,9,],[12,12,]),'init_def':([6,9,],[13,13,]),'timed_inits_def':([6,9,],[14,14,]),'goal_def':([6,9,],[15,15,]),'metric_def':([6,9,],[16,16,]),'typed_constants_lst':([19,],[28,]),'constants_lst':([19,28,52,64,124,146,],[29,47,74,114,179,114,]),'constant':([19,28,29,47,52,64,74,114,124,146,179,],[30,30,50,50,30,30,50,50,30,30,50,]),'ground_predicates_lst':([20,51,],[35,73,]),'ground_predicate':([20,35,51,73,],[37,56,37,56,]),'ground_fluent':([20,35,51,73,],[38,38,38,38,]),'timed_init_lst':([21,],[39,]),'goal_body_def':([22,61,85,],[41,86,142,]),'literal':([22,62,83,88,128,145,188,192,195,212,215,227,235,237,241,],[42,89,138,149,185,89,138,217,149,226,217,217,217,217,217,]),'predicate':([22,62,63,83,88,128,145,188,192,195,212,215,227,235,237,241,],[43,43,110,43,43,43,43,43,43,43,43,43,43,43,43,43,]),'timed_init_def':([39,],[59,]),'fluent_def':([44,92,93,94,95,96,97,98,99,100,101,102,147,153,],[69,154,154,154,154,154,154,154,154,154,154,154,154,154,]),'type':([49,70,120,205,220,],[71,121,177,224,232,]),'ground_fluent_def':([53,],[77,]),'effect_body':([60,131,],[80,187,]),'unlabeled_effect':([60,82,130,131,189,],[81,135,186,81,211,]),'deterministic_effect':([60,82,130,131,189,],[82,82,82,82,82,]),'effects_lst':([60,82,130,131,132,189,],[83,83,83,83,188,83,]),'goal_body_def_lst':([61,],[85,]),'literals_lst':([62,145,],[88,195,]),'expression':([62,83,87,88,92,93,94,95,96,97,98,99,100,101,102,140,143,145,147,153,156,188,195,],[90,139,144,150,155,155,155,155,155,155,155,155,155,155,155,144,144,90,155,155,144,139,150,]),'or_literal':([62,88,145,195,],[91,151,91,151,]),'variables_lst':([64,118,146,174,198,],[112,176,112,202,176,]),'variable':([64,112,118,146,174,176,198,202,],[115,170,115,115,115,170,115,170,]),'effect':([83,188,],[137,137,]),'expression_body_list':([92,93,94,95,96,97,98,99,100,101,102,147,],[152,157,158,159,160,161,162,163,164,165,166,164,]),'expression_body':([92,93,94,95,96,97,98,99,100,101,102,147,153,],[153,153,153,153,153,153,153,153,153,153,153,153,197,]),'typed_variables_lst':([118,198,],[174,174,]),'bounds_def':([174,],[201,]),'when_effects':([192,],[214,]),'when_if':([192,],[215,]),'simple_effect':([192,215,227,235,237,241,],[216,230,236,240,236,240,]),'num':([203,221,],[221,233,]),'when_then':([215,],[229,]),'simple_effects_lst':([227,237,],[235,241,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> problem","S'",1,None,None,None),
+  ('tsal -> domain','tsal',1,'p_tsal','tsalparser.py',230),
+  ('tsal -> problem','tsal',1,'p_tsal','tsalparser.py',231),
+  ('tsal -> domain problem','tsal',2,'p_tsal','tsalparser.py',232),
+  ('domain -> LPAREN DEFINE_KEY domain_def domain_section_lst RPAREN','domain',5,'p_domain','tsalparser.py',280),
+  ('domain_section_lst -> domain_section_lst domain_section','domain_section_lst',2,'p_domain_section_lst','tsalparser.py',302),
+  ('domain_section_lst -> domain_section','domain_section_lst',1,'p_domain_section_lst','tsalparser.py',303),
+  ('domain_section -> requirements_def','domain_section',1,'p_domain_section','tsalparser.py',312),
+  ('domain_section -> types_def','domain_section',1,'p_domain_section','tsalparser.py',313),
+  ('domain_section -> constants_def','domain_section',1,'p_domain_section','tsalparser.py',314),
+  ('domain_section -> fluents_def','domain_section',1,'p_domain_section','tsalparser.py',315),
+  ('domain_section -> predicates_def','domain_section',1,'p_domain_section','tsalparser.py',316),
+  ('domain_section -> derived_predicates_def','domain_section',1,'p_domain_section','tsalparser.py',317),
+  ('domain_section -> processes_def','domain_section',1,'p_domain_section','tsalparser.py',318),
+  ('domain_section -> actions_def','domain_section',1,'p_domain_section','tsalparser.py',319),
+  ('domain_section -> events_def','domain_section',1,'p_domain_section','tsalparser.py',320),
+  ('domain_def -> LPAREN DOMAIN_KEY NAME RPAREN','domain_def',4,'p_domain_def','tsalparser.py',325),
+  ('requirements_def -> LPAREN REQUIREMENTS_KEY requirements_lst RPAREN','requirements_def',4,'p_requirements_def','tsalparser.py',329),
+  ('requirements_def -> LPAREN REQUIREMENTS_KEY RPAREN','requirements_def',3,'p_requirements_def','tsalparser.py',330),
+  ('requirements_lst -> requirement_def requirements_lst','requirements_lst',2,'p_requirements_lst','tsalparser.py',337),
+  ('requirements_lst -> requirement_def','requirements_lst',1,'p_requirements_lst','tsalparser.py',338),
+  ('requirement_def -> NAME','requirement_def',1,'p_requirement_def','tsalparser.py',345),
+  ('types_def -> LPAREN TYPES_KEY typed_names_lst RPAREN','types_def',4,'p_types_def','tsalparser.py',349),
+  ('constants_def -> LPAREN CONSTANTS_KEY typed_names_lst RPAREN','constants_def',4,'p_constants_def','tsalparser.py',354),
+  ('constants_def -> LPAREN CONSTANTS_KEY RPAREN','constants_def',3,'p_constants_def','tsalparser.py',355),
+  ('typed_names_lst -> names_lst HYPHEN type typed_names_lst','typed_names_lst',4,'p_typed_names_lst','tsalparser.py',371),
+  ('typed_names_lst -> names_lst HYPHEN type','typed_names_lst',3,'p_typed_names_lst','tsalparser.py',372),
+  ('typed_names_lst -> names_lst','typed_names_lst',1,'p_typed_names_lst','tsalparser.py',373),
+  ('fluents_def -> LPAREN FLUENTS_KEY fluent_def_lst RPAREN','fluents_def',4,'p_fluents_def','tsalparser.py',387),
+  ('fluent_def_lst -> fluent_def_lst fluent_def','fluent_def_lst',2,'p_fluent_def_lst','tsalparser.py',393),
+  ('fluent_def_lst -> fluent_def','fluent_def_lst',1,'p_fluent_def_lst','tsalparser.py',394),
+  ('fluent_def -> LPAREN NAME typed_variables_lst RPAREN','fluent_def',4,'p_fluent_def','tsalparser.py',403),
+  ('fluent_def -> LPAREN NAME variables_lst RPAREN','fluent_def',4,'p_fluent_def','tsalparser.py',404),
+  ('fluent_def -> LPAREN NAME RPAREN','fluent_def',3,'p_fluent_def','tsalparser.py',405),
+  ('fluent_def -> fluent_def HYPHEN type','fluent_def',3,'p_fluent_def','tsalparser.py',406),
+  ('fluent_def -> LPAREN NAME typed_variables_lst bounds_def RPAREN','fluent_def',5,'p_fluent_def','tsalparser.py',407),
+  ('bounds_def -> BOUNDS_KEY num num POS_INTEGER','bounds_def',4,'p_bounds_def','tsalparser.py',420),
+  ('num -> POS_INTEGER','num',1,'p_num','tsalparser.py',424),
+  ('num -> NEG_INTEGER','num',1,'p_num','tsalparser.py',425),
+  ('predicates_def -> LPAREN PREDICATES_KEY predicate_def_lst RPAREN','predicates_def',4,'p_predicates_def','tsalparser.py',429),
+  ('predicate_def_lst -> predicate_def_lst predicate_def','predicate_def_lst',2,'p_predicate_def_lst','tsalparser.py',434),
+  ('predicate_def_lst -> predicate_def','predicate_def_lst',1,'p_predicate_def_lst','tsalparser.py',435),
+  ('predicate_def -> LPAREN NAME typed_variables_lst RPAREN','predicate_def',4,'p_predicate_def','tsalparser.py',444),
+  ('predicate_def -> LPAREN NAME variables_lst RPAREN','predicate_def',4,'p_predicate_def','tsalparser.py',445),
+  ('predicate_def -> LPAREN NAME RPAREN','predicate_def',3,'p_predicate_def','tsalparser.py',446),
+  ('derived_predicates_def -> LPAREN DERIVED_PREDICATES_KEY derived_def_lst RPAREN','derived_predicates_def',4,'p_derived_predicates_def','tsalparser.py',455),
+  ('derived_predicates_def -> LPAREN DERIVED_PREDICATES_KEY RPAREN','derived_predicates_def',3,'p_derived_predicates_def','tsalparser.py',456),
+  ('derived_def_lst -> <empty>','derived_def_lst',0,'p_derived_def_lst','tsalparser.py',463),
+  ('derived_def_lst -> derived_def_lst derived_def','derived_def_lst',2,'p_derived_def_lst','tsalparser.py',464),
+  ('derived_def -> LPAREN DERIVED_KEY predicate_def derived_def_body RPAREN','derived_def',5,'p_derived_def','tsalparser.py',473),
+  ('derived_def -> LPAREN DERIVED_KEY fluent_def derived_def_body RPAREN','derived_def',5,'p_derived_def','tsalparser.py',474),
+  ('derived_def_body -> LPAREN AND_KEY fluent_predicate_def_lst RPAREN','derived_def_body',4,'p_derived_def_body','tsalparser.py',480),
+  ('fluent_predicate_def_lst -> <empty>','fluent_predicate_def_lst',0,'p_fluent_predicate_def_lst','tsalparser.py',486),
+  ('fluent_predicate_def_lst -> expression fluent_predicate_def_lst','fluent_predicate_def_lst',2,'p_fluent_predicate_def_lst','tsalparser.py',487),
+  ('fluent_predicate_def_lst -> literal fluent_predicate_def_lst','fluent_predicate_def_lst',2,'p_fluent_predicate_def_lst','tsalparser.py',488),
+  ('processes_def -> LPAREN PROCESSES_KEY processes_def_lst RPAREN','processes_def',4,'p_processes_def','tsalparser.py',497),
+  ('processes_def_lst -> <empty>','processes_def_lst',0,'p_processes_def_lst','tsalparser.py',502),
+  ('processes_def_lst -> processes_def_lst process_def','processes_def_lst',2,'p_processes_def_lst','tsalparser.py',503),
+  ('process_def -> LPAREN EQUALS NAME expression RPAREN','process_def',5,'p_process_def','tsalparser.py',512),
+  ('actions_def -> LPAREN ACTIONS_KEY action_def_lst RPAREN','actions_def',4,'p_actions_def','tsalparser.py',519),
+  ('action_def_lst -> <empty>','action_def_lst',0,'p_action_def_lst','tsalparser.py',524),
+  ('action_def_lst -> action_def_lst action_def','action_def_lst',2,'p_action_def_lst','tsalparser.py',525),
+  ('action_def -> LPAREN ACTION_KEY NAME parameters_def action_def_body RPAREN','action_def',6,'p_action_def','tsalparser.py',533),
+  ('action_def -> LPAREN ACTION_KEY NAME parameters_def duration_def action_def_body RPAREN','action_def',7,'p_action_def','tsalparser.py',534),
+  ('event_def -> LPAREN EVENT_KEY NAME parameters_def event_def_body RPAREN','event_def',6,'p_event_def','tsalparser.py',581),
+  ('event_def -> LPAREN EVENT_KEY NAME parameters_def duration_def event_def_body RPAREN','event_def',7,'p_event_def','tsalparser.py',582),
+  ('events_def -> LPAREN EVENTS_KEY event_def_lst RPAREN','events_def',4,'p_events_def','tsalparser.py',593),
+  ('event_def_lst -> <empty>','event_def_lst',0,'p_event_def_lst','tsalparser.py',598),
+  ('event_def_lst -> event_def_lst event_def','event_def_lst',2,'p_event_def_lst','tsalparser.py',599),
+  ('parameters_def -> PARAMETERS_KEY LPAREN typed_variables_lst RPAREN','parameters_def',4,'p_parameters_def','tsalparser.py',607),
+  ('parameters_def -> PARAMETERS_KEY LPAREN variables_lst RPAREN','parameters_def',4,'p_parameters_def','tsalparser.py',608),
+  ('parameters_def -> PARAMETERS_KEY LPAREN RPAREN','parameters_def',3,'p_parameters_def','tsalparser.py',609),
+  ('action_def_body -> precond_def effects_def','action_def_body',2,'p_action_def_body','tsalparser.py',617),
+  ('event_def_body -> precond_def effects_def','event_def_body',2,'p_event_def_body','tsalparser.py',622),
+  ('event_def_body -> precond_def frequency_def effects_def','event_def_body',3,'p_event_def_body','tsalparser.py',623),
+  ('precond_def -> PRECONDITION_KEY LPAREN AND_KEY literals_lst RPAREN','precond_def',5,'p_precond_def','tsalparser.py',631),
+  ('precond_def -> PRECONDITION_KEY literal','precond_def',2,'p_precond_def','tsalparser.py',632),
+  ('precond_def -> PRECONDITION_KEY expression','precond_def',2,'p_precond_def','tsalparser.py',633),
+  ('precond_def -> PRECONDITION_KEY LPAREN RPAREN','precond_def',3,'p_precond_def','tsalparser.py',634),
+  ('effects_def -> EFFECT_KEY effect_body','effects_def',2,'p_effects_def','tsalparser.py',644),
+  ('effects_def -> EFFECT_KEY forall','effects_def',2,'p_effects_def','tsalparser.py',645),
+  ('effects_def -> EFFECT_KEY when_body','effects_def',2,'p_effects_def','tsalparser.py',646),
+  ('effects_def -> EFFECT_KEY LPAREN AND_KEY forall_body RPAREN','effects_def',5,'p_effects_def','tsalparser.py',647),
+  ('effect_body -> LPAREN RPAREN','effect_body',2,'p_effect_body','tsalparser.py',658),
+  ('effect_body -> LPAREN NAME unlabeled_effect RPAREN','effect_body',4,'p_effect_body','tsalparser.py',659),
+  ('effect_body -> effect_body LPAREN NAME unlabeled_effect RPAREN','effect_body',5,'p_effect_body','tsalparser.py',660),
+  ('effect_body -> unlabeled_effect','effect_body',1,'p_effect_body','tsalparser.py',661),
+  ('forall_body -> forall forall_body','forall_body',2,'p_forall_body','tsalparser.py',672),
+  ('forall_body -> forall','forall_body',1,'p_forall_body','tsalparser.py',673),
+  ('forall_body -> effect forall_body','forall_body',2,'p_forall_body','tsalparser.py',674),
+  ('forall_body -> effect','forall_body',1,'p_forall_body','tsalparser.py',675),
+  ('when_body -> LPAREN WHEN_KEY when_pre when_eff RPAREN','when_body',5,'p_when_body','tsalparser.py',682),
+  ('forall -> LPAREN FORALL_KEY LPAREN typed_variables_lst RPAREN when_body RPAREN','forall',7,'p_forall','tsalparser.py',687),
+  ('when_pre -> LPAREN AND_KEY literals_lst RPAREN','when_pre',4,'p_when_pre','tsalparser.py',691),
+  ('when_pre -> literal','when_pre',1,'p_when_pre','tsalparser.py',692),
+  ('when_eff -> LPAREN AND_KEY literals_lst RPAREN','when_eff',4,'p_when_eff','tsalparser.py',699),
+  ('when_eff -> literal','when_eff',1,'p_when_eff','tsalparser.py',700),
+  ('frequency_def -> INTERARRIVAL_KEY LPAREN NAME NAME DECIMAL RPAREN','frequency_def',6,'p_frequency_def','tsalparser.py',709),
+  ('frequency_def -> INTERARRIVAL_KEY LPAREN RPAREN','frequency_def',3,'p_frequency_def','tsalparser.py',710),
+  ('unlabeled_effect -> LPAREN ONEOF_KEY effect_body RPAREN','unlabeled_effect',4,'p_unlabeled_effect','tsalparser.py',717),
+  ('unlabeled_effect -> deterministic_effect unlabeled_effect','unlabeled_effect',2,'p_unlabeled_effect','tsalparser.py',718),
+  ('unlabeled_effect -> deterministic_effect','unlabeled_effect',1,'p_unlabeled_effect','tsalparser.py',719),
+  ('deterministic_effect -> LPAREN AND_KEY effects_lst RPAREN','deterministic_effect',4,'p_deterministic_effect','tsalparser.py',729),
+  ('deterministic_effect -> effects_lst','deterministic_effect',1,'p_deterministic_effect','tsalparser.py',730),
+  ('when_effects -> when_if when_then','when_effects',2,'p_when_effects','tsalparser.py',737),
+  ('when_if -> simple_effect','when_if',1,'p_when_if','tsalparser.py',743),
+  ('when_if -> LPAREN AND_KEY simple_effects_lst RPAREN','when_if',4,'p_when_if','tsalparser.py',744),
+  ('when_then -> simple_effect','when_then',1,'p_when_then','tsalparser.py',752),
+  ('when_then -> LPAREN AND_KEY simple_effects_lst RPAREN','when_then',4,'p_when_then','tsalparser.py',753),
+  ('effects_lst -> <empty>','effects_lst',0,'p_effects_lst','tsalparser.py',761),
+  ('effects_lst -> effects_lst effect','effects_lst',2,'p_effects_lst','tsalparser.py',762),
+  ('simple_effects_lst -> simple_effects_lst simple_effect','simple_effects_lst',2,'p_simple_effects_lst','tsalparser.py',771),
+  ('simple_effects_lst -> simple_effect','simple_effects_lst',1,'p_simple_effects_lst','tsalparser.py',772),
+  ('effect -> literal','effect',1,'p_effect','tsalparser.py',780),
+  ('effect -> expression','effect',1,'p_effect','tsalparser.py',781),
+  ('effect -> LPAREN PROBABILISTIC_KEY PROBABILITY literal RPAREN','effect',5,'p_effect','tsalparser.py',782),
+  ('effect -> LPAREN WHEN_KEY when_effects RPAREN','effect',4,'p_effect','tsalparser.py',783),
+  ('simple_effect -> literal','simple_effect',1,'p_simple_effect','tsalparser.py',792),
+  ('duration_def -> DURATION_KEY LPAREN expression RPAREN','duration_def',4,'p_duration_def','tsalparser.py',798),
+  ('duration_def -> DURATION_KEY LPAREN RPAREN','duration_def',3,'p_duration_def','tsalparser.py',799),
+  ('expression_body -> fluent_def','expression_body',1,'p_expression_body','tsalparser.py',812),
+  ('expression_body -> expression','expression_body',1,'p_expression_body','tsalparser.py',813),
+  ('expression_body_list -> expression_body expression_body','expression_body_list',2,'p_expression_body_list','tsalparser.py',817),
+  ('expression -> PLUS expression_body_list','expression',2,'p_expression','tsalparser.py',821),
+  ('expression -> HYPHEN expression_body_list','expression',2,'p_expression','tsalparser.py',822),
+  ('expression -> TIMES expression_body_list','expression',2,'p_expression','tsalparser.py',823),
+  ('expression -> DIVIDE expression_body_list','expression',2,'p_expression','tsalparser.py',824),
+  ('expression -> GT expression_body_list','expression',2,'p_expression','tsalparser.py',825),
+  ('expression -> GTEQ expression_body_list','expression',2,'p_expression','tsalparser.py',826),
+  ('expression -> LT expression_body_list','expression',2,'p_expression','tsalparser.py',827),
+  ('expression -> LTEQ expression_body_list','expression',2,'p_expression','tsalparser.py',828),
+  ('expression -> EQUALS expression_body_list','expression',2,'p_expression','tsalparser.py',829),
+  ('expression -> NEQ expression_body_list','expression',2,'p_expression','tsalparser.py',830),
+  ('expression -> MOD expression_body_list','expression',2,'p_expression','tsalparser.py',831),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression','tsalparser.py',832),
+  ('expression -> DECIMAL','expression',1,'p_expression','tsalparser.py',833),
+  ('expression -> PROBABILITY','expression',1,'p_expression','tsalparser.py',834),
+  ('expression -> VARIABLE','expression',1,'p_expression','tsalparser.py',835),
+  ('expression -> POS_INTEGER','expression',1,'p_expression','tsalparser.py',836),
+  ('expression -> NEG_INTEGER','expression',1,'p_expression','tsalparser.py',837),
+  ('expression -> NAME','expression',1,'p_expression','tsalparser.py',838),
+  ('literals_lst -> literals_lst literal','literals_lst',2,'p_literals_lst','tsalparser.py',850),
+  ('literals_lst -> literals_lst expression','literals_lst',2,'p_literals_lst','tsalparser.py',851),
+  ('literals_lst -> literal','literals_lst',1,'p_literals_lst','tsalparser.py',852),
+  ('literals_lst -> expression','literals_lst',1,'p_literals_lst','tsalparser.py',853),
+  ('literals_lst -> literals_lst or_literal','literals_lst',2,'p_literals_lst','tsalparser.py',854),
+  ('literals_lst -> or_literal','literals_lst',1,'p_literals_lst','tsalparser.py',855),
+  ('or_literal -> LPAREN OR_KEY literals_lst RPAREN','or_literal',4,'p_or_literal','tsalparser.py',865),
+  ('literal -> LPAREN NOT_KEY predicate RPAREN','literal',4,'p_literal','tsalparser.py',872),
+  ('literal -> predicate','literal',1,'p_literal','tsalparser.py',873),
+  ('ground_predicates_lst -> ground_predicates_lst ground_predicate','ground_predicates_lst',2,'p_ground_predicates_lst','tsalparser.py',881),
+  ('ground_predicates_lst -> ground_predicate','ground_predicates_lst',1,'p_ground_predicates_lst','tsalparser.py',882),
+  ('ground_predicate -> LPAREN NAME constants_lst RPAREN','ground_predicate',4,'p_ground_predicate','tsalparser.py',891),
+  ('ground_predicate -> LPAREN NAME RPAREN','ground_predicate',3,'p_ground_predicate','tsalparser.py',892),
+  ('ground_predicate -> ground_fluent','ground_predicate',1,'p_ground_predicate','tsalparser.py',893),
+  ('ground_fluent -> LPAREN EQUALS ground_fluent_def NAME RPAREN','ground_fluent',5,'p_ground_fluent','tsalparser.py',904),
+  ('ground_fluent -> LPAREN EQUALS ground_fluent_def POS_INTEGER RPAREN','ground_fluent',5,'p_ground_fluent','tsalparser.py',905),
+  ('ground_fluent -> LPAREN EQUALS ground_fluent_def NEG_INTEGER RPAREN','ground_fluent',5,'p_ground_fluent','tsalparser.py',906),
+  ('ground_fluent_def -> LPAREN NAME constants_lst RPAREN','ground_fluent_def',4,'p_ground_fluent_def','tsalparser.py',911),
+  ('ground_fluent_def -> LPAREN NAME RPAREN','ground_fluent_def',3,'p_ground_fluent_def','tsalparser.py',912),
+  ('predicate -> LPAREN NAME variables_lst RPAREN','predicate',4,'p_predicate','tsalparser.py',919),
+  ('predicate -> LPAREN EQUALS VARIABLE VARIABLE RPAREN','predicate',5,'p_predicate','tsalparser.py',920),
+  ('predicate -> LPAREN NAME RPAREN','predicate',3,'p_predicate','tsalparser.py',921),
+  ('predicate -> LPAREN NAME constants_lst RPAREN','predicate',4,'p_predicate','tsalparser.py',922),
+  ('typed_constants_lst -> typed_constants_lst constants_lst HYPHEN type','typed_constants_lst',4,'p_typed_constants_lst','tsalparser.py',935),
+  ('typed_constants_lst -> constants_lst HYPHEN type','typed_constants_lst',3,'p_typed_constants_lst','tsalparser.py',936),
+  ('typed_variables_lst -> typed_variables_lst variables_lst HYPHEN type','typed_variables_lst',4,'p_typed_variables_lst','tsalparser.py',945),
+  ('typed_variables_lst -> variables_lst HYPHEN type','typed_variables_lst',3,'p_typed_variables_lst','tsalparser.py',946),
+  ('constants_lst -> constants_lst constant','constants_lst',2,'p_constants_lst','tsalparser.py',955),
+  ('constants_lst -> constant','constants_lst',1,'p_constants_lst','tsalparser.py',956),
+  ('variables_lst -> variables_lst variable','variables_lst',2,'p_variables_lst','tsalparser.py',965),
+  ('variables_lst -> variable','variables_lst',1,'p_variables_lst','tsalparser.py',966),
+  ('variables_lst -> NAME','variables_lst',1,'p_variables_lst','tsalparser.py',967),
+  ('variables_lst -> variables_lst NAME','variables_lst',2,'p_variables_lst','tsalparser.py',968),
+  ('names_lst -> names_lst NAME','names_lst',2,'p_names_lst','tsalparser.py',977),
+  ('names_lst -> NAME','names_lst',1,'p_names_lst','tsalparser.py',978),
+  ('type -> NAME','type',1,'p_type','tsalparser.py',987),
+  ('constant -> NAME','constant',1,'p_constant','tsalparser.py',992),
+  ('constant -> POS_INTEGER','constant',1,'p_constant','tsalparser.py',993),
+  ('constant -> NEG_INTEGER','constant',1,'p_constant','tsalparser.py',994),
+  ('variable -> VARIABLE','variable',1,'p_variable','tsalparser.py',999),
+  ('problem -> plan_problem','problem',1,'p_problem','tsalparser.py',1007),
+  ('plan_problem -> LPAREN DEFINE_KEY plan_problem_def problem_section_lst RPAREN','plan_problem',5,'p_plan_problem','tsalparser.py',1021),
+  ('problem_section_lst -> problem_section_lst problem_section','problem_section_lst',2,'p_problem_section_lst','tsalparser.py',1039),
+  ('problem_section_lst -> problem_section','problem_section_lst',1,'p_problem_section_lst','tsalparser.py',1040),
+  ('problem_section -> domain_def','problem_section',1,'p_problem_section','tsalparser.py',1049),
+  ('problem_section -> objects_def','problem_section',1,'p_problem_section','tsalparser.py',1050),
+  ('problem_section -> init_def','problem_section',1,'p_problem_section','tsalparser.py',1051),
+  ('problem_section -> timed_inits_def','problem_section',1,'p_problem_section','tsalparser.py',1052),
+  ('problem_section -> goal_def','problem_section',1,'p_problem_section','tsalparser.py',1053),
+  ('problem_section -> metric_def','problem_section',1,'p_problem_section','tsalparser.py',1054),
+  ('plan_problem_def -> LPAREN PROBLEM_KEY NAME RPAREN','plan_problem_def',4,'p_plan_problem_def','tsalparser.py',1059),
+  ('objects_def -> LPAREN OBJECTS_KEY typed_constants_lst RPAREN','objects_def',4,'p_objects_def','tsalparser.py',1064),
+  ('objects_def -> LPAREN OBJECTS_KEY constants_lst RPAREN','objects_def',4,'p_objects_def','tsalparser.py',1065),
+  ('init_def -> LPAREN INIT_KEY LPAREN AND_KEY ground_predicates_lst RPAREN RPAREN','init_def',7,'p_init_def','tsalparser.py',1070),
+  ('init_def -> LPAREN INIT_KEY ground_predicates_lst RPAREN','init_def',4,'p_init_def','tsalparser.py',1071),
+  ('init_def -> LPAREN INIT_KEY RPAREN','init_def',3,'p_init_def','tsalparser.py',1072),
+  ('timed_inits_def -> LPAREN TIMED_INIT_KEY timed_init_lst RPAREN','timed_inits_def',4,'p_timed_inits_def','tsalparser.py',1084),
+  ('timed_init_lst -> <empty>','timed_init_lst',0,'p_timed_init_lst','tsalparser.py',1089),
+  ('timed_init_lst -> timed_init_lst timed_init_def','timed_init_lst',2,'p_timed_init_lst','tsalparser.py',1090),
+  ('timed_init_def -> LPAREN AT_KEY DECIMAL literal RPAREN','timed_init_def',5,'p_timed_init_def','tsalparser.py',1099),
+  ('goal_body_def -> LPAREN AND_KEY literals_lst RPAREN','goal_body_def',4,'p_goal_body_def','tsalparser.py',1106),
+  ('goal_body_def_lst -> goal_body_def_lst goal_body_def','goal_body_def_lst',2,'p_goal_body_def_lst','tsalparser.py',1110),
+  ('goal_body_def_lst -> goal_body_def','goal_body_def_lst',1,'p_goal_body_def_lst','tsalparser.py',1111),
+  ('goal_def -> LPAREN GOAL_KEY goal_body_def RPAREN','goal_def',4,'p_goal_def','tsalparser.py',1119),
+  ('goal_def -> LPAREN GOAL_KEY literal RPAREN','goal_def',4,'p_goal_def','tsalparser.py',1120),
+  ('goal_def -> LPAREN GOAL_KEY LPAREN ONEOF_KEY effect_body RPAREN RPAREN','goal_def',7,'p_goal_def','tsalparser.py',1121),
+  ('goal_def -> LPAREN GOAL_KEY LPAREN OR_KEY goal_body_def_lst RPAREN RPAREN','goal_def',7,'p_goal_def','tsalparser.py',1122),
+  ('metric_def -> LPAREN METRIC_KEY NAME fluent_def RPAREN','metric_def',5,'p_metric_def','tsalparser.py',1135),
+]
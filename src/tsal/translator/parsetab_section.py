@@ -0,0 +1,238 @@
+
+# parsetab_section.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'domain_sectionleftPLUSHYPHENleftTIMESDIVIDEACTIONS_KEY ACTION_KEY AND_KEY AT_KEY BOUNDS_KEY CONSTANTS_KEY DECIMAL DEFINE_KEY DERIVED_KEY DERIVED_PREDICATES_KEY DIVIDE DOMAIN_KEY DURATION_KEY EFFECT_KEY EQUALS EVENTS_KEY EVENT_KEY FLUENTS_KEY FORALL_KEY GOAL_KEY GT GTEQ HYPHEN INIT_KEY INTERARRIVAL_KEY LPAREN LT LTEQ METRIC_KEY MOD NAME NEG_INTEGER NEQ NOT_KEY OBJECTS_KEY ONEOF_KEY OR_KEY PARAMETERS_KEY PLUS POS_INTEGER PRECONDITION_KEY PREDICATES_KEY PROBABILISTIC_KEY PROBABILITY PROBLEM_KEY PROCESSES_KEY REQUIREMENTS_KEY RPAREN TIMED_INIT_KEY TIMES TYPES_KEY VARIABLE WHEN_KEYtsal : domain\n            | problem\n            | domain problemdomain : LPAREN DEFINE_KEY domain_def domain_section_lst RPARENdomain_section_lst : domain_section_lst domain_section\n                          | domain_sectiondomain_section : requirements_def\n                      | types_def\n                      | constants_def\n                      | fluents_def\n                      | predicates_def\n                      | derived_predicates_def\n                      | processes_def\n                      | actions_def\n                      | events_defdomain_def : LPAREN DOMAIN_KEY NAME RPARENrequirements_def : LPAREN REQUIREMENTS_KEY requirements_lst RPAREN\n                        | LPAREN REQUIREMENTS_KEY RPARENrequirements_lst :  requirement_def requirements_lst\n                        |  requirement_defrequirement_def : NAMEtypes_def : LPAREN TYPES_KEY typed_names_lst RPARENconstants_def : LPAREN CONSTANTS_KEY typed_names_lst RPAREN\n                     | LPAREN CONSTANTS_KEY RPARENtyped_names_lst : names_lst HYPHEN type typed_names_lst\n                       | names_lst HYPHEN type\n                       | names_lstfluents_def : LPAREN FLUENTS_KEY fluent_def_lst RPARENfluent_def_lst : fluent_def_lst fluent_def\n                      | fluent_deffluent_def : LPAREN NAME typed_variables_lst RPAREN\n                  | LPAREN NAME variables_lst RPAREN\n                  | LPAREN NAME RPAREN\n                  | fluent_def HYPHEN type\n                  |  LPAREN NAME typed_variables_lst bounds_def RPARENbounds_def : BOUNDS_KEY num num POS_INTEGERnum : POS_INTEGER\n            | NEG_INTEGERpredicates_def : LPAREN PREDICATES_KEY predicate_def_lst RPARENpredicate_def_lst : predicate_def_lst predicate_def\n                         | predicate_defpredicate_def : LPAREN NAME typed_variables_lst RPAREN\n                     | LPAREN NAME variables_lst RPAREN\n                     | LPAREN NAME RPARENderived_predicates_def : LPAREN DERIVED_PREDICATES_KEY derived_def_lst RPAREN\n                               | LPAREN DERIVED_PREDICATES_KEY RPARENderived_def_lst :\n                       | derived_def_lst derived_defderived_def : LPAREN DERIVED_KEY predicate_def derived_def_body RPAREN\n                    | LPAREN DERIVED_KEY fluent_def derived_def_body RPARENderived_def_body : LPAREN AND_KEY fluent_predicate_def_lst RPARENfluent_predicate_def_lst :\n                                | expression fluent_predicate_def_lst\n                                | literal fluent_predicate_def_lstprocesses_def : LPAREN PROCESSES_KEY processes_def_lst RPARENprocesses_def_lst :\n                         | processes_def_lst process_defprocess_def : LPAREN EQUALS NAME expression RPARENactions_def : LPAREN ACTIONS_KEY action_def_lst RPARENaction_def_lst :\n                      | action_def_lst action_defaction_def : LPAREN ACTION_KEY NAME parameters_def action_def_body RPAREN\n                  | LPAREN ACTION_KEY NAME parameters_def duration_def action_def_body RPARENevent_def : LPAREN EVENT_KEY NAME parameters_def event_def_body RPAREN\n                 | LPAREN EVENT_KEY NAME parameters_def duration_def event_def_body RPARENevents_def : LPAREN EVENTS_KEY event_def_lst RPARENevent_def_lst :\n                     | event_def_lst event_defparameters_def : PARAMETERS_KEY LPAREN typed_variables_lst RPAREN\n                      | PARAMETERS_KEY LPAREN variables_lst RPAREN\n                      | PARAMETERS_KEY LPAREN RPARENaction_def_body : precond_def effects_defevent_def_body : precond_def effects_def\n                      | precond_def frequency_def effects_defprecond_def : PRECONDITION_KEY LPAREN AND_KEY literals_lst RPAREN\n                   | PRECONDITION_KEY literal\n                   | PRECONDITION_KEY expression\n                   | PRECONDITION_KEY LPAREN RPARENeffects_def : EFFECT_KEY effect_body\n                    | EFFECT_KEY forall\n                    | EFFECT_KEY when_body\n                    | EFFECT_KEY LPAREN AND_KEY forall_body RPAREN effect_body : LPAREN RPAREN\n                    | LPAREN NAME unlabeled_effect RPAREN\n                    | effect_body LPAREN NAME unlabeled_effect RPAREN\n                    | unlabeled_effectforall_body : forall forall_body\n                   | forall\n                   | effect forall_body\n                   | effectwhen_body : LPAREN WHEN_KEY when_pre when_eff RPARENforall : LPAREN FORALL_KEY LPAREN typed_variables_lst RPAREN when_body RPARENwhen_pre : LPAREN AND_KEY literals_lst RPAREN\n                | literalwhen_eff : LPAREN AND_KEY literals_lst RPAREN\n                | literalfrequency_def : INTERARRIVAL_KEY LPAREN NAME NAME DECIMAL RPAREN\n                     | INTERARRIVAL_KEY LPAREN RPARENunlabeled_effect : LPAREN ONEOF_KEY effect_body RPAREN\n                        | deterministic_effect unlabeled_effect\n                        | deterministic_effectdeterministic_effect : LPAREN AND_KEY effects_lst RPAREN\n                            | effects_lstwhen_effects : when_if when_then when_if : simple_effect\n                | LPAREN AND_KEY simple_effects_lst RPARENwhen_then : simple_effect\n                 | LPAREN AND_KEY simple_effects_lst RPARENeffects_lst :\n                   | effects_lst effectsimple_effects_lst : simple_effects_lst simple_effect\n                          | simple_effecteffect : literal\n              | expression\n              | LPAREN PROBABILISTIC_KEY PROBABILITY literal RPAREN\n              | LPAREN WHEN_KEY when_effects RPARENsimple_effect : literalduration_def : DURATION_KEY LPAREN expression RPAREN\n                    | DURATION_KEY LPAREN RPARENexpression_body : fluent_def\n                       | expressionexpression_body_list : expression_body expression_bodyexpression : PLUS expression_body_list\n                  | HYPHEN expression_body_list\n                  | TIMES expression_body_list\n                  | DIVIDE expression_body_list\n                  | GT expression_body_list\n                  | GTEQ expression_body_list\n                  | LT expression_body_list\n                  | LTEQ expression_body_list\n                  | EQUALS expression_body_list\n                  | NEQ expression_body_list\n                  | MOD expression_body_list\n                  | LPAREN expression RPAREN\n                  | DECIMAL\n                  | PROBABILITY\n                  | VARIABLE\n                  | POS_INTEGER\n                  | NEG_INTEGER\n                  | NAMEliterals_lst : literals_lst literal\n                    | literals_lst expression\n                    | literal\n                    | expression\n                    | literals_lst or_literal\n                    | or_literalor_literal : LPAREN OR_KEY literals_lst RPARENliteral : LPAREN NOT_KEY predicate RPAREN\n               | predicateground_predicates_lst : ground_predicates_lst ground_predicate\n                             | ground_predicateground_predicate : LPAREN NAME constants_lst RPAREN\n                        | LPAREN NAME RPAREN\n                        | ground_fluentground_fluent : LPAREN EQUALS ground_fluent_def NAME RPAREN\n                     | LPAREN EQUALS ground_fluent_def POS_INTEGER RPAREN\n                     | LPAREN EQUALS ground_fluent_def NEG_INTEGER RPARENground_fluent_def : LPAREN NAME constants_lst RPAREN\n                         | LPAREN NAME RPARENpredicate : LPAREN NAME variables_lst RPAREN\n                 | LPAREN EQUALS VARIABLE VARIABLE RPAREN\n                 | LPAREN NAME RPAREN\n                 | LPAREN NAME constants_lst RPARENtyped_constants_lst : typed_constants_lst constants_lst HYPHEN type\n                           | constants_lst HYPHEN typetyped_variables_lst : typed_variables_lst variables_lst HYPHEN type\n                           | variables_lst HYPHEN typeconstants_lst : constants_lst constant\n                     | constantvariables_lst : variables_lst variable\n                     | variable\n                     | NAME\n                     | variables_lst NAMEnames_lst : names_lst NAME\n                 | NAMEtype : NAMEconstant : NAME\n                | POS_INTEGER\n                | NEG_INTEGERvariable : VARIABLEproblem : plan_problemplan_problem : LPAREN DEFINE_KEY plan_problem_def problem_section_lst RPARENproblem_section_lst : problem_section_lst problem_section\n                           | problem_sectionproblem_section : domain_def\n                       | objects_def\n                       | init_def\n                       | timed_inits_def\n                       | goal_def\n                       | metric_defplan_problem_def : LPAREN PROBLEM_KEY NAME RPARENobjects_def : LPAREN OBJECTS_KEY typed_constants_lst RPAREN\n                   | LPAREN OBJECTS_KEY constants_lst RPARENinit_def : LPAREN INIT_KEY LPAREN AND_KEY ground_predicates_lst RPAREN RPAREN\n                | LPAREN INIT_KEY ground_predicates_lst RPAREN\n                | LPAREN INIT_KEY RPARENtimed_inits_def : LPAREN TIMED_INIT_KEY timed_init_lst RPARENtimed_init_lst :\n                      | timed_init_lst timed_init_deftimed_init_def : LPAREN AT_KEY DECIMAL literal RPARENgoal_body_def : LPAREN AND_KEY literals_lst RPARENgoal_body_def_lst : goal_body_def_lst goal_body_def\n                         | goal_body_defgoal_def : LPAREN GOAL_KEY goal_body_def RPAREN\n                | LPAREN GOAL_KEY literal RPAREN\n                | LPAREN GOAL_KEY LPAREN ONEOF_KEY effect_body RPAREN RPAREN\n                | LPAREN GOAL_KEY LPAREN OR_KEY goal_body_def_lst RPAREN RPARENmetric_def : LPAREN METRIC_KEY NAME fluent_def RPAREN'
+    
+_lr_action_items = {'LPAREN':([0,15,16,17,18,19,20,31,32,34,35,36,38,39,40,49,53,56,59,62,65,67,70,74,76,78,83,88,91,92,94,95,96,99,109,110,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,129,134,136,137,138,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,159,160,166,167,168,170,171,172,173,174,176,179,180,181,187,191,192,194,198,199,203,204,205,208,212,219,224,226,227,228,229,230,231,232,234,235,236,237,239,240,241,242,243,248,249,251,254,255,257,258,259,263,264,266,267,269,270,272,273,274,277,280,283,286,290,291,294,295,296,297,299,300,301,302,306,307,311,315,316,317,318,319,320,321,323,324,325,],[11,30,33,-47,-56,-60,-67,30,-30,33,-41,54,57,60,63,-29,-40,-48,-57,-61,-68,-176,-33,-34,-44,93,-31,-32,-42,-43,106,106,109,-35,109,144,-140,144,144,144,144,144,144,144,144,144,144,-135,-136,-137,-138,-139,161,-33,168,-49,-50,-131,144,-120,-121,109,-58,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,180,181,-31,-32,109,168,168,-149,-134,-122,-62,202,109,109,-64,214,215,144,-63,225,-86,233,237,239,-65,-162,-137,255,-83,233,261,262,265,-100,-110,-113,-114,109,109,239,-143,-144,-146,-148,-160,-163,233,109,237,255,255,287,-94,225,-109,292,239,-141,-142,-145,-161,-102,-84,239,-99,304,310,-105,-117,239,-85,313,239,239,304,-116,-147,-93,239,-115,304,-112,304,-92,-106,-111,304,]),'$end':([1,2,3,4,5,6,7,8,9,10,22,29,37,41,43,46,48,52,55,58,61,64,],[0,-7,-8,-9,-10,-11,-12,-13,-14,-15,-18,-24,-46,-17,-22,-23,-28,-39,-45,-55,-59,-66,]),'REQUIREMENTS_KEY':([11,],[12,]),'TYPES_KEY':([11,],[13,]),'CONSTANTS_KEY':([11,],[14,]),'FLUENTS_KEY':([11,],[15,]),'PREDICATES_KEY':([11,],[16,]),'DERIVED_PREDICATES_KEY':([11,],[17,]),'PROCESSES_KEY':([11,],[18,]),'ACTIONS_KEY':([11,],[19,]),'EVENTS_KEY':([11,],[20,]),'RPAREN':([12,14,17,18,19,20,21,23,24,25,26,27,28,31,32,34,35,36,38,39,40,42,45,47,49,51,53,56,59,62,65,66,67,68,69,70,71,72,73,74,75,76,77,82,83,84,87,88,90,91,92,99,104,105,107,108,111,112,123,124,125,126,127,131,133,135,136,137,138,139,140,142,143,145,146,147,148,149,150,151,152,153,154,155,156,161,162,165,169,170,171,172,173,174,175,176,177,178,179,180,181,184,186,187,188,189,193,195,196,197,198,199,200,201,202,203,204,205,206,212,213,214,216,217,218,219,220,221,222,223,226,227,228,231,232,234,235,236,240,241,242,243,246,248,249,250,251,252,253,254,256,257,258,259,260,265,266,267,272,273,274,277,278,279,280,281,282,283,284,288,289,290,293,296,297,298,299,301,303,305,307,308,309,311,314,316,317,318,319,321,322,324,325,326,],[22,29,37,-56,-60,-67,41,-20,-21,43,-27,-175,46,48,-30,52,-41,55,58,61,64,-19,-174,70,-29,76,-40,-48,-57,-61,-68,-26,-176,-172,83,-33,88,-171,-180,-34,91,-44,92,-25,-31,99,-173,-32,-170,-42,-43,-35,-167,134,137,138,-140,145,-135,-136,-137,-138,-139,-166,166,167,-52,-49,-50,173,-131,-120,-121,-58,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,176,185,187,-36,195,-52,-52,-149,-134,-122,70,-62,198,-72,-109,207,209,210,211,-64,212,-73,219,-51,-53,-54,-63,-79,-80,-81,227,-86,-101,-103,238,-65,-74,245,248,-172,249,-162,251,-169,-178,-179,-109,-83,-109,-109,-100,-110,-113,-114,271,-143,-144,-146,219,-148,-160,-177,-163,-168,277,-109,279,280,-88,-90,283,227,290,-109,-141,-142,-145,-161,299,-82,-102,-87,-89,-84,300,303,-96,-99,307,-117,311,312,-85,315,-91,317,-116,-104,-107,-147,321,322,-115,323,-112,-92,-95,-111,326,-108,]),'NAME':([12,13,14,23,24,26,27,30,33,44,45,47,50,51,66,67,68,69,70,71,72,73,74,75,77,79,80,81,83,85,87,88,89,90,93,96,99,100,104,105,109,110,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,131,133,135,136,140,141,142,143,144,146,147,148,149,150,151,152,153,154,155,160,161,168,170,171,172,173,174,175,179,180,181,184,186,193,194,202,204,205,208,214,215,217,218,219,220,221,222,223,224,225,226,228,231,234,235,236,237,239,240,241,242,243,244,246,248,249,250,251,252,254,255,257,258,259,261,262,265,267,270,272,273,274,277,280,284,285,286,287,292,297,301,302,304,307,310,311,316,317,321,],[24,27,27,24,-21,45,-175,47,51,67,-174,68,67,68,27,-176,-172,68,-33,87,-171,-180,-34,68,87,96,97,98,-31,87,-173,-32,67,-170,105,111,-35,67,-167,68,111,111,-140,111,111,111,111,111,111,111,111,111,111,-135,-136,-137,-138,-139,-166,68,87,111,-131,111,-120,-121,175,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,111,68,193,111,111,-149,-134,-122,68,-109,111,193,68,87,217,111,228,-109,111,111,244,246,-172,87,-162,250,-169,-178,-179,-137,254,111,-109,-109,-110,-113,-114,193,193,111,-143,-144,-146,275,217,-148,-160,-177,-163,-168,-109,193,111,111,111,68,246,228,-109,111,-141,-142,-145,-161,-102,68,87,111,246,246,111,111,111,246,-116,246,-147,111,-115,-92,]),'HYPHEN':([26,27,32,45,49,67,68,70,71,72,73,74,77,83,85,87,88,90,95,96,99,109,110,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,134,135,136,140,141,142,143,144,146,147,148,149,150,151,152,153,154,155,160,166,167,168,170,171,172,173,174,179,180,181,186,194,204,205,208,219,224,226,228,231,234,235,236,237,239,240,241,242,243,248,249,251,254,255,257,258,259,267,270,272,273,274,277,280,285,286,297,301,302,307,311,316,317,321,],[44,-175,50,-174,50,-176,-172,-33,89,-171,-180,-34,89,-31,100,-173,-32,-170,50,114,-35,114,114,-140,114,114,114,114,114,114,114,114,114,114,-135,-136,-137,-138,-139,-33,89,114,-131,114,50,-121,114,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,114,-31,-32,114,114,114,-149,-134,-122,-109,114,114,89,114,-109,114,114,-162,-137,114,-109,-109,-110,-113,-114,114,114,114,-143,-144,-146,-148,-160,-163,-109,114,114,114,114,-109,114,-141,-142,-145,-161,-102,89,114,114,114,114,-116,-147,114,-115,-92,]),'VARIABLE':([47,51,67,68,69,70,71,72,73,74,75,77,83,85,87,88,90,96,99,104,105,109,110,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,131,133,135,136,140,141,142,143,144,146,147,148,149,150,151,152,153,154,155,160,161,168,170,171,172,173,174,175,179,180,181,184,186,193,194,204,205,208,217,218,219,224,226,228,231,234,235,236,237,239,240,241,242,243,246,247,248,249,251,254,255,257,258,259,261,267,270,272,273,274,276,277,280,284,285,286,297,301,302,307,311,316,317,321,],[73,73,-176,-172,73,-33,73,-171,-180,-34,73,73,-31,73,-173,-32,-170,125,-35,-167,73,125,125,-140,125,125,125,125,125,125,125,125,125,125,-135,-136,-137,-138,-139,-166,73,73,125,-131,125,-120,-121,125,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,125,73,125,125,125,-149,-134,-122,73,-109,125,125,73,73,73,224,-109,125,125,-172,73,-162,253,125,-109,-109,-110,-113,-114,125,125,125,-143,-144,-146,73,276,-148,-160,-163,-109,125,125,125,125,73,-109,125,-141,-142,-145,253,-161,-102,73,73,125,125,125,125,-116,-147,125,-115,-92,]),'DERIVED_KEY':([54,],[78,]),'EQUALS':([57,67,70,74,83,88,96,99,109,110,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,136,140,141,142,143,144,146,147,148,149,150,151,152,153,154,155,160,168,170,171,172,173,174,179,180,181,194,204,205,208,215,219,224,226,228,231,234,235,236,237,239,240,241,242,243,248,249,251,254,255,257,258,259,262,267,270,272,273,274,277,280,286,287,292,297,301,302,304,307,310,311,316,317,321,],[79,-176,-33,-34,-31,-32,110,-35,110,110,-140,110,110,110,110,110,110,110,110,110,110,-135,-136,-137,-138,-139,110,-131,110,-120,-121,110,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,110,194,110,110,-149,-134,-122,-109,110,194,110,-109,110,110,247,-162,-137,110,-109,-109,-110,-113,-114,194,194,110,-143,-144,-146,-148,-160,-163,-109,194,110,110,110,247,-109,110,-141,-142,-145,-161,-102,110,247,247,110,110,110,247,-116,247,-147,110,-115,-92,]),'ACTION_KEY':([60,],[80,]),'EVENT_KEY':([63,],[81,]),'PLUS':([67,70,74,83,88,96,99,109,110,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,136,140,141,142,143,144,146,147,148,149,150,151,152,153,154,155,160,168,170,171,172,173,174,179,180,181,194,204,205,208,219,224,226,228,231,234,235,236,237,239,240,241,242,243,248,249,251,254,255,257,258,259,267,270,272,273,274,277,280,286,297,301,302,307,311,316,317,321,],[-176,-33,-34,-31,-32,113,-35,113,113,-140,113,113,113,113,113,113,113,113,113,113,-135,-136,-137,-138,-139,113,-131,113,-120,-121,113,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,113,113,113,113,-149,-134,-122,-109,113,113,113,-109,113,113,-162,-137,113,-109,-109,-110,-113,-114,113,113,113,-143,-144,-146,-148,-160,-163,-109,113,113,113,113,-109,113,-141,-142,-145,-161,-102,113,113,113,113,-116,-147,113,-115,-92,]),'TIMES':([67,70,74,83,88,96,99,109,110,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,136,140,141,142,143,144,146,147,148,149,150,151,152,153,154,155,160,168,170,171,172,173,174,179,180,181,194,204,205,208,219,224,226,228,231,234,235,236,237,239,240,241,242,243,248,249,251,254,255,257,258,259,267,270,272,273,274,277,280,286,297,301,302,307,311,316,317,321,],[-176,-33,-34,-31,-32,115,-35,115,115,-140,115,115,115,115,115,115,115,115,115,115,-135,-136,-137,-138,-139,115,-131,115,-120,-121,115,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,115,115,115,115,-149,-134,-122,-109,115,115,115,-109,115,115,-162,-137,115,-109,-109,-110,-113,-114,115,115,115,-143,-144,-146,-148,-160,-163,-109,115,115,115,115,-109,115,-141,-142,-145,-161,-102,115,115,115,115,-116,-147,115,-115,-92,]),'DIVIDE':([67,70,74,83,88,96,99,109,110,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,136,140,141,142,143,144,146,147,148,149,150,151,152,153,154,155,160,168,170,171,172,173,174,179,180,181,194,204,205,208,219,224,226,228,231,234,235,236,237,239,240,241,242,243,248,249,251,254,255,257,258,259,267,270,272,273,274,277,280,286,297,301,302,307,311,316,317,321,],[-176,-33,-34,-31,-32,116,-35,116,116,-140,116,116,116,116,116,116,116,116,116,116,-135,-136,-137,-138,-139,116,-131,116,-120,-121,116,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,116,116,116,116,-149,-134,-122,-109,116,116,116,-109,116,116,-162,-137,116,-109,-109,-110,-113,-114,116,116,116,-143,-144,-146,-148,-160,-163,-109,116,116,116,116,-109,116,-141,-142,-145,-161,-102,116,116,116,116,-116,-147,116,-115,-92,]),'GT':([67,70,74,83,88,96,99,109,110,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,136,140,141,142,143,144,146,147,148,149,150,151,152,153,154,155,160,168,170,171,172,173,174,179,180,181,194,204,205,208,219,224,226,228,231,234,235,236,237,239,240,241,242,243,248,249,251,254,255,257,258,259,267,270,272,273,274,277,280,286,297,301,302,307,311,316,317,321,],[-176,-33,-34,-31,-32,117,-35,117,117,-140,117,117,117,117,117,117,117,117,117,117,-135,-136,-137,-138,-139,117,-131,117,-120,-121,117,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,117,117,117,117,-149,-134,-122,-109,117,117,117,-109,117,117,-162,-137,117,-109,-109,-110,-113,-114,117,117,117,-143,-144,-146,-148,-160,-163,-109,117,117,117,117,-109,117,-141,-142,-145,-161,-102,117,117,117,117,-116,-147,117,-115,-92,]),'GTEQ':([67,70,74,83,88,96,99,109,110,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,136,140,141,142,143,144,146,147,148,149,150,151,152,153,154,155,160,168,170,171,172,173,174,179,180,181,194,204,205,208,219,224,226,228,231,234,235,236,237,239,240,241,242,243,248,249,251,254,255,257,258,259,267,270,272,273,274,277,280,286,297,301,302,307,311,316,317,321,],[-176,-33,-34,-31,-32,118,-35,118,118,-140,118,118,118,118,118,118,118,118,118,118,-135,-136,-137,-138,-139,118,-131,118,-120,-121,118,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,118,118,118,118,-149,-134,-122,-109,118,118,118,-109,118,118,-162,-137,118,-109,-109,-110,-113,-114,118,118,118,-143,-144,-146,-148,-160,-163,-109,118,118,118,118,-109,118,-141,-142,-145,-161,-102,118,118,118,118,-116,-147,118,-115,-92,]),'LT':([67,70,74,83,88,96,99,109,110,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,136,140,141,142,143,144,146,147,148,149,150,151,152,153,154,155,160,168,170,171,172,173,174,179,180,181,194,204,205,208,219,224,226,228,231,234,235,236,237,239,240,241,242,243,248,249,251,254,255,257,258,259,267,270,272,273,274,277,280,286,297,301,302,307,311,316,317,321,],[-176,-33,-34,-31,-32,119,-35,119,119,-140,119,119,119,119,119,119,119,119,119,119,-135,-136,-137,-138,-139,119,-131,119,-120,-121,119,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,119,119,119,119,-149,-134,-122,-109,119,119,119,-109,119,119,-162,-137,119,-109,-109,-110,-113,-114,119,119,119,-143,-144,-146,-148,-160,-163,-109,119,119,119,119,-109,119,-141,-142,-145,-161,-102,119,119,119,119,-116,-147,119,-115,-92,]),'LTEQ':([67,70,74,83,88,96,99,109,110,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,136,140,141,142,143,144,146,147,148,149,150,151,152,153,154,155,160,168,170,171,172,173,174,179,180,181,194,204,205,208,219,224,226,228,231,234,235,236,237,239,240,241,242,243,248,249,251,254,255,257,258,259,267,270,272,273,274,277,280,286,297,301,302,307,311,316,317,321,],[-176,-33,-34,-31,-32,120,-35,120,120,-140,120,120,120,120,120,120,120,120,120,120,-135,-136,-137,-138,-139,120,-131,120,-120,-121,120,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,120,120,120,120,-149,-134,-122,-109,120,120,120,-109,120,120,-162,-137,120,-109,-109,-110,-113,-114,120,120,120,-143,-144,-146,-148,-160,-163,-109,120,120,120,120,-109,120,-141,-142,-145,-161,-102,120,120,120,120,-116,-147,120,-115,-92,]),'NEQ':([67,70,74,83,88,96,99,109,110,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,136,140,141,142,143,144,146,147,148,149,150,151,152,153,154,155,160,168,170,171,172,173,174,179,180,181,194,204,205,208,219,224,226,228,231,234,235,236,237,239,240,241,242,243,248,249,251,254,255,257,258,259,267,270,272,273,274,277,280,286,297,301,302,307,311,316,317,321,],[-176,-33,-34,-31,-32,121,-35,121,121,-140,121,121,121,121,121,121,121,121,121,121,-135,-136,-137,-138,-139,121,-131,121,-120,-121,121,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,121,121,121,121,-149,-134,-122,-109,121,121,121,-109,121,121,-162,-137,121,-109,-109,-110,-113,-114,121,121,121,-143,-144,-146,-148,-160,-163,-109,121,121,121,121,-109,121,-141,-142,-145,-161,-102,121,121,121,121,-116,-147,121,-115,-92,]),'MOD':([67,70,74,83,88,96,99,109,110,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,136,140,141,142,143,144,146,147,148,149,150,151,152,153,154,155,160,168,170,171,172,173,174,179,180,181,194,204,205,208,219,224,226,228,231,234,235,236,237,239,240,241,242,243,248,249,251,254,255,257,258,259,267,270,272,273,274,277,280,286,297,301,302,307,311,316,317,321,],[-176,-33,-34,-31,-32,122,-35,122,122,-140,122,122,122,122,122,122,122,122,122,122,-135,-136,-137,-138,-139,122,-131,122,-120,-121,122,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,122,122,122,122,-149,-134,-122,-109,122,122,122,-109,122,122,-162,-137,122,-109,-109,-110,-113,-114,122,122,122,-143,-144,-146,-148,-160,-163,-109,122,122,122,122,-109,122,-141,-142,-145,-161,-102,122,122,122,122,-116,-147,122,-115,-92,]),'DECIMAL':([67,70,74,83,88,96,99,109,110,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,136,140,141,142,143,144,146,147,148,149,150,151,152,153,154,155,160,168,170,171,172,173,174,179,180,181,194,204,205,208,219,224,226,228,231,234,235,236,237,239,240,241,242,243,248,249,251,254,255,257,258,259,267,270,272,273,274,275,277,280,286,297,301,302,307,311,316,317,321,],[-176,-33,-34,-31,-32,123,-35,123,123,-140,123,123,123,123,123,123,123,123,123,123,-135,-136,-137,-138,-139,123,-131,123,-120,-121,123,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,123,123,123,123,-149,-134,-122,-109,123,123,123,-109,123,123,-162,-137,123,-109,-109,-110,-113,-114,123,123,123,-143,-144,-146,-148,-160,-163,-109,123,123,123,123,-109,123,-141,-142,-145,298,-161,-102,123,123,123,123,-116,-147,123,-115,-92,]),'PROBABILITY':([67,70,74,83,88,96,99,109,110,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,136,140,141,142,143,144,146,147,148,149,150,151,152,153,154,155,160,168,170,171,172,173,174,179,180,181,194,204,205,208,219,224,226,228,231,234,235,236,237,239,240,241,242,243,248,249,251,254,255,257,258,259,267,268,270,272,273,274,277,280,286,297,301,302,307,311,316,317,321,],[-176,-33,-34,-31,-32,124,-35,124,124,-140,124,124,124,124,124,124,124,124,124,124,-135,-136,-137,-138,-139,124,-131,124,-120,-121,124,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,124,124,124,124,-149,-134,-122,-109,124,124,124,-109,124,124,-162,-137,124,-109,-109,-110,-113,-114,124,124,124,-143,-144,-146,-148,-160,-163,-109,124,124,124,124,-109,291,124,-141,-142,-145,-161,-102,124,124,124,124,-116,-147,124,-115,-92,]),'POS_INTEGER':([67,70,74,83,86,88,96,99,101,102,103,109,110,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,132,136,140,141,142,143,144,146,147,148,149,150,151,152,153,154,155,160,168,170,171,172,173,174,179,180,181,193,194,204,205,208,217,219,220,221,222,223,224,226,228,231,234,235,236,237,239,240,241,242,243,246,248,249,250,251,252,254,255,257,258,259,267,270,272,273,274,277,280,286,297,301,302,307,311,316,317,321,],[-176,-33,-34,-31,102,-32,126,-35,102,-37,-38,126,126,-140,126,126,126,126,126,126,126,126,126,126,-135,-136,-137,-138,-139,165,126,-131,126,-120,-121,126,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,126,126,126,126,-149,-134,-122,-109,126,126,222,126,-109,126,126,-177,-162,222,-169,-178,-179,-137,126,-109,-109,-110,-113,-114,126,126,126,-143,-144,-146,222,-148,-160,-177,-163,-168,-109,126,126,126,126,-109,126,-141,-142,-145,-161,-102,126,126,126,126,-116,-147,126,-115,-92,]),'NEG_INTEGER':([67,70,74,83,86,88,96,99,101,102,103,109,110,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,136,140,141,142,143,144,146,147,148,149,150,151,152,153,154,155,160,168,170,171,172,173,174,179,180,181,193,194,204,205,208,217,219,220,221,222,223,224,226,228,231,234,235,236,237,239,240,241,242,243,246,248,249,250,251,252,254,255,257,258,259,267,270,272,273,274,277,280,286,297,301,302,307,311,316,317,321,],[-176,-33,-34,-31,103,-32,127,-35,103,-37,-38,127,127,-140,127,127,127,127,127,127,127,127,127,127,-135,-136,-137,-138,-139,127,-131,127,-120,-121,127,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,127,127,127,127,-149,-134,-122,-109,127,127,223,127,-109,127,127,-177,-162,223,-169,-178,-179,-137,127,-109,-109,-110,-113,-114,127,127,127,-143,-144,-146,223,-148,-160,-177,-163,-168,-109,127,127,127,127,-109,127,-141,-142,-145,-161,-102,127,127,127,127,-116,-147,127,-115,-92,]),'EFFECT_KEY':([67,70,74,83,88,99,111,123,124,125,126,127,140,142,143,146,147,148,149,150,151,152,153,154,155,158,164,172,173,174,182,183,190,209,219,245,248,249,251,271,277,312,],[-176,-33,-34,-31,-32,-35,-140,-135,-136,-137,-138,-139,-131,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,179,179,-149,-134,-122,-76,-77,179,-78,-162,-98,-148,-160,-163,-75,-161,-97,]),'INTERARRIVAL_KEY':([67,70,74,83,88,99,111,123,124,125,126,127,140,142,143,146,147,148,149,150,151,152,153,154,155,164,172,173,174,182,183,209,219,248,249,251,271,277,],[-176,-33,-34,-31,-32,-35,-140,-135,-136,-137,-138,-139,-131,-120,-121,-123,-124,-125,-126,-127,-128,-129,-130,-132,-133,191,-149,-134,-122,-76,-77,-78,-162,-148,-160,-163,-75,-161,]),'BOUNDS_KEY':([67,69,104,131,133,],[-176,86,-167,-166,86,]),'PARAMETERS_KEY':([97,98,],[129,129,]),'AND_KEY':([106,181,202,233,262,265,287,292,310,],[136,208,226,267,286,267,302,306,320,]),'DURATION_KEY':([128,130,185,210,211,],[159,159,-71,-69,-70,]),'PRECONDITION_KEY':([128,130,157,163,185,207,210,211,238,],[160,160,160,160,-71,-119,-69,-70,-118,]),'NOT_KEY':([168,181,237,239,255,262,287,292,304,310,],[192,192,192,192,192,192,192,192,192,192,]),'FORALL_KEY':([202,255,],[229,229,]),'WHEN_KEY':([202,237,255,313,],[230,269,269,230,]),'ONEOF_KEY':([202,233,265,],[231,231,231,]),'PROBABILISTIC_KEY':([237,255,],[268,268,]),'OR_KEY':([239,],[270,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'domain_section':([0,],[1,]),'requirements_def':([0,],[2,]),'types_def':([0,],[3,]),'constants_def':([0,],[4,]),'fluents_def':([0,],[5,]),'predicates_def':([0,],[6,]),'derived_predicates_def':([0,],[7,]),'processes_def':([0,],[8,]),'actions_def':([0,],[9,]),'events_def':([0,],[10,]),'requirements_lst':([12,23,],[21,42,]),'requirement_def':([12,23,],[23,23,]),'typed_names_lst':([13,14,66,],[25,28,82,]),'names_lst':([13,14,66,],[26,26,26,]),'fluent_def_lst':([15,],[31,]),'fluent_def':([15,31,78,110,113,114,115,116,117,118,119,120,121,122,141,194,],[32,49,95,142,142,142,142,142,142,142,142,142,142,142,142,142,]),'predicate_def_lst':([16,],[34,]),'predicate_def':([16,34,78,],[35,53,94,]),'derived_def_lst':([17,],[36,]),'processes_def_lst':([18,],[38,]),'action_def_lst':([19,],[39,]),'event_def_lst':([20,],[40,]),'derived_def':([36,],[56,]),'process_def':([38,],[59,]),'action_def':([39,],[62,]),'event_def':([40,],[65,]),'type':([44,50,89,100,],[66,74,104,131,]),'typed_variables_lst':([47,51,105,161,175,261,],[69,75,133,184,69,284,]),'variables_lst':([47,51,69,75,105,133,161,175,184,193,246,261,284,],[71,77,85,85,135,85,186,71,85,218,218,285,85,]),'variable':([47,51,69,71,75,77,85,105,133,135,161,175,184,186,193,218,246,261,284,285,],[72,72,72,90,72,90,90,72,72,90,72,72,72,90,72,90,72,72,72,90,]),'bounds_def':([69,133,],[84,84,]),'num':([86,101,],[101,132,]),'derived_def_body':([94,95,],[107,108,]),'expression':([96,109,110,113,114,115,116,117,118,119,120,121,122,136,141,144,160,168,170,171,180,181,194,205,208,226,237,239,240,255,257,258,259,270,286,297,301,302,316,],[112,139,143,143,143,143,143,143,143,143,143,143,143,170,143,139,183,139,170,170,206,139,143,236,242,236,139,139,273,139,236,236,236,242,242,273,273,242,273,]),'parameters_def':([97,98,],[128,130,]),'expression_body_list':([110,113,114,115,116,117,118,119,120,121,122,194,],[140,146,147,148,149,150,151,152,153,154,155,140,]),'expression_body':([110,113,114,115,116,117,118,119,120,121,122,141,194,],[141,141,141,141,141,141,141,141,141,141,141,174,141,]),'action_def_body':([128,157,],[156,177,]),'duration_def':([128,130,],[157,163,]),'precond_def':([128,130,157,163,],[158,164,158,164,]),'event_def_body':([130,163,],[162,188,]),'fluent_predicate_def_lst':([136,170,171,],[169,196,197,]),'literal':([136,160,170,171,205,208,226,230,240,257,258,259,263,269,270,286,291,294,297,301,302,306,316,318,320,325,],[171,182,171,171,235,241,235,264,272,235,235,235,289,296,241,241,305,296,272,272,241,296,272,296,296,296,]),'predicate':([136,160,170,171,192,205,208,226,230,240,257,258,259,263,269,270,286,291,294,297,301,302,306,316,318,320,325,],[172,172,172,172,216,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,]),'effects_def':([158,164,190,],[178,189,213,]),'frequency_def':([164,],[190,]),'effect_body':([179,231,],[199,266,]),'forall':([179,226,258,259,],[200,258,258,258,]),'when_body':([179,300,],[201,314,]),'unlabeled_effect':([179,204,228,231,254,],[203,232,260,203,278,]),'deterministic_effect':([179,204,228,231,254,],[204,204,204,204,204,]),'effects_lst':([179,204,226,228,231,254,267,],[205,205,257,205,205,205,257,]),'constants_lst':([193,246,],[220,220,]),'constant':([193,220,246,],[221,252,221,]),'effect':([205,226,257,258,259,],[234,259,234,259,259,]),'literals_lst':([208,270,286,302,],[240,297,301,316,]),'or_literal':([208,240,270,286,297,301,302,316,],[243,274,243,243,274,274,243,274,]),'forall_body':([226,258,259,],[256,281,282,]),'when_pre':([230,],[263,]),'when_eff':([263,],[288,]),'when_effects':([269,],[293,]),'when_if':([269,],[294,]),'simple_effect':([269,294,306,318,320,325,],[295,309,319,324,319,324,]),'when_then':([294,],[308,]),'simple_effects_lst':([306,320,],[318,325,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> domain_section","S'",1,None,None,None),
+  ('tsal -> domain','tsal',1,'p_tsal','tsalparser.py',324),
+  ('tsal -> problem','tsal',1,'p_tsal','tsalparser.py',325),
+  ('tsal -> domain problem','tsal',2,'p_tsal','tsalparser.py',326),
+  ('domain -> LPAREN DEFINE_KEY domain_def domain_section_lst RPAREN','domain',5,'p_domain','tsalparser.py',374),
+  ('domain_section_lst -> domain_section_lst domain_section','domain_section_lst',2,'p_domain_section_lst','tsalparser.py',396),
+  ('domain_section_lst -> domain_section','domain_section_lst',1,'p_domain_section_lst','tsalparser.py',397),
+  ('domain_section -> requirements_def','domain_section',1,'p_domain_section','tsalparser.py',406),
+  ('domain_section -> types_def','domain_section',1,'p_domain_section','tsalparser.py',407),
+  ('domain_section -> constants_def','domain_section',1,'p_domain_section','tsalparser.py',408),
+  ('domain_section -> fluents_def','domain_section',1,'p_domain_section','tsalparser.py',409),
+  ('domain_section -> predicates_def','domain_section',1,'p_domain_section','tsalparser.py',410),
+  ('domain_section -> derived_predicates_def','domain_section',1,'p_domain_section','tsalparser.py',411),
+  ('domain_section -> processes_def','domain_section',1,'p_domain_section','tsalparser.py',412),
+  ('domain_section -> actions_def','domain_section',1,'p_domain_section','tsalparser.py',413),
+  ('domain_section -> events_def','domain_section',1,'p_domain_section','tsalparser.py',414),
+  ('domain_def -> LPAREN DOMAIN_KEY NAME RPAREN','domain_def',4,'p_domain_def','tsalparser.py',419),
+  ('requirements_def -> LPAREN REQUIREMENTS_KEY requirements_lst RPAREN','requirements_def',4,'p_requirements_def','tsalparser.py',423),
+  ('requirements_def -> LPAREN REQUIREMENTS_KEY RPAREN','requirements_def',3,'p_requirements_def','tsalparser.py',424),
+  ('requirements_lst -> requirement_def requirements_lst','requirements_lst',2,'p_requirements_lst','tsalparser.py',431),
+  ('requirements_lst -> requirement_def','requirements_lst',1,'p_requirements_lst','tsalparser.py',432),
+  ('requirement_def -> NAME','requirement_def',1,'p_requirement_def','tsalparser.py',439),
+  ('types_def -> LPAREN TYPES_KEY typed_names_lst RPAREN','types_def',4,'p_types_def','tsalparser.py',443),
+  ('constants_def -> LPAREN CONSTANTS_KEY typed_names_lst RPAREN','constants_def',4,'p_constants_def','tsalparser.py',448),
+  ('constants_def -> LPAREN CONSTANTS_KEY RPAREN','constants_def',3,'p_constants_def','tsalparser.py',449),
+  ('typed_names_lst -> names_lst HYPHEN type typed_names_lst','typed_names_lst',4,'p_typed_names_lst','tsalparser.py',465),
+  ('typed_names_lst -> names_lst HYPHEN type','typed_names_lst',3,'p_typed_names_lst','tsalparser.py',466),
+  ('typed_names_lst -> names_lst','typed_names_lst',1,'p_typed_names_lst','tsalparser.py',467),
+  ('fluents_def -> LPAREN FLUENTS_KEY fluent_def_lst RPAREN','fluents_def',4,'p_fluents_def','tsalparser.py',481),
+  ('fluent_def_lst -> fluent_def_lst fluent_def','fluent_def_lst',2,'p_fluent_def_lst','tsalparser.py',487),
+  ('fluent_def_lst -> fluent_def','fluent_def_lst',1,'p_fluent_def_lst','tsalparser.py',488),
+  ('fluent_def -> LPAREN NAME typed_variables_lst RPAREN','fluent_def',4,'p_fluent_def','tsalparser.py',497),
+  ('fluent_def -> LPAREN NAME variables_lst RPAREN','fluent_def',4,'p_fluent_def','tsalparser.py',498),
+  ('fluent_def -> LPAREN NAME RPAREN','fluent_def',3,'p_fluent_def','tsalparser.py',499),
+  ('fluent_def -> fluent_def HYPHEN type','fluent_def',3,'p_fluent_def','tsalparser.py',500),
+  ('fluent_def -> LPAREN NAME typed_variables_lst bounds_def RPAREN','fluent_def',5,'p_fluent_def','tsalparser.py',501),
+  ('bounds_def -> BOUNDS_KEY num num POS_INTEGER','bounds_def',4,'p_bounds_def','tsalparser.py',514),
+  ('num -> POS_INTEGER','num',1,'p_num','tsalparser.py',518),
+  ('num -> NEG_INTEGER','num',1,'p_num','tsalparser.py',519),
+  ('predicates_def -> LPAREN PREDICATES_KEY predicate_def_lst RPAREN','predicates_def',4,'p_predicates_def','tsalparser.py',523),
+  ('predicate_def_lst -> predicate_def_lst predicate_def','predicate_def_lst',2,'p_predicate_def_lst','tsalparser.py',528),
+  ('predicate_def_lst -> predicate_def','predicate_def_lst',1,'p_predicate_def_lst','tsalparser.py',529),
+  ('predicate_def -> LPAREN NAME typed_variables_lst RPAREN','predicate_def',4,'p_predicate_def','tsalparser.py',538),
+  ('predicate_def -> LPAREN NAME variables_lst RPAREN','predicate_def',4,'p_predicate_def','tsalparser.py',539),
+  ('predicate_def -> LPAREN NAME RPAREN','predicate_def',3,'p_predicate_def','tsalparser.py',540),
+  ('derived_predicates_def -> LPAREN DERIVED_PREDICATES_KEY derived_def_lst RPAREN','derived_predicates_def',4,'p_derived_predicates_def','tsalparser.py',549),
+  ('derived_predicates_def -> LPAREN DERIVED_PREDICATES_KEY RPAREN','derived_predicates_def',3,'p_derived_predicates_def','tsalparser.py',550),
+  ('derived_def_lst -> <empty>','derived_def_lst',0,'p_derived_def_lst','tsalparser.py',557),
+  ('derived_def_lst -> derived_def_lst derived_def','derived_def_lst',2,'p_derived_def_lst','tsalparser.py',558),
+  ('derived_def -> LPAREN DERIVED_KEY predicate_def derived_def_body RPAREN','derived_def',5,'p_derived_def','tsalparser.py',567),
+  ('derived_def -> LPAREN DERIVED_KEY fluent_def derived_def_body RPAREN','derived_def',5,'p_derived_def','tsalparser.py',568),
+  ('derived_def_body -> LPAREN AND_KEY fluent_predicate_def_lst RPAREN','derived_def_body',4,'p_derived_def_body','tsalparser.py',574),
+  ('fluent_predicate_def_lst -> <empty>','fluent_predicate_def_lst',0,'p_fluent_predicate_def_lst','tsalparser.py',580),
+  ('fluent_predicate_def_lst -> expression fluent_predicate_def_lst','fluent_predicate_def_lst',2,'p_fluent_predicate_def_lst','tsalparser.py',581),
+  ('fluent_predicate_def_lst -> literal fluent_predicate_def_lst','fluent_predicate_def_lst',2,'p_fluent_predicate_def_lst','tsalparser.py',582),
+  ('processes_def -> LPAREN PROCESSES_KEY processes_def_lst RPAREN','processes_def',4,'p_processes_def','tsalparser.py',591),
+  ('processes_def_lst -> <empty>','processes_def_lst',0,'p_processes_def_lst','tsalparser.py',596),
+  ('processes_def_lst -> processes_def_lst process_def','processes_def_lst',2,'p_processes_def_lst','tsalparser.py',597),
+  ('process_def -> LPAREN EQUALS NAME expression RPAREN','process_def',5,'p_process_def','tsalparser.py',606),
+  ('actions_def -> LPAREN ACTIONS_KEY action_def_lst RPAREN','actions_def',4,'p_actions_def','tsalparser.py',613),
+  ('action_def_lst -> <empty>','action_def_lst',0,'p_action_def_lst','tsalparser.py',618),
+  ('action_def_lst -> action_def_lst action_def','action_def_lst',2,'p_action_def_lst','tsalparser.py',619),
+  ('action_def -> LPAREN ACTION_KEY NAME parameters_def action_def_body RPAREN','action_def',6,'p_action_def','tsalparser.py',627),
+  ('action_def -> LPAREN ACTION_KEY NAME parameters_def duration_def action_def_body RPAREN','action_def',7,'p_action_def','tsalparser.py',628),
+  ('event_def -> LPAREN EVENT_KEY NAME parameters_def event_def_body RPAREN','event_def',6,'p_event_def','tsalparser.py',675),
+  ('event_def -> LPAREN EVENT_KEY NAME parameters_def duration_def event_def_body RPAREN','event_def',7,'p_event_def','tsalparser.py',676),
+  ('events_def -> LPAREN EVENTS_KEY event_def_lst RPAREN','events_def',4,'p_events_def','tsalparser.py',687),
+  ('event_def_lst -> <empty>','event_def_lst',0,'p_event_def_lst','tsalparser.py',692),
+  ('event_def_lst -> event_def_lst event_def','event_def_lst',2,'p_event_def_lst','tsalparser.py',693),
+  ('parameters_def -> PARAMETERS_KEY LPAREN typed_variables_lst RPAREN','parameters_def',4,'p_parameters_def','tsalparser.py',701),
+  ('parameters_def -> PARAMETERS_KEY LPAREN variables_lst RPAREN','parameters_def',4,'p_parameters_def','tsalparser.py',702),
+  ('parameters_def -> PARAMETERS_KEY LPAREN RPAREN','parameters_def',3,'p_parameters_def','tsalparser.py',703),
+  ('action_def_body -> precond_def effects_def','action_def_body',2,'p_action_def_body','tsalparser.py',711),
+  ('event_def_body -> precond_def effects_def','event_def_body',2,'p_event_def_body','tsalparser.py',716),
+  ('event_def_body -> precond_def frequency_def effects_def','event_def_body',3,'p_event_def_body','tsalparser.py',717),
+  ('precond_def -> PRECONDITION_KEY LPAREN AND_KEY literals_lst RPAREN','precond_def',5,'p_precond_def','tsalparser.py',725),
+  ('precond_def -> PRECONDITION_KEY literal','precond_def',2,'p_precond_def','tsalparser.py',726),
+  ('precond_def -> PRECONDITION_KEY expression','precond_def',2,'p_precond_def','tsalparser.py',727),
+  ('precond_def -> PRECONDITION_KEY LPAREN RPAREN','precond_def',3,'p_precond_def','tsalparser.py',728),
+  ('effects_def -> EFFECT_KEY effect_body','effects_def',2,'p_effects_def','tsalparser.py',738),
+  ('effects_def -> EFFECT_KEY forall','effects_def',2,'p_effects_def','tsalparser.py',739),
+  ('effects_def -> EFFECT_KEY when_body','effects_def',2,'p_effects_def','tsalparser.py',740),
+  ('effects_def -> EFFECT_KEY LPAREN AND_KEY forall_body RPAREN','effects_def',5,'p_effects_def','tsalparser.py',741),
+  ('effect_body -> LPAREN RPAREN','effect_body',2,'p_effect_body','tsalparser.py',752),
+  ('effect_body -> LPAREN NAME unlabeled_effect RPAREN','effect_body',4,'p_effect_body','tsalparser.py',753),
+  ('effect_body -> effect_body LPAREN NAME unlabeled_effect RPAREN','effect_body',5,'p_effect_body','tsalparser.py',754),
+  ('effect_body -> unlabeled_effect','effect_body',1,'p_effect_body','tsalparser.py',755),
+  ('forall_body -> forall forall_body','forall_body',2,'p_forall_body','tsalparser.py',766),
+  ('forall_body -> forall','forall_body',1,'p_forall_body','tsalparser.py',767),
+  ('forall_body -> effect forall_body','forall_body',2,'p_forall_body','tsalparser.py',768),
+  ('forall_body -> effect','forall_body',1,'p_forall_body','tsalparser.py',769),
+  ('when_body -> LPAREN WHEN_KEY when_pre when_eff RPAREN','when_body',5,'p_when_body','tsalparser.py',776),
+  ('forall -> LPAREN FORALL_KEY LPAREN typed_variables_lst RPAREN when_body RPAREN','forall',7,'p_forall','tsalparser.py',781),
+  ('when_pre -> LPAREN AND_KEY literals_lst RPAREN','when_pre',4,'p_when_pre','tsalparser.py',785),
+  ('when_pre -> literal','when_pre',1,'p_when_pre','tsalparser.py',786),
+  ('when_eff -> LPAREN AND_KEY literals_lst RPAREN','when_eff',4,'p_when_eff','tsalparser.py',793),
+  ('when_eff -> literal','when_eff',1,'p_when_eff','tsalparser.py',794),
+  ('frequency_def -> INTERARRIVAL_KEY LPAREN NAME NAME DECIMAL RPAREN','frequency_def',6,'p_frequency_def','tsalparser.py',803),
+  ('frequency_def -> INTERARRIVAL_KEY LPAREN RPAREN','frequency_def',3,'p_frequency_def','tsalparser.py',804),
+  ('unlabeled_effect -> LPAREN ONEOF_KEY effect_body RPAREN','unlabeled_effect',4,'p_unlabeled_effect','tsalparser.py',811),
+  ('unlabeled_effect -> deterministic_effect unlabeled_effect','unlabeled_effect',2,'p_unlabeled_effect','tsalparser.py',812),
+  ('unlabeled_effect -> deterministic_effect','unlabeled_effect',1,'p_unlabeled_effect','tsalparser.py',813),
+  ('deterministic_effect -> LPAREN AND_KEY effects_lst RPAREN','deterministic_effect',4,'p_deterministic_effect','tsalparser.py',823),
+  ('deterministic_effect -> effects_lst','deterministic_effect',1,'p_deterministic_effect','tsalparser.py',824),
+  ('when_effects -> when_if when_then','when_effects',2,'p_when_effects','tsalparser.py',831),
+  ('when_if -> simple_effect','when_if',1,'p_when_if','tsalparser.py',837),
+  ('when_if -> LPAREN AND_KEY simple_effects_lst RPAREN','when_if',4,'p_when_if','tsalparser.py',838),
+  ('when_then -> simple_effect','when_then',1,'p_when_then','tsalparser.py',846),
+  ('when_then -> LPAREN AND_KEY simple_effects_lst RPAREN','when_then',4,'p_when_then','tsalparser.py',847),
+  ('effects_lst -> <empty>','effects_lst',0,'p_effects_lst','tsalparser.py',855),
+  ('effects_lst -> effects_lst effect','effects_lst',2,'p_effects_lst','tsalparser.py',856),
+  ('simple_effects_lst -> simple_effects_lst simple_effect','simple_effects_lst',2,'p_simple_effects_lst','tsalparser.py',865),
+  ('simple_effects_lst -> simple_effect','simple_effects_lst',1,'p_simple_effects_lst','tsalparser.py',866),
+  ('effect -> literal','effect',1,'p_effect','tsalparser.py',874),
+  ('effect -> expression','effect',1,'p_effect','tsalparser.py',875),
+  ('effect -> LPAREN PROBABILISTIC_KEY PROBABILITY literal RPAREN','effect',5,'p_effect','tsalparser.py',876),
+  ('effect -> LPAREN WHEN_KEY when_effects RPAREN','effect',4,'p_effect','tsalparser.py',877),
+  ('simple_effect -> literal','simple_effect',1,'p_simple_effect','tsalparser.py',886),
+  ('duration_def -> DURATION_KEY LPAREN expression RPAREN','duration_def',4,'p_duration_def','tsalparser.py',892),
+  ('duration_def -> DURATION_KEY LPAREN RPAREN','duration_def',3,'p_duration_def','tsalparser.py',893),
+  ('expression_body -> fluent_def','expression_body',1,'p_expression_body','tsalparser.py',906),
+  ('expression_body -> expression','expression_body',1,'p_expression_body','tsalparser.py',907),
+  ('expression_body_list -> expression_body expression_body','expression_body_list',2,'p_expression_body_list','tsalparser.py',911),
+  ('expression -> PLUS expression_body_list','expression',2,'p_expression','tsalparser.py',915),
+  ('expression -> HYPHEN expression_body_list','expression',2,'p_expression','tsalparser.py',916),
+  ('expression -> TIMES expression_body_list','expression',2,'p_expression','tsalparser.py',917),
+  ('expression -> DIVIDE expression_body_list','expression',2,'p_expression','tsalparser.py',918),
+  ('expression -> GT expression_body_list','expression',2,'p_expression','tsalparser.py',919),
+  ('expression -> GTEQ expression_body_list','expression',2,'p_expression','tsalparser.py',920),
+  ('expression -> LT expression_body_list','expression',2,'p_expression','tsalparser.py',921),
+  ('expression -> LTEQ expression_body_list','expression',2,'p_expression','tsalparser.py',922),
+  ('expression -> EQUALS expression_body_list','expression',2,'p_expression','tsalparser.py',923),
+  ('expression -> NEQ expression_body_list','expression',2,'p_expression','tsalparser.py',924),
+  ('expression -> MOD expression_body_list','expression',2,'p_expression','tsalparser.py',925),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression','tsalparser.py',926),
+  ('expression -> DECIMAL','expression',1,'p_expression','tsalparser.py',927),
+  ('expression -> PROBABILITY','expression',1,'p_expression','tsalparser.py',928),
+  ('expression -> VARIABLE','expression',1,'p_expression','tsalparser.py',929),
+  ('expression -> POS_INTEGER','expression',1,'p_expression','tsalparser.py',930),
+  ('expression -> NEG_INTEGER','expression',1,'p_expression','tsalparser.py',931),
+  ('expression -> NAME','expression',1,'p_expression','tsalparser.py',932),
+  ('literals_lst -> literals_lst literal','literals_lst',2,'p_literals_lst','tsalparser.py',944),
+  ('literals_lst -> literals_lst expression','literals_lst',2,'p_literals_lst','tsalparser.py',945),
+  ('literals_lst -> literal','literals_lst',1,'p_literals_lst','tsalparser.py',946),
+  ('literals_lst -> expression','literals_lst',1,'p_literals_lst','tsalparser.py',947),
+  ('literals_lst -> literals_lst or_literal','literals_lst',2,'p_literals_lst','tsalparser.py',948),
+  ('literals_lst -> or_literal','literals_lst',1,'p_literals_lst','tsalparser.py',949),
+  ('or_literal -> LPAREN OR_KEY literals_lst RPAREN','or_literal',4,'p_or_literal','tsalparser.py',959),
+  ('literal -> LPAREN NOT_KEY predicate RPAREN','literal',4,'p_literal','tsalparser.py',966),
+  ('literal -> predicate','literal',1,'p_literal','tsalparser.py',967),
+  ('ground_predicates_lst -> ground_predicates_lst ground_predicate','ground_predicates_lst',2,'p_ground_predicates_lst','tsalparser.py',975),
+  ('ground_predicates_lst -> ground_predicate','ground_predicates_lst',1,'p_ground_predicates_lst','tsalparser.py',976),
+  ('ground_predicate -> LPAREN NAME constants_lst RPAREN','ground_predicate',4,'p_ground_predicate','tsalparser.py',985),
+  ('ground_predicate -> LPAREN NAME RPAREN','ground_predicate',3,'p_ground_predicate','tsalparser.py',986),
+  ('ground_predicate -> ground_fluent','ground_predicate',1,'p_ground_predicate','tsalparser.py',987),
+  ('ground_fluent -> LPAREN EQUALS ground_fluent_def NAME RPAREN','ground_fluent',5,'p_ground_fluent','tsalparser.py',998),
+  ('ground_fluent -> LPAREN EQUALS ground_fluent_def POS_INTEGER RPAREN','ground_fluent',5,'p_ground_fluent','tsalparser.py',999),
+  ('ground_fluent -> LPAREN EQUALS ground_fluent_def NEG_INTEGER RPAREN','ground_fluent',5,'p_ground_fluent','tsalparser.py',1000),
+  ('ground_fluent_def -> LPAREN NAME constants_lst RPAREN','ground_fluent_def',4,'p_ground_fluent_def','tsalparser.py',1005),
+  ('ground_fluent_def -> LPAREN NAME RPAREN','ground_fluent_def',3,'p_ground_fluent_def','tsalparser.py',1006),
+  ('predicate -> LPAREN NAME variables_lst RPAREN','predicate',4,'p_predicate','tsalparser.py',1013),
+  ('predicate -> LPAREN EQUALS VARIABLE VARIABLE RPAREN','predicate',5,'p_predicate','tsalparser.py',1014),
+  ('predicate -> LPAREN NAME RPAREN','predicate',3,'p_predicate','tsalparser.py',1015),
+  ('predicate -> LPAREN NAME constants_lst RPAREN','predicate',4,'p_predicate','tsalparser.py',1016),
+  ('typed_constants_lst -> typed_constants_lst constants_lst HYPHEN type','typed_constants_lst',4,'p_typed_constants_lst','tsalparser.py',1029),
+  ('typed_constants_lst -> constants_lst HYPHEN type','typed_constants_lst',3,'p_typed_constants_lst','tsalparser.py',1030),
+  ('typed_variables_lst -> typed_variables_lst variables_lst HYPHEN type','typed_variables_lst',4,'p_typed_variables_lst','tsalparser.py',1039),
+  ('typed_variables_lst -> variables_lst HYPHEN type','typed_variables_lst',3,'p_typed_variables_lst','tsalparser.py',1040),
+  ('constants_lst -> constants_lst constant','constants_lst',2,'p_constants_lst','tsalparser.py',1049),
+  ('constants_lst -> constant','constants_lst',1,'p_constants_lst','tsalparser.py',1050),
+  ('variables_lst -> variables_lst variable','variables_lst',2,'p_variables_lst','tsalparser.py',1059),
+  ('variables_lst -> variable','variables_lst',1,'p_variables_lst','tsalparser.py',1060),
+  ('variables_lst -> NAME','variables_lst',1,'p_variables_lst','tsalparser.py',1061),
+  ('variables_lst -> variables_lst NAME','variables_lst',2,'p_variables_lst','tsalparser.py',1062),
+  ('names_lst -> names_lst NAME','names_lst',2,'p_names_lst','tsalparser.py',1071),
+  ('names_lst -> NAME','names_lst',1,'p_names_lst','tsalparser.py',1072),
+  ('type -> NAME','type',1,'p_type','tsalparser.py',1081),
+  ('constant -> NAME','constant',1,'p_constant','tsalparser.py',1086),
+  ('constant -> POS_INTEGER','constant',1,'p_constant','tsalparser.py',1087),
+  ('constant -> NEG_INTEGER','constant',1,'p_constant','tsalparser.py',1088),
+  ('variable -> VARIABLE','variable',1,'p_variable','tsalparser.py',1093),
+  ('problem -> plan_problem','problem',1,'p_problem','tsalparser.py',1101),
+  ('plan_problem -> LPAREN DEFINE_KEY plan_problem_def problem_section_lst RPAREN','plan_problem',5,'p_plan_problem','tsalparser.py',1115),
+  ('problem_section_lst -> problem_section_lst problem_section','problem_section_lst',2,'p_problem_section_lst','tsalparser.py',1133),
+  ('problem_section_lst -> problem_section','problem_section_lst',1,'p_problem_section_lst','tsalparser.py',1134),
+  ('problem_section -> domain_def','problem_section',1,'p_problem_section','tsalparser.py',1143),
+  ('problem_section -> objects_def','problem_section',1,'p_problem_section','tsalparser.py',1144),
+  ('problem_section -> init_def','problem_section',1,'p_problem_section','tsalparser.py',1145),
+  ('problem_section -> timed_inits_def','problem_section',1,'p_problem_section','tsalparser.py',1146),
+  ('problem_section -> goal_def','problem_section',1,'p_problem_section','tsalparser.py',1147),
+  ('problem_section -> metric_def','problem_section',1,'p_problem_section','tsalparser.py',1148),
+  ('plan_problem_def -> LPAREN PROBLEM_KEY NAME RPAREN','plan_problem_def',4,'p_plan_problem_def','tsalparser.py',1153),
+  ('objects_def -> LPAREN OBJECTS_KEY typed_constants_lst RPAREN','objects_def',4,'p_objects_def','tsalparser.py',1158),
+  ('objects_def -> LPAREN OBJECTS_KEY constants_lst RPAREN','objects_def',4,'p_objects_def','tsalparser.py',1159),
+  ('init_def -> LPAREN INIT_KEY LPAREN AND_KEY ground_predicates_lst RPAREN RPAREN','init_def',7,'p_init_def','tsalparser.py',1164),
+  ('init_def -> LPAREN INIT_KEY ground_predicates_lst RPAREN','init_def',4,'p_init_def','tsalparser.py',1165),
+  ('init_def -> LPAREN INIT_KEY RPAREN','init_def',3,'p_init_def','tsalparser.py',1166),
+  ('timed_inits_def -> LPAREN TIMED_INIT_KEY timed_init_lst RPAREN','timed_inits_def',4,'p_timed_inits_def','tsalparser.py',1178),
+  ('timed_init_lst -> <empty>','timed_init_lst',0,'p_timed_init_lst','tsalparser.py',1183),
+  ('timed_init_lst -> timed_init_lst timed_init_def','timed_init_lst',2,'p_timed_init_lst','tsalparser.py',1184),
+  ('timed_init_def -> LPAREN AT_KEY DECIMAL literal RPAREN','timed_init_def',5,'p_timed_init_def','tsalparser.py',1193),
+  ('goal_body_def -> LPAREN AND_KEY literals_lst RPAREN','goal_body_def',4,'p_goal_body_def','tsalparser.py',1200),
+  ('goal_body_def_lst -> goal_body_def_lst goal_body_def','goal_body_def_lst',2,'p_goal_body_def_lst','tsalparser.py',1204),
+  ('goal_body_def_lst -> goal_body_def','goal_body_def_lst',1,'p_goal_body_def_lst','tsalparser.py',1205),
+  ('goal_def -> LPAREN GOAL_KEY goal_body_def RPAREN','goal_def',4,'p_goal_def','tsalparser.py',1213),
+  ('goal_def -> LPAREN GOAL_KEY literal RPAREN','goal_def',4,'p_goal_def','tsalparser.py',1214),
+  ('goal_def -> LPAREN GOAL_KEY LPAREN ONEOF_KEY effect_body RPAREN RPAREN','goal_def',7,'p_goal_def','tsalparser.py',1215),
+  ('goal_def -> LPAREN GOAL_KEY LPAREN OR_KEY goal_body_def_lst RPAREN RPAREN','goal_def',7,'p_goal_def','tsalparser.py',1216),
+  ('metric_def -> LPAREN METRIC_KEY NAME fluent_def RPAREN','metric_def',5,'p_metric_def','tsalparser.py',1229),
+]
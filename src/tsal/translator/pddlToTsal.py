@@ -138,6 +138,17 @@ def pddl_To_Tsal(pddl_file, typ):
     pddl = None
     with open(pddl_file, "r") as f:
         pddl = f.read()
+    write_to_file(tsal_file, pddl_Text_To_Tsal(pddl, typ))
+    return tsal_file
+
+def pddl_Text_To_Tsal(pddl, typ):
+    """
+    Translate pddl source to tsal source in memory.
+
+    :param pddl: pddl domain or problem text
+    :param typ: "dom" for a domain, "prob" for a problem
+    :return: the tsal text
+    """
     txt = key_words(pddl, "pddl", "tsal")
     if typ == "dom":
         txt, start, action_txt, actions = group_text(txt, "\(:action ")
@@ -148,8 +159,7 @@ def pddl_To_Tsal(pddl_file, typ):
         txt = txt[0:start:] + event_txt + txt[start::]
     elif typ == "prob":
         txt, start, metric_txt, metrics = group_text(txt, "\(:metric")
-    write_to_file(tsal_file, txt)
-    return tsal_file
+    return txt
 
 
 def tsal_To_Pddl(tsal_file, typ):
@@ -14,6 +14,7 @@
 # along with pypddl-parser.  If not, see <http://www.gnu.org/licenses/>.
 
 
+from tsal.translator.hashing import hashless_state, restore_state
 from tsal.translator.term import Term
 
 
@@ -21,6 +22,10 @@ class Predicate(object):
 
     class_name = 'predicates'
 
+    __slots__ = ('_name', '_args', '_span', '_hash')
+    __getstate__ = hashless_state
+    __setstate__ = restore_state
+
     def __init__(self, name, args=[]):
         """
             Construct a Predicate object
@@ -31,14 +36,34 @@ class Predicate(object):
 
         self._name = name
         self._args = args
+        self._span = None  # Span in the source, only set by located parsers
+        self._hash = None  # computed on first use
 
     @property
     def name(self):
         return self._name
 
+    @property
+    def span(self):
+        return self._span
+
     @property
     def args(self):
-        return self._args[:]
+        args = self._args
+        return args if type(args) is tuple else args[:]
+
+    @property
+    def frozen(self):
+        return type(self._args) is tuple
+
+    def freeze(self):
+        """
+        Keep the args as a tuple, returned by args without a copy.
+
+        :return: self
+        """
+        self._args = tuple(self._args)
+        return self
 
     @property
     def arity(self):
@@ -65,11 +90,15 @@ class Predicate(object):
             return '({0} {1})'.format(self._name, ' '.join(map(str, self._args)))
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if self.name == other.name \
-                and self.args == other.args:
+                and tuple(self._args) == tuple(other.args):
             return True
         else:
             return False
 
     def __hash__(self):
-        return hash((self.name,str(self.args)))
\ No newline at end of file
+        if self._hash is None:
+            self._hash = hash((self._name, tuple(self._args)))
+        return self._hash
\ No newline at end of file
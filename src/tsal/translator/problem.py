@@ -19,6 +19,8 @@ from tsal.translator.predicate import Predicate
 from tsal.translator.term import Term
 from tsal.translator.fluent import Fluent
 from tsal.translator.expression import Expression
+from tsal.translator.encoding import Encoding
+from tsal.translator.frozen import freeze_atoms
 
 
 class Problem(object):
@@ -47,6 +49,8 @@ class Problem(object):
         self._timed_init = timed_init
         self._goal = self.set_goal(goal)
         self._metric = metric
+        self._objects_by_type = None  # (domain, domain revision, index) of the last objects_by_type call
+        self._encoding = None  # (domain, domain revision, Encoding) of the last encoding call
 
     def set_goal(self, goal):
         goals ={'self': [], 'others': {}}
@@ -154,14 +158,57 @@ class Problem(object):
         return pddl_str_cleaned
 
 
+    def objects_by_type(self, domain):
+        """
+        Index of the objects of the problem and the constants of domain by type, subtypes included, see
+        TypeLattice.objects_by_type. Built once per domain, and again after add_object or a change to the types of
+        the domain (see Domain.revision).
+
+        :param domain: the Domain of the problem
+        :return: dictionary from types to tuples of object names
+        """
+        if self._objects_by_type is None or self._objects_by_type[0] is not domain or \
+                self._objects_by_type[1] != domain.revision:
+            index = domain.type_lattice.objects_by_type(self._objects, domain.constants)
+            self._objects_by_type = (domain, domain.revision, index)
+        return self._objects_by_type[2]
+
+    def encoding(self, domain=None):
+        """
+        Dense integer ids of the objects, predicate and fluent symbols and types, see Encoding. Built once
+        per domain, and again after add_object, add_to_init or Domain.clear_caches.
+
+        :param domain: the Domain of the problem, adds its constants, predicates, fluents and types
+        :return: the Encoding of the problem
+        """
+        revision = domain.revision if domain is not None else None
+        if self._encoding is None or self._encoding[0] is not domain or self._encoding[1] != revision:
+            self._encoding = (domain, revision, Encoding(self, domain))
+        return self._encoding[2]
+
     def add_object(self, name_obj, type_obj):
+        self._objects_by_type = None
+        self._encoding = None
         if type_obj in self._objects:
             self._objects[type_obj].append(name_obj)
         else:
             self._objects[type] = [name_obj]
 
     def add_to_init(self, pred):
+        self._encoding = None
         self._init.append(pred)
+
+    def freeze(self):
+        """
+        Freeze the predicates and fluents of the initial state and the goals, see Predicate.freeze. The
+        init list itself stays mutable.
+
+        :return: self
+        """
+        freeze_atoms(self._init)
+        freeze_atoms(self._goal['self'])
+        freeze_atoms(self._goal['others'].values())
+        return self
     def add_to_init_text(self, name, constants_args):
         """
         Adds a predicate (positive literal) to the init set
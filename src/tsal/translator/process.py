@@ -14,15 +14,22 @@
 # along with pypddl-parser.  If not, see <http://www.gnu.org/licenses/>.
 
 
+from tsal.translator.hashing import hashless_state, restore_state
+
+
 class Process(object):
 
     """
     Represents an equation that changes the value of a fluent over time
     """
 
+    __getstate__ = hashless_state
+    __setstate__ = restore_state
+
     def __init__(self, fluent=None, equation=None):
         self._fluent = fluent
         self._equation = equation
+        self._hash = None  # computed on first use
 
     @property
     def fluent(self):
@@ -39,7 +46,8 @@ class Process(object):
         return "(= {} {})".format(self._fluent, self._equation)
 
     def __hash__(self):
-        #print(hash(str(self)))
-        return hash(str(self))
+        if self._hash is None:
+            self._hash = hash((self._fluent, self._equation))
+        return self._hash
 
 
@@ -0,0 +1,216 @@
+# Author: Dustin Dannenhauer
+# Email: dustin.dannenhauer@parallaxresearch.org
+
+# This file is part of tsal-translator, an extension of pypddl-parser
+
+import functools
+import glob
+import hashlib
+import os
+import pickle
+import struct
+import tempfile
+
+from tsal.translator import tsalparser
+
+# magic, parser version, source mtime (ns), source size, source content hash
+_header = struct.Struct('<8s16sQQ16s')
+_magic = b'TSALSNP1'
+
+
+def _digest(data):
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _source_key(filename):
+    # mtime, size and content hash of a source file, read from one open file
+    with open(filename, 'rb') as file:
+        data = file.read()
+        stat = os.fstat(file.fileno())
+    return stat.st_mtime_ns, stat.st_size, _digest(data)
+
+
+def _sources():
+    # the modules of the parser and of the classes it builds, the pickled snapshots depend on all of them
+    return sorted(glob.glob(os.path.join(os.path.dirname(tsalparser.__file__), '*.py')))
+
+
+@functools.lru_cache(maxsize=None)
+def _parser_version():
+    # snapshots written by a different grammar, model classes or pickle protocol are never loaded
+    hasher = hashlib.blake2b(pickle.HIGHEST_PROTOCOL.to_bytes(1, 'little'), digest_size=16)
+    for path in _sources():
+        with open(path, 'rb') as file:
+            data = file.read()
+        hasher.update(os.path.basename(path).encode() + len(data).to_bytes(8, 'little'))
+        hasher.update(data)
+    return hasher.digest()
+
+
+class SnapshotCache(object):
+    """
+    On-disk cache of parsed Domain and Problem objects.
+
+    Every source file has one entry, named after the hash of its absolute path, holding the mtime, size and
+    content hash of the source next to the pickled result. An entry is used when the mtime and size still
+    match, or failing that when the content hash does, so a file rewritten with the same text (e.g. by
+    pddl_To_Tsal) is still a hit; such a hit rewrites the header with the new mtime and size. The key of a source
+    is taken before it is parsed, so a file changed while parsing is parsed again on the next load. Once the entries take more than max_bytes the least recently used are removed.
+    """
+
+    suffix = '.tsalsnap'
+    default_max_bytes = 64 << 20
+
+    def __init__(self, cache_dir, max_bytes=default_max_bytes):
+        """
+
+        :param cache_dir: directory holding the snapshots, created when missing
+        :param max_bytes: upper bound on the total size of the snapshots
+        """
+        self._cache_dir = cache_dir
+        self._max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @property
+    def cache_dir(self):
+        return self._cache_dir
+
+    @property
+    def max_bytes(self):
+        return self._max_bytes
+
+    def parse(self, filename, parse=None):
+        """
+        Return the parsed file from the cache, parsing and storing it on a miss.
+
+        :param filename: path of the source file
+        :param parse: function parsing filename on a miss, TSALParser.parse when None
+        :return: the parsed Domain or Problem
+        """
+        result = self.load(filename)
+        if result is None:
+            try:
+                source = _source_key(filename)
+            except OSError:
+                source = None  # the parser reports the missing file
+            result = (parse or tsalparser.TSALParser.parse)(filename)
+            if result is not None and source is not None:
+                self.store(filename, result, source)
+        return result
+
+    def load(self, filename):
+        """
+        :param filename: path of the source file
+        :return: the cached Domain or Problem, None when there is no valid snapshot
+        """
+        entry = self.entry_path(filename)
+        try:
+            stat = os.stat(filename)
+            with open(entry, 'rb') as file:
+                data = file.read()
+        except OSError:
+            return None
+        if len(data) < _header.size:
+            return None
+        magic, version, mtime, size, digest = _header.unpack_from(data)
+        if magic != _magic or version != _parser_version():
+            return None
+        rewritten = False
+        if mtime != stat.st_mtime_ns or size != stat.st_size:
+            try:
+                source = _source_key(filename)
+            except OSError:
+                return None
+            if source[2] != digest:
+                return None
+            rewritten = True
+        try:
+            result = pickle.loads(memoryview(data)[_header.size:])
+        except Exception:
+            return None
+        if rewritten:
+            # the same text with a new mtime, record it so the next load is a hit on the mtime and size
+            try:
+                self.__write(filename, _header.pack(_magic, version, *source), memoryview(data)[_header.size:])
+            except OSError:
+                pass
+        else:
+            self.__touch(entry)
+        return result
+
+    def store(self, filename, result, source=None):
+        """
+        Write the snapshot of a parsed file.
+
+        :param filename: path of the source file result was parsed from
+        :param result: the parsed Domain or Problem
+        :param source: (mtime, size, content hash) of filename taken before parsing it, read now when None
+        """
+        header = _header.pack(_magic, _parser_version(), *(source or _source_key(filename)))
+        self.__write(filename, header, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+        self.evict()
+
+    def __write(self, filename, header, payload):
+        # write to a temporary file and rename it so readers never see a partial snapshot
+        fd, tmp = tempfile.mkstemp(dir=self._cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(header)
+                file.write(payload)
+            os.replace(tmp, self.entry_path(filename))
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+
+    def entry_path(self, filename):
+        key = hashlib.blake2b(os.path.abspath(filename).encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(self._cache_dir, key + self.suffix)
+
+    def evict(self):
+        """
+        Remove the least recently used snapshots until they fit in max_bytes.
+        """
+        entries = []
+        total = 0
+        with os.scandir(self._cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(self.suffix):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                total += stat.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self._max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self):
+        """
+        Remove every snapshot.
+        """
+        with os.scandir(self._cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(self.suffix):
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+
+    @staticmethod
+    def __touch(path):
+        # the entry mtime records the last use for eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
@@ -0,0 +1,10 @@
+# Author: Dustin Dannenhauer
+# Email: dustin.dannenhauer@parallaxresearch.org
+
+# This file is part of tsal-translator, an extension of pypddl-parser
+
+import collections
+
+# where a parsed object was written: line and column (both from 1) of its first character, byte offsets of its
+# first character and just past its last one; set on Action, Event, Predicate and Expression by located parsers
+Span = collections.namedtuple('Span', ('line', 'column', 'offset', 'end'))
@@ -0,0 +1,119 @@
+# Author: Dustin Dannenhauer
+# Email: dustin.dannenhauer@parallaxresearch.org
+
+# This file is part of tsal-translator, an extension of pypddl-parser
+
+import sys
+
+from tsal.translator.expression import Expression
+from tsal.translator.fluent import Fluent
+from tsal.translator.frozen import FrozenList
+from tsal.translator.literal import Literal
+from tsal.translator.predicate import Predicate
+from tsal.translator.term import Term
+
+
+class SymbolTable(object):
+    """
+    Hash-consing table of terms and atoms.
+
+    Names are interned strings and every Term, Predicate, Fluent and Literal put through the table is
+    replaced by the first structurally identical one it has seen, so equal atoms are the same object: their
+    hash is computed once and set and dict lookups between them end on the identity check. A domain and its
+    problems should share one table. Interned objects are shared, they must not be changed afterwards.
+    """
+
+    def __init__(self):
+        self._objects = {}  # structural key -> canonical Term, Predicate, Fluent or Literal
+
+    def __len__(self):
+        return len(self._objects)
+
+    def term(self, term):
+        key = (Term, term._name, term._type, term._value)
+        canonical = self._objects.get(key)
+        if canonical is None:
+            term._name, term._type, term._value = [self.__symbol(value) for value in key[1:]]
+            hash(term)
+            canonical = self._objects[key] = term
+        return canonical
+
+    def predicate(self, predicate):
+        args = [self.__arg(arg) for arg in predicate._args]
+        key = (Predicate, predicate._name, tuple(args))
+        canonical = self._objects.get(key)
+        if canonical is None:
+            predicate._name = self.__symbol(predicate._name)
+            predicate._args = tuple(args) if predicate.frozen else args
+            predicate._hash = None
+            hash(predicate)
+            canonical = self._objects[key] = predicate
+        return canonical
+
+    def fluent(self, fluent):
+        # bounds and type are part of the key, a declaration does not print like a use of the same fluent
+        args = [self.__arg(arg) for arg in fluent._args]
+        key = (Fluent, fluent._name, tuple(args), tuple(fluent._bounds), fluent._type)
+        canonical = self._objects.get(key)
+        if canonical is None:
+            fluent._name = self.__symbol(fluent._name)
+            fluent._args = tuple(args) if fluent.frozen else args
+            fluent._hash = None
+            hash(fluent)
+            canonical = self._objects[key] = fluent
+        return canonical
+
+    def literal(self, literal):
+        key = (Literal, self.predicate(literal._predicate), literal._positive)
+        canonical = self._objects.get(key)
+        if canonical is None:
+            literal._predicate = key[1]
+            literal._hash = None
+            hash(literal)
+            canonical = self._objects[key] = literal
+        return canonical
+
+    def intern(self, obj):
+        """
+        Intern every term and atom reachable from obj, e.g. a parsed Domain or Problem, a list of atoms or a
+        single atom. Lists, dicts and the attributes of model objects are updated in place.
+
+        :return: obj, or its canonical object when obj is a term or an atom
+        """
+        return self.__walk(obj, set())
+
+    _atoms = {Term: term, Predicate: predicate, Fluent: fluent, Literal: literal}
+
+    def __walk(self, obj, seen):
+        cls = type(obj)
+        intern = self._atoms.get(cls)
+        if intern is not None:
+            return intern(self, obj)
+        if cls is tuple:
+            return tuple([self.__walk(item, seen) for item in obj])
+        if cls is FrozenList:  # the inner lists of a frozen action or event
+            return FrozenList([self.__walk(item, seen) for item in obj])
+        if cls in (str, int, float, bool) or obj is None or id(obj) in seen:
+            return obj
+        seen.add(id(obj))
+        if cls is list:
+            obj[:] = [self.__walk(item, seen) for item in obj]
+        elif cls is dict:
+            for key, value in obj.items():
+                obj[key] = self.__walk(value, seen)
+        elif cls is Expression:
+            obj._left_child = self.__walk(obj._left_child, seen)
+            obj._right_child = self.__walk(obj._right_child, seen)
+        elif hasattr(obj, '__dict__'):  # Domain, Problem, Action, Event and the other model objects
+            attributes = vars(obj)
+            for name, value in attributes.items():
+                attributes[name] = self.__walk(value, seen)
+        return obj
+
+    def __arg(self, arg):
+        intern = self._atoms.get(type(arg))
+        return intern(self, arg) if intern is not None else self.__symbol(arg)
+
+    @staticmethod
+    def __symbol(value):
+        return sys.intern(value) if type(value) is str else value
@@ -14,9 +14,16 @@
 # along with pypddl-parser.  If not, see <http://www.gnu.org/licenses/>.
 
 
+from tsal.translator.hashing import hashless_state, restore_state
+
+
 class Term(object):
     class_name = 'litypes'
 
+    __slots__ = ('_name', '_type', '_value', '_hash')
+    __getstate__ = hashless_state
+    __setstate__ = restore_state
+
     def __init__(self, **kwargs):
         """
             Construct a Term object
@@ -34,6 +41,7 @@ class Term(object):
         self._name  = kwargs.get('name',  None)
         self._type  = kwargs.get('type',  None)
         self._value = kwargs.get('value', None)
+        self._hash  = None  # computed on first use
 
     @property
     def name(self):
@@ -42,6 +50,7 @@ class Term(object):
     @name.setter
     def name(self, name):
         self._name = name
+        self._hash = None
 
     @property
     def type(self):
@@ -96,6 +105,8 @@ class Term(object):
             return '{0}'.format(self._value)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not other:
             return False
         if self._type == other._type:
@@ -108,5 +119,7 @@ class Term(object):
                         return True
         return False
 
-    def __hash__(self): # TODO: add to git
-        return hash((self.name, self.type, self.value))
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash((self._name, self._type, self._value))
+        return self._hash
@@ -44,7 +44,7 @@ class TimedLiteral(object):
     def __eq__(self, other):
         try:
             if self._predicate.name == other._predicate.name \
-                    and self._predicate.args == other._predicate.args \
+                    and tuple(self._predicate.args) == tuple(other._predicate.args) \
                     and self._positive == other._positive\
                     and self._time == other._time:
                 return True
@@ -15,6 +15,13 @@
 
 # Extended by Dustin Dannenhauer and Noah Reifsnyder to support TSAL
 
+import codecs
+import copy
+import functools
+import itertools
+import mmap
+import os
+import re
 import sys
 from tsal.ply import lex, yacc
 from tsal.translator.term import Term
@@ -31,6 +38,7 @@ from tsal.translator.process import Process
 from tsal.translator.equation import Equation
 from tsal.translator.timedliteral import TimedLiteral
 from tsal.translator.distribution import FrequencyDistribution
+from tsal.translator.span import Span
 
 Debug = False
 # turn on for debugging
@@ -42,6 +50,18 @@ Debug = False
 # )
 # log = logging.getLogger()
 
+# The lexer and parser tables are generated into lextab.py and parsetab.py next to this module, and are only rebuilt
+# when the token rules or the grammar change. When this directory is read-only, rebuilt tables are pickled into the
+# user cache directory instead.
+_tabdir = os.path.dirname(os.path.abspath(__file__))
+
+
+def _table_cache_file(name):
+    if os.access(_tabdir, os.W_OK):
+        return None
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'tsal', '{}-{}.pickle'.format(name, sys.implementation.cache_tag))
+
 tokens = (
     'NAME',
     'VARIABLE',
@@ -194,7 +214,7 @@ def t_POS_INTEGER(t):
 
 def t_newline(t):
     r'\n+'
-    t.lineno += len(t.value)
+    t.lexer.lineno += len(t.value)
 
 
 def t_error(t):
@@ -203,10 +223,104 @@ def t_error(t):
 
 
 # build the lexer
-lex.lex(debug=Debug)
+_lexer = lex.lex(debug=Debug, lextab='lextab', outputdir=_tabdir, picklefile=_table_cache_file('lextab'))
 #lex.lex(debug=True, debuglog=log, )  # turn this on to debug
 
 
+def _rule_regex(name):
+    rule = globals()[name]
+    return rule.__doc__ if callable(rule) else rule
+
+
+class _Token(lex.LexToken):
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'lexer')
+
+
+class TSALLexer(object):
+    """
+    Drop-in replacement of the PLY lexer built above, producing the same token stream.
+
+    Tokens are found with finditer over one regex of the same rules, reserved words with a dict lookup,
+    without a python function call per token. The parentheses are tried first, they can not start any other
+    token so the first matching rule is the one PLY picks; whitespace and newlines are skipped inside the
+    regex and line numbers are counted between tokens. lexpos is left at the end of the input after input().
+    """
+
+    # rules in the order they are tried, the rest keep the order of the PLY master regex
+    _rules = ('t_LPAREN', 't_RPAREN', 't_KEYWORD', 't_VARIABLE', 't_PROBABILITY', 't_DECIMAL', 't_NEG_INTEGER',
+              't_POS_INTEGER', 't_PLUS', 't_TIMES', 't_HYPHEN', 't_NEQ', 't_GTEQ', 't_LTEQ', 't_DIVIDE', 't_EQUALS',
+              't_GT', 't_LT', 't_MOD')
+    # skipped characters, then one group per rule and a last group for an illegal character
+    _master_re = re.compile('{skip}*(?:{rules}|([^{skipped}]))'.format(
+        skip='[{}\\n]'.format(re.escape(t_ignore)), skipped=re.escape(t_ignore) + '\\n',
+        rules='|'.join('({})'.format(_rule_regex(name)) for name in _rules)), _lexer.lexreflags)
+    # by group: the token type, and how its value is made
+    _types = (None,) + tuple(name[2:] for name in _rules) + (None,)
+    _KEYWORD, _STRING, _INT, _FLOAT, _ILLEGAL = range(5)
+    _kinds = ((None, _STRING, _STRING, _KEYWORD, _STRING, _FLOAT, _FLOAT, _INT, _INT) +
+              (_STRING,) * (len(_rules) - 8) + (_ILLEGAL,))
+
+    def __init__(self):
+        self.lexdata = ''
+        self.lexpos = 0
+        self.lineno = 1
+        self.token = self.__end
+
+    def input(self, data):
+        self.lexdata = data
+        self.lexpos = len(data)
+        self.token = functools.partial(next, self.tokenize(data, self.lineno), None)
+
+    def tokenize(self, data, lineno=1):
+        """
+        Generate the tokens of data.
+
+        :param data: lowercased, comment free tsal source
+        :param lineno: line number of the start of data
+        """
+        types = self._types
+        kinds = self._kinds
+        get_reserved = reserved.get
+        count = data.count
+        last = 0
+        for match in self._master_re.finditer(data):
+            index = match.lastindex
+            value = match.group(index)
+            kind = kinds[index]
+            if kind == self._KEYWORD:
+                type = get_reserved(value, 'NAME')
+            elif kind == self._STRING:
+                type = types[index]
+            elif kind == self._INT:
+                type = types[index]
+                value = int(value)
+            elif kind == self._FLOAT:
+                type = types[index]
+                value = float(value)
+            else:
+                print("Error: illegal character '{0}'".format(value))
+                continue
+            start = match.start(index)
+            lineno += count('\n', last, start)
+            last = start
+            token = _Token()
+            token.type = type
+            token.value = value
+            token.lineno = lineno
+            token.lexpos = start
+            yield token
+
+    def clone(self):
+        return TSALLexer()
+
+    def __iter__(self):
+        return iter(self.token, None)
+
+    @staticmethod
+    def __end():
+        return None
+
+
 def p_tsal(p):
     '''tsal : domain
             | problem
@@ -228,60 +342,79 @@ def p_tsal(p):
 #    p[0] = Domain(name=p[3], requirements=[4], types=p[5][1], constants=p[6][1], predicates=p[8], operators=p[11],
 #                  fluents=p[7], derived_predicates=p[9], events=p[12], processes=p[10])
 start = 'tsal'
+
+# section keyword of every kwarg of Domain, the optional sections may be given in any order
+_domain_sections = {'requirements': ':requirements',
+                    'types': ':types',
+                    'constants': ':constants',
+                    'fluents': ':fluents',
+                    'predicates': ':predicates',
+                    'derived_predicates': ':derived-predicates',
+                    'processes': ':processes',
+                    'operators': ':actions',
+                    'events': ':events'}
+_required_domain_sections = ('requirements', 'types', 'predicates', 'operators')
+
+
+def _check_sections(p, kind, name, sections, known, required):
+    # semantic check of a section list, returns the sections by kwarg name or None when they are invalid
+    found = {}
+    for key, value in sections:
+        if key in found:
+            _semantic_error(p, "{} '{}' defines {} more than once".format(kind, name, known[key]))
+            return None
+        found[key] = value
+    missing = [known[key] for key in required if key not in found]
+    if missing:
+        _semantic_error(p, "{} '{}' is missing {}".format(kind, name, ', '.join(missing)))
+        return None
+    return found
+
+
 def p_domain(p):
-    '''domain : LPAREN DEFINE_KEY domain_def requirements_def types_def constants_def fluents_predicates_def derived_predicates_def processes_def actions_def events_def RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def fluents_predicates_def derived_predicates_def processes_def actions_def events_def RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def constants_def fluents_predicates_def  processes_def actions_def events_def RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def fluents_predicates_def processes_def actions_def events_def RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def constants_def fluents_predicates_def derived_predicates_def  actions_def events_def RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def fluents_predicates_def derived_predicates_def  actions_def events_def RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def constants_def fluents_predicates_def actions_def events_def RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def fluents_predicates_def actions_def events_def RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def fluents_predicates_def actions_def RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def constants_def fluents_predicates_def derived_predicates_def processes_def actions_def  RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def fluents_predicates_def derived_predicates_def processes_def actions_def  RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def constants_def fluents_predicates_def  processes_def actions_def  RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def fluents_predicates_def processes_def actions_def  RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def constants_def fluents_predicates_def derived_predicates_def  actions_def  RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def fluents_predicates_def derived_predicates_def  actions_def  RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def constants_def fluents_predicates_def actions_def  RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def predicates_def actions_def RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def constants_def predicates_def derived_predicates_def processes_def actions_def events_def RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def predicates_def derived_predicates_def processes_def actions_def events_def RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def constants_def predicates_def  processes_def actions_def events_def RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def predicates_def processes_def actions_def events_def RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def constants_def predicates_def derived_predicates_def  actions_def events_def RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def predicates_def derived_predicates_def  actions_def events_def RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def constants_def predicates_def actions_def events_def RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def predicates_def  actions_def events_def RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def constants_def predicates_def derived_predicates_def processes_def actions_def  RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def predicates_def derived_predicates_def processes_def actions_def  RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def constants_def predicates_def processes_def actions_def  RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def predicates_def processes_def actions_def  RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def constants_def predicates_def derived_predicates_def  actions_def  RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def predicates_def derived_predicates_def  actions_def  RPAREN
-              | LPAREN DEFINE_KEY domain_def requirements_def types_def constants_def predicates_def actions_def  RPAREN'''
-    global new_predicates
-    global new_events
-    kwargs = {'domain_name': None,
-                   'requirements': [],
-                   'types': {},
-                   'constants': {},
-                   'predicates': new_predicates,
-                   'fluents': [],
-                   'operators': [],
-                   'events': new_events,
-                   'derived_predicates': [],
-                   'processes': []}
-    for i in p:
-        if i and type(i) == list:
-            for j in i:
-                if j and type(j) == tuple:
-                    kwargs[j[0]] = kwargs[j[0]] + j[1]
-        if i and type(i) == tuple:
-            kwargs[i[0]] = i[1]
+    '''domain : LPAREN DEFINE_KEY domain_def domain_section_lst RPAREN'''
+    kwargs = {'domain_name': p[3][1],
+              'requirements': [],
+              'types': {},
+              'constants': {},
+              'predicates': [],
+              'fluents': [],
+              'operators': [],
+              'events': [],
+              'derived_predicates': [],
+              'processes': []}
+    sections = _check_sections(p, 'domain', p[3][1], p[4], _domain_sections, _required_domain_sections)
+    if sections is None:
+        p[0] = None
+        return
+    kwargs.update(sections)
+    kwargs['predicates'] = kwargs['predicates'] + p.parser.new_predicates
+    kwargs['events'] = kwargs['events'] + p.parser.new_events
     p[0] = Domain(**kwargs)
-    pass
+
+
+def p_domain_section_lst(p):
+    '''domain_section_lst : domain_section_lst domain_section
+                          | domain_section'''
+    if len(p) == 2:
+        p[0] = [p[1]]
+    elif len(p) == 3:
+        p[1].append(p[2])
+        p[0] = p[1]
+
+
+def p_domain_section(p):
+    '''domain_section : requirements_def
+                      | types_def
+                      | constants_def
+                      | fluents_def
+                      | predicates_def
+                      | derived_predicates_def
+                      | processes_def
+                      | actions_def
+                      | events_def'''
+    p[0] = p[1]
+
 
 def p_domain_def(p):
     '''domain_def : LPAREN DOMAIN_KEY NAME RPAREN'''
@@ -345,11 +478,6 @@ def p_typed_names_lst(p):
             p[4][p[3]] = p[1]
         p[0] = p[4]  # p[4] is already a dictionary, add one entry more
 
-def p_fluents_predicates_def(p):
-    '''fluents_predicates_def : fluents_def predicates_def
-                              | predicates_def fluents_def'''
-    p[0] = p[1:]
-
 def p_fluents_def(p):
     '''fluents_def : LPAREN FLUENTS_KEY fluent_def_lst RPAREN'''
     # todo - allow fluents def to be empty
@@ -357,12 +485,13 @@ def p_fluents_def(p):
 
 
 def p_fluent_def_lst(p):
-    '''fluent_def_lst : fluent_def fluent_def_lst
+    '''fluent_def_lst : fluent_def_lst fluent_def
                       | fluent_def'''
     if len(p) == 2:
         p[0] = [p[1]]
     elif len(p) == 3:
-        p[0] = [p[1]] + p[2]
+        p[1].append(p[2])
+        p[0] = p[1]
 
 
 def p_fluent_def(p):
@@ -374,7 +503,7 @@ def p_fluent_def(p):
 
     if len(p) == 4:
         if isinstance(p[1], Fluent):
-            p[0] = Fluent(name=p[1].name, args=p[1].args, bounds=p[1].bounds, typ=p[3])
+            p[0] = Fluent(name=p[1].name, args=p[1].args, bounds=p[1].bounds if p[1].has_bounds else None, typ=p[3])
         else:
             p[0] = Fluent(name=p[2])
     elif len(p) == 5:
@@ -397,12 +526,13 @@ def p_predicates_def(p):
 
 
 def p_predicate_def_lst(p):
-    '''predicate_def_lst : predicate_def predicate_def_lst
+    '''predicate_def_lst : predicate_def_lst predicate_def
                          | predicate_def'''
     if len(p) == 2:
         p[0] = [p[1]]
     elif len(p) == 3:
-        p[0] = [p[1]] + p[2]
+        p[1].append(p[2])
+        p[0] = p[1]
 
 
 def p_predicate_def(p):
@@ -414,26 +544,26 @@ def p_predicate_def(p):
         p[0] = Predicate(p[2])
     elif len(p) == 5:
         p[0] = Predicate(p[2], p[3])
+    if p.parser.located:
+        _locate(p, p[0])
 
 
 def p_derived_predicates_def(p):
     '''derived_predicates_def : LPAREN DERIVED_PREDICATES_KEY derived_def_lst RPAREN
                                | LPAREN DERIVED_PREDICATES_KEY RPAREN'''
     if len(p) == 5:
-        p[0] = p[3]
+        p[0] = ('derived_predicates', p[3])
     elif len(p) == 4:
-        p[0] = []
+        p[0] = ('derived_predicates', [])
 
 def p_derived_def_lst(p):
     '''derived_def_lst :
-                       | derived_def derived_def_lst
-                       | derived_def'''
+                       | derived_def_lst derived_def'''
     if len(p) == 1:
         p[0] = []
-    elif len(p) == 2:
-        p[0] = [p[1]]
     elif len(p) == 3:
-        p[0] = [p[1]] + p[2]
+        p[1].append(p[2])
+        p[0] = p[1]
 
 
 def p_derived_def(p):
@@ -462,17 +592,15 @@ def p_fluent_predicate_def_lst(p):
 
 def p_processes_def(p):
     '''processes_def : LPAREN PROCESSES_KEY processes_def_lst RPAREN'''
-    p[0] = p[3]
+    p[0] = ('processes', p[3])
 
 
 def p_processes_def_lst(p):
     '''processes_def_lst :
-                         | process_def processes_def_lst
-                         | process_def'''
-    if len(p) == 2:
-        p[0] = [p[1]]
-    elif len(p) == 3:
-        p[0] = [p[1]] + p[2]
+                         | processes_def_lst process_def'''
+    if len(p) == 3:
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -491,22 +619,17 @@ def p_actions_def(p):
 
 def p_action_def_lst(p):
     '''action_def_lst :
-                      | action_def action_def_lst
-                      | action_def'''
-    if len(p) == 2:
-        p[0] = [p[1]]
-    elif len(p) == 3:
-        p[0] = [p[1]] + p[2]
+                      | action_def_lst action_def'''
+    if len(p) == 3:
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = []
 
-forall_counter = 0
-new_predicates = []
-new_events = []
 def p_action_def(p):
     '''action_def : LPAREN ACTION_KEY NAME parameters_def action_def_body RPAREN
                   | LPAREN ACTION_KEY NAME parameters_def duration_def action_def_body RPAREN'''
-    global forall_counter
+    parser = p.parser  # forall bookkeeping lives on the parser so concurrent parses do not share it
     raw_eff_lst = []
     eff_lst = []
     if len(p) == 7:
@@ -534,12 +657,12 @@ def p_action_def(p):
             pred_args = None
             for i in range(len(eff[2][2])):
                 eff[2][2][i] = (1.0, eff[2][2][i])
-            new_pred = Predicate(name="FORALL"+str(forall_counter), args=params_l)
+            new_pred = Predicate(name="FORALL"+str(parser.forall_counter), args=params_l)
             eff_pred = Predicate(name=new_pred.name, args=[x.name for x in new_pred.args])
-            new_event = Event(name=str(forall_counter)+"FORALL", params=params, precond=eff[2][1] + [Literal(eff_pred, True)], effects=[eff[2][2] + [(1.0, Literal(eff_pred, False))]])
-            forall_counter = forall_counter + 1
-            new_predicates.append(new_pred)
-            new_events.append(new_event)
+            new_event = Event(name=str(parser.forall_counter)+"FORALL", params=params, precond=eff[2][1] + [Literal(eff_pred, True)], effects=[eff[2][2] + [(1.0, Literal(eff_pred, False))]])
+            parser.forall_counter = parser.forall_counter + 1
+            parser.new_predicates.append(new_pred)
+            parser.new_events.append(new_event)
             eff_lst.append((1.0, Literal(Predicate(name=new_pred.name, args=[x.name for x in new_pred.args]), True)))
         elif eff[0] == 'WHEN':
             pass
@@ -549,18 +672,25 @@ def p_action_def(p):
         p[0] = Action(p[3], p[4], p[5][0], [eff_lst])
     elif len(p) == 8:  # duration given
         p[0] = Action(p[3], p[4], p[6][0], [eff_lst], duration=p[5])
+    if p.parser.located:
+        _locate(p, p[0])
 
 
 def p_event_def(p):
     '''event_def : LPAREN EVENT_KEY NAME parameters_def event_def_body RPAREN
                  | LPAREN EVENT_KEY NAME parameters_def duration_def event_def_body RPAREN'''
     if len(p) == 7:  # no duration
-        p[0] = Event(p[3], p[4], p[5][0], p[5][1])
+        if len(p[5]) == 2:  # no freq. dist. given
+            p[0] = Event(p[3], p[4], p[5][0], p[5][1])
+        elif len(p[5]) == 3:  # freq. dist. given
+            p[0] = Event(p[3], p[4], p[5][0], p[5][1], distribution=p[5][2])
     elif len(p) == 8:  # duration given
         if len(p[6]) == 2:  # no freq. dist. given
             p[0] = Event(p[3], p[4], p[6][0], p[6][1], duration=p[5])
         elif len(p[6]) == 3:  # freq. dist. given
             p[0] = Event(p[3], p[4], p[6][0], p[6][1], duration=p[5], distribution=p[6][2])
+    if p.parser.located:
+        _locate(p, p[0])
 
 
 def p_events_def(p):
@@ -570,12 +700,10 @@ def p_events_def(p):
 
 def p_event_def_lst(p):
     '''event_def_lst :
-                     | event_def event_def_lst
-                     | event_def'''
-    if len(p) == 2:
-        p[0] = [p[1]]
-    elif len(p) == 3:
-        p[0] = [p[1]] + p[2]
+                     | event_def_lst event_def'''
+    if len(p) == 3:
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -684,7 +812,7 @@ def p_when_eff(p):
 def p_frequency_def(p):
     '''frequency_def : INTERARRIVAL_KEY LPAREN NAME NAME DECIMAL RPAREN
                      | INTERARRIVAL_KEY LPAREN RPAREN'''
-    if len(p) == 6:
+    if len(p) == 7:
         p[0] = FrequencyDistribution(name=p[3], qualifier=p[4], value=p[5])
     elif len(p) == 4:
         p[0] = None
@@ -735,23 +863,22 @@ def p_when_then(p):
 
 def p_effects_lst(p):
     '''effects_lst :
-                   | effect effects_lst
-                   | effect'''
+                   | effects_lst effect'''
 
-    if len(p) == 2:
-        p[0] = [p[1]]
-    elif len(p) == 3:
-        p[0] = [p[1]] + p[2]
+    if len(p) == 3:
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = []
 
 def p_simple_effects_lst(p):
-    '''simple_effects_lst : simple_effect simple_effects_lst
+    '''simple_effects_lst : simple_effects_lst simple_effect
                           | simple_effect'''
     if len(p) == 2:
         p[0] = [p[1]]
     elif len(p) == 3:
-        p[0] = [p[1]] + p[2]
+        p[1].append(p[2])
+        p[0] = p[1]
 
 def p_effect(p):
     '''effect : literal
@@ -818,23 +945,26 @@ def p_expression(p):
     if len(p) == 3:
         p[0] = Expression(value=None, operator=p[1], left_child=p[2][0], right_child=p[2][1])
     elif len(p) == 4:
-        p[0] = p[2]
+        p[0] = p[2]  # located, the span takes in the parentheses
     elif len(p) == 2:
         p[0] = Expression(value=p[1])
+    if p.parser.located:
+        _locate(p, p[0])
 
 
 def p_literals_lst(p):
     # ADDED EXPRESSION
-    '''literals_lst : literal literals_lst
-                    | expression literals_lst
+    '''literals_lst : literals_lst literal
+                    | literals_lst expression
                     | literal
                     | expression
-                    | or_literal literals_lst
+                    | literals_lst or_literal
                     | or_literal'''
     if len(p) == 2:
         p[0] = [p[1]]
     elif len(p) == 3:
-        p[0] = [p[1]] + p[2]
+        p[1].append(p[2])
+        p[0] = p[1]
 
 
 def p_or_literal(p):
@@ -854,12 +984,13 @@ def p_literal(p):
 
 
 def p_ground_predicates_lst(p):
-    '''ground_predicates_lst : ground_predicate ground_predicates_lst
+    '''ground_predicates_lst : ground_predicates_lst ground_predicate
                              | ground_predicate'''
     if len(p) == 2:
         p[0] = [p[1]]
     elif len(p) == 3:
-        p[0] = [p[1]] + p[2]
+        p[1].append(p[2])
+        p[0] = p[1]
 
 
 def p_ground_predicate(p):
@@ -872,6 +1003,9 @@ def p_ground_predicate(p):
         p[0] = Predicate(p[2], p[3])
     else:
         p[0] = p[1]
+        return
+    if p.parser.located:
+        _locate(p, p[0])
 
 
 
@@ -881,6 +1015,8 @@ def p_ground_fluent(p):
                      | LPAREN EQUALS ground_fluent_def NEG_INTEGER RPAREN'''
 
     p[0] = Predicate(p[2], [p[3], p[4]])
+    if p.parser.located:
+        _locate(p, p[0])
 
 def p_ground_fluent_def(p):
     '''ground_fluent_def : LPAREN NAME constants_lst RPAREN
@@ -902,57 +1038,62 @@ def p_predicate(p):
         p[0] = Predicate(p[2], p[3])
     elif len(p) == 6:
         p[0] = Predicate('=', [p[3], p[4]])
+    if p.parser.located:
+        _locate(p, p[0])
 
 
 
 
 def p_typed_constants_lst(p):
-    '''typed_constants_lst : constants_lst HYPHEN type typed_constants_lst
+    '''typed_constants_lst : typed_constants_lst constants_lst HYPHEN type
                            | constants_lst HYPHEN type'''
     if len(p) == 4:
         p[0] = [Term.constant(value, p[3]) for value in p[1]]
     elif len(p) == 5:
-        p[0] = [Term.constant(value, p[3]) for value in p[1]] + p[4]
+        p[1].extend(Term.constant(value, p[4]) for value in p[2])
+        p[0] = p[1]
 
 
 def p_typed_variables_lst(p):
-    '''typed_variables_lst : variables_lst HYPHEN type typed_variables_lst
+    '''typed_variables_lst : typed_variables_lst variables_lst HYPHEN type
                            | variables_lst HYPHEN type'''
     if len(p) == 4:
         p[0] = [Term.variable(name, p[3]) for name in p[1]]
     elif len(p) == 5:
-        p[0] = [Term.variable(name, p[3]) for name in p[1]] + p[4]
+        p[1].extend(Term.variable(name, p[4]) for name in p[2])
+        p[0] = p[1]
 
 
 def p_constants_lst(p):
-    '''constants_lst : constant constants_lst
+    '''constants_lst : constants_lst constant
                      | constant'''
     if len(p) == 2:
         p[0] = [Term.constant(p[1])]
     elif len(p) == 3:
-        p[0] = [Term.constant(p[1])] + p[2]
+        p[1].append(Term.constant(p[2]))
+        p[0] = p[1]
 
 
 def p_variables_lst(p):
-    '''variables_lst : variable variables_lst
+    '''variables_lst : variables_lst variable
                      | variable
                      | NAME
-                     | NAME variables_lst'''
+                     | variables_lst NAME'''
     if len(p) == 2:
         p[0] = [Term.variable(p[1])]
     elif len(p) == 3:
-        p[0] = [Term.variable(p[1])] + p[2]
+        p[1].append(Term.variable(p[2]))
+        p[0] = p[1]
 
 
 def p_names_lst(p):
-    '''names_lst : NAME names_lst
+    '''names_lst : names_lst NAME
                  | NAME'''
-    if len(p) == 1:
-        p[0] = []
-    elif len(p) == 2:
+    if len(p) == 2:
         p[0] = [p[1]]
     elif len(p) == 3:
-        p[0] = [p[1]] + p[2]
+        p[1].append(p[2])
+        p[0] = p[1]
 
 
 def p_type(p):
@@ -980,25 +1121,53 @@ def p_problem(p):
     p[0] = p[1]
 
 
+_problem_sections = {'domain_name': ':domain',
+                     'objects': ':objects',
+                     'init': ':init',
+                     'timed_init': ':timed-init',
+                     'goal': ':goal',
+                     'metric': ':metric'}
+_required_problem_sections = ('domain_name', 'objects', 'init', 'goal')
+
+
 def p_plan_problem(p):
-    '''plan_problem : LPAREN DEFINE_KEY plan_problem_def domain_def objects_def init_def timed_inits_def goal_def metric_def RPAREN
-                    | LPAREN DEFINE_KEY plan_problem_def domain_def objects_def init_def goal_def metric_def RPAREN
-                    | LPAREN DEFINE_KEY plan_problem_def domain_def objects_def init_def timed_inits_def goal_def  RPAREN
-                    | LPAREN DEFINE_KEY plan_problem_def domain_def objects_def init_def goal_def  RPAREN'''
+    '''plan_problem : LPAREN DEFINE_KEY plan_problem_def problem_section_lst RPAREN'''
 
-    kwargs = {'problem_name': None,
+    kwargs = {'problem_name': p[3][1],
               'domain_name': None,
               'objects': [],
               'init': [],
               'timed_init': [],
               'goal': [],
               'metric': ("minimize", Fluent(name="plan-length"))}  # default metric is to minimize plan length
-    for i in p:
-        if i and type(i)==tuple:
-            kwargs[i[0]] = i[1]
+    sections = _check_sections(p, 'problem', p[3][1], p[4], _problem_sections, _required_problem_sections)
+    if sections is None:
+        p[0] = None
+        return
+    kwargs.update(sections)
     p[0] = Problem(**kwargs)
 
 
+def p_problem_section_lst(p):
+    '''problem_section_lst : problem_section_lst problem_section
+                           | problem_section'''
+    if len(p) == 2:
+        p[0] = [p[1]]
+    elif len(p) == 3:
+        p[1].append(p[2])
+        p[0] = p[1]
+
+
+def p_problem_section(p):
+    '''problem_section : domain_def
+                       | objects_def
+                       | init_def
+                       | timed_inits_def
+                       | goal_def
+                       | metric_def'''
+    p[0] = p[1]
+
+
 def p_plan_problem_def(p):
     '''plan_problem_def : LPAREN PROBLEM_KEY NAME RPAREN'''
     p[0] = ('problem_name', p[3])
@@ -1031,12 +1200,10 @@ def p_timed_inits_def(p):
 
 def p_timed_init_lst(p):
     '''timed_init_lst :
-                      | timed_init_def timed_init_lst
-                      | timed_init_def'''
-    if len(p) == 2:
-        p[0] = [p[1]]
-    elif len(p) == 3:
-        p[0] = [p[1]] + p[2]
+                      | timed_init_lst timed_init_def'''
+    if len(p) == 3:
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -1053,12 +1220,13 @@ def p_goal_body_def(p):
     p[0] = p[3]
 
 def p_goal_body_def_lst(p):
-    '''goal_body_def_lst : goal_body_def goal_body_def_lst
+    '''goal_body_def_lst : goal_body_def_lst goal_body_def
                          | goal_body_def'''
     if len(p) == 2:
         p[0] = [p[1]]
     elif len(p) == 3:
-        p[0] = [p[1]] + p[2]
+        p[1].append(p[2])
+        p[0] = p[1]
 
 def p_goal_def(p):
     '''goal_def : LPAREN GOAL_KEY goal_body_def RPAREN
@@ -1090,20 +1258,257 @@ def p_error(p):
     print("Error: syntax error when parsing '{}'".format(p))
 
 
-# build parser
-yacc.yacc(debug=Debug)
+def _semantic_error(p, message):
+    print("Error: {} (line {})".format(message, p.lineno(1)))
+
+
+def _locate(p, node):
+    # the span of the rule just reduced, from the position tracking of a located parser
+    data = p.lexer.lexdata
+    start = p.lexpos(1)
+    end = _token_end_re.match(data, p.lexspan(len(p) - 1)[1]).end()
+    # the leading newline added by the input cleaning is not part of the source
+    node._span = Span(p.lineno(1), start - data.rfind('\n', 0, start), start - 1, end - 1)
+
+
+class _StartLogger(yacc.PlyLogger):
+    """
+    Error log of the parsers of a part of the grammar: the rules and symbols their start does not reach are
+    expected and not reported, every other warning or error, conflicts included, is.
+    """
+
+    _expected = ('Symbol %r is unreachable', '%s:%d: Rule %r defined, but not used', 'There is 1 unused rule',
+                 'There are %d unused rules', 'There is 1 unused token', 'There are %d unused tokens')
+
+    def warning(self, msg, *args, **kwargs):
+        if msg not in self._expected:
+            super(_StartLogger, self).warning(msg, *args, **kwargs)
+
+
+# build parsers: files holding only a domain or only a problem are parsed from the domain and problem start
+# symbols, their tables are a fraction of the full grammar
+_domain_parser = yacc.yacc(debug=Debug, start='domain', tabmodule='parsetab_domain', outputdir=_tabdir,
+                           picklefile=_table_cache_file('parsetab_domain'), errorlog=_StartLogger(sys.stderr))
+_problem_parser = yacc.yacc(debug=Debug, start='problem', tabmodule='parsetab_problem', outputdir=_tabdir,
+                            picklefile=_table_cache_file('parsetab_problem'), errorlog=_StartLogger(sys.stderr))
+# a single domain section, e.g. '(:actions ...)', used to re-parse one edited element of a domain
+_section_parser = yacc.yacc(debug=Debug, start='domain_section', tabmodule='parsetab_section', outputdir=_tabdir,
+                            picklefile=_table_cache_file('parsetab_section'), errorlog=_StartLogger(sys.stderr))
+_parser = yacc.yacc(debug=Debug, tabmodule='parsetab', outputdir=_tabdir, picklefile=_table_cache_file('parsetab'))
 #yacc.yacc(debug=True, debuglog=log)  # turn on for debugging
+_parsers = {'tsal': _parser, 'domain': _domain_parser, 'problem': _problem_parser, 'domain_section': _section_parser}
+
+
+def _reset_parse_state(parser, located=False, forall_counter=0):
+    # located parsers attach a Span to the objects they build
+    parser.located = located
+    # events and predicates generated for forall effects, collected by p_action_def and added by p_domain
+    parser.forall_counter = forall_counter
+    parser.new_predicates = []
+    parser.new_events = []
+
+
+for _start_parser in _parsers.values():
+    _reset_parse_state(_start_parser)
+
+
+# ';' comments, cut off by the bulk readers after trailing whitespace is dropped, the same order the line reader uses
+_comment_re = re.compile(r';[^\n]*')
+_comment_bytes_re = re.compile(rb';[^\n]*')
+_token_end_re = re.compile(r'\)|[^\s()]*')
+# bytes.translate table lowercasing ascii and turning the whitespace the lexer does not skip into spaces
+_located_table = bytes.maketrans(b'ABCDEFGHIJKLMNOPQRSTUVWXYZ\r\v\f', b'abcdefghijklmnopqrstuvwxyz   ')
+# '(define (domain' or '(define (problem' at the start of the cleaned text, and any later '(define'
+_header_re = re.compile(r'\s*\(\s*define\s*\(\s*(domain|problem)(?![\w\-])')
+_define_re = re.compile(r'\(\s*define(?![\w\-])')
+
+
+def _parse_file(filename, reader):
+    # module level so process pools can pickle it
+    return TSALParser.parse(filename, reader)
 
 
 class TSALParser(object):
 
+    # size of the blocks read by the 'chunked' reader
+    chunk_size = 1 << 20
+    # lexer of the instances made by the parse class methods, 'ply' or 'fast' (TSALLexer)
+    default_lexer = 'ply'
+
+    def __init__(self, lexer=None, located=False):
+        """
+        A parser instance owns a clone of the lexer and a copy of the LR parser, both sharing the
+        read-only tables, so instances can be used on different threads at the same time.
+        A single instance is not thread safe, use one per thread.
+
+        By default the parser runs with position tracking off. A located parser tracks positions and sets
+        the span of every Action, Event, Predicate and Expression it builds, see benchmarks/bench_located.py.
+
+        :param lexer: 'ply' for the PLY lexer, 'fast' for TSALLexer, default_lexer when None
+        :param located: attach a Span to the parsed objects
+        """
+        self._located = located
+        lexer = lexer or self.default_lexer
+        if lexer == 'ply':
+            self._lexer = _lexer.clone()
+        elif lexer == 'fast':
+            self._lexer = TSALLexer()
+        else:
+            raise ValueError("unknown lexer '{}', expected 'ply' or 'fast'".format(lexer))
+        self._parsers = {}  # copies of the module parsers by start symbol, made on first use
+        self._generated = ([], [])
+
+    @classmethod
+    def parse(cls, filename, reader='chunked', start=None, located=False):
+        """
+        :param filename: path of the tsal file
+        :param reader: passed on to read_input, not used when located
+        :param start: start symbol, see parse_input
+        :param located: attach to the parsed objects their Span in the file
+        :return: the parsed Domain or Problem
+        """
+        if located:
+            with open(filename, 'rb') as file:
+                return cls(located=True).parse_input(cls.clean_input(file.read(), located=True), start)
+        data = cls.read_input(filename, reader)
+        return cls().parse_input(data, start)
+
     @classmethod
-    def parse(cls, filename):
-        data = cls.__read_input(filename)
-        return yacc.parse(data, debug=Debug, tracking=True)
+    def parse_string(cls, text, start=None, located=False):
+        """
+        Parse tsal source held in memory, without going through a file.
+
+        :param text: the source as a str, or as utf-8 encoded bytes, bytearray or memoryview
+        :param start: start symbol, see parse_input
+        :param located: attach to the parsed objects their Span in the utf-8 encoding of text
+        :return: the parsed Domain or Problem
+        """
+        return cls(located=located).parse_input(cls.clean_input(text, located), start)
+
+    @classmethod
+    def parse_stream(cls, stream, start=None, located=False):
+        """
+        Parse tsal source from an open text or binary (utf-8) file object, read in blocks of chunk_size.
+
+        :param stream: object with a read(size) method, e.g. a file, io.StringIO or io.BytesIO
+        :param start: start symbol, see parse_input
+        :param located: attach to the parsed objects their Span in the utf-8 encoding of the stream,
+                        the whole stream is read at once
+        :return: the parsed Domain or Problem
+        """
+        if located:
+            return cls(located=True).parse_input(cls.clean_input(stream.read(), located=True), start)
+        return cls().parse_input(cls.__read_stream(stream), start)
+
+    @property
+    def generated(self):
+        """
+        :return: (predicates, events) generated for the forall effects of the actions by the last parse_input,
+                 also part of the parsed Domain, not of a parsed 'domain_section'
+        """
+        return self._generated
+
+    def parse_input(self, data, start=None, forall_counter=0):
+        """
+        Parse text that has already been cleaned by read_input or clean_input. Line numbers count the
+        newline the cleaning puts in front of the first line, spans of a located parser are only offsets
+        into the source when data comes from clean_input(..., located=True).
+
+        :param data: lowercased, comment free tsal source
+        :param start: 'domain' or 'problem' to parse with the grammar of that file kind only, 'tsal' for the
+                      full grammar (a domain, a problem, or a domain followed by a problem), None to pick
+                      with start_symbol, 'domain_section' for a single section of a domain
+        :param forall_counter: the number of the first generated forall predicate and event, e.g. past those
+                               of the domain a 'domain_section' is parsed for
+        :return: the parsed Domain or Problem
+        """
+        if start is None:
+            start = self.start_symbol(data)
+        parser = self._parsers.get(start)
+        if parser is None:
+            if start not in _parsers:
+                raise ValueError("unknown start symbol '{}', expected one of {}".format(start, ', '.join(_parsers)))
+            parser = self._parsers[start] = copy.copy(_parsers[start])
+        self._lexer.lineno = 0  # the cleaned data starts with a newline
+        _reset_parse_state(parser, self._located, forall_counter)
+        parsed = parser.parse(data, lexer=self._lexer, debug=Debug, tracking=self._located)
+        self._generated = (parser.new_predicates, parser.new_events)
+        return parsed
+
+    @staticmethod
+    def start_symbol(data):
+        """
+        :param data: lowercased, comment free tsal source
+        :return: 'domain' or 'problem' when data starts a domain or problem definition and holds no other,
+                 'tsal' otherwise
+        """
+        match = _header_re.match(data)
+        if match is None:
+            return 'tsal'
+        if match.group(1) == 'problem':
+            return 'problem'
+        if _define_re.search(data, match.end()):  # a domain followed by a problem
+            return 'tsal'
+        return 'domain'
+
+    @classmethod
+    def parse_many(cls, filenames, workers=None, processes=False, reader='chunked'):
+        """
+        Parse several tsal files concurrently.
+
+        :param filenames: paths of the tsal files
+        :param workers: size of the pool, the executor default when None
+        :param processes: use a process pool instead of a thread pool, parsing is pure python so only
+                          processes run in parallel, the results are pickled back to the caller
+        :param reader: passed on to read_input
+        :return: list of the parsed Domains and Problems, in the order of filenames
+        """
+        import concurrent.futures  # pulls in logging, only paid for when used
+        executor_cls = concurrent.futures.ProcessPoolExecutor if processes else concurrent.futures.ThreadPoolExecutor
+        with executor_cls(max_workers=workers) as executor:
+            return list(executor.map(_parse_file, filenames, itertools.repeat(reader)))
+
+    @classmethod
+    def read_input(cls, filename, reader='chunked'):
+        """
+        Read a tsal file and return the lowercased, comment free text handed to the lexer.
+
+        :param filename: path of the tsal file
+        :param reader: 'chunked' cleans the file in large blocks, 'mmap' memory-maps the file and
+                       cleans it as bytes before a single decode (ascii files, others are decoded first),
+                       'lines' is the original line by line reader
+        :return: the cleaned source, identical for every reader
+        """
+        if reader == 'chunked':
+            return cls.__read_chunked(filename)
+        elif reader == 'mmap':
+            return cls.__read_mmap(filename)
+        elif reader == 'lines':
+            return cls.__read_lines(filename)
+        raise ValueError("unknown reader '{}', expected 'chunked', 'mmap' or 'lines'".format(reader))
+
+    @classmethod
+    def clean_input(cls, text, located=False):
+        """
+        Clean in-memory tsal source the same way read_input cleans a file.
+
+        :param text: the source as a str, or as utf-8 encoded bytes, bytearray or memoryview
+        :param located: keep every byte of the source at its offset (plus one, for the leading newline):
+                        comments and other whitespace are blanked out instead of removed and the bytes are
+                        decoded as latin-1, so the lexer positions are byte offsets
+        :return: the lowercased, comment free text handed to the lexer
+        """
+        if located:
+            if isinstance(text, str):
+                text = text.encode('utf-8')
+            data = _comment_bytes_re.sub(cls.__blank, bytes(text).translate(_located_table))
+            return '\n' + data.decode('latin-1')
+        if not isinstance(text, str):
+            text = str(text, 'utf-8')
+        return cls.__finish(cls.__clean(text))
 
     @classmethod
-    def __read_input(cls, filename):
+    def __read_lines(cls, filename):
         with open(filename, 'r', encoding='utf-8') as file:
             data = ''
             for line in file:
@@ -1112,6 +1517,61 @@ class TSALParser(object):
                 data += '\n' + line
         return data
 
+    @classmethod
+    def __read_chunked(cls, filename):
+        with open(filename, 'r', encoding='utf-8') as file:
+            return cls.__read_stream(file)
+
+    @classmethod
+    def __read_stream(cls, stream):
+        parts = []
+        tail = ''
+        decoder = codecs.getincrementaldecoder('utf-8')()  # binary streams, a block may end inside a character
+        while True:
+            chunk = stream.read(cls.chunk_size)
+            if not chunk:
+                break
+            if not isinstance(chunk, str):
+                chunk = decoder.decode(chunk)
+            chunk = tail + chunk
+            end = chunk.rfind('\n') + 1  # only clean whole lines, carry the rest over
+            tail = chunk[end:]
+            parts.append(cls.__clean(chunk[:end]))
+        parts.append(cls.__clean(tail + decoder.decode(b'', final=True)))
+        return cls.__finish(''.join(parts))
+
+    @classmethod
+    def __read_mmap(cls, filename):
+        with open(filename, 'rb') as file:
+            try:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty files can not be mapped
+                return ''
+            with buffer:
+                data = buffer.read()
+        if not data.isascii():
+            # bytes.lower and bytes.rstrip only know ascii letters and whitespace, clean the decoded text
+            return cls.__finish(cls.__clean(data.decode('utf-8')))
+        data = _comment_bytes_re.sub(b'', b'\n'.join([line.rstrip() for line in data.lower().split(b'\n')]))
+        return cls.__finish(data.decode('ascii'))
+
+    @staticmethod
+    def __clean(text):
+        return _comment_re.sub('', '\n'.join([line.rstrip() for line in text.lower().split('\n')]))
+
+    @staticmethod
+    def __blank(match):
+        return b' ' * len(match.group())
+
+    @staticmethod
+    def __finish(data):
+        # match the line reader: every line is prefixed with a newline and the last newline is dropped
+        if not data:
+            return ''
+        if data.endswith('\n'):
+            data = data[:-1]
+        return '\n' + data
+
     @classmethod
     def __strip_comments(cls, line):
         pos = line.find(';')
@@ -0,0 +1,20 @@
+# Helpers shared by the tests in this directory.
+
+import os
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'examples')
+
+
+def example(*path):
+    return os.path.join(EXAMPLES, *path)
+
+
+def example_files(extensions=('.tsal',)):
+    """
+    :param extensions: the file name endings to keep
+    :return: sorted list of the paths of the files of the examples with those endings
+    """
+    found = []
+    for directory, _, names in os.walk(EXAMPLES):
+        found.extend(os.path.join(directory, name) for name in names if name.endswith(tuple(extensions)))
+    return sorted(found)
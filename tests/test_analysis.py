@@ -0,0 +1,88 @@
+from tsal.translator.analysis import SymbolAnalysis, effect_atoms
+from tsal.translator.tsalparser import TSALParser
+
+DOMAIN = '''(define (domain GAME)
+  (:requirements :typing)
+  (:types player item)
+  (:predicates (ready) (won ?p) (lost ?p) (owns ?p ?i) (sold ?i) (tagged ?i) (seen ?i) (coin) (lucky) (broken ?i)
+               (road ?i ?j))
+  (:fluents (self) - player (money ?p) (debt ?p) (score) (level) (wear ?i) (rating ?p))
+  (:derived-predicates (:derived (rich ?p) (and (> (money ?p) 10))))
+  (:processes (= level (* 0.1 ?level)))
+  (:actions
+      (:action flip :parameters (?p - player) :precondition (and (ready))
+             :effect (oneof (and (won ?p) (+ (money ?p) 2)) (and (lost ?p) (- (money ?p) 1))))
+      (:action deal :parameters (?p - player) :precondition (and (ready))
+             :effect (good (and (+ (score) 1))) (bad (and (not (ready)))))
+      (:action toss :parameters (?p - player) :precondition (and (ready))
+             :effect (and (probabilistic 0.5 (coin)) (- (debt ?p) -3)))
+      (:action sell :parameters (?p - player ?i - item) :precondition (and (owns ?p ?i) (road ?i ?i))
+             :effect (and (when (and (ready)) (and (sold ?i) (not (owns ?p ?i))))))
+      (:action look :parameters () :precondition (and (ready))
+             :effect (forall (?i - item) (when (and (tagged ?i)) (and (seen ?i)))))
+      (:action use :parameters (?i - item) :precondition (and (ready))
+             :effect (and (= (wear ?i) 3) (lucky) (+ (rating ?p) -2)))
+  )
+  (:events
+      (:event wear :parameters (?i - item) :precondition (and (ready))
+             :effect (when (and (lucky)) (and (tagged ?i) (not (coin)))))
+      (:event break :parameters () :precondition (and (ready))
+             :effect (forall (?i - item) (when (and (seen ?i)) (and (broken ?i)))))
+  )
+)'''
+
+
+def game():
+    domain = TSALParser.parse_string(DOMAIN)
+    return domain, {operator.name: operator for operator in domain.operators + domain.events}
+
+
+def atoms(operator):
+    return sorted(str(atom) for atom in effect_atoms(operator))
+
+
+def test_effect_atoms_of_every_branch():
+    _, operators = game()
+    assert atoms(operators['flip']) == ['(+ (money ?p) 2)', '(- (money ?p) 1)', '(lost ?p)', '(won ?p)']
+    assert atoms(operators['deal']) == ['(+ (score) 1)', '(not ready)']
+    assert atoms(operators['toss']) == ['(- (debt ?p) -3)', 'coin']
+    # the conditions of a when are left out
+    assert atoms(operators['sell']) == ['(not (owns ?p ?i))', '(sold ?i)']
+    assert atoms(operators['wear']) == ['(not coin)', '(tagged ?i)']
+    assert atoms(operators['break']) == ['(broken ?i)']
+
+
+def test_kinds_of_the_symbols():
+    domain, _ = game()
+    analysis = SymbolAnalysis(domain)
+    assert analysis.static == {'self', 'road'}
+    assert analysis.add_only == {'won', 'lost', 'sold', 'tagged', 'seen', 'lucky', 'broken'}
+    assert analysis.delete_only == {'ready', 'owns'}
+    # coin is added by a probabilistic effect and deleted by an event
+    assert {'coin', 'money', 'wear'} <= analysis.dynamic
+    # the predicate of a forall is added by its action and deleted by the event it is compiled to
+    assert analysis.kind('FORALL0') == 'dynamic'
+    # subtracting a negative constant increases, adding one decreases
+    assert analysis.increasing == {'debt', 'score'} and analysis.decreasing == {'rating'}
+    assert analysis.kind('=') == 'static' and analysis.is_static('road') and not analysis.is_static('coin')
+
+
+def test_derived_predicates_and_process_fluents_are_dynamic():
+    domain, _ = game()
+    analysis = SymbolAnalysis(domain)
+    assert analysis.kind('rich') == analysis.kind('level') == 'dynamic'
+    assert analysis.writers('rich') == analysis.writers('level') == analysis.writers('road') == ()
+
+
+def test_writers_and_partition():
+    domain, operators = game()
+    analysis = SymbolAnalysis(domain)
+    assert analysis.writers('money') == (operators['flip'],)
+    assert set(analysis.writers('coin')) == {operators['toss'], operators['wear']}
+    problem = TSALParser.parse_string('''(define (problem GAME-1) (:domain GAME)
+      (:objects p1 - player i1 i2 - item)
+      (:init (= (self) p1) (ready) (road i1 i2) (owns p1 i1) (= (money p1) 3))
+      (:goal (or (and (= (self) p1) (won p1)))))''')
+    static, other = analysis.partition(problem.init)
+    assert [str(atom) for atom in static] == ['(self) = p1', '(road i1 i2)']
+    assert [str(atom) for atom in other] == [str(atom) for atom in problem.init if atom not in static]
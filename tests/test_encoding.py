@@ -0,0 +1,81 @@
+from tsal.translator.fluent import Fluent
+from tsal.translator.predicate import Predicate
+from tsal.translator.term import Term
+from tsal.translator.tsalparser import TSALParser
+
+from tests.common import example
+
+EXAMPLES = ('blocksworld', 'monopoly', 'test')
+
+
+def parsed(name):
+    return TSALParser.parse(example(name, 'domain.tsal')), TSALParser.parse(example(name, 'problem.tsal'))
+
+
+def atom(item):
+    # the predicate or the fluent of an initial state item
+    if item.name == '=' and isinstance(item.args[0], Fluent):
+        return item.args[0]
+    return item
+
+
+def test_ids_are_dense_and_consistent():
+    for name in EXAMPLES:
+        domain, problem = parsed(name)
+        encoding = problem.encoding(domain)
+        for names, lookup in ((encoding.objects, encoding.object_id), (encoding.symbols, encoding.symbol_id),
+                              (encoding.types, encoding.type_id)):
+            assert len(set(names)) == len(names)
+            assert [lookup(value) for value in names] == list(range(len(names)))
+        objects = [value for values in problem.objects.values() for value in values]
+        assert list(encoding.objects[:len(set(objects))]) == list(dict.fromkeys(objects))  # problem objects first
+
+
+def test_init_atoms_round_trip():
+    for name in EXAMPLES:
+        domain, problem = parsed(name)
+        encoding = problem.encoding(domain)
+        atoms, values = encoding.encode_init()
+        assert len(atoms) + len(values) == len({encoding.encode(item) for item in problem.init})
+        for item in problem.init:
+            code = encoding.encode(item)
+            decoded = encoding.decode(code)
+            assert type(decoded) is type(atom(item))
+            assert str(decoded) == str(atom(item))
+            assert encoding.is_fluent(code[0]) == isinstance(decoded, Fluent)
+            if decoded is not atom(item) and isinstance(atom(item), Fluent):
+                assert values[code] == item.args[1]
+
+
+def test_objects_of_type_include_subtypes():
+    domain, problem = parsed('monopoly')
+    encoding = problem.encoding(domain)
+    by_type = problem.objects_by_type(domain)
+    for type_ in encoding.types:
+        assert encoding.objects_of_type(type_) == tuple(encoding.object_id(value) for value in by_type.get(type_, ()))
+    subtypes = [type_ for type_ in problem.objects if type_ != 'int']
+    assert set(encoding.objects_of_type('int')) >= {encoding.object_id(value) for type_ in subtypes
+                                                     for value in problem.objects[type_]}
+
+
+def test_encoding_is_cached_until_the_problem_or_domain_changes():
+    domain, problem = parsed('blocksworld')
+    encoding = problem.encoding(domain)
+    assert problem.encoding(domain) is encoding
+    assert problem.encoding() is not encoding
+
+    encoding = problem.encoding(domain)
+    block = next(iter(problem.objects))
+    problem.add_object('z', block)
+    assert problem.encoding(domain) is not encoding
+    assert 'z' in problem.encoding(domain).objects
+
+    encoding = problem.encoding(domain)
+    problem.add_to_init(Predicate('clear', [Term.constant('z')]))
+    assert problem.encoding(domain) is not encoding
+    assert problem.encoding(domain).encode(Predicate('clear', [Term.constant('z')])) in \
+        problem.encoding(domain).encode_init()[0]
+
+    encoding = problem.encoding(domain)
+    domain.clear_caches()
+    assert problem.encoding(domain) is not encoding
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from tsal.simulator.evaluation import CompiledExpression, CompiledVector
+from tsal.simulator.fluents import FluentIndex
+from tsal.translator.expression import Expression
+from tsal.translator.fluent import Fluent
+from tsal.translator.term import Term
+from tsal.translator.tsalparser import TSALParser
+
+from tests.test_fluents import DOMAIN, PROBLEM
+
+
+def index():
+    domain, problem = TSALParser.parse_string(DOMAIN), TSALParser.parse_string(PROBLEM)
+    fluents = FluentIndex(problem.encoding(domain), domain.fluents)
+    return fluents, fluents.initial_values(problem)
+
+
+def debt(arg):
+    return Fluent('debt', [arg])
+
+
+def test_vector_matches_the_expressions_one_by_one():
+    fluents, values = index()
+    expressions = [Expression(operator='+', left_child=debt(Term.constant('a')), right_child=Fluent('count', [])),
+                   Expression(operator='/', left_child=Fluent('count', []), right_child=Expression(value=0)),
+                   debt(Term.constant('b'))]
+    vector = CompiledVector(expressions, fluents)
+    expected = [CompiledExpression(expression, fluents)(values) for expression in expressions]
+    np.testing.assert_array_equal(vector(values), expected)
+    batch = np.repeat(values[None, :], 3, axis=0)
+    np.testing.assert_array_equal(vector(batch), [expected] * 3)
+
+
+@pytest.mark.parametrize('expression', [
+    Expression(value='?x'),
+    Expression(operator='*', left_child=Expression(value=2), right_child=Expression(value='?x')),
+    debt(Term.variable('?i')),
+    Expression(operator='+', left_child=Fluent('count', []), right_child=debt(Term.variable('?i', 'item'))),
+], ids=['variable', 'nested variable', 'fluent of a variable', 'nested fluent of a variable'])
+def test_vector_rejects_variables(expression):
+    fluents, _ = index()
+    with pytest.raises(ValueError, match='ground expressions'):
+        CompiledVector([Fluent('count', []), expression], fluents)
+
+
+def test_batch_sees_numbers_and_fluents_added_after_its_first_call():
+    fluents, values = index()
+    objects = [float(number) for number in range(len(fluents.encoding.objects))]  # shared, numbers get appended
+    item = fluents.encoding.object_id('a')
+    plus = CompiledExpression(Expression(operator='+', left_child=Expression(value='?n'),
+                                         right_child=debt(Term.variable('?i'))),
+                              fluents, variables=('?n', '?i'), objects=objects)
+    assert plus.batch(values, [[item, item]])[0] == item + values[fluents.find(debt(Term.constant('a')))]
+
+    objects.append(40.0)  # a number bound after the first batch call, and an object of its own
+    number = len(objects) - 1
+    added = fluents.fluent_id((fluents.encoding.symbol_id('debt'), number))
+    values = fluents.resize(values)
+    values[added] = 2.0
+    bindings = [[number, item], [number, number]]
+    np.testing.assert_array_equal(plus.batch(values, bindings), [plus(values, tuple(b)) for b in bindings])
+    assert plus.batch(values, bindings)[1] == 42.0
@@ -0,0 +1,69 @@
+import os
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from tsal.translator.distribution import FrequencyDistribution
+from tsal.translator.equation import Equation
+from tsal.translator.expression import Expression
+from tsal.translator.process import Process
+
+# builds and hashes a process, then pickles it to stdout
+PICKLE_PROCESS = '''
+import pickle, sys
+from tests.test_expression import process
+built = process()
+hash(built)
+sys.stdout.buffer.write(pickle.dumps(built))
+'''
+
+
+def process():
+    rate = Expression(operator='-', left_child=Expression(value='inflow'), right_child=Expression(value='?level'))
+    return Process(fluent='level', equation=Equation(variables=['?level'], expression=rate))
+
+
+def test_structural_hash():
+    assert hash(process()) == hash(process())
+    distribution = FrequencyDistribution('exponential', 'mean', 5.0)
+    assert hash(distribution) == hash(FrequencyDistribution('exponential', 'mean', 5.0))
+
+
+def test_hash_not_pickled():
+    for obj in (process(), process().equation, process().equation.expression,
+                FrequencyDistribution('poisson', 'frequency', 2.0)):
+        hash(obj)
+        restored = pickle.loads(pickle.dumps(obj))
+        assert restored._hash is None and hash(restored) == hash(obj)
+
+
+def test_pickled_expressions_across_processes():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONHASHSEED='3')
+    output = subprocess.run([sys.executable, '-c', PICKLE_PROCESS], env=env, cwd=root, stdout=subprocess.PIPE,
+                            check=True).stdout
+    loaded = pickle.loads(output)
+    assert loaded.equation.expression in {process().equation.expression}
+    assert hash(loaded) == hash(process())
+
+
+def test_hashed_expression_is_immutable():
+    expression = Expression(operator='+', left_child=Expression(value=1), right_child=Expression(value=2))
+    expression.right_child = Expression(value=3)
+    parent = Expression(operator='*', left_child=Expression(value=2), right_child=expression)
+    hash(parent)
+    with pytest.raises(AttributeError):
+        expression.right_child = Expression(value=4)
+
+
+def test_comparing_does_not_freeze_an_expression():
+    expression = Expression(operator='+', left_child=Expression(value=1), right_child=Expression(value=2))
+    same = Expression(operator='+', left_child=Expression(value=1), right_child=Expression(value=2))
+    assert expression in [Expression(value=1), same] and expression == same
+    expression.right_child = Expression(value=3)
+    assert expression != same and expression not in [same]
+    same.right_child = Expression(value=3)
+    assert expression == same and hash(expression) == hash(same)
+    assert expression != Expression(operator='+', left_child=Expression(value=1), right_child=Expression(value=4))
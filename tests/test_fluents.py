@@ -0,0 +1,85 @@
+import math
+
+import numpy as np
+
+from tsal.simulator.fluents import FluentIndex
+from tsal.translator.fluent import Fluent
+from tsal.translator.tsalparser import TSALParser
+
+from tests.common import example
+
+DOMAIN = '''(define (domain BOUNDED)
+  (:requirements :typing)
+  (:types item player)
+  (:predicates (held ?i))
+  (:fluents (self) - player (owner ?i - item) - player (debt ?i - item :bounds -5 0 0)
+            (weight ?i - item :bounds -5 10 1) (count))
+  (:actions
+      (:action hold :parameters (?i - item) :precondition (and (held ?i)) :effect (and (held ?i)))
+  )
+)'''
+
+PROBLEM = '''(define (problem BOUNDED-1) (:domain BOUNDED)
+  (:objects a b - item p1 - player)
+  (:init (= (self) p1) (= (owner a) p1) (= (debt a) 3) (= (debt b) -7) (= (weight a) 12) (= (weight b) 2)
+         (= (count) 7))
+  (:goal (or (and (= (self) p1) (held a)))))'''
+
+
+def index():
+    domain, problem = TSALParser.parse_string(DOMAIN), TSALParser.parse_string(PROBLEM)
+    fluents = FluentIndex(problem.encoding(domain), domain.fluents)
+    return problem, fluents, fluents.initial_values(problem)
+
+
+def value(problem, fluents, values, position):
+    # the value of the fluent assigned by the position-th init atom
+    return fluents.decode_value(fluents.find(problem.init[position]), values[fluents.find(problem.init[position])])
+
+
+def test_bound_defaults_only_replace_none():
+    assert Fluent('f', [], [-5, 0, 0]).bounds == [-5, 0, 0]
+    assert Fluent('f', [], [None, None, 1]).bounds == [0, 100, 1]
+    assert not Fluent('f', []).has_bounds
+
+
+def test_zero_max_and_precision_enforced():
+    problem, fluents, values = index()
+    assert value(problem, fluents, values, 2) == 0  # clamped to the max of 0
+    assert value(problem, fluents, values, 3) == -5
+    values[fluents.find(problem.init[3])] = -2.6
+    assert value(problem, fluents, fluents.enforce(values), 3) == -3  # rounded to 0 decimals
+    assert value(problem, fluents, values, 4) == 10
+    values[fluents.find(problem.init[5])] = 2.26
+    assert value(problem, fluents, fluents.enforce(values), 5) == 2.3
+    assert value(problem, fluents, values, 6) == 7  # no bounds
+
+
+def test_symbolic_values():
+    problem, fluents, values = index()
+    assert value(problem, fluents, values, 0) == 'p1'
+    assert value(problem, fluents, values, 1) == 'p1'
+    assert fluents.symbolic.sum() == 2
+
+
+def test_batched_updates():
+    problem, fluents, values = index()
+    debt, count = fluents.find(problem.init[3]), fluents.find(problem.init[6])
+    fluents.increase(values, [count, count, debt], [1, 1, 10.4])
+    assert values[count] == 9 and values[debt] == 0
+    batch = np.tile(values, (3, 1))
+    fluents.decrease(batch, [count], np.arange(3).reshape(3, 1) * 2.0)
+    assert list(batch[:, count]) == [9, 7, 5]
+    fluents.assign(batch, [debt], -9)
+    assert list(batch[:, debt]) == [-5] * 3
+
+
+def test_initial_values_of_example():
+    domain = TSALParser.parse(example('monopoly', 'domain.tsal'))
+    problem = TSALParser.parse(example('monopoly', 'problem.tsal'))
+    fluents = FluentIndex(problem.encoding(domain), domain.fluents)
+    values = fluents.initial_values(problem)
+    for atom in problem.init:
+        index = fluents.find(atom)
+        assert fluents.decode_value(index, values[index]) == atom.args[1]
+    assert math.isnan(fluents.resize(fluents.empty())[0])
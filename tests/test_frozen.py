@@ -0,0 +1,64 @@
+import pickle
+
+import pytest
+
+from tsal.translator.frozen import FrozenList
+from tsal.translator.tsalparser import TSALParser
+
+from tests.common import example
+
+
+def lists(value):
+    # every list nested in value, value included
+    found = []
+    if isinstance(value, list):
+        found.append(value)
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            found.extend(lists(item))
+    return found
+
+
+def operators(frozen=False):
+    domain = TSALParser.parse(example('monopoly', 'domain.tsal'))
+    if frozen:
+        domain.freeze()
+    return domain.operators + domain.events
+
+
+def test_frozen_effects_cannot_be_changed():
+    for operator_ in operators(frozen=True):
+        nested = lists(operator_.effects) + lists(operator_.precond)
+        assert nested and all(type(value) is FrozenList for value in nested)
+    action = operators(frozen=True)[0]
+    with pytest.raises(TypeError):
+        action.effects0.append(action.effects0[0])
+    with pytest.raises(TypeError):
+        action.effects0[0] = None
+    with pytest.raises(TypeError):
+        action.effects0 += [None]
+
+
+def test_frozen_operators_are_equal_to_mutable_ones():
+    for mutable, frozen in zip(operators(), operators(frozen=True)):
+        assert str(frozen) == str(mutable)
+        assert list(frozen.effects) == mutable.effects
+        assert list(frozen.precond) == mutable.precond
+        assert str(pickle.loads(pickle.dumps(frozen))) == str(mutable)
+
+
+def test_replace_copies_the_nested_effects_of_a_mutable_operator():
+    for operator_ in operators():
+        copy = operator_.replace(name=operator_.name + '-copy')
+        assert copy.effects == operator_.effects
+        original = lists(operator_.effects)[1:]  # the outer list is copied by the getter
+        assert not {id(value) for value in original} & {id(value) for value in lists(copy.effects)}
+        for value in lists(copy.effects)[1:]:
+            value.append(None)
+        assert None not in [item for value in original for item in value]
+
+
+def test_replace_of_a_frozen_operator_shares_its_effects():
+    for operator_ in operators(frozen=True):
+        copy = operator_.replace(name=operator_.name + '-copy')
+        assert copy.frozen and copy.effects is operator_.effects
@@ -0,0 +1,87 @@
+import random
+
+from tsal.simulator.generator import SuccessorGenerator
+from tsal.simulator.state import State
+from tsal.simulator.successor import SuccessorEngine
+from tsal.translator.tsalparser import TSALParser
+
+from tests.common import example
+
+
+def engine(name, operators=None):
+    domain = TSALParser.parse(example(name, 'domain.tsal'))
+    problem = TSALParser.parse(example(name, 'problem.tsal'))
+    return SuccessorEngine(domain, problem, operators(domain) if operators else None)
+
+
+def walk(engine_, steps, seed=0):
+    # the states of a random walk, restarted from the initial state when no grounding is applicable
+    rng = random.Random(seed)
+    state, values = engine_.initial()
+    found = [(state, values)]
+    for _ in range(steps):
+        applicable = engine_.applicable(state, values)
+        if not applicable:
+            state, values = engine_.initial()
+            continue
+        ground, binding = rng.choice(applicable)
+        state, values = engine_.apply(state, values, ground, binding, rng.randrange(len(ground.outcomes)))
+        found.append((state, values))
+    return found
+
+
+def scrambled(engine_, count, seed=0):
+    # states with random bits, and random values among those the equalities of the groundings test
+    rng = random.Random(seed)
+    _, values = engine_.initial()
+    tested = {}
+    for ground in engine_.grounds:
+        for index, value in ground.equalities:
+            tested.setdefault(index, set()).add(value)
+    found = []
+    for _ in range(count):
+        bits = rng.getrandbits(len(engine_.index)) if len(engine_.index) else 0
+        new = values.copy()
+        for index, choices in tested.items():
+            new[index] = rng.choice(sorted(choices) + [new[index]])
+        found.append((State(engine_.index, bits), new))
+    return found
+
+
+def linear(grounds, bits, values):
+    return [ground for ground in grounds if ground.holds(bits, values)]
+
+
+def check(engine_, states):
+    generator = engine_.generator
+    order = {id(ground): position for position, ground in enumerate(generator.grounds)}
+    for state, values in states:
+        found = sorted(generator.candidates(state.bits, values), key=lambda ground: order[id(ground)])
+        assert found == linear(generator.grounds, state.bits, values)
+        expected = [(ground, binding) for ground in found for binding in ground.bindings(state.bits, values)]
+        assert sorted(generator.applicable(state, values), key=lambda pair: (order[id(pair[0])], pair[1])) == \
+            sorted(expected, key=lambda pair: (order[id(pair[0])], pair[1]))
+
+
+def test_generator_matches_a_linear_scan_on_blocksworld():
+    blocks = engine('blocksworld')
+    assert len(blocks.generator) == len(blocks.grounds) and blocks.generator.nodes > 1
+    check(blocks, walk(blocks, 500) + scrambled(blocks, 200))
+
+
+def test_generator_matches_a_linear_scan_on_monopoly():
+    for operators in (lambda domain: domain.operators, lambda domain: domain.events,
+                      lambda domain: domain.operators + domain.events):
+        monopoly = engine('monopoly', operators)
+        check(monopoly, walk(monopoly, 200) + scrambled(monopoly, 200))
+
+
+def test_generator_of_some_groundings():
+    blocks = engine('blocksworld')
+    state, values = blocks.initial()
+    for size in (0, 1, 5, len(blocks.grounds) // 2):
+        grounds = blocks.grounds[:size]
+        generator = SuccessorGenerator(grounds)
+        assert len(generator) == size
+        assert set(map(id, generator.candidates(state.bits, values))) == \
+            set(map(id, linear(grounds, state.bits, values)))
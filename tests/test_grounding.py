@@ -0,0 +1,78 @@
+import itertools
+
+import pytest
+
+from tsal.simulator.grounding import Grounder
+from tsal.translator.tsalparser import TSALParser
+
+from tests.common import example
+
+DOMAIN = '''(define (domain ROADS)
+  (:requirements :typing)
+  (:types truck - vehicle place vehicle player)
+  (:predicates (road ?a ?b) (at ?v ?p) (closed ?p) (visited ?p) (fuel ?v))
+  (:fluents (self) - player (distance ?a - place ?b - place) (capacity ?v - vehicle))
+  (:actions
+      (:action drive :parameters (?v - vehicle ?a - place ?b - place)
+             :precondition (and (road ?a ?b) (at ?v ?a) (not (closed ?b)) (< (distance ?a ?b) 10))
+             :effect (and (at ?v ?b) (not (at ?v ?a)) (visited ?b)))
+      (:action load :parameters (?t - truck ?p - place) :precondition (and (> (capacity ?t) 1) (visited ?p))
+             :effect (and (visited ?p)))
+      (:action explore :parameters (?p - place) :precondition (and (not (visited ?p)))
+             :effect (and (visited ?p)))
+      (:action burn :parameters (?v - vehicle) :precondition (and (fuel ?v)) :effect (and (not (fuel ?v))))
+  )
+)'''
+
+PROBLEM = '''(define (problem ROADS-1) (:domain ROADS)
+  (:objects x y z - place c - vehicle t - truck p1 - player)
+  (:init (= (self) p1) (road x y) (road y z) (road x z) (closed z) (at c x) (at t y) (visited y) (fuel t)
+         (= (distance x y) 5) (= (distance y z) 4) (= (distance x z) 12) (= (capacity c) 3) (= (capacity t) 2))
+  (:goal (or (and (= (self) p1) (at c z)))))'''
+
+
+def grounder():
+    domain, problem = TSALParser.parse_string(DOMAIN), TSALParser.parse_string(PROBLEM)
+    return domain, problem, Grounder(domain, problem)
+
+
+def test_static_preconditions_prune_the_groundings():
+    domain, _, roads = grounder()
+    found = {operator_.name: sorted(roads.groundings(operator_)) for operator_ in domain.operators}
+    assert found == {
+        'drive': [('c', 'x', 'y'), ('t', 'x', 'y')],  # y z is closed, x z too far, (at ?v ?a) changes
+        'load': [('t', 'x'), ('t', 'y'), ('t', 'z')],  # visited may become true, c is not a truck
+        'explore': [('x',), ('z',)],  # y stays visited
+        'burn': [('t',)],  # fuel is never added
+    }
+    assert sorted((operator_.name, binding) for operator_, binding in roads.ground()) == \
+        sorted((name, binding) for name, bindings in found.items() for binding in bindings)
+
+
+def test_tables_hold_the_object_ids_of_the_groundings():
+    domain, problem, roads = grounder()
+    encoding = problem.encoding(domain)
+    for operator_, table in zip(domain.operators, roads.tables()):
+        assert table.operator is operator_ and table.arity == len(operator_.params)
+        groundings = list(roads.groundings(operator_))
+        assert len(table) == len(groundings)
+        assert list(table.bindings()) == groundings
+        assert list(table) == [tuple(encoding.object_id(name) for name in binding) for binding in groundings]
+
+
+def test_operators_without_static_preconditions_get_every_binding():
+    domain = TSALParser.parse(example('blocksworld', 'domain.tsal'))
+    problem = TSALParser.parse(example('blocksworld', 'problem.tsal'))
+    blocks = Grounder(domain, problem)
+    objects = {name for names in problem.objects_by_type(domain).values() for name in names}  # untyped parameters
+    for operator_ in domain.operators:
+        expected = itertools.product(*[objects for _ in operator_.params])
+        assert sorted(blocks.groundings(operator_)) == sorted(expected)
+
+
+def test_repeated_parameters_are_rejected():
+    domain, _, roads = grounder()
+    burn = domain.operators[-1]
+    twice = burn.replace(params=burn.params + burn.params)
+    with pytest.raises(ValueError, match='repeated parameters'):
+        list(roads.groundings(twice))
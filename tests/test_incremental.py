@@ -0,0 +1,67 @@
+from tsal.translator.analysis import STATIC
+from tsal.translator.incremental import IncrementalDomain
+from tsal.translator.tsalparser import TSALParser
+
+from tests.common import example
+
+FORALLS = '''(define (domain F)
+  (:requirements :typing)
+  (:types block)
+  (:predicates (a ?x) (b ?x) (c ?x ?y))
+  (:actions
+      (:action one :parameters (?x - block) :precondition (and (a ?x))
+             :effect (and (forall (?y - block) (when (and (c ?x ?y)) (and (b ?y))))))
+      (:action two :parameters (?x - block) :precondition (and (b ?x))
+             :effect (and (not (b ?x)) (forall (?y - block) (when (and (c ?x ?y)) (and (a ?y))))))
+  )
+)'''
+
+
+def parts(domain):
+    return ([str(predicate) for predicate in domain.predicates], [str(event) for event in domain.events],
+            [str(action) for action in domain.operators])
+
+
+def edit(incremental, kind, name, change=lambda text: text):
+    element = incremental.find(kind, name)
+    incremental.replace(element, change(incremental.source[element.start:element.end]))
+    return TSALParser.parse_string(incremental.source, start='domain')
+
+
+def test_replace_matches_full_parse():
+    with open(example('monopoly', 'domain.tsal'), 'rb') as file:
+        incremental = IncrementalDomain(file.read())
+    for kind in ('action', 'event', 'fluent', 'predicate'):
+        name = [element for element in incremental.elements if element.kind == kind][-1].name
+        assert str(edit(incremental, kind, name)) == str(incremental.domain)
+
+
+def test_replace_unchanged_forall_action():
+    incremental = IncrementalDomain(FORALLS)
+    full = edit(incremental, 'action', 'two')
+    assert parts(incremental.domain) == parts(full)
+    assert 'FORALL1' in str(incremental.domain.operators[1])
+
+
+def test_replace_forall_action_body():
+    incremental = IncrementalDomain(FORALLS)
+    full = edit(incremental, 'action', 'two', lambda text: text.replace(b'(a ?y)', b'(a ?y) (b ?y)'))
+    assert parts(incremental.domain) == parts(full)
+    assert len(incremental.domain.events) == 2
+
+
+def test_replace_drops_old_foralls():
+    incremental = IncrementalDomain(FORALLS)
+    element = incremental.find('action', 'one')
+    incremental.replace(element, '(:action one :parameters (?x - block) :precondition (and (a ?x)) '
+                                 ':effect (and (b ?x)))')
+    assert [predicate.name for predicate in incremental.domain.predicates] == ['a', 'b', 'c', 'FORALL1']
+    assert [event.name for event in incremental.domain.events] == ['1FORALL']
+
+
+def test_replace_clears_analysis():
+    incremental = IncrementalDomain(FORALLS)
+    domain = incremental.domain
+    assert domain.analysis.kind('c') == STATIC
+    edit(incremental, 'action', 'one', lambda text: text.replace(b'(and (b ?y))', b'(and (b ?y) (not (c ?x ?y)))'))
+    assert domain.analysis.kind('c') != STATIC
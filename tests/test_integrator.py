@@ -0,0 +1,102 @@
+import math
+
+import numpy as np
+import pytest
+
+from tsal.simulator.integrator import ProcessIntegrator
+from tsal.simulator.successor import SuccessorEngine
+from tsal.translator.tsalparser import TSALParser
+
+DOMAIN = '''(define (domain TANK)
+  (:requirements :typing)
+  (:types tank player)
+  (:predicates (open ?t) (overflow))
+  (:fluents (self) - player (level) (inflow) (heat) (temp ?t))
+  (:processes
+      (= level (- (inflow) (* 0.1 ?level)))
+      (= heat (* -0.5 heat))
+      (= heat (* 0.0 ?t))
+  )
+  (:actions
+      (:action close :parameters (?t - tank) :precondition (and (open ?t)) :effect (and (not (open ?t))))
+  )
+  (:events
+      (:event spill :parameters () :precondition (and (> (level) 8.0) (not (overflow)))
+             :effect (and (overflow)))
+  )
+)'''
+
+PROBLEM = '''(define (problem TANK-1) (:domain TANK)
+  (:objects t1 - tank p1 - player)
+  (:init (= (self) p1) (open t1) (= (level) 0) (= (inflow) 1) (= (heat) 4))
+  (:goal (or (and (= (self) p1) (overflow)))))'''
+
+
+def tank():
+    domain = TSALParser.parse_string(DOMAIN)
+    engine = SuccessorEngine(domain, TSALParser.parse_string(PROBLEM), domain.operators + domain.events)
+    integrator = ProcessIntegrator(domain, engine.fluents)
+    state, values = engine.initial()
+    symbol = engine.encoding.symbol_id
+    return engine, integrator, state, values, engine.fluents.find((symbol('level'),)), \
+        engine.fluents.find((symbol('heat'),))
+
+
+def level(time, start=0.0):
+    # d(level)/dt = 1 - level / 10
+    return 10 - (10 - start) * math.exp(-time / 10)
+
+
+def test_processes_on_fluents_are_integrated_the_others_skipped():
+    _, integrator, _, _, level_id, heat_id = tank()
+    assert list(integrator.ids) == sorted([level_id, heat_id])
+    assert len(integrator.processes) == 2 and len(integrator.rates) == 2
+    assert len(integrator.skipped) == 1 and '?t' in next(iter(integrator.skipped.values()))
+
+
+def test_rk4_is_accurate_and_euler_first_order():
+    _, integrator, _, values, level_id, heat_id = tank()
+    _, rk4, crossed = integrator.integrate(values, 10.0, dt=1.0, method='rk4')
+    assert not crossed
+    assert rk4[level_id] == pytest.approx(level(10.0), abs=1e-5)
+    assert rk4[heat_id] == pytest.approx(4 * math.exp(-5), abs=1e-3)
+    errors = [abs(integrator.integrate(values, 10.0, dt=dt, method='euler')[1][level_id] - level(10.0))
+              for dt in (0.2, 0.1)]
+    assert errors[0] > 1e-3 and errors[0] / errors[1] == pytest.approx(2, rel=0.05)
+    # adaptive steps: a tighter tolerance gives a smaller error
+    errors = [abs(integrator.integrate(values, 10.0, dt=1.0, method=method, tolerance=tolerance)[1][level_id] -
+                  level(10.0)) for method in ('euler', 'rk4') for tolerance in (1e-4, 1e-6)]
+    assert errors[1] < errors[0] < 0.01 and errors[3] < errors[2] < 1e-5
+
+
+def test_integration_stops_at_the_crossing_that_enables_an_event():
+    engine, integrator, state, values, level_id, _ = tank()
+
+    def watch(vector):
+        return frozenset(ground.operator.name for ground, _ in engine.applicable(state, vector))
+    elapsed, found, crossed = integrator.integrate(values, 100.0, dt=0.5, watch=watch, resolution=1e-7)
+    assert crossed and 'spill' in watch(found) and 'spill' not in watch(values)
+    assert elapsed == pytest.approx(10 * math.log(5), abs=1e-6)
+    assert found[level_id] == pytest.approx(8.0, abs=1e-6)
+    assert integrator.integrate(values, 5.0, dt=0.5, watch=watch)[2] is False
+
+
+def test_batches_match_single_vectors_and_inputs_are_kept():
+    _, integrator, _, values, level_id, _ = tank()
+    batch = np.repeat(values[None, :], 5, axis=0)
+    batch[:, level_id] = np.arange(5)
+    kept = batch.copy()
+    _, result, _ = integrator.integrate(batch, 10.0, dt=0.1)
+    np.testing.assert_array_equal(batch, kept)
+    for row in range(5):
+        np.testing.assert_allclose(result[row], integrator.integrate(batch[row], 10.0, dt=0.1)[1])
+        assert result[row, level_id] == pytest.approx(level(10.0, start=row), abs=1e-8)
+    np.testing.assert_allclose(integrator.step(batch, 0.1)[0], integrator.step(batch[0], 0.1))
+
+
+def test_bad_arguments_are_rejected():
+    _, integrator, _, values, _, _ = tank()
+    with pytest.raises(ValueError):
+        integrator.step(values, 0.1, method='midpoint')
+    with pytest.raises(ValueError):
+        integrator.integrate(np.stack([values, values]), 1.0, watch=len)
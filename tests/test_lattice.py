@@ -0,0 +1,80 @@
+from tsal.simulator.grounding import Grounder
+from tsal.translator.lattice import TypeLattice
+from tsal.translator.tsalparser import TSALParser
+
+DOMAIN = '''(define (domain FLEET)
+  (:requirements :typing)
+  (:types truck van - vehicle vehicle - thing place player)
+  (:constants depot - place)
+  (:predicates (at ?v ?p) (parked ?x))
+  (:fluents (self) - player)
+  (:actions
+      (:action park :parameters (?x - object) :precondition (and (not (parked ?x))) :effect (and (parked ?x)))
+      (:action move :parameters (?v - vehicle ?p - place) :precondition (and (not (at ?v ?p)))
+             :effect (and (at ?v ?p)))
+  )
+)'''
+
+PROBLEM = '''(define (problem FLEET-1) (:domain FLEET)
+  (:objects t1 t2 - truck v1 - van home - place p1 - player)
+  (:init (= (self) p1))
+  (:goal (or (and (= (self) p1) (at t1 home)))))'''
+
+
+def fleet():
+    return TSALParser.parse_string(DOMAIN), TSALParser.parse_string(PROBLEM)
+
+
+def test_ancestors_and_descendants_are_transitive():
+    lattice = fleet()[0].type_lattice
+    assert lattice.ancestors('truck') == {'truck', 'vehicle', 'thing', 'object'}
+    assert lattice.descendants('thing') == {'thing', 'vehicle', 'truck', 'van'}
+    assert lattice.descendants('object') == set(lattice.types)
+    assert lattice.is_subtype('truck', 'thing') and not lattice.is_subtype('thing', 'truck')
+    assert not lattice.is_subtype('place', 'vehicle')
+    for name in lattice.types:
+        assert lattice.ancestor_mask(name) == sum(1 << lattice.ids[other] for other in lattice.ancestors(name))
+        assert lattice.descendant_mask(name) == sum(1 << lattice.ids[other] for other in lattice.descendants(name))
+
+
+def test_object_is_the_supertype_of_every_type():
+    lattice = TypeLattice({'a': ['b'], 'c': []})
+    assert 'object' in lattice and lattice.descendants('object') == {'object', 'a', 'b', 'c'}
+    assert all(lattice.is_subtype(name, 'object') for name in ('a', 'b', 'c', 'undeclared'))
+    assert lattice.ancestors('undeclared') == {'undeclared', 'object'} and lattice.ancestor_mask('undeclared') == 0
+
+
+def test_cycles_are_one_class():
+    lattice = TypeLattice({'a': ['b'], 'b': ['c'], 'c': ['a']})
+    assert lattice.ancestors('a') == lattice.descendants('a') | {'object'} == {'a', 'b', 'c', 'object'}
+
+
+def test_objects_by_type_include_subtypes_and_constants():
+    domain, problem = fleet()
+    index = problem.objects_by_type(domain)
+    assert index['vehicle'] == index['thing'] == ('t1', 't2', 'v1')
+    assert index['place'] == ('home', 'depot')
+    assert set(index['object']) == {'t1', 't2', 'v1', 'home', 'p1', 'depot'}
+    assert problem.objects_by_type(domain) is index
+
+
+def test_object_parameters_take_every_object():
+    domain, problem = fleet()
+    groundings = dict((operator_.name, []) for operator_ in domain.operators)
+    for operator_, binding in Grounder(domain, problem).ground(domain.operators):
+        groundings[operator_.name].append(binding)
+    assert sorted(groundings['park']) == sorted((name,) for name in ('t1', 't2', 'v1', 'home', 'p1', 'depot'))
+    assert len(groundings['move']) == 3 * 2
+
+
+def test_objects_by_type_follow_changes_to_the_types():
+    domain, problem = fleet()
+    index = problem.objects_by_type(domain)
+    revision = domain.revision
+    domain.add_type('place', 'thing')
+    assert domain.revision > revision
+    assert problem.objects_by_type(domain) is not index
+    assert problem.objects_by_type(domain)['thing'] == ('t1', 't2', 'v1', 'home', 'depot')
+    domain.types = {'vehicle': ['truck']}
+    assert problem.objects_by_type(domain)['vehicle'] == ('t1', 't2')
+    assert 'thing' not in problem.objects_by_type(domain)
@@ -0,0 +1,26 @@
+import pytest
+
+from tsal.translator import tsalparser
+from tsal.translator.tsalparser import TSALLexer, TSALParser
+
+from tests.common import EXAMPLES, example_files
+
+
+def token_stream(lexer, data):
+    lexer.lineno = 1
+    lexer.input(data)
+    return [(token.type, token.value, token.lineno, token.lexpos) for token in lexer]
+
+
+@pytest.mark.parametrize('path', example_files(('.tsal', '.pddl')), ids=lambda path: path[len(EXAMPLES) + 1:])
+def test_fast_lexer_matches_ply_on_examples(path):
+    data = TSALParser.read_input(path)
+    expected = token_stream(tsalparser._lexer.clone(), data)
+    assert expected
+    assert token_stream(TSALLexer(), data) == expected
+
+
+def test_fast_lexer_matches_ply_on_raw_text():
+    # comments, blank lines and the characters read_input would strip
+    data = '; a comment\n(define (domain D)\n\n  (:predicates (at ?x - obj))\t; more\n  -1.5 2 ?y)\n'
+    assert token_stream(TSALLexer(), data) == token_stream(tsalparser._lexer.clone(), data)
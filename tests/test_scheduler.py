@@ -0,0 +1,123 @@
+import math
+
+import pytest
+
+from tsal.simulator.scheduler import EventScheduler, interarrival
+from tsal.simulator.successor import SuccessorEngine
+from tsal.translator.distribution import FrequencyDistribution
+from tsal.translator.event import Event
+from tsal.translator.tsalparser import TSALParser
+
+DOMAIN = '''(define (domain MACHINES)
+  (:requirements :typing)
+  (:types machine player)
+  (:predicates (working ?m) (broken ?m) (ticked))
+  (:fluents (self) - player (failures))
+  (:actions
+      (:action repair :parameters (?m - machine) :precondition (and (broken ?m))
+             :effect (and (working ?m) (not (broken ?m))))
+  )
+  (:events
+      (:event fail :parameters (?m - machine) :precondition (and (working ?m))
+             :interarrival (exponential mean 5.0)
+             :effect (and (broken ?m) (not (working ?m)) (+ (failures) 1)))
+      (:event fix :parameters (?m - machine) :precondition (and (broken ?m))
+             :interarrival (exponential mean 2.5)
+             :effect (and (working ?m) (not (broken ?m))))
+      (:event tick :parameters () :precondition (and (not (ticked)))
+             :interarrival (constant mean 3.0)
+             :effect (and (ticked)))
+  )
+)'''
+
+PROBLEM = '''(define (problem MACHINES-1) (:domain MACHINES)
+  (:objects {} - machine p1 - player)
+  (:init (= (self) p1) (= (failures) 0) {})
+  (:goal (or (and (= (self) p1) (working m0)))))'''
+
+
+def engine(machines=3):
+    names = ['m{}'.format(number) for number in range(machines)]
+    domain = TSALParser.parse_string(DOMAIN)
+    problem = TSALParser.parse_string(PROBLEM.format(' '.join(names), ' '.join('(working {})'.format(name)
+                                                                               for name in names)))
+    return SuccessorEngine(domain, problem, domain.operators + domain.events)
+
+
+def enabled_events(engine_, state, values):
+    return sorted((repr(ground), binding) for ground, binding in engine_.applicable(state, values)
+                  if isinstance(ground.operator, Event))
+
+
+def failures(scheduler):
+    fluents = scheduler.engine.fluents
+    return scheduler.values[fluents.find((fluents.encoding.symbol_id('failures'),))]
+
+
+def test_interarrival_of_the_distributions():
+    assert interarrival(None) == (False, 0.0)
+    assert interarrival(FrequencyDistribution('exponential', 'mean', 4.0)) == (True, 4.0)
+    assert interarrival(FrequencyDistribution('poisson', 'rate', 4.0)) == (True, 0.25)
+    assert interarrival(FrequencyDistribution('exponential', 'frequency', 0)) == (True, math.inf)
+    assert interarrival(FrequencyDistribution('constant', 'mean', 3.0)) == (False, 3.0)
+    with pytest.raises(ValueError):
+        interarrival(FrequencyDistribution('normal', 'mean', 1.0))
+    with pytest.raises(ValueError):
+        interarrival(FrequencyDistribution('exponential', 'mean', -1.0))
+
+
+def test_queue_holds_the_enabled_events():
+    machines = engine()
+    scheduler = EventScheduler(machines, seed=0)
+    assert len(scheduler.events) == 7
+    for _ in range(300):
+        expected = enabled_events(machines, scheduler.state, scheduler.values)
+        assert scheduler.pending == len(expected)
+        time, ground, binding = scheduler.peek()
+        assert time >= scheduler.time and (repr(ground), binding) in expected
+        assert scheduler.step() == (time, ground, binding)
+        assert scheduler.time == time
+
+
+def test_runs_repeat_with_the_same_seed():
+    machines = engine()
+    trace = [(time, repr(ground), binding) for time, ground, binding in EventScheduler(machines, seed=3).run(50.0)]
+    again = [(time, repr(ground), binding) for time, ground, binding in EventScheduler(machines, seed=3).run(50.0)]
+    other = [(time, repr(ground), binding) for time, ground, binding in EventScheduler(machines, seed=4).run(50.0)]
+    assert trace == again and trace != other
+    assert all(earlier[0] <= later[0] <= 50.0 for earlier, later in zip(trace, trace[1:]))
+
+
+def test_constant_interarrival_occurs_on_time():
+    scheduler = EventScheduler(engine(), seed=0)
+    ticks = [time for time, ground, _ in scheduler.run(20.0) if ground.operator.name == 'tick']
+    assert ticks == [3.0]
+    assert scheduler.time <= 20.0
+
+
+def test_failure_rate_follows_the_interarrival_means():
+    # each machine works for 5 on average then is broken for 2.5: one failure per 7.5 time units
+    machines, duration = 50, 300.0
+    scheduler = EventScheduler(engine(machines), seed=1)
+    scheduler.run(duration)
+    expected = machines * duration / 7.5
+    assert abs(failures(scheduler) - expected) < 0.1 * expected
+    broken = sum(1 for ground, _ in scheduler.engine.applicable(scheduler.state, scheduler.values)
+                 if ground.operator.name == 'fix')
+    assert 0 < broken < machines
+
+
+def test_update_after_an_action():
+    machines = engine()
+    scheduler = EventScheduler(machines, seed=0)
+    while not any(ground.operator.name == 'repair' for ground, _ in machines.applicable(scheduler.state,
+                                                                                       scheduler.values)):
+        scheduler.step()
+    ground, binding = [pair for pair in machines.applicable(scheduler.state, scheduler.values)
+                       if pair[0].operator.name == 'repair'][0]
+    state, values = machines.apply(scheduler.state, scheduler.values, ground, binding)
+    scheduler.update(state, values)
+    assert scheduler.pending == len(enabled_events(machines, state, values))
+    # the repaired machine is fixed no more, it has to fail first
+    names = [other.operator.name for _, other, _ in scheduler.run(limit=100) if other.args == ground.args]
+    assert names and names[0] == 'fail'
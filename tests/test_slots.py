@@ -0,0 +1,58 @@
+import copy
+import pickle
+import sys
+
+import pytest
+
+from tsal.translator.expression import Expression
+from tsal.translator.fluent import Fluent
+from tsal.translator.literal import Literal
+from tsal.translator.predicate import Predicate
+from tsal.translator.term import Term
+from tsal.translator.tsalparser import TSALParser
+
+from tests.common import example
+
+
+def instances():
+    term = Term(value='a')
+    predicate = Predicate('on', [term, Term(value='b')])
+    fluent = Fluent('money', [Term(value='p1')])
+    return [term, predicate, Literal(predicate, False), fluent,
+            Expression(operator='+', left_child=fluent, right_child=Expression(value=2))]
+
+
+@pytest.mark.parametrize('item', instances(), ids=lambda item: type(item).__name__)
+def test_instances_have_no_dict(item):
+    assert not hasattr(item, '__dict__')
+    classes = [cls for cls in type(item).__mro__ if cls is not object]
+    assert all('__slots__' in vars(cls) for cls in classes)
+    # the object and gc headers, then one pointer per slot
+    assert sys.getsizeof(item) <= 32 + 8 * sum(len(vars(cls)['__slots__']) for cls in classes)
+    with pytest.raises(AttributeError):
+        item.extra = 1
+
+
+@pytest.mark.parametrize('item', instances(), ids=lambda item: type(item).__name__)
+def test_slotted_instances_copy_and_pickle(item):
+    for other in (copy.copy(item), copy.deepcopy(item), pickle.loads(pickle.dumps(item))):
+        assert str(other) == str(item)
+    hash(item)
+    if not isinstance(item, Literal):
+        assert pickle.loads(pickle.dumps(item)) == item
+
+
+def test_parsed_atoms_have_no_dict():
+    problem = TSALParser.parse(example('monopoly', 'problem.tsal'))
+    found = set()
+    stack = list(problem.init)
+    while stack:
+        item = stack.pop()
+        if isinstance(item, (Term, Predicate, Literal, Fluent, Expression)):
+            found.add(type(item))
+            assert not hasattr(item, '__dict__')
+            stack.extend(getattr(item, name) for name in ('args', 'left_child', 'right_child', 'predicate')
+                         if hasattr(item, name))
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    assert {Term, Predicate, Fluent} <= found
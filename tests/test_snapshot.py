@@ -0,0 +1,66 @@
+import os
+import shutil
+
+from tsal.translator import snapshot
+from tsal.translator.snapshot import SnapshotCache
+from tsal.translator.tsalparser import TSALParser
+
+from tests.common import example
+
+
+def cached_domain(tmp_path):
+    source = str(tmp_path / 'domain.tsal')
+    shutil.copy(example('blocksworld', 'domain.tsal'), source)
+    cache = SnapshotCache(str(tmp_path / 'cache'))
+    cache.parse(source)
+    return cache, source
+
+
+def test_snapshot_is_loaded_by_the_same_code(tmp_path):
+    cache, source = cached_domain(tmp_path)
+    assert cache.load(source) is not None
+
+
+def test_snapshot_depends_on_the_model_modules(tmp_path, monkeypatch):
+    names = [os.path.basename(path) for path in snapshot._sources()]
+    assert {'tsalparser.py', 'domain.py', 'problem.py', 'predicate.py', 'term.py', 'action.py'} <= set(names)
+
+    cache, source = cached_domain(tmp_path)
+    changed = [str(tmp_path / os.path.basename(path)) for path in snapshot._sources()]
+    for path, copy in zip(snapshot._sources(), changed):
+        shutil.copy(path, copy)
+    with open(changed[names.index('term.py')], 'a') as file:
+        file.write('\n# a change to a model class\n')
+    monkeypatch.setattr(snapshot, '_sources', lambda: changed)
+    snapshot._parser_version.cache_clear()
+    try:
+        assert cache.load(source) is None
+    finally:
+        monkeypatch.undo()
+        snapshot._parser_version.cache_clear()
+    assert cache.load(source) is not None
+
+
+def test_a_file_changed_while_parsing_is_parsed_again(tmp_path):
+    source = str(tmp_path / 'domain.tsal')
+    shutil.copy(example('blocksworld', 'domain.tsal'), source)
+    cache = SnapshotCache(str(tmp_path / 'cache'))
+
+    def parse(filename):
+        result = TSALParser.parse(filename)
+        with open(filename, 'a') as file:
+            file.write('\n; edited while parsing\n')
+        return result
+    assert cache.parse(source, parse) is not None
+    assert cache.load(source) is None
+
+
+def test_a_content_hit_records_the_new_mtime(tmp_path):
+    cache, source = cached_domain(tmp_path)
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert cache.load(source) is not None
+    with open(cache.entry_path(source), 'rb') as file:
+        mtime, size = snapshot._header.unpack(file.read(snapshot._header.size))[2:4]
+    assert (mtime, size) == (stat.st_mtime_ns + 10 ** 9, stat.st_size)
+    assert cache.load(source) is not None
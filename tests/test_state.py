@@ -0,0 +1,76 @@
+import copy
+import pickle
+
+from tsal.simulator.state import AtomIndex
+from tsal.translator.predicate import Predicate
+from tsal.translator.term import Term
+from tsal.translator.tsalparser import TSALParser
+
+from tests.common import example
+
+
+def blocksworld():
+    domain = TSALParser.parse(example('blocksworld', 'domain.tsal'))
+    problem = TSALParser.parse(example('blocksworld', 'problem.tsal'))
+    index = AtomIndex(problem.encoding(domain), domain.analysis)
+    return problem, index, index.initial_state(problem)
+
+
+def atom(name, *args):
+    return Predicate(name, [Term.constant(arg) for arg in args])
+
+
+def test_initial_state_holds_the_initial_atoms():
+    problem, index, state = blocksworld()
+    atoms = [item for item in problem.init if item.name != '=']
+    assert len(state) == len(atoms) == len(index)
+    assert all(item in state for item in atoms)
+    assert sorted(map(str, state.atoms())) == sorted(map(str, atoms))
+    assert sorted(state) == sorted(index.code(item) for item in atoms)
+    assert atom('holding', 'a') not in state and atom('holding', 'a') not in index
+
+
+def test_set_clear_and_apply_are_set_operations():
+    problem, index, state = blocksworld()
+    holding, handempty = atom('holding', 'a'), atom('handempty')
+    changed = state.set([holding]).clear([handempty])
+    assert holding in changed and handempty not in changed and handempty in state and holding not in state
+    assert set(changed) == set(state) - {index.code(handempty)} | {index.code(holding)}
+    assert state.apply(index.mask([holding]), index.mask([handempty])) == changed
+    assert changed.clear([holding]).set([handempty]) == state
+    assert hash(changed.clear([holding]).set([handempty])) == hash(state)
+    assert state.holds_all(index.mask([handempty])) and state.holds_none(index.mask([holding]))
+    assert index.find(holding) == index.bit(holding) and index.atom(index.bit(holding)) == holding
+
+
+def test_states_are_immutable_values():
+    problem, index, state = blocksworld()
+    assert copy.copy(state) is state and copy.deepcopy(state) is state
+    other = AtomIndex(index.encoding).initial_state(problem)
+    assert set(other) == set(state) and other != state  # the bits of another index mean other atoms
+    assert {state, state.set([])} == {state}
+    restored = pickle.loads(pickle.dumps(state))
+    assert restored.bits == state.bits and set(restored) == set(state)
+
+
+def test_static_atoms_get_no_bit():
+    domain = TSALParser.parse_string('''(define (domain ROADS)
+      (:requirements :typing)
+      (:types place player)
+      (:predicates (road ?a ?b) (at ?p))
+      (:fluents (self) - player)
+      (:actions
+          (:action move :parameters (?a ?b) :precondition (and (at ?a) (road ?a ?b))
+                 :effect (and (at ?b) (not (at ?a))))
+      )
+    )''')
+    problem = TSALParser.parse_string('''(define (problem ROADS-1) (:domain ROADS)
+      (:objects x y - place p1 - player)
+      (:init (= (self) p1) (road x y) (at x))
+      (:goal (or (and (= (self) p1) (at y)))))''')
+    index = AtomIndex(problem.encoding(domain), domain.analysis)
+    state = index.initial_state(problem)
+    assert len(index) == 1 and len(state) == 1
+    assert atom('road', 'x', 'y') in state and atom('road', 'y', 'x') not in state
+    assert index.bit(atom('road', 'y', 'x')) is None and index.mask([atom('road', 'x', 'y')]) == 0
+    assert atom('at', 'y') not in state and index.bit(atom('at', 'y')) == 1
@@ -0,0 +1,119 @@
+import math
+
+from tsal.simulator.successor import SuccessorEngine
+from tsal.translator.tsalparser import TSALParser
+
+from tests.common import example
+
+DOMAIN = '''(define (domain PAY)
+  (:requirements :typing)
+  (:types item player)
+  (:predicates (held ?i))
+  (:fluents (self) - player (owner ?i - item) - player (money ?p - player) (count))
+  (:actions
+      (:action pay :parameters (?i - item) :precondition (and (held ?i) (= (owner ?i) ?p))
+             :effect (and (= (money ?p) 5)))
+      (:action copy :parameters (?i - item) :precondition (and (held ?i) (= (count) ?n))
+             :effect (and (= (count) ?n)))
+      (:action spend :parameters (?i - item) :precondition (and (held ?i) (= (owner ?i) ?p) (> (money ?p) 1))
+             :effect (and (- (money ?p) 1)))
+      (:action rich :parameters () :precondition (and (= (money ?q) 5)) :effect (and (- (money ?q) 5)))
+  )
+)'''
+
+PROBLEM = '''(define (problem PAY-1) (:domain PAY)
+  (:objects a b - item p1 p2 - player)
+  (:init (= (self) p1) (= (owner a) p2) (= (count) 3) (held a) (held b))
+  (:goal (or (and (= (self) p1) (held a)))))'''
+
+
+def engine():
+    return SuccessorEngine(TSALParser.parse_string(DOMAIN), TSALParser.parse_string(PROBLEM))
+
+
+def blocksworld_successors(problem, atoms):
+    # the successors of the blocksworld actions, computed on sets of atoms
+    blocks = problem.objects['block']
+    found = []
+    for x in blocks:
+        if ('clear', x) in atoms and ('ontable', x) in atoms and ('handempty',) in atoms:
+            found.append(('pick-up', (x,), atoms - {('ontable', x), ('clear', x), ('handempty',)} | {('holding', x)}))
+        if ('holding', x) in atoms:
+            found.append(('put-down', (x,), atoms - {('holding', x)} | {('clear', x), ('handempty',), ('ontable', x)}))
+        for y in blocks:
+            if ('holding', x) in atoms and ('clear', y) in atoms:
+                found.append(('stack', (x, y), atoms - {('holding', x), ('clear', y)} |
+                              {('clear', x), ('handempty',), ('on', x, y)}))
+            if ('on', x, y) in atoms and ('clear', x) in atoms and ('handempty',) in atoms:
+                found.append(('unstack', (x, y), atoms - {('clear', x), ('handempty',), ('on', x, y)} |
+                              {('holding', x), ('clear', y)}))
+    return sorted((name, args, sorted(successor)) for name, args, successor in found)
+
+
+def atoms_of(state):
+    return frozenset((atom.name.lower(),) + tuple(term.value for term in atom.args) for atom in state.atoms())
+
+
+def test_blocksworld_successors_match_the_action_definitions():
+    problem = TSALParser.parse(example('blocksworld', 'problem.tsal'))
+    blocksworld = SuccessorEngine(TSALParser.parse(example('blocksworld', 'domain.tsal')), problem)
+    state, values = blocksworld.initial()
+    seen = {atoms_of(state)}
+    frontier = [state]
+    while frontier and len(seen) < 2000:
+        state = frontier.pop()
+        successors = blocksworld.successors(state, values)
+        assert sorted((ground.operator.name, ground.args, sorted(atoms_of(successor)))
+                      for ground, _, _, successor, _ in successors) == \
+            blocksworld_successors(problem, set(atoms_of(state)))
+        for _, _, probability, successor, _ in successors:
+            assert probability == 1.0
+            if atoms_of(successor) not in seen:
+                seen.add(atoms_of(successor))
+                frontier.append(successor)
+    assert len(seen) >= 2000
+
+
+def test_numeric_effect_on_a_fluent_without_id_is_applied():
+    pay = engine()
+    state, values = pay.initial()
+    money = pay.encoding.symbol_id('money')
+    assert pay.fluents.find((money, pay.encoding.object_id('p2'))) is None
+    (ground, binding), = [found for found in pay.applicable(state, values) if found[0].operator.name == 'pay']
+    _, new = pay.apply(state, values, ground, binding)
+    index = pay.fluents.find((money, pay.encoding.object_id('p2')))
+    assert index is not None and len(new) == len(pay.fluents)
+    assert new[index] == 5
+    assert len(values) < len(new)  # the values of the state left as they were
+
+
+def test_fluents_new_to_a_sibling_state_are_undefined_in_it():
+    pay = engine()
+    assert not pay.skipped
+    state, values = pay.initial()
+    names = lambda found: sorted(ground.operator.name for ground, _, _, _, _ in found)  # noqa: E731
+    first = pay.successors(state, values)
+    assert names(first) == ['copy', 'copy', 'pay']
+    _, _, _, paid, paid_values = [found for found in first if found[0].operator.name == 'pay'][0]
+    # (money p2) has an id now, longer than the values of the initial state and of its other successors
+    assert len(paid_values) > len(values)
+    for _, _, _, successor, successor_values in first:
+        pay.successors(successor, successor_values)
+    assert names(pay.successors(state, values)) == ['copy', 'copy', 'pay']
+    assert names(pay.successors(paid, paid_values)) == ['copy', 'copy', 'pay', 'rich', 'spend']
+
+
+def test_numbers_bound_again_reuse_their_object_id():
+    copy = engine()
+    state, values = copy.initial()
+    bindings = set()
+    objects = []
+    for _ in range(3):
+        for ground, binding in copy.applicable(state, values):
+            if ground.operator.name == 'copy':
+                bindings.add(binding)
+                state, values = copy.apply(state, values, ground, binding)
+        objects.append(len(copy.objects))
+    assert objects[0] == objects[-1]
+    assert len({binding[-1] for binding in bindings}) == 1
+    assert sum(1 for value in copy.objects if isinstance(value, float) and math.isnan(value)) == 1
@@ -0,0 +1,49 @@
+import copy
+import os
+import pickle
+import subprocess
+import sys
+
+from tsal.translator.predicate import Predicate
+from tsal.translator.symbols import SymbolTable
+from tsal.translator.term import Term
+from tsal.translator.tsalparser import TSALParser
+
+from tests.common import example
+
+# parses, interns (which hashes every atom) and pickles the blocksworld problem to stdout
+PICKLE_PROBLEM = '''
+import pickle, sys
+from tsal.translator.symbols import SymbolTable
+from tsal.translator.tsalparser import TSALParser
+problem = SymbolTable().intern(TSALParser.parse({!r}))
+sys.stdout.buffer.write(pickle.dumps(problem))
+'''
+
+
+def test_intern_shares_equal_atoms():
+    table = SymbolTable()
+    first = table.intern(Predicate('on', [Term(value='a'), Term(value='b')]))
+    second = table.intern(Predicate('on', [Term(value='a'), Term(value='b')]))
+    assert first is second
+    assert table.intern(Predicate('on', [Term(value='b'), Term(value='a')])) is not first
+
+
+def test_hash_not_pickled():
+    term = Term(value='a')
+    hash(term)
+    assert '_hash' not in term.__getstate__()
+    restored = pickle.loads(pickle.dumps(term))
+    assert restored == term and restored._hash is None
+    assert copy.copy(term) == term
+
+
+def test_pickled_atoms_across_processes():
+    path = example('blocksworld', 'problem.tsal')
+    for seed in ('1', '2'):
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        output = subprocess.run([sys.executable, '-c', PICKLE_PROBLEM.format(path)], env=env,
+                                stdout=subprocess.PIPE, check=True).stdout
+        problem = pickle.loads(output)
+        fresh = set(TSALParser.parse(path).init)
+        assert problem.init and all(atom in fresh for atom in problem.init)
@@ -0,0 +1,309 @@
+import concurrent.futures
+import importlib
+import importlib.util
+import io
+import os
+import re
+import sys
+
+import pytest
+
+from tsal.ply import lex, yacc
+from tsal.translator import tsalparser
+from tsal.translator.tsalparser import TSALParser
+
+from tests.common import EXAMPLES, example_files
+
+DOMAIN = '''(define (domain ROOMS)
+  (:requirements :typing)
+  (:types room player)
+  (:predicates (at ?r) (door ?a ?b))
+  (:fluents (self) - player (steps))
+  (:actions
+      (:action go :parameters (?a - room ?b - room) :precondition (and (at ?a) (door ?a ?b))
+             :effect (and (at ?b) (not (at ?a)) (+ (steps) 1)))
+  )
+)'''
+
+PROBLEM = '''(define (problem ROOMS-1) (:domain ROOMS)
+  (:objects hall kitchen - room p1 - player)
+  (:init (= (self) p1) (at hall) (door hall kitchen) (= (steps) 0))
+  (:goal (or (and (= (self) p1) (at kitchen)))))'''
+
+
+def sections(text):
+    # the text of the sections of a definition, by keyword
+    body = text[text.index('(', text.index('(', 1) + 1):text.rindex(')')]
+    found, depth, start = {}, 0, None
+    for position, char in enumerate(body):
+        if char == '(':
+            if depth == 0:
+                start = position
+            depth += 1
+        elif char == ')':
+            depth -= 1
+            if depth == 0:
+                part = body[start:position + 1]
+                found[part[1:].split()[0]] = part
+    return found
+
+
+def reorder(text, keys):
+    head = text[:text.index('(', text.index('(', 1) + 1)]
+    parts = sections(text)
+    return head + ' '.join(parts[key] for key in keys) + ')'
+
+
+@pytest.mark.parametrize('start', ['tsal', 'domain', 'problem', 'domain_section'])
+def test_grammar_has_no_conflicts(start):
+    # the tables are rebuilt from the grammar, not read from the generated modules
+    log = io.StringIO()
+    errorlog = yacc.PlyLogger(log) if start == 'tsal' else tsalparser._StartLogger(log)
+    yacc.yacc(module=tsalparser, start=start, tabmodule='parsetab_check', write_tables=False, debug=False,
+              errorlog=errorlog)
+    assert log.getvalue() == ''
+
+
+def test_sections_in_any_order_parse_the_same():
+    domain = TSALParser.parse_string(DOMAIN)
+    keys = list(sections(DOMAIN))
+    assert keys == [':requirements', ':types', ':predicates', ':fluents', ':actions']
+    for order in (keys[::-1], keys[2:] + keys[:2]):
+        assert repr(TSALParser.parse_string(reorder(DOMAIN, order))) == repr(domain)
+    problem = TSALParser.parse_string(PROBLEM)
+    keys = list(sections(PROBLEM))
+    assert str(TSALParser.parse_string(reorder(PROBLEM, keys[::-1]))) == str(problem)
+
+
+@pytest.mark.parametrize('text, kind, message', [
+    (reorder(DOMAIN, [':requirements', ':types', ':predicates', ':types', ':fluents', ':actions']), 'domain',
+     "domain 'rooms' defines :types more than once"),
+    (reorder(DOMAIN, [':requirements', ':types', ':fluents', ':actions']), 'domain',
+     "domain 'rooms' is missing :predicates"),
+    (reorder(DOMAIN, [':fluents']), 'domain', "domain 'rooms' is missing :requirements, :types, :predicates, :actions"),
+    (reorder(PROBLEM, [':domain', ':objects', ':init', ':init', ':goal']), 'problem',
+     "problem 'rooms-1' defines :init more than once"),
+    (reorder(PROBLEM, [':domain', ':init', ':goal']), 'problem', "problem 'rooms-1' is missing :objects"),
+], ids=['duplicate domain section', 'missing domain section', 'missing domain sections', 'duplicate problem section',
+        'missing problem section'])
+def test_invalid_sections_are_reported(text, kind, message, capsys):
+    assert TSALParser.start_symbol(TSALParser.clean_input(text)) == kind
+    assert TSALParser.parse_string(text) is None
+    assert TSALParser.parse_string(text, start='tsal') is None
+    assert capsys.readouterr().out.count('Error: {} (line '.format(message)) == 2
+
+
+@pytest.mark.parametrize('path', example_files(('.tsal', '.pddl')), ids=lambda path: path[len(EXAMPLES) + 1:])
+def test_readers_agree_on_examples(path, monkeypatch):
+    expected = TSALParser.read_input(path, 'lines')
+    assert TSALParser.read_input(path, 'mmap') == TSALParser.read_input(path, 'chunked') == expected
+    monkeypatch.setattr(TSALParser, 'chunk_size', 7)  # lines and characters cut across blocks
+    assert TSALParser.read_input(path, 'chunked') == expected
+
+
+def test_readers_agree_on_non_ascii_text(tmp_path, monkeypatch):
+    path = tmp_path / 'domain.tsal'
+    source = DOMAIN.replace('ROOMS', 'CAFÉ').replace('player)', 'player ÉTÉ)\u2003')
+    source = source.replace(':typing)', ':typing) ; À')
+    path.write_bytes(source.encode('utf-8'))
+    expected = TSALParser.read_input(str(path), 'lines')
+    assert '(define (domain café)' in expected and '(:types room player été)\n' in expected
+    for chunk_size in (TSALParser.chunk_size, 3):
+        monkeypatch.setattr(TSALParser, 'chunk_size', chunk_size)
+        assert TSALParser.read_input(str(path), 'chunked') == expected
+    assert TSALParser.read_input(str(path), 'mmap') == expected
+    path.write_bytes(b'')
+    assert TSALParser.read_input(str(path), 'mmap') == TSALParser.read_input(str(path), 'lines') == ''
+
+
+def dump(result):
+    # the text of a parsed Domain or Problem, with the parts their reprs leave out
+    if hasattr(result, 'operators'):
+        return repr(result) + str([(item.name, item.params, item.precond, item.effects) for item in
+                                   result.operators + result.events]) + str(result.types) + str(result.constants)
+    return str(result) + str(result.objects) + str(result.init) + str(result.goal) + str(result.metric)
+
+
+@pytest.mark.parametrize('path', example_files(), ids=lambda path: path[len(EXAMPLES) + 1:])
+def test_full_grammar_matches_the_per_kind_start(path):
+    data = TSALParser.read_input(path)
+    assert dump(TSALParser().parse_input(data, start='tsal')) == dump(TSALParser().parse_input(data))
+
+
+def test_long_lists_keep_their_order():
+    count = 5000
+    doors = ' '.join('(door r{} r{})'.format(number, number + 1) for number in range(count - 1))
+    rooms = ' '.join('r{}'.format(number) for number in range(count))
+    problem = TSALParser.parse_string(PROBLEM.replace('(door hall kitchen)', doors).replace('hall kitchen', rooms))
+    assert problem.objects['room'] == ['r{}'.format(number) for number in range(count)]
+    doors = [str(atom) for atom in problem.init if atom.name == 'door']
+    assert doors == ['(door r{} r{})'.format(number, number + 1) for number in range(count - 1)]
+
+
+GRAMMAR = '''
+tokens = ('NUMBER', 'PLUS')
+t_PLUS = r'\\+'
+t_ignore = ' '
+
+
+def t_NUMBER(t):
+    r'{number}'
+    t.value = float(t.value)
+    return t
+
+
+def t_error(t):
+    raise ValueError(t.value)
+
+
+def p_sum(p):
+    """{rule}"""
+    p[0] = p[1] + p[3] if len(p) == 4 else p[1] * 2 if len(p) == 3 else p[1]
+
+
+def p_error(p):
+    raise ValueError(p)
+'''
+SUM = 'sum : sum PLUS NUMBER\n | NUMBER'
+DOUBLED_SUM = SUM + '\n | sum PLUS'  # a trailing + doubles the sum
+
+
+def build(tmp_path, monkeypatch, name, number=r'\d+', rule=SUM):
+    # a tiny grammar module with its lexer and parser tables pickled in tmp_path
+    path = tmp_path / (name + '.py')
+    path.write_text(GRAMMAR.replace('{number}', number).replace('{rule}', rule))
+    spec = importlib.util.spec_from_file_location(name, str(path))
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, name, module)  # the validation of the rules reads their source
+    spec.loader.exec_module(module)
+    tables = {kind: str(tmp_path / (kind + '.pickle')) for kind in ('lex', 'yacc')}
+    lexer = lex.lex(module=module, lextab=None, picklefile=tables['lex'])
+    parser = yacc.yacc(module=module, tabmodule=None, picklefile=tables['yacc'], debug=False, write_tables=True,
+                       errorlog=yacc.NullLogger())
+    return lambda text: parser.parse(text, lexer=lexer), tables
+
+
+def stamp(tables):
+    # clears the mtimes of the table files, a rebuild writes them again
+    for path in tables.values():
+        os.utime(path, ns=(0, 0))
+
+
+def rewritten(tables):
+    return {kind for kind, path in tables.items() if os.stat(path).st_mtime_ns != 0}
+
+
+def test_tables_are_rebuilt_when_the_grammar_changes(tmp_path, monkeypatch):
+    parse, tables = build(tmp_path, monkeypatch, 'grammar_a')
+    assert parse('1 + 2 + 3') == 6
+    stamp(tables)
+    parse, _ = build(tmp_path, monkeypatch, 'grammar_b')
+    assert parse('1 + 2') == 3 and rewritten(tables) == set()
+
+    parse, _ = build(tmp_path, monkeypatch, 'grammar_c', rule=DOUBLED_SUM)
+    assert parse('1 + 2 +') == 6 and rewritten(tables) == {'yacc'}
+    stamp(tables)
+    parse, _ = build(tmp_path, monkeypatch, 'grammar_d', number=r'\d+(\.\d+)?', rule=DOUBLED_SUM)
+    assert parse('1.5 + 2') == 3.5 and rewritten(tables) == {'lex'}
+
+
+@pytest.mark.parametrize('start, tabmodule', [('tsal', 'parsetab'), ('domain', 'parsetab_domain'),
+                                              ('problem', 'parsetab_problem'), ('domain_section', 'parsetab_section')])
+def test_generated_tables_are_those_of_the_grammar(start, tabmodule):
+    reflect = yacc.ParserReflect(dict(vars(tsalparser), start=start))
+    reflect.get_all()
+    assert importlib.import_module('tsal.translator.' + tabmodule)._lr_signature == reflect.signature()
+
+
+def test_generated_lexer_tables_are_those_of_the_tokens():
+    reflect = lex.LexerReflect(dict(vars(tsalparser)), reflags=int(re.VERBOSE))  # the reflags of lex.lex
+    reflect.get_all()
+    assert importlib.import_module('tsal.translator.lextab')._lexsignature == reflect.signature()
+
+
+@pytest.mark.parametrize('processes', [False, True], ids=['threads', 'processes'])
+def test_parse_many_matches_one_by_one(processes):
+    paths = example_files() * 2
+    expected = [dump(TSALParser.parse(path)) for path in paths]
+    assert [dump(result) for result in TSALParser.parse_many(paths, workers=4, processes=processes)] == expected
+
+
+def test_parsers_on_threads_do_not_share_state():
+    # forall effects number the predicates they generate, every parse starts again from 0
+    text = DOMAIN.replace('(:action go', '(:action look :parameters () :precondition (and (at hall))\n'
+                          ' :effect (forall (?r - room) (when (and (door hall ?r)) (and (at ?r)))))\n'
+                          ' (:action go')
+    expected = dump(TSALParser.parse_string(text))
+    assert 'forall0' in expected.lower()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        found = list(executor.map(lambda _: dump(TSALParser.parse_string(text)), range(64)))
+    assert found == [expected] * 64
+
+
+@pytest.mark.parametrize('path', example_files(), ids=lambda path: path[len(EXAMPLES) + 1:])
+def test_strings_bytes_and_streams_parse_like_files(path, monkeypatch):
+    with open(path, 'rb') as file:
+        data = file.read()
+    expected = dump(TSALParser.parse(path))
+    text = data.decode('utf-8')
+    for source in (text, data, bytearray(data), memoryview(data)):
+        assert dump(TSALParser.parse_string(source)) == expected
+    monkeypatch.setattr(TSALParser, 'chunk_size', 5)
+    assert dump(TSALParser.parse_stream(io.StringIO(text))) == expected
+    assert dump(TSALParser.parse_stream(io.BytesIO(data))) == expected
+    with open(path, 'rb') as file:
+        assert dump(TSALParser.parse_stream(file)) == expected
+
+
+def test_streams_cut_inside_a_character(monkeypatch):
+    data = DOMAIN.replace('(:types', '; salle à manger, ½ étage\n  (:types').encode('utf-8')
+    expected = dump(TSALParser.parse_string(DOMAIN))
+    for chunk_size in range(1, 8):
+        monkeypatch.setattr(TSALParser, 'chunk_size', chunk_size)
+        assert dump(TSALParser.parse_stream(io.BytesIO(data))) == expected
+
+
+def spanned(result):
+    # the actions, events and the predicates and expressions of their preconditions
+    for operator in result.operators + result.events:
+        yield operator
+        for item in operator.precond:
+            yield item.predicate if hasattr(item, 'predicate') else item
+
+
+def check_span(data, node):
+    line, column, offset, end = node.span
+    assert data[offset:offset + 1] == b'(' and data[end - 1:end] == b')'
+    assert data[offset:end].count(b'(') == data[offset:end].count(b')')
+    assert line == data.count(b'\n', 0, offset) + 1 and column == offset - data.rfind(b'\n', 0, offset)
+
+
+@pytest.mark.parametrize('path', [path for path in example_files() if 'domain' in os.path.basename(path)],
+                         ids=lambda path: path[len(EXAMPLES) + 1:])
+def test_located_spans_point_at_the_source(path):
+    with open(path, 'rb') as file:
+        data = file.read()
+    located = TSALParser.parse(path, located=True)
+    assert dump(located) == dump(TSALParser.parse(path))
+    assert all(node.span is None for node in spanned(TSALParser.parse(path)))
+    for node in spanned(located):
+        name = getattr(node, 'name', '')
+        if name.startswith('forall') or name[:1].isdigit():
+            continue  # generated for forall effects, not in the source
+        check_span(data, node)
+        if hasattr(node, 'precond'):
+            assert data[node.span.offset:node.span.end].lower().split()[:2] in \
+                ([b'(:action', node.name.encode()], [b'(:event', node.name.encode()])
+
+
+def test_spans_are_byte_offsets():
+    text = DOMAIN.replace('(:types', '; à é\n  (:types')
+    domain = TSALParser.parse_string(text, located=True)
+    data = text.encode('utf-8')
+    go = domain.operators[0]
+    check_span(data, go)
+    assert data[go.span.offset:go.span.end].startswith(b'(:action go') and go.span.line == 8
+    predicate = go.precond[0].predicate
+    check_span(data, predicate)
+    assert data[predicate.span.offset:predicate.span.end] == b'(at ?a)'
+    assert predicate.span.column == data.split(b'\n')[go.span.line - 1].index(b'(at ?a)') + 1